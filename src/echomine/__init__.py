@@ -59,8 +59,10 @@ __author__ = "Echomine Contributors"
 
 # Public API imports (T061-T062)
 from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.ndjson import NDJSONAdapter
 from echomine.adapters.openai import OpenAIAdapter
 from echomine.exceptions import (
+    AmbiguousIdError,
     EchomineError,
     ParseError,
     SchemaVersionError,
@@ -68,7 +70,7 @@ from echomine.exceptions import (
 )
 from echomine.export.csv import CSVExporter
 from echomine.export.markdown import MarkdownExporter
-from echomine.models.conversation import Conversation
+from echomine.models.conversation import Conversation, ConversationHeader
 from echomine.models.message import Message
 from echomine.models.protocols import ConversationProvider
 from echomine.models.search import SearchQuery, SearchResult
@@ -91,6 +93,7 @@ __all__: list[str] = [
     "__version__",
     # Data models
     "Conversation",
+    "ConversationHeader",
     "Message",
     "SearchQuery",
     "SearchResult",
@@ -102,6 +105,7 @@ __all__: list[str] = [
     "ExportMetadata",
     # Adapters
     "ClaudeAdapter",
+    "NDJSONAdapter",
     "OpenAIAdapter",
     # Exporters
     "CSVExporter",
@@ -116,4 +120,5 @@ __all__: list[str] = [
     "ParseError",
     "ValidationError",
     "SchemaVersionError",
+    "AmbiguousIdError",
 ]
@@ -6,6 +6,7 @@ enabling O(1) memory consumption regardless of export file size.
 Public API:
     - OpenAIAdapter: Streams conversations from OpenAI ChatGPT export files
     - ClaudeAdapter: Streams conversations from Anthropic Claude export files
+    - NDJSONAdapter: Reads normalized NDJSON files (one conversation per line)
 
 Constitution Compliance:
     - Principle VIII: Memory-efficient streaming (FR-003)
@@ -14,7 +15,8 @@ Constitution Compliance:
 """
 
 from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.ndjson import NDJSONAdapter
 from echomine.adapters.openai import OpenAIAdapter
 
 
-__all__ = ["ClaudeAdapter", "OpenAIAdapter"]
+__all__ = ["ClaudeAdapter", "NDJSONAdapter", "OpenAIAdapter"]
@@ -0,0 +1,800 @@
+"""Shared streaming implementation for JSON array exports.
+
+OpenAI and Claude exports are both a JSON array of conversation objects.
+Everything except turning one raw object into a model is the same for the
+two: ijson streaming, parallel parsing, skip and progress reporting, bulk
+export, search, sidecar indexes and ID lookups. ``JSONArrayAdapter``
+implements it once; each provider adapter supplies the parse hooks and a
+few class attributes.
+
+Provider Hooks:
+    - ``_parse_conversation``: raw object -> Conversation (raises on malformed)
+    - ``_parse_or_skip``: raw object -> Conversation | Skipped | None
+    - ``_parse_header_or_skip``: raw object -> ConversationHeader | Skipped | None
+
+Constitution Compliance:
+    - Principle VIII: Memory-efficient streaming (FR-003, SC-001)
+    - Principle VI: Type safety with mypy --strict
+    - Principle IV: Observability (error context, structured logging)
+    - FR-281-285: Graceful degradation for malformed entries
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import Any, ClassVar, TypeVar
+
+import ijson
+
+from echomine.adapters.parallel import HeaderOutcome, ParseOutcome, Skipped, iter_parallel
+from echomine.exceptions import ParseError
+from echomine.export.bulk import BulkExportFormat, ConversationWriter, ExportedFile
+from echomine.index import ExportIndex, SearchIndex
+from echomine.index.export_index import IndexProvider
+from echomine.models.conversation import Conversation, ConversationHeader
+from echomine.models.message import Message
+from echomine.models.protocols import OnSkipCallback, ProgressCallback
+from echomine.models.search import SearchQuery, SearchResult
+from echomine.search.pipeline import search_conversations, search_indexed
+from echomine.utils.archive import open_export
+from echomine.utils.id_lookup import IdResolver
+
+
+# Module logger for operational visibility
+logger = logging.getLogger(__name__)
+
+# Object produced by a parse hook (Conversation or ConversationHeader)
+_T = TypeVar("_T")
+
+
+class JSONArrayAdapter(ABC):
+    """Base class of the adapters for JSON array exports.
+
+    Subclasses implement the parse hooks and set the class attributes
+    below; streaming, export, search and lookups are inherited.
+    """
+
+    provider: ClassVar[IndexProvider]
+    """Provider name, recorded in sidecar indexes and normalized NDJSON files."""
+
+    _id_field: ClassVar[str]
+    """Raw object key holding the conversation ID."""
+
+    _case_sensitive_ids: ClassVar[bool]
+    """Whether ID and prefix lookups match case-sensitively."""
+
+    _malformed_errors: ClassVar[tuple[type[Exception], ...]]
+    """Exceptions ``_parse_conversation`` raises for a malformed entry."""
+
+    _json_error: ClassVar[str]
+    """ParseError message for invalid JSON ({error} and {file_path} fields)."""
+
+    def stream_conversations(
+        self,
+        file_path: Path,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+        trusted: bool = False,
+    ) -> Iterator[Conversation]:
+        """Stream conversations from an export file with O(1) memory.
+
+        This method uses ijson to incrementally parse the export file, yielding
+        Conversation objects one at a time. The entire file is NEVER loaded into
+        memory - only the current conversation being parsed.
+
+        Streaming Behavior:
+            - Returns iterator (lazy evaluation)
+            - Conversations yielded in file order
+            - Parser state bounded by ijson buffer (~50MB)
+            - No buffering between conversations
+            - workers > 1: conversations parsed in worker processes; in file
+              order unless ordered=False (then in completion order)
+
+        Error Handling:
+            - Invalid JSON: Raises ParseError immediately
+            - Missing file: Raises FileNotFoundError
+            - Schema violations: Raises ValidationError (Pydantic)
+            - Empty array: Succeeds, yields zero conversations
+
+        Args:
+            file_path: Path to export JSON file
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+            trusted: Skip Pydantic validation of Message/Conversation fields,
+                for known-good exports (see ``echomine.models.trusted``)
+
+        Yields:
+            Conversation objects parsed from export
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed (syntax errors)
+            ValidationError: If conversation data violates schema
+
+        Example:
+            ```python
+            # Basic usage
+            adapter = OpenAIAdapter()
+            for conv in adapter.stream_conversations(Path("export.json")):
+                print(f"Conversation: {conv.title}")
+
+            # Handle errors
+            try:
+                conversations = list(adapter.stream_conversations(path))
+            except ParseError as e:
+                print(f"Invalid export format: {e}")
+            except ValidationError as e:
+                print(f"Schema violation: {e}")
+
+            # Parse on 8 cores, order irrelevant
+            for conv in adapter.stream_conversations(path, workers=8, ordered=False):
+                print(conv.title)
+            ```
+
+        Memory Complexity: O(1) for file size, O(N) for single conversation
+        Time Complexity: O(M) where M = total conversations in file
+        """
+        yield from self._stream_conversations(
+            file_path,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            workers=workers,
+            ordered=ordered,
+            trusted=trusted,
+        )
+
+    def stream_conversation_headers(
+        self,
+        file_path: Path,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[ConversationHeader]:
+        """Stream conversation metadata without building any Message.
+
+        Yields id, title, timestamps and message count for each conversation.
+        The message count is read from the raw entry (see the provider's
+        ``_parse_header_or_skip``); message content is never validated, so an
+        entry whose messages are all malformed is still listed here although
+        ``stream_conversations`` would skip it.
+
+        Args:
+            file_path: Path to export JSON file
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+
+        Yields:
+            ConversationHeader for each well-formed conversation, in file order
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed (syntax errors)
+
+        Example:
+            ```python
+            adapter = OpenAIAdapter()
+            for header in adapter.stream_conversation_headers(Path("export.json")):
+                print(f"{header.title}: {header.message_count} messages")
+            ```
+
+        Memory Complexity: O(1) for file size, O(N) for single raw conversation
+        Time Complexity: O(M) where M = total conversations in file
+        """
+        yield from self._stream_parsed(
+            file_path,
+            self._parse_header_or_skip,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def export_all(
+        self,
+        file_path: Path,
+        out_dir: Path,
+        *,
+        format: BulkExportFormat = "markdown",
+        include_metadata: bool = True,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        sync: bool = False,
+    ) -> Iterator[ExportedFile]:
+        """Write every conversation to its own file, reading the export once.
+
+        Each conversation is rendered (markdown or JSON) and written to
+        ``out_dir`` as soon as it is parsed; see ``echomine.export.bulk``
+        for file naming. With ``workers > 1`` parsing, rendering and writing
+        run in the worker processes and files are reported in completion
+        order. Malformed entries are skipped as in ``stream_conversations``.
+
+        Args:
+            file_path: Path to export JSON file
+            out_dir: Output directory (created if missing)
+            format: "markdown" (default) or "json"
+            include_metadata: Markdown only - include YAML frontmatter and
+                message IDs (default: True)
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+            workers: Number of processes (1 = export in this process)
+            sync: Skip conversations the manifest in ``out_dir`` lists as up
+                to date (see ``echomine.export.bulk.sync_export``, which also
+                updates the manifest)
+
+        Yields:
+            ExportedFile for each conversation (``written=False`` for files a
+            sync left untouched)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed (syntax errors)
+            OSError: If out_dir or a file cannot be written
+
+        Example:
+            ```python
+            adapter = OpenAIAdapter()
+            for exported in adapter.export_all(Path("export.json"), Path("out"), workers=8):
+                print(exported.path)
+            ```
+
+        Memory Complexity: O(workers * batch) for file size
+        Time Complexity: O(M / workers) where M = total conversations in file
+        """
+        out_dir.mkdir(parents=True, exist_ok=True)
+        writer = ConversationWriter(
+            self._parse_or_skip,
+            out_dir,
+            format,
+            include_metadata=include_metadata,
+            header=self._parse_header_or_skip if sync else None,
+        )
+        yield from self._stream_parsed(
+            file_path,
+            writer,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            workers=workers,
+            ordered=False,
+        )
+
+    def _stream_conversations(
+        self,
+        file_path: Path,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        prefilter: SearchQuery | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+        trusted: bool = False,
+    ) -> Iterator[Conversation]:
+        """Stream conversations, optionally rejecting them before parsing.
+
+        With ``prefilter`` set, each raw conversation is checked against the
+        query's header filters (see ``_header_excluded``) and dropped before
+        any Message or Conversation model is built. Excluded conversations are
+        neither counted for progress nor reported via on_skip.
+
+        With ``workers > 1``, parsing runs in worker processes (see
+        ``echomine.adapters.parallel``); callbacks still run here, in this
+        process, with the same semantics as serial streaming.
+
+        Args:
+            file_path: Path to export JSON file
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+            prefilter: Optional SearchQuery whose header filters are pushed down
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+            trusted: Build models without Pydantic validation
+
+        Yields:
+            Conversation objects parsed from export
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed (syntax errors)
+        """
+        yield from self._stream_parsed(
+            file_path,
+            partial(self._parse_or_skip, trusted=True) if trusted else self._parse_or_skip,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            prefilter=prefilter,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def _stream_parsed(
+        self,
+        file_path: Path,
+        parse: Callable[[dict[str, Any], SearchQuery | None], _T | Skipped | None],
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        prefilter: SearchQuery | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[_T]:
+        """Run a parse hook over every export entry, handling skips and progress.
+
+        Shared by conversation and header streaming. ``parse`` returns the
+        parsed object, Skipped for a malformed entry, or None when the
+        prefilter excludes the entry.
+
+        Args:
+            file_path: Path to export JSON file
+            parse: ``_parse_or_skip`` or ``_parse_header_or_skip``
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+            prefilter: Optional SearchQuery whose header filters are pushed down
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+
+        Yields:
+            Parsed objects, in file order unless ordered=False
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed (syntax errors)
+        """
+        # Open file in binary mode for ijson (required for streaming)
+        # FileNotFoundError raised naturally by open() if file missing
+        try:
+            with contextlib.ExitStack() as stack:
+                # Stream top-level array items using ijson
+                # Memory: O(1) - ijson maintains bounded buffer
+                # Each "item" is a complete conversation object
+                try:
+                    outcomes: Iterator[_T | Skipped | None]
+                    if workers > 1:
+                        # Workers open the export themselves
+                        outcomes = iter_parallel(
+                            parse,
+                            file_path,
+                            workers=workers,
+                            ordered=ordered,
+                            prefilter=prefilter,
+                        )
+                    else:
+                        f = stack.enter_context(open_export(file_path))
+                        outcomes = (
+                            parse(raw_conversation, prefilter)
+                            for raw_conversation in ijson.items(f, "item")
+                        )
+                    count = 0  # Track for progress_callback (FR-069)
+
+                    for outcome in outcomes:
+                        # Predicate pushdown: excluded on header fields, never parsed
+                        if outcome is None:
+                            continue
+
+                        if isinstance(outcome, Skipped):
+                            # Graceful degradation: skip malformed entries (FR-281)
+                            # Invoke on_skip callback if provided (FR-107)
+                            if on_skip:
+                                on_skip(outcome.conversation_id, outcome.reason)
+
+                            # Log warning but continue processing (FR-281)
+                            logger.warning(
+                                "Skipped malformed conversation",
+                                extra={
+                                    "conversation_id": outcome.conversation_id,
+                                    "reason": outcome.reason,
+                                },
+                            )
+                            continue  # Skip this conversation, process next
+
+                        count += 1
+
+                        # Invoke progress callback every 100 items (FR-069)
+                        if progress_callback and count % 100 == 0:
+                            progress_callback(count)
+
+                        yield outcome
+
+                except ijson.JSONError as e:
+                    # ijson.JSONError raised for malformed JSON
+                    # Convert to our ParseError for consistent error handling (FR-039, FR-041)
+                    raise ParseError(self._json_error.format(error=e, file_path=file_path)) from e
+
+        except FileNotFoundError:
+            # Re-raise FileNotFoundError without wrapping
+            # This is a standard Python exception, no conversion needed
+            raise
+
+    def search(
+        self,
+        file_path: Path,
+        query: SearchQuery,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        low_memory: bool = False,
+        workers: int = 1,
+    ) -> Iterator[SearchResult[Conversation]]:
+        """Search conversations with BM25 relevance ranking.
+
+        Algorithm:
+        1. Stream all conversations (O(1) memory per conversation)
+        2. Apply title filter if specified (metadata-only, fast)
+        3. Apply date range filter if specified
+        4. Build corpus and calculate BM25 scores
+        5. Rank by relevance (descending)
+        6. Apply limit if specified
+        7. Yield SearchResult objects one at a time
+
+        Args:
+            file_path: Path to export file
+            query: SearchQuery with keywords, title_filter, limit
+            progress_callback: Optional callback invoked per conversation processed
+            on_skip: Optional callback for malformed entries
+            low_memory: Stream the export twice instead of holding every
+                candidate: pass 1 gathers BM25 statistics, pass 2 scores and
+                keeps only the top ``query.limit`` results
+            workers: Number of processes parsing the export (see
+                ``stream_conversations``); ranking is unaffected
+
+        Yields:
+            SearchResult[Conversation] with ranked results and scores
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed
+
+        Performance:
+            - Memory: O(N) where N = matching conversations
+              (O(limit) with low_memory=True)
+            - Time: O(M) where M = total conversations in file
+              (two streaming passes with low_memory=True)
+            - Early termination: Not implemented (stream all for BM25)
+            - With a current search index (``echomine index build``), queries
+              without phrases are answered from the index and only the
+              returned conversations are parsed
+
+        Example:
+            ```python
+            adapter = OpenAIAdapter()
+            query = SearchQuery(keywords=["python"], limit=10)
+
+            for result in adapter.search(Path("export.json"), query):
+                print(f"{result.score:.2f}: {result.conversation.title}")
+            ```
+        """
+        # Search index: rank from postings, re-read only returned conversations
+        search_index = SearchIndex.load(file_path)
+        if (
+            search_index is not None
+            and search_index.provider == self.provider
+            and search_index.supports(query)
+        ):
+            yield from search_indexed(
+                search_index, query, self._parse_conversation, progress_callback=progress_callback
+            )
+            return
+
+        yield from search_conversations(
+            partial(self._stream_conversations, file_path, workers=workers),
+            query,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            low_memory=low_memory,
+        )
+
+    def build_search_index(
+        self,
+        file_path: Path,
+        *,
+        progress_callback: ProgressCallback | None = None,
+    ) -> SearchIndex:
+        """Build the persistent search index (``<export>.emsearch``) for an export.
+
+        Once built, ``search()`` answers phrase-free queries from the index
+        with the same scores and matched message IDs as streaming search.
+        Malformed conversations are left out, as streaming search skips them.
+
+        Args:
+            file_path: Path to export file
+            progress_callback: Optional callback invoked every 100 conversations
+
+        Returns:
+            SearchIndex for the freshly built sidecar
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If the export is not a JSON array
+        """
+
+        def parse(raw: dict[str, Any]) -> Conversation | None:
+            try:
+                return self._parse_conversation(raw)
+            except self._malformed_errors:
+                return None  # Malformed entry: skipped exactly as when streaming
+
+        return SearchIndex.build(
+            file_path,
+            provider=self.provider,
+            parse_conversation=parse,
+            progress_callback=progress_callback,
+        )
+
+    def get_conversation_by_id(
+        self,
+        file_path: Path,
+        conversation_id: str,
+    ) -> Conversation | None:
+        """Retrieve specific conversation by UUID (FR-155, FR-217, FR-356).
+
+        If a current sidecar index exists (see ``echomine index build``), seeks
+        directly to the conversation's byte range and parses only that slice.
+        Otherwise uses streaming search - O(N) time, O(1) memory - checking
+        each entry's ID field before parsing it, so only the matching
+        conversation is parsed.
+
+        Besides full IDs, accepts a prefix of at least 4 characters that
+        matches exactly one conversation (see ``echomine.utils.id_lookup``);
+        a full ID match wins. Matching is case-sensitive for OpenAI exports
+        and case-insensitive for Claude exports.
+
+        Args:
+            file_path: Path to export JSON file
+            conversation_id: UUID (full or prefix >=4 chars) of conversation
+                to retrieve
+
+        Returns:
+            Conversation object if found, None otherwise (FR-155)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed
+            AmbiguousIdError: If a prefix matches several conversations
+
+        Example:
+            ```python
+            adapter = OpenAIAdapter()
+            conv = adapter.get_conversation_by_id(
+                Path("export.json"),
+                "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+            )
+            if conv:
+                print(f"Found: {conv.title}")
+            else:
+                print("Conversation not found")
+            ```
+
+        Performance:
+            - Time: O(log N) with a sidecar index, otherwise O(N) where
+              N = conversations in file (streaming search)
+            - Memory: O(1) for file size, O(M) for single conversation
+            - Early termination: Returns as soon as the full ID is found
+              (a prefix needs the whole export, to rule out other matches)
+        """
+        return self.get_conversations_by_ids(file_path, [conversation_id]).get(conversation_id)
+
+    def get_conversations_by_ids(
+        self,
+        file_path: Path,
+        conversation_ids: Iterable[str],
+    ) -> dict[str, Conversation]:
+        """Retrieve several conversations by UUID in a single pass over the export.
+
+        Equivalent to calling ``get_conversation_by_id`` for each ID (same
+        full or >=4 character unique prefix matching), but the export is
+        streamed once: entries whose ID field matches no requested ID are
+        dropped before any Message or Conversation model is built, and
+        streaming stops as soon as every full ID has been found. With a
+        current sidecar index, each conversation is read from its byte range
+        instead.
+
+        Args:
+            file_path: Path to export JSON file
+            conversation_ids: UUIDs (full or prefix >=4 chars) of conversations
+                to retrieve (duplicates ignored)
+
+        Returns:
+            Requested ID -> Conversation, in request order; IDs that were not
+            found are absent
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed
+            AmbiguousIdError: If a prefix matches several conversations
+
+        Example:
+            ```python
+            adapter = OpenAIAdapter()
+            found = adapter.get_conversations_by_ids(Path("export.json"), ["conv-1", "conv-2"])
+            missing = {"conv-1", "conv-2"} - found.keys()
+            ```
+
+        Performance:
+            - Time: O(k log N) with a sidecar index, otherwise O(N) for one
+              streaming pass (ending at the last requested conversation)
+            - Memory: O(1) for file size, O(k) for the k conversations found
+        """
+        requested = list(dict.fromkeys(conversation_ids))
+
+        index = ExportIndex.load(file_path)
+        if index is not None and index.provider == self.provider:
+            indexed = {cid: self._get_indexed(index, cid) for cid in requested}
+            return {cid: conv for cid, conv in indexed.items() if conv is not None}
+
+        # Shared with the parse hook, which asks it which entries to parse
+        resolver: IdResolver[Conversation] = IdResolver(
+            requested, case_sensitive=self._case_sensitive_ids
+        )
+        if requested:
+            for conversation in self._stream_parsed(
+                file_path, partial(self._parse_if_requested, resolver=resolver)
+            ):
+                resolver.add(conversation.id, conversation)
+                if resolver.done:
+                    break  # Early termination: every full ID found
+
+        return resolver.resolve()
+
+    def _get_indexed(self, index: ExportIndex, conversation_id: str) -> Conversation | None:
+        """Parse the first well-formed conversation the sidecar index has for an ID."""
+        return next(self._parse_indexed(index, index.find(conversation_id)), None)
+
+    def _parse_indexed(
+        self, index: ExportIndex, spans: Iterable[tuple[int, int]]
+    ) -> Iterator[Conversation]:
+        """Parse the conversations at sidecar index byte ranges, skipping malformed ones."""
+        for raw_conversation in index.iter_raw_conversations(spans):
+            try:
+                yield self._parse_conversation(raw_conversation)
+            except self._malformed_errors:
+                continue  # Malformed entry: skipped exactly as when streaming
+
+    def _parse_if_requested(
+        self,
+        raw_conversation: dict[str, Any],
+        prefilter: SearchQuery | None = None,
+        *,
+        resolver: IdResolver[Conversation],
+    ) -> ParseOutcome:
+        """Parse a raw conversation only if the resolver may return it.
+
+        Parse hook of ``get_conversations_by_ids``: other entries are excluded
+        (None) on their ID field alone, like a prefilter.
+        """
+        conversation_id = raw_conversation.get(self._id_field)
+        if not isinstance(conversation_id, str) or not resolver.wants(conversation_id):
+            return None
+        return self._parse_or_skip(raw_conversation, prefilter)
+
+    def get_message_by_id(
+        self,
+        file_path: Path,
+        message_id: str,
+        *,
+        conversation_id: str | None = None,
+    ) -> tuple[Message, Conversation] | None:
+        """Retrieve specific message by UUID with parent conversation context.
+
+        Searches for a message by ID, optionally scoped to a specific conversation
+        for performance optimization. Returns both the message and its parent
+        conversation to provide full context.
+
+        If a current sidecar index exists (see ``echomine index build``), parses
+        only the conversations whose raw messages list the ID. Otherwise uses
+        streaming search for memory efficiency - O(1) memory usage.
+
+        Args:
+            file_path: Path to export JSON file
+            message_id: UUID of message to retrieve
+            conversation_id: Optional conversation UUID to scope search (performance hint)
+
+        Returns:
+            Tuple of (Message, Conversation) if found, None otherwise.
+            The Conversation is the parent containing the message.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If JSON is malformed
+
+        Example:
+            ```python
+            adapter = OpenAIAdapter()
+
+            # Search with conversation hint (faster)
+            result = adapter.get_message_by_id(
+                Path("export.json"),
+                "msg-123",
+                conversation_id="conv-456"
+            )
+
+            # Search all conversations (slower)
+            result = adapter.get_message_by_id(
+                Path("export.json"),
+                "msg-123"
+            )
+
+            if result:
+                message, conversation = result
+                print(f"Message: {message.content}")
+                print(f"From conversation: {conversation.title}")
+            else:
+                print("Message not found")
+            ```
+
+        Performance:
+            - With conversation_id:
+                - Time: O(N) where N = conversations until match
+                - Memory: O(1) for file size, O(M) for single conversation
+            - Without conversation_id:
+                - Time: O(log K) with a sidecar index (K = indexed message IDs),
+                  otherwise O(N*M) where N = conversations, M = messages per
+                  conversation
+                - Memory: O(1) for file size, O(M) for single conversation
+            - Early termination: Returns immediately when match found
+
+        Design Notes:
+            Returns tuple instead of just Message to provide conversation context
+            (title, timestamps, other messages) which is valuable for CLI display
+            and analysis workflows.
+        """
+        # If conversation_id provided, search only that conversation
+        if conversation_id is not None:
+            conv = self.get_conversation_by_id(file_path, conversation_id)
+            if conv is not None:
+                msg = conv.get_message_by_id(message_id)
+                if msg is not None:
+                    return (msg, conv)
+            return None
+
+        # Sidecar index: parse only the conversations listing the message ID
+        index = ExportIndex.load(file_path)
+        if index is not None and index.provider == self.provider:
+            for conv in self._parse_indexed(index, index.find_message(message_id)):
+                msg = conv.get_message_by_id(message_id)
+                if msg is not None:
+                    return (msg, conv)
+            return None
+
+        # Otherwise, stream all conversations and search each
+        for conv in self.stream_conversations(file_path):
+            msg = conv.get_message_by_id(message_id)
+            if msg is not None:
+                return (msg, conv)
+
+        # Not found in any conversation
+        return None
+
+    @abstractmethod
+    def _parse_conversation(
+        self, raw_data: dict[str, Any], *, trusted: bool = False
+    ) -> Conversation:
+        """Parse one raw conversation object, raising on malformed entries."""
+
+    @abstractmethod
+    def _parse_or_skip(
+        self,
+        raw_conversation: dict[str, Any],
+        prefilter: SearchQuery | None = None,
+        *,
+        trusted: bool = False,
+    ) -> ParseOutcome:
+        """Parse one raw conversation, reporting malformed entries instead of raising."""
+
+    @abstractmethod
+    def _parse_header_or_skip(
+        self, raw_conversation: dict[str, Any], prefilter: SearchQuery | None = None
+    ) -> HeaderOutcome:
+        """Read one conversation header, reporting malformed entries instead of raising."""
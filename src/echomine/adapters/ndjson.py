@@ -0,0 +1,762 @@
+"""Normalized NDJSON conversation files: writer and adapter.
+
+Provider exports are one deeply nested JSON array: every read scans the whole
+document and maps each provider-specific entry (OpenAI node trees, Claude
+content blocks) onto the models again. The normalized format stores the
+result of that work once: one ``Conversation`` per line, in the
+``model_dump_json`` schema, written by ``write_ndjson`` (CLI:
+``echomine normalize``). Reading it back with ``NDJSONAdapter``:
+
+    - Each line is validated straight into a Conversation by pydantic-core
+      (``Conversation.model_validate_json``); no provider mapping runs
+    - Lines are independent, so parallel reading cuts the file at newlines
+      (``iter_parallel_lines``) instead of scanning the array first
+    - ID lookups memory-map the file and read only each line's leading
+      ``"id"`` field; message lookups search the mapping for the message's
+      ``"id":`` bytes. Only matching lines are parsed, so no sidecar index
+      is needed
+
+Header line:
+    ``write_ndjson(..., provider=...)`` first writes one header line,
+    ``{"echomine_ndjson": 1, "provider": "claude"}``, recording the export's
+    provider. Readers skip it; ID lookups use it to match IDs the way the
+    provider adapter does (case-insensitively for Claude). Files without a
+    header match IDs case-sensitively.
+
+Metadata numbers:
+    The adapters keep decimal numbers from a raw export as ``Decimal``
+    (ijson's type), which ``model_dump_json`` writes as strings. The writer
+    writes them as JSON numbers instead; they are read back as ``float``.
+
+Constitution Compliance:
+    - Principle VIII: Memory-efficient streaming (one line at a time)
+    - Principle VI: Strict typing with mypy --strict
+    - Principle I: Library-first (importable writer and adapter)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import re
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from decimal import Decimal
+from functools import partial
+from pathlib import Path
+from typing import Any, TypeVar
+
+import ijson
+import pydantic_core
+from pydantic import ValidationError as PydanticValidationError
+
+from echomine.adapters.parallel import HeaderOutcome, ParseOutcome, Skipped, iter_parallel_lines
+from echomine.exceptions import ParseError
+from echomine.export.bulk import BulkExportFormat, ConversationWriter, ExportedFile
+from echomine.index.export_index import IndexProvider
+from echomine.models.conversation import Conversation, ConversationHeader
+from echomine.models.message import Message
+from echomine.models.protocols import OnSkipCallback, ProgressCallback
+from echomine.models.search import SearchQuery, SearchResult
+from echomine.search.pipeline import search_conversations
+from echomine.utils.id_lookup import IdResolver
+
+
+# Module logger for operational visibility
+logger = logging.getLogger(__name__)
+
+# Object produced by a parse hook (Conversation or ConversationHeader)
+_T = TypeVar("_T")
+
+# Bytes read by is_ndjson() to find the first non-whitespace character
+_SNIFF_BYTES = 4096
+
+# Top-level keys is_ndjson() requires of a normalized line, and those of raw
+# provider entries (OpenAI, Claude) it rejects
+_NORMALIZED_KEYS = frozenset({"id", "messages"})
+_PROVIDER_KEYS = frozenset({"mapping", "chat_messages"})
+
+# "id" is the first Conversation field, so written lines start with it
+_LEADING_ID = re.compile(rb'\s*\{\s*"id"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+NDJSON_FORMAT_VERSION = 1
+"""Version written to the header line (see the module docstring)."""
+
+# First key of the header line; conversation lines start with "id" instead
+_HEADER_KEY = "echomine_ndjson"
+_HEADER = re.compile(rb'\s*\{\s*"echomine_ndjson"\s*:')
+
+# Bytes of the first line read for the header
+_HEADER_BYTES = 256
+
+
+def dump_conversation(conversation: Conversation) -> bytes:
+    """Serialize a conversation as one NDJSON line (without the newline).
+
+    Args:
+        conversation: Parsed conversation
+
+    Returns:
+        ``model_dump_json`` output, with ``Decimal`` metadata values written
+        as numbers rather than strings
+    """
+    return pydantic_core.to_json(_plain_numbers(conversation.model_dump()))
+
+
+def _plain_numbers(value: Any) -> Any:
+    """Replace ``Decimal`` values with floats, recursively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _plain_numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain_numbers(item) for item in value]
+    return value
+
+
+def write_ndjson(
+    conversations: Iterable[Conversation],
+    destination: Path,
+    *,
+    provider: IndexProvider | None = None,
+) -> int:
+    """Write conversations to a normalized NDJSON file, one per line.
+
+    The file is written to a temporary file and atomically moved into place.
+
+    Args:
+        conversations: Conversations to write (e.g. an adapter's
+            ``stream_conversations``), in the order they should appear
+        destination: Path of the NDJSON file (conventionally ``*.ndjson``)
+        provider: Provider of the export the conversations come from,
+            recorded in a header line so lookups match IDs like that
+            provider's adapter (None: no header line)
+
+    Returns:
+        Number of conversations written
+
+    Raises:
+        OSError: If the destination cannot be written
+
+    Example:
+        ```python
+        adapter = ClaudeAdapter()
+        write_ndjson(
+            adapter.stream_conversations(Path("export.json")),
+            Path("export.ndjson"),
+            provider="claude",
+        )
+        for conv in NDJSONAdapter().stream_conversations(Path("export.ndjson")):
+            print(conv.title)
+        ```
+
+    Memory Complexity: O(1) for the number of conversations
+    """
+    count = 0
+    tmp_path = destination.with_name(f".{destination.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            if provider is not None:
+                header = {_HEADER_KEY: NDJSON_FORMAT_VERSION, "provider": provider}
+                f.write(pydantic_core.to_json(header) + b"\n")
+            for conversation in conversations:
+                f.write(dump_conversation(conversation) + b"\n")
+                count += 1
+        tmp_path.replace(destination)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return count
+
+
+def is_ndjson(file_path: Path) -> bool:
+    """Tell whether a file is normalized NDJSON rather than an export.
+
+    Raw exports are JSON arrays (or ZIP/compressed files), and a single
+    exported conversation is one JSON object too, so the first value's
+    top-level keys decide: it is either the header line or a ``Conversation``
+    dump (it has ``id`` and ``messages``), not a provider entry (``mapping``
+    for OpenAI, ``chat_messages`` for Claude). Only the first value is read.
+
+    Args:
+        file_path: Path to check
+
+    Returns:
+        True if the first JSON value is the header line or an object in the
+        normalized schema
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file cannot be read
+    """
+    with file_path.open("rb") as f:
+        if not f.read(_SNIFF_BYTES).lstrip().startswith(b"{"):
+            return False
+        f.seek(0)
+        keys: set[str] = set()
+        try:
+            for prefix, event, value in ijson.parse(f, multiple_values=True):
+                if prefix:
+                    continue
+                if event == "map_key":
+                    keys.add(value)
+                elif event == "end_map":
+                    break
+            else:
+                return False
+        except ijson.JSONError:
+            return False
+    if _HEADER_KEY in keys:
+        return True
+    return keys >= _NORMALIZED_KEYS and not keys & _PROVIDER_KEYS
+
+
+def ndjson_provider(file_path: Path) -> IndexProvider | None:
+    """Read the export provider recorded in a normalized file's header line.
+
+    Args:
+        file_path: Path to NDJSON file
+
+    Returns:
+        "openai" or "claude", or None if the file has no header line
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file cannot be read
+    """
+    with file_path.open("rb") as f:
+        return _header_provider(f.readline(_HEADER_BYTES))
+
+
+class NDJSONAdapter:
+    """Adapter for normalized NDJSON files written by ``write_ndjson``.
+
+    Implements the same interface as the provider adapters, so a normalized
+    file can stand in for the export it was written from: conversations,
+    headers, search results and lookups are equal to the provider adapter's
+    (apart from metadata numbers, see the module docstring).
+
+    Example:
+        ```python
+        from pathlib import Path
+        from echomine.adapters import NDJSONAdapter
+
+        adapter = NDJSONAdapter()
+        for conversation in adapter.stream_conversations(Path("export.ndjson"), workers=8):
+            print(f"{conversation.title}: {conversation.message_count} messages")
+
+        conv = adapter.get_conversation_by_id(Path("export.ndjson"), "a1b2c3d4")
+        ```
+    """
+
+    def stream_conversations(
+        self,
+        file_path: Path,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[Conversation]:
+        """Stream conversations from a normalized NDJSON file.
+
+        Blank lines are ignored; lines that are not valid conversations are
+        skipped with a warning (and reported via on_skip).
+
+        Args:
+            file_path: Path to NDJSON file
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed lines skipped (FR-107)
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+
+        Yields:
+            Conversation objects, in file order unless ordered=False
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a line is not a JSON object (not an NDJSON file)
+
+        Memory Complexity: O(1) for file size, O(N) for single conversation
+        Time Complexity: O(M / workers) where M = total conversations in file
+        """
+        yield from self._stream_parsed(
+            file_path,
+            self._parse_or_skip,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def stream_conversation_headers(
+        self,
+        file_path: Path,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[ConversationHeader]:
+        """Stream conversation metadata without building any Message.
+
+        Args:
+            file_path: Path to NDJSON file
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed lines skipped (FR-107)
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+
+        Yields:
+            ConversationHeader for each well-formed line
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a line is not a JSON object (not an NDJSON file)
+        """
+        yield from self._stream_parsed(
+            file_path,
+            self._parse_header_or_skip,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            workers=workers,
+            ordered=ordered,
+        )
+
+    def export_all(
+        self,
+        file_path: Path,
+        out_dir: Path,
+        *,
+        format: BulkExportFormat = "markdown",
+        include_metadata: bool = True,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        sync: bool = False,
+    ) -> Iterator[ExportedFile]:
+        """Write every conversation to its own file, reading the NDJSON file once.
+
+        See ``OpenAIAdapter.export_all``; output files are identical.
+
+        Args:
+            file_path: Path to NDJSON file
+            out_dir: Output directory (created if missing)
+            format: "markdown" (default) or "json"
+            include_metadata: Markdown only - include YAML frontmatter and
+                message IDs (default: True)
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed lines skipped (FR-107)
+            workers: Number of processes (1 = export in this process)
+            sync: Skip conversations the manifest in ``out_dir`` lists as up
+                to date
+
+        Yields:
+            ExportedFile for each conversation
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a line is not a JSON object (not an NDJSON file)
+            OSError: If out_dir or a file cannot be written
+        """
+        out_dir.mkdir(parents=True, exist_ok=True)
+        writer = ConversationWriter(
+            self._parse_or_skip,
+            out_dir,
+            format,
+            include_metadata=include_metadata,
+            header=self._parse_header_or_skip if sync else None,
+        )
+        yield from self._stream_parsed(
+            file_path,
+            writer,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            workers=workers,
+            ordered=False,
+        )
+
+    def _stream_parsed(
+        self,
+        file_path: Path,
+        parse: Callable[[bytes, SearchQuery | None], _T | Skipped | None],
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        workers: int = 1,
+        ordered: bool = True,
+    ) -> Iterator[_T]:
+        """Run a parse hook over every non-blank line, handling skips and progress.
+
+        Args:
+            file_path: Path to NDJSON file
+            parse: ``_parse_or_skip``, ``_parse_header_or_skip`` or a writer
+            progress_callback: Optional callback invoked every 100 conversations (FR-069)
+            on_skip: Optional callback invoked when malformed lines skipped (FR-107)
+            workers: Number of parsing processes (1 = parse in this process)
+            ordered: With workers > 1, yield in file order (False: as parsed)
+
+        Yields:
+            Parsed objects, in file order unless ordered=False
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a line is not a JSON object
+        """
+        with ExitStack() as stack:
+            outcomes: Iterator[_T | Skipped | None]
+            if workers > 1:
+                # Workers open the file themselves
+                outcomes = iter_parallel_lines(parse, file_path, workers=workers, ordered=ordered)
+            else:
+                f = stack.enter_context(file_path.open("rb"))
+                outcomes = (parse(line, None) for line in f if line.strip())
+            count = 0
+
+            for outcome in outcomes:
+                if outcome is None:
+                    continue
+
+                if isinstance(outcome, Skipped):
+                    # Graceful degradation: skip malformed lines (FR-281)
+                    if on_skip:
+                        on_skip(outcome.conversation_id, outcome.reason)
+                    logger.warning(
+                        "Skipped malformed conversation",
+                        extra={
+                            "conversation_id": outcome.conversation_id,
+                            "reason": outcome.reason,
+                        },
+                    )
+                    continue
+
+                count += 1
+
+                # Invoke progress callback every 100 items (FR-069)
+                if progress_callback and count % 100 == 0:
+                    progress_callback(count)
+
+                yield outcome
+
+    def _parse_or_skip(self, line: bytes, prefilter: SearchQuery | None = None) -> ParseOutcome:
+        """Parse one line, reporting malformed lines instead of raising.
+
+        Shared by serial streaming, lookups and the worker processes of
+        parallel streaming. ``prefilter`` is accepted for the parse hook
+        signature only: search applies every filter to the parsed
+        conversation, which is as cheap as checking the line.
+
+        Args:
+            line: One NDJSON line
+            prefilter: Ignored
+
+        Returns:
+            Conversation, Skipped for malformed lines (FR-281), or None for
+            the header line
+
+        Raises:
+            ParseError: If the line is not a JSON object
+        """
+        if _HEADER.match(line):
+            return None
+        _require_object(line)
+        try:
+            return Conversation.model_validate_json(line)
+        except PydanticValidationError as e:
+            return Skipped(_line_id(line) or "unknown", f"Validation error: {e}")
+
+    def _parse_header_or_skip(
+        self, line: bytes, prefilter: SearchQuery | None = None
+    ) -> HeaderOutcome:
+        """Read one conversation header, reporting malformed lines instead of raising.
+
+        Header-only counterpart of ``_parse_or_skip``: messages are decoded
+        as plain JSON and counted, never validated.
+
+        Args:
+            line: One NDJSON line
+            prefilter: Ignored
+
+        Returns:
+            ConversationHeader, Skipped for malformed lines (FR-281), or None
+            for the header line
+
+        Raises:
+            ParseError: If the line is not a JSON object
+        """
+        if _HEADER.match(line):
+            return None
+        _require_object(line)
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            return Skipped(_line_id(line) or "unknown", f"Invalid JSON: {e}")
+        messages = data.get("messages")
+        try:
+            # JSON timestamps are ISO strings; the rest stays strictly typed
+            return ConversationHeader.model_validate(
+                {
+                    "id": data.get("id"),
+                    "title": data.get("title"),
+                    "created_at": data.get("created_at"),
+                    "updated_at": data.get("updated_at"),
+                    "message_count": len(messages) if isinstance(messages, list) else 0,
+                },
+                strict=False,
+            )
+        except PydanticValidationError as e:
+            conversation_id = data.get("id")
+            return Skipped(
+                conversation_id if isinstance(conversation_id, str) else "unknown",
+                f"Validation error: {e}",
+            )
+
+    def search(
+        self,
+        file_path: Path,
+        query: SearchQuery,
+        *,
+        progress_callback: ProgressCallback | None = None,
+        on_skip: OnSkipCallback | None = None,
+        low_memory: bool = False,
+        workers: int = 1,
+    ) -> Iterator[SearchResult[Conversation]]:
+        """Search conversations with BM25 relevance ranking.
+
+        Runs the provider adapters' pipeline (``echomine.search.pipeline``)
+        over the conversations of the NDJSON file, so results equal
+        searching the original export.
+
+        Args:
+            file_path: Path to NDJSON file
+            query: SearchQuery with keywords, title_filter, limit
+            progress_callback: Optional callback invoked per conversation processed
+            on_skip: Optional callback for malformed lines
+            low_memory: Read the file twice instead of holding every candidate
+            workers: Number of processes parsing the file
+
+        Yields:
+            SearchResult[Conversation] with ranked results and scores
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a line is not a JSON object
+        """
+        yield from search_conversations(
+            partial(self._stream_conversations, file_path, workers=workers),
+            query,
+            progress_callback=progress_callback,
+            on_skip=on_skip,
+            low_memory=low_memory,
+        )
+
+    def _stream_conversations(
+        self,
+        file_path: Path,
+        *,
+        on_skip: OnSkipCallback | None = None,
+        prefilter: SearchQuery | None = None,
+        workers: int = 1,
+    ) -> Iterator[Conversation]:
+        """Stream conversations for search.
+
+        ``prefilter`` is ignored: search checks every filter on the parsed
+        conversation, which is as cheap as checking the line.
+        """
+        yield from self._stream_parsed(
+            file_path, self._parse_or_skip, on_skip=on_skip, workers=workers
+        )
+
+    def get_conversation_by_id(
+        self,
+        file_path: Path,
+        conversation_id: str,
+    ) -> Conversation | None:
+        """Retrieve specific conversation by ID (FR-155).
+
+        Accepts full IDs and prefixes of at least 4 characters, as the
+        provider adapters do. Matching is case-insensitive for files whose
+        header line records a Claude export, case-sensitive otherwise.
+
+        Args:
+            file_path: Path to NDJSON file
+            conversation_id: ID (full or prefix >=4 chars) of conversation to retrieve
+
+        Returns:
+            Conversation object if found, None otherwise (FR-155)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If the matching line is not a JSON object
+            AmbiguousIdError: If a prefix matches several conversations
+
+        Performance:
+            - Time: O(file size) byte scan; only the matching line is parsed
+            - Memory: O(1) for file size (memory-mapped), O(M) for single conversation
+        """
+        return self.get_conversations_by_ids(file_path, [conversation_id]).get(conversation_id)
+
+    def get_conversations_by_ids(
+        self,
+        file_path: Path,
+        conversation_ids: Iterable[str],
+    ) -> dict[str, Conversation]:
+        """Retrieve several conversations by ID in a single pass over the file.
+
+        The file is memory-mapped and each line's leading ``"id"`` field is
+        read in place; lines matching no requested ID are never parsed, and
+        the scan stops once every full ID has been found. IDs match like
+        ``get_conversation_by_id``.
+
+        Args:
+            file_path: Path to NDJSON file
+            conversation_ids: IDs (full or prefix >=4 chars) of conversations
+                to retrieve (duplicates ignored)
+
+        Returns:
+            Requested ID -> Conversation, in request order; IDs that were not
+            found are absent
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a matching line is not a JSON object
+            AmbiguousIdError: If a prefix matches several conversations
+        """
+        requested = list(dict.fromkeys(conversation_ids))
+        if not requested:
+            return {}
+
+        with _mapped(file_path) as view:
+            # Claude IDs match case-insensitively, as in ClaudeAdapter
+            provider = _header_provider(view[:_HEADER_BYTES])
+            resolver: IdResolver[Conversation] = IdResolver(
+                requested, case_sensitive=provider != "claude"
+            )
+            for start, end in _line_spans(view):
+                conversation_id = _line_id(view, start, end)
+                if conversation_id is None or not resolver.wants(conversation_id):
+                    continue
+                outcome = self._parse_or_skip(view[start:end])
+                if isinstance(outcome, Conversation):
+                    resolver.add(outcome.id, outcome)
+                    if resolver.done:
+                        break  # Early termination: every full ID found
+
+        return resolver.resolve()
+
+    def get_message_by_id(
+        self,
+        file_path: Path,
+        message_id: str,
+        *,
+        conversation_id: str | None = None,
+    ) -> tuple[Message, Conversation] | None:
+        """Retrieve specific message by ID with parent conversation context.
+
+        Without a conversation hint, the memory-mapped file is searched for
+        the message's ``"id":`` bytes (as ``write_ndjson`` writes them) and
+        only the lines containing them are parsed.
+
+        Args:
+            file_path: Path to NDJSON file
+            message_id: ID of message to retrieve
+            conversation_id: Optional conversation ID to scope search
+
+        Returns:
+            Tuple of (Message, Conversation) if found, None otherwise
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ParseError: If a candidate line is not a JSON object
+        """
+        if conversation_id is not None:
+            conv = self.get_conversation_by_id(file_path, conversation_id)
+            if conv is not None:
+                msg = conv.get_message_by_id(message_id)
+                if msg is not None:
+                    return (msg, conv)
+            return None
+
+        needle = b'"id":' + pydantic_core.to_json(message_id)
+        with _mapped(file_path) as view:
+            position = view.find(needle)
+            while position != -1:
+                start = view.rfind(b"\n", 0, position) + 1
+                end = view.find(b"\n", position)
+                if end == -1:
+                    end = len(view)
+                outcome = self._parse_or_skip(view[start:end])
+                if isinstance(outcome, Conversation):
+                    msg = outcome.get_message_by_id(message_id)
+                    if msg is not None:
+                        return (msg, outcome)
+                position = view.find(needle, end)
+
+        return None
+
+
+def _header_provider(head: bytes) -> IndexProvider | None:
+    """Read the provider from a file's first bytes, if they hold the header line."""
+    if _HEADER.match(head) is None:
+        return None
+    end = head.find(b"\n")
+    try:
+        header = json.loads(head[:end] if end != -1 else head)
+    except ValueError:
+        return None
+    provider = header.get("provider")
+    if provider == "claude":
+        return "claude"
+    if provider == "openai":
+        return "openai"
+    return None
+
+
+def _require_object(line: bytes) -> None:
+    """Reject a line that cannot be a normalized conversation at all."""
+    if not line.lstrip().startswith(b"{"):
+        raise ParseError(
+            f"Expected one JSON object per line, got {line[:40]!r}. "
+            "Normalized files are written by 'echomine normalize'."
+        )
+
+
+@contextmanager
+def _mapped(file_path: Path) -> Iterator[mmap.mmap | bytes]:
+    """Memory-map a file read-only (an empty file maps to ``b""``)."""
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # mmap rejects empty files
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            yield view
+
+
+def _line_spans(view: mmap.mmap | bytes) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) of every line, excluding the newline."""
+    start = 0
+    size = len(view)
+    while start < size:
+        end = view.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield start, end
+        start = end + 1
+
+
+def _line_id(view: mmap.mmap | bytes, start: int = 0, end: int | None = None) -> str | None:
+    """Read a line's conversation ID, from its leading ``"id"`` field if present."""
+    if end is None:
+        end = len(view)
+    match = _LEADING_ID.match(view, start, end)
+    try:
+        if match is not None:
+            conversation_id = json.loads(b'"' + match.group(1) + b'"')
+        else:
+            # Not written by write_ndjson (or not a conversation): decode it all
+            data = json.loads(view[start:end])
+            conversation_id = data.get("id") if isinstance(data, dict) else None
+    except ValueError:
+        return None
+    return conversation_id if isinstance(conversation_id, str) else None
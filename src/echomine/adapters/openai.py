@@ -47,35 +47,27 @@ Performance Targets (T028):
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterator
+from collections.abc import Callable
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import Any, Literal
 
-import ijson
 from pydantic import ValidationError as PydanticValidationError
 
-from echomine.exceptions import ParseError
+from echomine.adapters.base import JSONArrayAdapter
+from echomine.adapters.parallel import HeaderOutcome, ParseOutcome, Skipped
 from echomine.models.content_types import OPENAI_CATEGORY_MAP, ContentTypeCategory
-from echomine.models.conversation import Conversation
+from echomine.models.conversation import Conversation, ConversationHeader
 from echomine.models.image import ImageRef
 from echomine.models.message import Message
-from echomine.models.protocols import OnSkipCallback, ProgressCallback
-from echomine.models.search import SearchQuery, SearchResult
-from echomine.search.ranking import (
-    BM25Scorer,
-    all_terms_present,
-    exclude_filter,
-    phrase_matches,
-)
-from echomine.search.snippet import extract_snippet_from_messages
+from echomine.models.search import SearchQuery
+from echomine.models.trusted import trusted_conversation, trusted_message
 
 
 # Module logger for operational visibility
 logger = logging.getLogger(__name__)
 
 
-class OpenAIAdapter:
+class OpenAIAdapter(JSONArrayAdapter):
     """Adapter for streaming OpenAI conversation exports.
 
     This adapter uses ijson to stream-parse OpenAI ChatGPT export files with
@@ -120,578 +112,127 @@ class OpenAIAdapter:
         - SC-001: Memory usage <1GB for large exports
     """
 
-    def stream_conversations(
-        self,
-        file_path: Path,
-        *,
-        progress_callback: ProgressCallback | None = None,
-        on_skip: OnSkipCallback | None = None,
-    ) -> Iterator[Conversation]:
-        """Stream conversations from OpenAI export file with O(1) memory.
-
-        This method uses ijson to incrementally parse the export file, yielding
-        Conversation objects one at a time. The entire file is NEVER loaded into
-        memory - only the current conversation being parsed.
-
-        Streaming Behavior:
-            - Returns iterator (lazy evaluation)
-            - Conversations yielded in file order
-            - Parser state bounded by ijson buffer (~50MB)
-            - No buffering between conversations
-
-        Error Handling:
-            - Invalid JSON: Raises ParseError immediately
-            - Missing file: Raises FileNotFoundError
-            - Schema violations: Raises ValidationError (Pydantic)
-            - Empty array: Succeeds, yields zero conversations
-
-        Args:
-            file_path: Path to OpenAI export JSON file
-            progress_callback: Optional callback invoked every 100 conversations (FR-069)
-            on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+    provider = "openai"
+    _id_field = "id"
+    _case_sensitive_ids = True
+    _malformed_errors = (PydanticValidationError,)
+    _json_error = (
+        "JSON parsing failed: {error}. "
+        "Verify export file '{file_path}' is valid JSON from OpenAI ChatGPT."
+    )
 
-        Yields:
-            Conversation objects parsed from export
-
-        Raises:
-            FileNotFoundError: If file doesn't exist
-            ParseError: If JSON is malformed (syntax errors)
-            ValidationError: If conversation data violates schema
-
-        Example:
-            ```python
-            # Basic usage
-            adapter = OpenAIAdapter()
-            for conv in adapter.stream_conversations(Path("export.json")):
-                print(f"Conversation: {conv.title}")
-
-            # Handle errors
-            try:
-                conversations = list(adapter.stream_conversations(path))
-            except ParseError as e:
-                print(f"Invalid export format: {e}")
-            except ValidationError as e:
-                print(f"Schema violation: {e}")
-            ```
-
-        Memory Complexity: O(1) for file size, O(N) for single conversation
-        Time Complexity: O(M) where M = total conversations in file
-        """
-        # Open file in binary mode for ijson (required for streaming)
-        # FileNotFoundError raised naturally by open() if file missing
-        try:
-            with open(file_path, "rb") as f:
-                # Stream top-level array items using ijson
-                # Memory: O(1) - ijson maintains bounded buffer
-                # Each "item" is a complete conversation object
-                try:
-                    items = ijson.items(f, "item")
-                    count = 0  # Track for progress_callback (FR-069)
-
-                    for raw_conversation in items:
-                        # Parse individual conversation
-                        # Memory: O(N) where N = messages in this conversation
-                        try:
-                            conversation = self._parse_conversation(raw_conversation)
-                            count += 1
-
-                            # Invoke progress callback every 100 items (FR-069)
-                            if progress_callback and count % 100 == 0:
-                                progress_callback(count)
-
-                            yield conversation
-                        except PydanticValidationError as e:
-                            # Graceful degradation: skip malformed entries (FR-281)
-                            conversation_id = raw_conversation.get("id", "unknown")
-                            reason = f"Validation error: {e}"
-
-                            # Invoke on_skip callback if provided (FR-107)
-                            if on_skip:
-                                on_skip(conversation_id, reason)
-
-                            # Log warning but continue processing (FR-281)
-                            logger.warning(
-                                "Skipped malformed conversation",
-                                extra={
-                                    "conversation_id": conversation_id,
-                                    "reason": reason,
-                                },
-                            )
-                            continue  # Skip this conversation, process next
-
-                except ijson.JSONError as e:
-                    # ijson.JSONError raised for malformed JSON
-                    # Convert to our ParseError for consistent error handling (FR-039, FR-041)
-                    raise ParseError(
-                        f"JSON parsing failed: {e}. "
-                        f"Verify export file '{file_path}' is valid JSON from OpenAI ChatGPT."
-                    ) from e
-
-        except FileNotFoundError:
-            # Re-raise FileNotFoundError without wrapping
-            # This is a standard Python exception, no conversion needed
-            raise
-
-    def search(
+    def _parse_or_skip(
         self,
-        file_path: Path,
-        query: SearchQuery,
+        raw_conversation: dict[str, Any],
+        prefilter: SearchQuery | None = None,
         *,
-        progress_callback: ProgressCallback | None = None,
-        on_skip: OnSkipCallback | None = None,
-    ) -> Iterator[SearchResult[Conversation]]:
-        """Search conversations with BM25 relevance ranking.
-
-        Algorithm:
-        1. Stream all conversations (O(1) memory per conversation)
-        2. Apply title filter if specified (metadata-only, fast)
-        3. Apply date range filter if specified
-        4. Build corpus and calculate BM25 scores
-        5. Rank by relevance (descending)
-        6. Apply limit if specified
-        7. Yield SearchResult objects one at a time
-
-        Args:
-            file_path: Path to OpenAI export file
-            query: SearchQuery with keywords, title_filter, limit
-            progress_callback: Optional callback invoked per conversation processed
-            on_skip: Optional callback for malformed entries
-
-        Yields:
-            SearchResult[Conversation] with ranked results and scores
-
-        Raises:
-            FileNotFoundError: If file doesn't exist
-            ParseError: If JSON is malformed
-
-        Performance:
-            - Memory: O(N) where N = matching conversations
-            - Time: O(M) where M = total conversations in file
-            - Early termination: Not implemented (stream all for BM25)
-
-        Example:
-            ```python
-            adapter = OpenAIAdapter()
-            query = SearchQuery(keywords=["python"], limit=10)
-
-            for result in adapter.search(Path("export.json"), query):
-                print(f"{result.score:.2f}: {result.conversation.title}")
-            ```
-        """
-        # Stream conversations and apply filters
-        # Type: (conversation, filtered_messages) for snippet extraction
-        conversations: list[tuple[Conversation, list[Message]]] = []
-        corpus_texts: list[str] = []
-
-        count = 0
-        for conv in self.stream_conversations(file_path):
-            count += 1
-
-            # Progress callback (every 100 items per FR-069)
-            if progress_callback and count % 100 == 0:
-                progress_callback(count)
-
-            # Title filter (fast metadata check)
-            if query.has_title_filter():
-                assert query.title_filter is not None  # Type narrowing
-                if query.title_filter.lower() not in conv.title.lower():
-                    continue  # Skip non-matching titles
-
-            # Date range filter
-            if query.has_date_filter():
-                conv_date = conv.created_at.date()
-
-                # Check from_date (inclusive)
-                if query.from_date is not None and conv_date < query.from_date:
-                    continue
-
-                # Check to_date (inclusive)
-                if query.to_date is not None and conv_date > query.to_date:
-                    continue
-
-            # FR-006: Message count filter (streaming approach for O(1) memory)
-            if query.has_message_count_filter():
-                msg_count = conv.message_count
-
-                # Check min_messages (inclusive)
-                if query.min_messages is not None and msg_count < query.min_messages:
-                    continue
-
-                # Check max_messages (inclusive)
-                if query.max_messages is not None and msg_count > query.max_messages:
-                    continue
-
-            # FR-018: Filter messages by role before text aggregation
-            if query.role_filter is not None:
-                filtered_messages = [m for m in conv.messages if m.role == query.role_filter]
-            else:
-                filtered_messages = list(conv.messages)
-
-            # Skip conversations with no messages matching the role filter
-            if query.role_filter is not None and not filtered_messages:
-                continue
-
-            # Build corpus text
-            # When role_filter is set, only search in filtered message content (not title)
-            # When role_filter is None, include title for metadata-based matching
-            if query.role_filter is not None:
-                conv_text = " ".join(m.content for m in filtered_messages)
-            else:
-                conv_text = f"{conv.title} " + " ".join(m.content for m in filtered_messages)
-
-            conversations.append((conv, filtered_messages))
-            corpus_texts.append(conv_text)
-
-        # Final progress callback
-        if progress_callback:
-            progress_callback(count)
-
-        # Handle empty results
-        if not conversations:
-            return  # Empty iterator
-
-        # Calculate average document length for BM25
-        # Use regex tokenization to match BM25Scorer's tokenization
-        import re
-
-        def tokenize_for_length(text: str) -> int:
-            """Count tokens using same method as BM25Scorer."""
-            text_lower = text.lower()
-            count = len(re.findall(r"[a-z0-9]+", text_lower))
-            count += len(re.findall(r"[^\W\d_a-z]", text_lower))
-            return count
-
-        avg_doc_length = sum(tokenize_for_length(text) for text in corpus_texts) / len(corpus_texts)
-
-        # Initialize BM25 scorer
-        scorer = BM25Scorer(corpus=corpus_texts, avg_doc_length=avg_doc_length)
-
-        # Score all conversations
-        # Type: (conversation, score, matched_message_ids, filtered_messages)
-        scored_conversations: list[tuple[Conversation, float, list[str], list[Message]]] = []
-
-        for (conv, filtered_msgs), conv_text in zip(conversations, corpus_texts):
-            score = 0.0
-            matched_message_ids: list[str] = []
-            has_keyword_match = False
-            has_phrase_match = False
-
-            # Check keyword matches (BM25 scoring)
-            if query.has_keyword_search():
-                assert query.keywords is not None  # Type narrowing
-
-                # FR-009: match_mode='all' requires ALL keywords present
-                if query.match_mode == "all":
-                    if all_terms_present(conv_text, query.keywords, scorer):
-                        # All keywords present - calculate score
-                        score = scorer.score(conv_text, query.keywords)
-                        matched_message_ids = self._find_matched_messages(
-                            filtered_msgs, query.keywords
-                        )
-                        has_keyword_match = True
-                    # else: keywords don't all match, but may still match phrases (checked below)
-                else:
-                    # Default 'any' mode: regular BM25 scoring
-                    score = scorer.score(conv_text, query.keywords)
-                    matched_message_ids = self._find_matched_messages(filtered_msgs, query.keywords)
-                    if score > 0.0:
-                        has_keyword_match = True
-
-            # Check phrase matches (exact substring matching)
-            # FR-002: Multiple phrases use OR logic
-            # FR-004: Phrases can be combined with keywords (OR logic)
-            if query.has_phrase_search():
-                assert query.phrases is not None  # Type narrowing
-                if phrase_matches(conv_text, query.phrases):
-                    has_phrase_match = True
-                    # If phrase matches but no keyword score, use 1.0
-                    if score == 0.0:
-                        score = 1.0
-                    # Find messages that match the phrases (from filtered messages only)
-                    for message in filtered_msgs:
-                        if phrase_matches(message.content, query.phrases):
-                            if message.id not in matched_message_ids:
-                                matched_message_ids.append(message.id)
-
-            # Skip conversations with no matches (neither keyword nor phrase)
-            if not has_keyword_match and not has_phrase_match:
-                # If no keywords or phrases specified, include all (title/date filter only)
-                if not query.has_keyword_search() and not query.has_phrase_search():
-                    score = 1.0
-                else:
-                    continue
-
-            # FR-014: Apply exclude filter after matching, before ranking
-            if query.has_exclude_keywords():
-                assert query.exclude_keywords is not None  # Type narrowing
-                if exclude_filter(conv_text, query.exclude_keywords, scorer):
-                    continue  # Skip conversations containing excluded terms
-
-            scored_conversations.append((conv, score, matched_message_ids, filtered_msgs))
-
-        # Handle no results after filtering
-        if not scored_conversations:
-            return  # Empty iterator
-
-        # Sort conversations based on query parameters (FR-043-048)
-        # FR-043a: Tie-breaking by conversation_id (ascending, lexicographic)
-        # FR-043b: Stable sort (Python's sort() is stable by default)
-        def get_sort_key(
-            item: tuple[Conversation, float, list[str], list[Message]],
-        ) -> tuple[float | str | int, str]:
-            """Get sort key based on query sort_by parameter.
-
-            Returns tuple for multi-level sorting:
-            - Primary: sort_by field value
-            - Secondary: conversation_id (tie-breaker, FR-043a)
-
-            FR-046a: For date sort, use updated_at or fall back to created_at if None
-            FR-047: Title sort is case-insensitive
-            """
-            conv, score, _, _ = item
-
-            primary_key: float | str | int
-            if query.sort_by == "score":
-                # Sort by BM25 relevance score
-                primary_key = score
-            elif query.sort_by == "date":
-                # FR-046a: Use updated_at if present, otherwise created_at
-                sort_date = conv.updated_at if conv.updated_at is not None else conv.created_at
-                # Convert datetime to timestamp for numeric sorting
-                primary_key = sort_date.timestamp()
-            elif query.sort_by == "title":
-                # FR-047: Case-insensitive title sort
-                primary_key = conv.title.lower()
-            else:  # query.sort_by == "messages"
-                # Sort by message count
-                primary_key = conv.message_count
-
-            # FR-043a: Tie-breaking by conversation_id (ascending)
-            return (primary_key, conv.id)
-
-        # Apply sorting with reverse based on sort_order (FR-044)
-        reverse_sort = query.sort_order == "desc"
-        scored_conversations.sort(key=get_sort_key, reverse=reverse_sort)
-
-        # Normalize scores to [0.0, 1.0] range using BM25 normalization formula (FR-319)
-        # Formula: score_normalized = score_raw / (score_raw + 1)
-        # This ensures consistent score interpretation across queries
-        scored_conversations = [
-            (conv, score / (score + 1.0) if score > 0 else 0.0, msg_ids, msgs)
-            for conv, score, msg_ids, msgs in scored_conversations
-        ]
-
-        # Apply limit (always positive integer per SearchQuery validation)
-        scored_conversations = scored_conversations[: query.limit]
-
-        # Yield SearchResult objects with snippet extraction (FR-021-025)
-        for conv, score, matched_message_ids, filtered_msgs in scored_conversations:
-            # Build keywords list for snippet extraction
-            snippet_keywords: list[str] = []
-            if query.keywords:
-                snippet_keywords.extend(query.keywords)
-            if query.phrases:
-                snippet_keywords.extend(query.phrases)
-
-            # Extract snippet from matched messages
-            snippet, _ = extract_snippet_from_messages(
-                filtered_msgs,
-                snippet_keywords,
-                matched_message_ids,
-            )
-
-            yield SearchResult[Conversation](
-                conversation=conv,
-                score=score,
-                matched_message_ids=matched_message_ids,
-                snippet=snippet,
-            )
-
-    def get_conversation_by_id(
-        self,
-        file_path: Path,
-        conversation_id: str,
-    ) -> Conversation | None:
-        """Retrieve specific conversation by UUID (FR-155, FR-217, FR-356).
+        trusted: bool = False,
+    ) -> ParseOutcome:
+        """Parse one raw conversation, reporting malformed entries instead of raising.
 
-        Uses streaming search for memory efficiency - O(N) time, O(1) memory.
-        For large files with frequent ID lookups, consider building an index.
+        Shared by serial streaming and the worker processes of parallel
+        streaming, so both apply the same prefilter and skip rules.
 
         Args:
-            file_path: Path to OpenAI export JSON file
-            conversation_id: UUID of conversation to retrieve
+            raw_conversation: Raw conversation dict from export
+            prefilter: Optional SearchQuery whose header filters are pushed down
+            trusted: Build models without Pydantic validation
 
         Returns:
-            Conversation object if found, None otherwise (FR-155)
-
-        Raises:
-            FileNotFoundError: If file doesn't exist
-            ParseError: If JSON is malformed
-
-        Example:
-            ```python
-            adapter = OpenAIAdapter()
-            conv = adapter.get_conversation_by_id(
-                Path("export.json"),
-                "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
-            )
-            if conv:
-                print(f"Found: {conv.title}")
-            else:
-                print("Conversation not found")
-            ```
-
-        Performance:
-            - Time: O(N) where N = conversations in file (streaming search)
-            - Memory: O(1) for file size, O(M) for single conversation
-            - Early termination: Returns immediately when match found
+            Conversation, Skipped for malformed entries (FR-281), or None
+            if the prefilter excludes the conversation
         """
-        # Stream conversations and return first match
-        for conversation in self.stream_conversations(file_path):
-            if conversation.id == conversation_id:
-                return conversation
-
-        # Not found - return None per FR-155
-        return None
+        # Predicate pushdown: reject on header fields before parsing
+        if prefilter is not None and self._header_excluded(raw_conversation, prefilter):
+            return None
 
-    def get_message_by_id(
-        self,
-        file_path: Path,
-        message_id: str,
-        *,
-        conversation_id: str | None = None,
-    ) -> tuple[Message, Conversation] | None:
-        """Retrieve specific message by UUID with parent conversation context.
+        # Parse individual conversation
+        # Memory: O(N) where N = messages in this conversation
+        try:
+            return self._parse_conversation(raw_conversation, trusted=trusted)
+        except PydanticValidationError as e:
+            return Skipped(raw_conversation.get("id", "unknown"), f"Validation error: {e}")
 
-        Searches for a message by ID, optionally scoped to a specific conversation
-        for performance optimization. Returns both the message and its parent
-        conversation to provide full context.
+    def _parse_header_or_skip(
+        self, raw_conversation: dict[str, Any], prefilter: SearchQuery | None = None
+    ) -> HeaderOutcome:
+        """Read one conversation header, reporting malformed entries instead of raising.
 
-        Uses streaming search for memory efficiency - O(1) memory usage.
+        Header-only counterpart of ``_parse_or_skip``.
 
         Args:
-            file_path: Path to OpenAI export JSON file
-            message_id: UUID of message to retrieve
-            conversation_id: Optional conversation UUID to scope search (performance hint)
+            raw_conversation: Raw conversation dict from export
+            prefilter: Optional SearchQuery whose header filters are pushed down
 
         Returns:
-            Tuple of (Message, Conversation) if found, None otherwise.
-            The Conversation is the parent containing the message.
-
-        Raises:
-            FileNotFoundError: If file doesn't exist
-            ParseError: If JSON is malformed
-
-        Example:
-            ```python
-            adapter = OpenAIAdapter()
-
-            # Search with conversation hint (faster)
-            result = adapter.get_message_by_id(
-                Path("export.json"),
-                "msg-123",
-                conversation_id="conv-456"
-            )
-
-            # Search all conversations (slower)
-            result = adapter.get_message_by_id(
-                Path("export.json"),
-                "msg-123"
-            )
-
-            if result:
-                message, conversation = result
-                print(f"Message: {message.content}")
-                print(f"From conversation: {conversation.title}")
-            else:
-                print("Message not found")
-            ```
-
-        Performance:
-            - With conversation_id:
-                - Time: O(N) where N = conversations until match
-                - Memory: O(1) for file size, O(M) for single conversation
-            - Without conversation_id:
-                - Time: O(N*M) where N = conversations, M = messages per conversation
-                - Memory: O(1) for file size, O(M) for single conversation
-            - Early termination: Returns immediately when match found
-
-        Design Notes:
-            Returns tuple instead of just Message to provide conversation context
-            (title, timestamps, other messages) which is valuable for CLI display
-            and analysis workflows.
+            ConversationHeader, Skipped for malformed entries (FR-281), or None
+            if the prefilter excludes the conversation
         """
-        # If conversation_id provided, search only that conversation
-        if conversation_id is not None:
-            conv = self.get_conversation_by_id(file_path, conversation_id)
-            if conv is not None:
-                msg = conv.get_message_by_id(message_id)
-                if msg is not None:
-                    return (msg, conv)
+        if prefilter is not None and self._header_excluded(raw_conversation, prefilter):
             return None
 
-        # Otherwise, stream all conversations and search each
-        for conv in self.stream_conversations(file_path):
-            msg = conv.get_message_by_id(message_id)
-            if msg is not None:
-                return (msg, conv)
-
-        # Not found in any conversation
-        return None
-
-    def _find_matched_messages(self, messages: list[Message], keywords: list[str]) -> list[str]:
-        """Find message IDs containing any of the keywords.
+        try:
+            conversation_id, title, created_at, updated_at = self._parse_header_fields(
+                raw_conversation
+            )
+            # Message nodes are counted, not parsed (navigation nodes have no message)
+            mapping = raw_conversation.get("mapping") or {}
+            message_count = sum(1 for node in mapping.values() if node.get("message") is not None)
+            return ConversationHeader(
+                id=conversation_id,
+                title=title,
+                created_at=created_at,
+                updated_at=updated_at,
+                message_count=message_count,
+            )
+        except PydanticValidationError as e:
+            return Skipped(raw_conversation.get("id", "unknown"), f"Validation error: {e}")
 
-        Uses word-boundary matching to find keywords as complete tokens,
-        not just substrings. This matches the BM25 tokenization approach.
+    def _header_excluded(self, raw_data: dict[str, Any], query: SearchQuery) -> bool:
+        """Check if a raw conversation is excluded by the query's header filters.
 
-        Tokenizes keywords the same way as BM25Scorer to handle multi-character
-        keywords (e.g., Chinese "编程" -> ["编", "程"]).
+        Reads only top-level fields (title, create_time) and counts message
+        nodes in mapping without parsing them. Fields that are missing or
+        malformed are treated as unknown so the conversation still reaches
+        _parse_conversation and is skipped (and reported) there as usual.
 
         Args:
-            messages: List of messages to search (pre-filtered by role if applicable)
-            keywords: List of keywords to match (will be tokenized)
+            raw_data: Raw conversation dict from OpenAI export
+            query: SearchQuery whose header filters apply
 
         Returns:
-            List of message IDs containing keyword matches
-
-        Example:
-            ```python
-            messages = [msg1, msg2, msg3]
-            matched_ids = self._find_matched_messages(messages, ["python", "java"])
-            # Returns IDs of messages containing "python" OR "java"
-            ```
+            True if the conversation can be dropped without parsing
         """
-        import re
-
-        matched_ids: list[str] = []
+        title = raw_data.get("title")
 
-        # Tokenize keywords (same as BM25Scorer)
-        keyword_tokens: list[str] = []
-        for keyword in keywords:
-            kw_lower = keyword.lower()
-            # Latin tokens
-            keyword_tokens.extend(re.findall(r"[a-z0-9]+", kw_lower))
-            # Non-Latin tokens (CJK characters)
-            keyword_tokens.extend(re.findall(r"[^\W\d_a-z]", kw_lower))
-
-        for message in messages:
-            # Tokenize message content using same method as BM25Scorer
-            content_lower = message.content.lower()
-            message_tokens: list[str] = []
-
-            # Latin tokens
-            message_tokens.extend(re.findall(r"[a-z0-9]+", content_lower))
-            # Non-Latin tokens (CJK characters)
-            message_tokens.extend(re.findall(r"[^\W\d_a-z]", content_lower))
-
-            # Check if any keyword token is in the message tokens
-            if any(kw_token in message_tokens for kw_token in keyword_tokens):
-                matched_ids.append(message.id)
+        created_at: datetime | None = None
+        create_time = raw_data.get("create_time")
+        if create_time is not None and query.has_date_filter():
+            try:
+                created_at = datetime.fromtimestamp(float(create_time), tz=UTC)
+            except (TypeError, ValueError, OverflowError, OSError):
+                created_at = None
+
+        # Upper bound: malformed message nodes are dropped during parsing
+        max_message_count: int | None = None
+        mapping = raw_data.get("mapping", {})
+        if query.min_messages is not None and isinstance(mapping, dict):
+            try:
+                max_message_count = sum(
+                    1 for node in mapping.values() if node.get("message") is not None
+                )
+            except AttributeError:
+                max_message_count = None
 
-        return matched_ids
+        return query.excludes_header(
+            title=title if isinstance(title, str) else None,
+            created_at=created_at,
+            max_message_count=max_message_count,
+        )
 
-    def _parse_conversation(self, raw_data: dict[str, Any]) -> Conversation:
+    def _parse_conversation(
+        self, raw_data: dict[str, Any], *, trusted: bool = False
+    ) -> Conversation:
         """Parse raw OpenAI conversation dict to Conversation model.
 
         Transforms OpenAI export structure to unified Conversation model:
@@ -699,9 +240,11 @@ class OpenAIAdapter:
         2. Convert Unix timestamps to UTC datetime
         3. Normalize nested fields (author.role, content.parts)
         4. Build Message and Conversation objects with Pydantic validation
+           (trusted: without it, see ``echomine.models.trusted``)
 
         Args:
             raw_data: Raw conversation dict from OpenAI export
+            trusted: Build models without Pydantic validation
 
         Returns:
             Validated Conversation object
@@ -718,8 +261,51 @@ class OpenAIAdapter:
         messages = self._extract_messages_from_mapping(
             raw_data.get("mapping", {}),
             default_model_slug=default_model_slug,
+            trusted=trusted,
         )
 
+        conversation_id, title, created_at, updated_at = self._parse_header_fields(raw_data)
+
+        seen: set[str] = set()
+        models_used: list[str] = []
+        for msg in messages:
+            if msg.model is not None and msg.model not in seen:
+                seen.add(msg.model)
+                models_used.append(msg.model)
+
+        # Trusted exports skip Pydantic validation
+        build: Callable[..., Conversation] = trusted_conversation if trusted else Conversation
+        return build(
+            id=conversation_id,
+            title=title,
+            created_at=created_at,
+            updated_at=updated_at,
+            messages=messages,
+            models_used=models_used,
+            metadata={
+                "moderation_results": raw_data.get("moderation_results", []),
+                "current_node": raw_data.get("current_node"),
+            },
+        )
+
+    def _parse_header_fields(
+        self, raw_data: dict[str, Any]
+    ) -> tuple[str, str, datetime, datetime | None]:
+        """Extract id, title and timestamps from a raw OpenAI conversation.
+
+        Shared by full parsing and header-only streaming so both reject the
+        same entries.
+
+        Args:
+            raw_data: Raw conversation dict from OpenAI export
+
+        Returns:
+            (conversation_id, title, created_at, updated_at)
+
+        Raises:
+            PydanticValidationError: If id, title, create_time or update_time
+                is missing, or create_time is null
+        """
         # Validate required fields exist before attempting conversion
         # Missing fields will cause KeyError, which we catch and re-raise as PydanticValidationError
         try:
@@ -773,31 +359,14 @@ class OpenAIAdapter:
             datetime.fromtimestamp(float(update_time), tz=UTC) if update_time is not None else None
         )
 
-        seen: set[str] = set()
-        models_used: list[str] = []
-        for msg in messages:
-            if msg.model is not None and msg.model not in seen:
-                seen.add(msg.model)
-                models_used.append(msg.model)
-
-        return Conversation(
-            id=conversation_id,
-            title=title,
-            created_at=created_at,
-            updated_at=updated_at,
-            messages=messages,
-            models_used=models_used,
-            metadata={
-                "moderation_results": raw_data.get("moderation_results", []),
-                "current_node": raw_data.get("current_node"),
-            },
-        )
+        return conversation_id, title, created_at, updated_at
 
     def _extract_messages_from_mapping(
         self,
         mapping: dict[str, Any],
         *,
         default_model_slug: str | None = None,
+        trusted: bool = False,
     ) -> list[Message]:
         """Extract messages from OpenAI mapping tree structure.
 
@@ -814,6 +383,8 @@ class OpenAIAdapter:
 
         Args:
             mapping: OpenAI mapping dict (node_id -> node_object)
+            default_model_slug: Model assumed for assistant messages without one
+            trusted: Build messages without Pydantic validation
 
         Returns:
             List of Message objects sorted by timestamp
@@ -837,6 +408,7 @@ class OpenAIAdapter:
                     message_data,
                     node_data,
                     default_model_slug=default_model_slug,
+                    trusted=trusted,
                 )
                 messages.append(message)
             except (KeyError, ValueError, PydanticValidationError) as e:
@@ -857,6 +429,7 @@ class OpenAIAdapter:
         node_data: dict[str, Any],
         *,
         default_model_slug: str | None = None,
+        trusted: bool = False,
     ) -> Message:
         """Parse OpenAI message dict to Message model.
 
@@ -869,6 +442,8 @@ class OpenAIAdapter:
         Args:
             message_data: Message object from OpenAI export
             node_data: Parent node object (contains parent field)
+            default_model_slug: Model assumed for assistant messages without one
+            trusted: Build the Message without Pydantic validation
 
         Returns:
             Validated Message object
@@ -956,7 +531,8 @@ class OpenAIAdapter:
         if model is None and role == "assistant" and default_model_slug is not None:
             model = default_model_slug
 
-        return Message(
+        build: Callable[..., Message] = trusted_message if trusted else Message
+        return build(
             id=message_data["id"],
             content=content,
             role=role,
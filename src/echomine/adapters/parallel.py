@@ -0,0 +1,275 @@
+"""Multi-process parsing of the top-level conversation array.
+
+Parsing an export is CPU-bound (ijson decoding plus Pydantic validation), so
+a single process leaves most cores idle. This module splits the export into
+batches of element byte ranges and parses them in worker processes:
+
+    - The main process runs the byte-level scanner (``iter_element_spans``)
+      to find element boundaries and groups spans into ~1 MiB batches
+    - Each worker re-reads its byte ranges from the file, parses them with
+      ``read_element`` and hands each raw conversation to the adapter's
+      ``_parse_or_skip`` (or ``_parse_header_or_skip``)
+    - A compressed ZIP member or gzip/bz2/xz file cannot be read at an
+      offset without decompressing everything before it (packed files can,
+      block by block), so for those the main process
+      reads each batch's bytes in one forward pass and sends them instead
+    - Results come back as ``Conversation`` (or ``ConversationHeader``) /
+      ``Skipped`` / ``None`` (excluded by prefilter); the adapter keeps
+      progress counting, skip logging and ``on_skip`` in the main process,
+      so callback semantics match serial streaming exactly
+
+Normalized NDJSON files (one conversation per line, see
+``echomine.adapters.ndjson``) need no scanner: ``iter_parallel_lines`` cuts
+the file into byte ranges ending at newlines, and each worker reads its range
+and parses it line by line.
+
+Memory is bounded by the number of in-flight batches (``workers * 2``), not
+by file size.
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (bounded queue of batches)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import contextlib
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+
+from echomine.index.export_index import parse_element, read_element
+from echomine.index.scanner import ElementSpan, iter_element_spans
+from echomine.models.conversation import Conversation, ConversationHeader
+from echomine.models.search import SearchQuery
+from echomine.utils.archive import open_export, supports_random_access
+
+
+# Target size of one unit of work sent to a worker (amortizes IPC overhead)
+PARALLEL_BATCH_BYTES = 1024 * 1024
+
+# Batches queued per worker before the main process waits for results
+_BATCHES_PER_WORKER = 2
+
+
+class Skipped(NamedTuple):
+    """A malformed conversation the adapter declined to parse.
+
+    Attributes:
+        conversation_id: Provider ID of the conversation (or "unknown")
+        reason: Human-readable validation failure
+    """
+
+    conversation_id: str
+    reason: str
+
+
+# Outcome of parsing one raw conversation: None means excluded by prefilter
+ParseOutcome = Conversation | Skipped | None
+
+# Outcome of reading one conversation header
+HeaderOutcome = ConversationHeader | Skipped | None
+
+# Adapter hook turning a raw conversation (dict, or NDJSON line bytes) into a
+# ParseOutcome or HeaderOutcome
+ParseHook = Callable[[Any, SearchQuery | None], Any]
+
+
+def iter_parallel(
+    parse: ParseHook,
+    file_path: Path,
+    *,
+    workers: int,
+    ordered: bool = True,
+    prefilter: SearchQuery | None = None,
+    batch_bytes: int = PARALLEL_BATCH_BYTES,
+) -> Iterator[Any]:
+    """Parse every conversation of an export in worker processes.
+
+    Args:
+        parse: Picklable parse hook (an adapter's bound ``_parse_or_skip`` or
+            ``_parse_header_or_skip``)
+        file_path: Path to export JSON file, ZIP archive or compressed file
+        workers: Number of worker processes
+        ordered: Yield outcomes in file order (False: as batches complete)
+        prefilter: Optional SearchQuery forwarded to ``parse``
+        batch_bytes: Approximate number of export bytes per batch
+
+    Yields:
+        One ``parse`` result per top-level array element
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ParseError: If the export is not a valid JSON array of objects
+
+    Memory Complexity: O(workers * batch_bytes)
+    Time Complexity: O(file size / workers) for parsing, O(file size) to scan
+    """
+    pool = _spawn_pool(workers)
+    max_pending = workers * _BATCHES_PER_WORKER
+    pending: deque[Future[list[Any]]] = deque()
+    try:
+        with contextlib.ExitStack() as stack:
+            f = stack.enter_context(open_export(file_path))
+            # Compressed archive member: read batches here, in file order
+            reader = (
+                None
+                if supports_random_access(file_path)
+                else stack.enter_context(open_export(file_path))
+            )
+            for batch in _batch_spans(iter_element_spans(f), batch_bytes):
+                if reader is None:
+                    future = pool.submit(_parse_batch, parse, file_path, batch, prefilter)
+                else:
+                    elements = [(start, _read_span(reader, start, end)) for start, end in batch]
+                    future = pool.submit(
+                        _parse_elements, parse, str(file_path), elements, prefilter
+                    )
+                pending.append(future)
+                if len(pending) >= max_pending:
+                    yield from _next_results(pending, ordered)
+        while pending:
+            yield from _next_results(pending, ordered)
+    finally:
+        # Early exit (consumer stopped iterating, or an error): drop queued work
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_parallel_lines(
+    parse: ParseHook,
+    file_path: Path,
+    *,
+    workers: int,
+    ordered: bool = True,
+    prefilter: SearchQuery | None = None,
+    batch_bytes: int = PARALLEL_BATCH_BYTES,
+) -> Iterator[Any]:
+    """Parse every non-blank line of an NDJSON file in worker processes.
+
+    Args:
+        parse: Picklable parse hook taking one line (bytes, without the
+            trailing newline)
+        file_path: Path to a plain (uncompressed) NDJSON file
+        workers: Number of worker processes
+        ordered: Yield outcomes in file order (False: as batches complete)
+        prefilter: Optional SearchQuery forwarded to ``parse``
+        batch_bytes: Approximate number of file bytes per batch
+
+    Yields:
+        One ``parse`` result per non-blank line
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+
+    Memory Complexity: O(workers * batch_bytes)
+    Time Complexity: O(file size / workers)
+    """
+    pool = _spawn_pool(workers)
+    max_pending = workers * _BATCHES_PER_WORKER
+    pending: deque[Future[list[Any]]] = deque()
+    try:
+        for start, end in _line_ranges(file_path, batch_bytes):
+            pending.append(pool.submit(_parse_lines, parse, file_path, start, end, prefilter))
+            if len(pending) >= max_pending:
+                yield from _next_results(pending, ordered)
+        while pending:
+            yield from _next_results(pending, ordered)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _spawn_pool(workers: int) -> ProcessPoolExecutor:
+    """Create the worker pool."""
+    # Spawned (not forked) workers: safe when the caller runs threads, such
+    # as a CLI progress display, and identical across platforms
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def _line_ranges(file_path: Path, batch_bytes: int) -> Iterator[tuple[int, int]]:
+    """Cut a file into byte ranges of at least ``batch_bytes``, each ending after a newline."""
+    with file_path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return  # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            start = 0
+            while start < size:
+                newline = view.find(b"\n", min(start + batch_bytes, size) - 1)
+                end = size if newline == -1 else newline + 1
+                yield start, end
+                start = end
+
+
+def _batch_spans(spans: Iterable[ElementSpan], batch_bytes: int) -> Iterator[list[tuple[int, int]]]:
+    """Group consecutive element spans into batches of about ``batch_bytes``."""
+    batch: list[tuple[int, int]] = []
+    size = 0
+    for span in spans:
+        batch.append((span.start, span.end))
+        size += span.end - span.start
+        if size >= batch_bytes:
+            yield batch
+            batch = []
+            size = 0
+    if batch:
+        yield batch
+
+
+def _next_results(pending: deque[Future[list[Any]]], ordered: bool) -> Iterator[Any]:
+    """Wait for the oldest batch (ordered) or any finished batches (unordered)."""
+    if ordered:
+        yield from pending.popleft().result()
+        return
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in [future for future in pending if future in done]:
+        pending.remove(future)
+        yield from future.result()
+
+
+def _parse_batch(
+    parse: ParseHook,
+    file_path: Path,
+    spans: list[tuple[int, int]],
+    prefilter: SearchQuery | None,
+) -> list[Any]:
+    """Worker entry point: parse one batch of element byte ranges."""
+    with open_export(file_path) as f:
+        return [parse(read_element(f, start, end), prefilter) for start, end in spans]
+
+
+def _parse_elements(
+    parse: ParseHook,
+    name: str,
+    elements: list[tuple[int, bytes]],
+    prefilter: SearchQuery | None,
+) -> list[Any]:
+    """Worker entry point: parse one batch of (offset, element bytes)."""
+    return [
+        parse(parse_element(data, start=start, name=name), prefilter) for start, data in elements
+    ]
+
+
+def _parse_lines(
+    parse: ParseHook,
+    file_path: Path,
+    start: int,
+    end: int,
+    prefilter: SearchQuery | None,
+) -> list[Any]:
+    """Worker entry point: parse the lines in one byte range of an NDJSON file."""
+    with file_path.open("rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    return [parse(line, prefilter) for line in data.split(b"\n") if line.strip()]
+
+
+def _read_span(f: IO[bytes], start: int, end: int) -> bytes:
+    """Read an element's bytes (seeking forward only, for compressed members)."""
+    f.seek(start)
+    return f.read(end - start)
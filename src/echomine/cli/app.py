@@ -34,8 +34,12 @@ import typer
 
 from echomine import __version__
 from echomine.cli.commands.export import export_conversation
+from echomine.cli.commands.export_all import export_all
 from echomine.cli.commands.get import get_app
+from echomine.cli.commands.index import index_app
 from echomine.cli.commands.list import list_conversations
+from echomine.cli.commands.normalize import normalize_command
+from echomine.cli.commands.pack import pack_command
 from echomine.cli.commands.search import search_conversations
 from echomine.cli.commands.stats import stats_command
 
@@ -66,6 +70,12 @@ app = typer.Typer(
   [dim]# Export conversation to markdown[/dim]
   [green]echomine export[/green] export.json [yellow]<conversation-id>[/yellow] [cyan]--output[/cyan] chat.md
 
+  [dim]# Build sidecar index for fast ID lookups[/dim]
+  [green]echomine index build[/green] export.json
+
+  [dim]# Compress an export, keeping indexed lookups fast[/dim]
+  [green]echomine pack[/green] export.zip
+
 [dim]For more help:[/dim] [green]echomine COMMAND --help[/green]""",
     add_completion=False,  # Disable shell completion for simplicity
     no_args_is_help=False,  # Handled manually in callback to support --version
@@ -111,7 +121,17 @@ app.command(name="search", help="[cyan]Search[/cyan] conversations by keywords")
 app.command(name="export", help="[cyan]Export[/cyan] conversation to markdown format")(
     export_conversation
 )
+app.command(
+    name="export-all", help="[cyan]Export[/cyan] every conversation to a directory of files"
+)(export_all)
 app.command(name="stats", help="[cyan]Display[/cyan] export-level statistics")(stats_command)
+app.add_typer(index_app, name="index")  # Hierarchical command group (build)
+app.command(name="pack", help="[cyan]Compress[/cyan] an export into a seekable packed file")(
+    pack_command
+)
+app.command(
+    name="normalize", help="[cyan]Normalize[/cyan] an export to NDJSON, one conversation per line"
+)(normalize_command)
 
 
 def _configure_encoding() -> None:
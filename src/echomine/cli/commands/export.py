@@ -36,25 +36,36 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated, Literal, cast
 
 import typer
 from rich.console import Console
 
-from echomine.cli.provider import get_adapter
+from echomine.adapters.ndjson import NDJSONAdapter, is_ndjson
+from echomine.cli.provider import ProviderType, get_adapter
+from echomine.exceptions import AmbiguousIdError, ParseError
 from echomine.export import MarkdownExporter
+from echomine.index import find_conversations_by_title
 
 
 # Console for stderr output (progress, success messages, errors)
 console = Console(stderr=True)
 
 
-def _find_conversation_by_title(file_path: Path, title: str) -> tuple[str, str] | None:
+def _find_conversation_by_title(
+    file_path: Path, title: str, provider: str | None = None
+) -> tuple[str, str] | None:
     """Find conversation ID and exact title by title substring match.
 
+    Streams only the id and title of each conversation (or reads the title
+    column of a current sidecar index), so memory does not grow with the
+    export size.
+
     Args:
-        file_path: Path to OpenAI export JSON file
+        file_path: Path to OpenAI or Claude export JSON file
         title: Title substring to search for (case-insensitive)
+        provider: Export provider ("openai" or "claude"); None recognizes
+            the format per conversation
 
     Returns:
         Tuple of (conversation_id, exact_title) if single match found,
@@ -66,25 +77,24 @@ def _find_conversation_by_title(file_path: Path, title: str) -> tuple[str, str]
         json.JSONDecodeError: If file is not valid JSON
         PermissionError: If file cannot be read
     """
-    with open(file_path, encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Handle both list and single conversation
-    conversations = data if isinstance(data, list) else [data]
-
-    # Find all conversations with matching title (case-insensitive substring)
-    matches: list[tuple[str, str]] = []
-    title_lower = title.lower()
-
-    for conv in conversations:
-        if not isinstance(conv, dict):
-            continue
-
-        conv_title = conv.get("title", "")
-        conv_id = conv.get("id") or conv.get("conversation_id")
-
-        if conv_id and title_lower in conv_title.lower():
-            matches.append((conv_id, conv_title))
+    # An invalid --provider is reported when the adapter is created
+    known: ProviderType | None = None
+    if provider is not None and provider.lower() in ("openai", "claude"):
+        known = cast(ProviderType, provider.lower())
+    try:
+        if known is None and is_ndjson(file_path):
+            # Normalized file: headers are read line by line, no scanner
+            title_lower = title.lower()
+            matches = [
+                (header.id, header.title)
+                for header in NDJSONAdapter().stream_conversation_headers(file_path)
+                if title_lower in header.title.lower()
+            ]
+        else:
+            matches = find_conversations_by_title(file_path, title, provider=known)
+    except ParseError as e:
+        # Reported by the command as "Invalid JSON in export file"
+        raise json.JSONDecodeError(str(e), "", 0) from e
 
     # Return results based on match count
     if len(matches) == 0:
@@ -211,7 +221,7 @@ def export_conversation(
         if title is not None:
             # Find conversation by title
             try:
-                result = _find_conversation_by_title(file_path, title)
+                result = _find_conversation_by_title(file_path, title, provider)
                 if result is None:
                     console.print(
                         f"[red]Error: No conversation found with title containing '{title}'[/red]"
@@ -232,6 +242,7 @@ def export_conversation(
             actual_conversation_id = conversation_id  # type: ignore[assignment]
 
         # Load conversation using appropriate adapter
+        # get_conversation_by_id seeks via the sidecar index when one exists
         adapter = get_adapter(provider, file_path)
         conversation = None
 
@@ -239,20 +250,20 @@ def export_conversation(
         if output:
             with console.status("[bold green]Finding conversation..."):
                 try:
-                    for conv in adapter.stream_conversations(file_path):
-                        if conv.id == actual_conversation_id:
-                            conversation = conv
-                            break
+                    conversation = adapter.get_conversation_by_id(file_path, actual_conversation_id)
+                except AmbiguousIdError as e:
+                    console.print(f"[red]Error: {e}[/red]")
+                    raise typer.Exit(code=1) from None
                 except Exception as e:
                     console.print(f"[red]Error: Failed to parse export file: {e}[/red]")
                     raise typer.Exit(code=1)
         else:
             # No progress indicator when writing to stdout (keeps stdout clean)
             try:
-                for conv in adapter.stream_conversations(file_path):
-                    if conv.id == actual_conversation_id:
-                        conversation = conv
-                        break
+                conversation = adapter.get_conversation_by_id(file_path, actual_conversation_id)
+            except AmbiguousIdError as e:
+                console.print(f"[red]Error: {e}[/red]")
+                raise typer.Exit(code=1) from None
             except Exception as e:
                 console.print(f"[red]Error: Failed to parse export file: {e}[/red]")
                 raise typer.Exit(code=1)
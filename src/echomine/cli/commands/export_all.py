@@ -0,0 +1,281 @@
+"""Export-all command implementation.
+
+This module implements the 'export-all' command, which writes every
+conversation of an export to its own markdown or JSON file in one pass over
+the export (supports OpenAI and Claude exports).
+
+Constitution Compliance:
+    - Principle I: Library-first (delegates to adapter.export_all)
+    - CHK031: stdout empty, progress/summary/errors on stderr
+    - CHK032: Exit codes 0 (success), 1 (error), 2 (invalid arguments)
+
+Command Contract:
+    Usage: echomine export-all <file_path> --out-dir DIR [OPTIONS]
+
+    Arguments:
+        file_path: Path to OpenAI or Claude export JSON file
+
+    Options:
+        --out-dir, -o: Output directory (created if missing)
+        --format, -f: Output format: markdown (default) or json
+        --jobs, -j: Number of processes (default: 1)
+        --no-metadata: Markdown only - disable YAML frontmatter and message IDs
+        --sync: Only re-render new or changed conversations (keeps a manifest)
+        --prune: With --sync, delete files of conversations no longer in the export
+        --provider, -p: Export provider (openai or claude). Auto-detected if omitted.
+
+    Exit Codes:
+        0: Success
+        1: File not found, permission denied, parse error, write error
+        2: Invalid arguments
+
+    Output Streams:
+        stdout: Empty
+        stderr: Progress indicator, summary with throughput, error messages
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Annotated, Literal
+
+import typer
+from rich.console import Console
+
+from echomine.cli.provider import AdapterType, get_adapter
+from echomine.exceptions import ParseError
+from echomine.export.bulk import sync_export
+
+
+# Console for stderr output (progress, summary, errors)
+console = Console(stderr=True)
+
+
+def export_all(
+    file_path: Annotated[
+        Path,
+        typer.Argument(
+            help="Path to export file",
+            exists=False,  # Manual check for exit code 1
+            file_okay=True,
+            dir_okay=False,
+            readable=False,  # Manual check for exit code 1
+            resolve_path=True,
+        ),
+    ],
+    *,
+    out_dir: Annotated[
+        Path,
+        typer.Option(
+            "--out-dir",
+            "-o",
+            help="Output directory (created if missing)",
+            file_okay=False,
+            dir_okay=True,
+            resolve_path=True,
+        ),
+    ],
+    format: Annotated[
+        Literal["markdown", "json"],
+        typer.Option(
+            "--format",
+            "-f",
+            help="Output format: markdown (default) or json",
+            case_sensitive=False,
+        ),
+    ] = "markdown",
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Parse, render and write in N processes (default: 1)",
+            min=1,
+        ),
+    ] = 1,
+    no_metadata: Annotated[
+        bool,
+        typer.Option(
+            "--no-metadata",
+            help="Disable YAML frontmatter and message IDs in markdown files (FR-033)",
+        ),
+    ] = False,
+    sync: Annotated[
+        bool,
+        typer.Option(
+            "--sync",
+            help="Only re-render new or changed conversations (tracked in a manifest)",
+        ),
+    ] = False,
+    prune: Annotated[
+        bool,
+        typer.Option(
+            "--prune",
+            help="With --sync: delete files of conversations no longer in the export",
+        ),
+    ] = False,
+    provider: Annotated[
+        str | None,
+        typer.Option(
+            "--provider",
+            "-p",
+            help="Export provider (openai or claude). Auto-detected if omitted.",
+            case_sensitive=False,
+        ),
+    ] = None,
+) -> None:
+    """[bold]Export every conversation[/bold] to its own markdown or JSON file.
+
+    Reads the export once and writes one file per conversation into
+    [cyan]--out-dir[/cyan], named after the title and ID
+    ([dim]python-asyncio-tutorial_conv-abc123.md[/dim]). Files are written
+    atomically, so re-running over the same directory replaces them.
+    With [cyan]--sync[/cyan], a manifest in the directory remembers what was
+    exported, and only new or changed conversations are rendered and written.
+
+    [bold]Examples:[/bold]
+        [dim]# Export everything as markdown[/dim]
+        $ [green]echomine export-all[/green] export.json [cyan]--out-dir[/cyan] notes/
+
+        [dim]# JSON files, 8 processes[/dim]
+        $ [green]echomine export-all[/green] export.json [cyan]-o[/cyan] json/ [cyan]-f[/cyan] json [cyan]-j[/cyan] 8
+
+        [dim]# Refresh a vault from a newer export, removing deleted conversations[/dim]
+        $ [green]echomine export-all[/green] export.json [cyan]-o[/cyan] notes/ [cyan]--sync --prune[/cyan]
+
+    [bold]Exit Codes:[/bold]
+        [green]0[/green]: Success
+        [red]1[/red]: File not found, permission denied, parse error, write error
+        [yellow]2[/yellow]: Invalid arguments
+    """
+    try:
+        if provider is not None and provider.lower() not in ("openai", "claude"):
+            console.print(
+                f"[red]Error: Invalid provider '{provider}'. Must be 'openai' or 'claude'.[/red]"
+            )
+            raise typer.Exit(code=2)
+
+        if prune and not sync:
+            console.print("[red]Error: --prune requires --sync[/red]")
+            raise typer.Exit(code=2)
+
+        # Check file exists (manual check for exit code 1)
+        if not file_path.exists():
+            console.print(f"[red]Error: File not found: {file_path}[/red]")
+            raise typer.Exit(code=1)
+
+        adapter = get_adapter(provider, file_path)
+
+        if sync:
+            _run_sync(
+                adapter,
+                file_path,
+                out_dir,
+                format=format,
+                include_metadata=not no_metadata,
+                prune=prune,
+                jobs=jobs,
+            )
+            return
+
+        written = 0
+        size = 0
+        skipped: list[str] = []
+
+        def record_skip(conversation_id: str, _reason: str) -> None:
+            skipped.append(conversation_id)
+
+        start = time.perf_counter()
+        with console.status("[bold green]Exporting conversations...") as status:
+            for exported in adapter.export_all(
+                file_path,
+                out_dir,
+                format=format,
+                include_metadata=not no_metadata,
+                on_skip=record_skip,
+                workers=jobs,
+            ):
+                written += 1
+                size += exported.size
+                if written % 100 == 0:
+                    status.update(f"[bold green]Exporting conversations... {written:,}")
+        elapsed = time.perf_counter() - start
+
+        rate = written / elapsed if elapsed > 0 else 0.0
+        console.print(
+            f"[green]✓ Exported {written:,} conversations ({size / 1_048_576:.1f} MiB) "
+            f"→ {out_dir} in {elapsed:.1f}s ({rate:,.0f} conversations/s)[/green]"
+        )
+        if skipped:
+            console.print(f"[yellow]Skipped {len(skipped):,} malformed conversations[/yellow]")
+
+    except FileNotFoundError:
+        console.print(f"[red]Error: File not found: {file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except PermissionError as e:
+        console.print(f"[red]Error: Permission denied: {e.filename or file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except (ParseError, ValueError) as e:
+        console.print(f"[red]Error: Invalid export file: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except OSError as e:
+        console.print(f"[red]Error: Failed to write file: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted by user[/yellow]")
+        raise typer.Exit(code=130) from None
+
+    except typer.Exit:
+        # Re-raise typer.Exit to preserve exit code
+        raise
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+
+def _run_sync(
+    adapter: AdapterType,
+    file_path: Path,
+    out_dir: Path,
+    *,
+    format: Literal["markdown", "json"],
+    include_metadata: bool,
+    prune: bool,
+    jobs: int,
+) -> None:
+    """Run an incremental sync and print its summary to stderr."""
+    skipped: list[str] = []
+
+    def record_skip(conversation_id: str, _reason: str) -> None:
+        skipped.append(conversation_id)
+
+    def update_progress(count: int) -> None:
+        status.update(f"[bold green]Syncing conversations... {count:,}")
+
+    start = time.perf_counter()
+    with console.status("[bold green]Syncing conversations...") as status:
+        result = sync_export(
+            file_path,
+            out_dir,
+            adapter=adapter,
+            format=format,
+            include_metadata=include_metadata,
+            prune=prune,
+            progress_callback=update_progress,
+            on_skip=record_skip,
+            workers=jobs,
+        )
+    elapsed = time.perf_counter() - start
+
+    console.print(
+        f"[green]✓ Synced {out_dir} in {elapsed:.1f}s: {result.written:,} written, "
+        f"{result.unchanged:,} unchanged, {result.pruned:,} pruned[/green]"
+    )
+    if skipped:
+        console.print(f"[yellow]Skipped {len(skipped):,} malformed conversations[/yellow]")
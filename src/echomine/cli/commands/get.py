@@ -12,13 +12,14 @@ Constitution Compliance:
 
 Command Contract:
     Usage:
-        echomine get conversation <file_path> <conversation_id> [OPTIONS]
+        echomine get conversation <file_path> <conversation_id>... [OPTIONS]
         echomine get message <file_path> <message_id> [OPTIONS]
         echomine get messages <file_path> <conversation_id> [OPTIONS]
 
     Arguments:
         file_path: Path to OpenAI export JSON file
-        conversation_id: Conversation ID to retrieve
+        conversation_id: Conversation ID(s) to retrieve (several: one pass
+            over the export, JSON output is an array)
         message_id: Message ID to retrieve
 
     Options (conversation):
@@ -56,14 +57,14 @@ from __future__ import annotations
 import json
 from collections import Counter
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
 from pydantic import ValidationError as PydanticValidationError
 from rich.console import Console
 
 from echomine.cli.formatters import get_role_color, is_rich_enabled
-from echomine.cli.provider import get_adapter
+from echomine.cli.provider import AdapterType, get_adapter
 from echomine.exceptions import ParseError
 from echomine.models.conversation import Conversation
 from echomine.models.message import Message
@@ -159,8 +160,13 @@ def _format_conversation_json(conversation: Conversation) -> str:
     Returns:
         JSON string with conversation data
     """
-    # Build conversation dict
-    conv_dict = {
+    # Pretty-print JSON with 2-space indentation
+    return json.dumps(_conversation_json_dict(conversation), indent=2, ensure_ascii=False) + "\n"
+
+
+def _conversation_json_dict(conversation: Conversation) -> dict[str, Any]:
+    """JSON record of a conversation, with its messages."""
+    return {
         "id": conversation.id,
         "title": conversation.title,
         "created_at": conversation.created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -178,9 +184,6 @@ def _format_conversation_json(conversation: Conversation) -> str:
         ],
     }
 
-    # Pretty-print JSON with 2-space indentation
-    return json.dumps(conv_dict, indent=2, ensure_ascii=False) + "\n"
-
 
 def _format_message_table(
     message: Message, conversation: Conversation, verbose: bool = False
@@ -621,10 +624,11 @@ def get_conversation(
             resolve_path=True,
         ),
     ],
-    conversation_id: Annotated[
-        str,
+    conversation_ids: Annotated[
+        list[str],
         typer.Argument(
-            help="Conversation ID to retrieve",
+            help="Conversation ID(s) to retrieve",
+            metavar="CONVERSATION_ID...",
         ),
     ],
     format: Annotated[
@@ -658,6 +662,8 @@ def get_conversation(
 
     Retrieves a specific conversation from an OpenAI export file by its ID
     and displays its metadata in either human-readable table format or JSON.
+    Several IDs are retrieved in a single pass over the export; JSON output
+    is then an array in the order given.
 
     [bold]Examples:[/bold]
         [dim]# Get conversation with table format (default)[/dim]
@@ -671,6 +677,9 @@ def get_conversation(
 
         [dim]# Pipe to jq[/dim]
         $ [green]echomine get conversation[/green] export.json [yellow]abc-123[/yellow] [cyan]-f[/cyan] json | jq '.messages[0].content'
+
+        [dim]# Several conversations, one pass over the export[/dim]
+        $ [green]echomine get conversation[/green] export.json [yellow]abc-123 def-456 ghi-789[/yellow] [cyan]-f[/cyan] json
     """
     try:
         # Validate format option
@@ -689,6 +698,13 @@ def get_conversation(
         # Retrieve conversation using library method with appropriate adapter
         adapter = get_adapter(provider, file_path)
 
+        if len(conversation_ids) > 1:
+            _get_conversations(
+                adapter, file_path, conversation_ids, format=format_lower, verbose=verbose
+            )
+            return
+        conversation_id = conversation_ids[0]
+
         # Show progress indicator (only for table format, not JSON)
         conversation: Conversation | None = None
         if format_lower == "table":
@@ -708,14 +724,8 @@ def get_conversation(
             output = _format_conversation_json(conversation)
             # Write JSON output to stdout (CHK031)
             print(output, end="")
-        # Check if Rich should be enabled (TTY detection)
-        elif is_rich_enabled(json_flag=(format_lower == "json")):
-            # Use Rich formatter for TTY
-            _format_conversation_rich(conversation, verbose=verbose)
         else:
-            # Use plain text formatter for pipes/redirects
-            output = _format_conversation_table(conversation, verbose=verbose)
-            print(output, end="")
+            _print_conversation_table(conversation, verbose=verbose)
 
         # Success - return normally for exit code 0
         return
@@ -752,6 +762,55 @@ def get_conversation(
         raise typer.Exit(code=1) from None
 
 
+def _get_conversations(
+    adapter: AdapterType,
+    file_path: Path,
+    conversation_ids: list[str],
+    *,
+    format: str,
+    verbose: bool,
+) -> None:
+    """Retrieve several conversations in one pass and print those found.
+
+    JSON output is an array in the order the IDs were given; table output
+    prints one table per conversation. IDs that were not found are reported
+    on stderr after the output, with exit code 1.
+
+    Raises:
+        typer.Exit: With code 1 if any ID was not found
+    """
+    if format == "table":
+        with console.status(f"[bold green]Searching for {len(conversation_ids)} conversations..."):
+            found = adapter.get_conversations_by_ids(file_path, conversation_ids)
+    else:
+        found = adapter.get_conversations_by_ids(file_path, conversation_ids)
+
+    if format == "json":
+        records = [_conversation_json_dict(conv) for conv in found.values()]
+        print(json.dumps(records, indent=2, ensure_ascii=False))
+    else:
+        for conversation in found.values():
+            _print_conversation_table(conversation, verbose=verbose)
+
+    missing = [cid for cid in dict.fromkeys(conversation_ids) if cid not in found]
+    for conversation_id in missing:
+        console.print(f"[red]Error: Conversation not found with ID: {conversation_id}[/red]")
+    if missing:
+        raise typer.Exit(code=1)
+
+
+def _print_conversation_table(conversation: Conversation, *, verbose: bool) -> None:
+    """Print a conversation as a Rich table (TTY) or plain text table (pipes)."""
+    # Check if Rich should be enabled (TTY detection)
+    if is_rich_enabled(json_flag=False):
+        # Use Rich formatter for TTY
+        _format_conversation_rich(conversation, verbose=verbose)
+    else:
+        # Use plain text formatter for pipes/redirects
+        output = _format_conversation_table(conversation, verbose=verbose)
+        print(output, end="")
+
+
 # ============================================================================
 # Subcommand: get message
 # ============================================================================
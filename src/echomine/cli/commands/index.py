@@ -0,0 +1,202 @@
+"""Index command implementation with subcommands for sidecar index management.
+
+This module implements the hierarchical 'index' command for building the
+sidecar indexes next to an export file. Once built, lookups by ID
+(``get conversation``, ``get message --conversation-id``, ``export``) seek
+directly to the conversation instead of streaming the whole export, and
+``search`` ranks from the inverted index instead of reparsing the export.
+
+Constitution Compliance:
+    - Principle I: Library-first (delegates to ExportIndex.build and the
+      adapters' build_search_index)
+    - CHK031: Data on stdout, progress/errors on stderr
+    - CHK032: Exit codes 0 (success), 1 (error), 2 (invalid arguments)
+
+Command Contract:
+    Usage:
+        echomine index build <file_path> [OPTIONS]
+
+    Arguments:
+        file_path: Path to OpenAI or Claude export JSON file
+
+    Options (build):
+        --provider, -p: Export provider (openai or claude). Auto-detected if omitted.
+        --search/--no-search: Also build the search index (default: --search)
+
+    Exit Codes:
+        0: Success (indexes written to <file_path>.emidx and <file_path>.emsearch)
+        1: File not found, permission denied, parse error
+        2: Invalid arguments
+
+    Output Streams:
+        stdout: Empty
+        stderr: Progress indicator, success message, error messages
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.ndjson import is_ndjson
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.cli.provider import ProviderType, detect_provider
+from echomine.exceptions import ParseError
+from echomine.index import ExportIndex
+from echomine.utils.archive import supports_random_access
+
+
+# Typer app for index subcommands
+index_app = typer.Typer(
+    name="index",
+    help="[cyan]Build[/cyan] sidecar indexes for fast lookups",
+    no_args_is_help=True,
+    rich_markup_mode="rich",
+)
+
+# Console for stderr output (progress, success messages, errors)
+console = Console(stderr=True)
+
+
+@index_app.command(name="build")
+def build_index(
+    file_path: Annotated[
+        Path,
+        typer.Argument(
+            help="Path to export file",
+            exists=False,  # Manual check for exit code 1
+            file_okay=True,
+            dir_okay=False,
+            readable=False,  # Manual check for exit code 1
+            resolve_path=True,
+        ),
+    ],
+    provider: Annotated[
+        str | None,
+        typer.Option(
+            "--provider",
+            "-p",
+            help="Export provider (openai or claude). Auto-detected if omitted.",
+            case_sensitive=False,
+        ),
+    ] = None,
+    search: Annotated[
+        bool,
+        typer.Option(
+            "--search/--no-search",
+            help="Also build the search index (<file>.emsearch) used by 'search'",
+        ),
+    ] = True,
+) -> None:
+    """[bold]Build sidecar indexes[/bold] for fast ID lookups and search.
+
+    Scans the export and writes [cyan]<file>.emidx[/cyan] next to it,
+    mapping every conversation ID to its byte range, and
+    [cyan]<file>.emsearch[/cyan], an inverted index with BM25 statistics.
+    Commands that look up conversations by ID, and [green]search[/green]
+    queries without [cyan]--phrase[/cyan], use the indexes automatically
+    while they are current; indexes for a modified export are ignored
+    until rebuilt.
+
+    [bold]Examples:[/bold]
+        [dim]# Build index (provider auto-detected)[/dim]
+        $ [green]echomine index build[/green] export.json
+
+        [dim]# Subsequent lookups seek directly to the conversation[/dim]
+        $ [green]echomine get conversation[/green] export.json [yellow]abc-123[/yellow]
+
+        [dim]# Searches rank from the index, parsing only returned conversations[/dim]
+        $ [green]echomine search[/green] export.json [cyan]-k[/cyan] python
+
+    [bold]Exit Codes:[/bold]
+        [green]0[/green]: Success
+        [red]1[/red]: File not found, permission denied, parse error
+        [yellow]2[/yellow]: Invalid arguments
+    """
+    try:
+        if provider is not None and provider.lower() not in ("openai", "claude"):
+            console.print(
+                f"[red]Error: Invalid provider '{provider}'. Must be 'openai' or 'claude'.[/red]"
+            )
+            raise typer.Exit(code=2)
+
+        # Check file exists (manual check for exit code 1)
+        if not file_path.exists():
+            console.print(f"[red]Error: File not found: {file_path}[/red]")
+            raise typer.Exit(code=1)
+
+        if is_ndjson(file_path):
+            console.print(
+                "[red]Error: Normalized NDJSON files need no index: "
+                "lookups read them in place.[/red]"
+            )
+            raise typer.Exit(code=1)
+
+        # FR-046/FR-049: Explicit provider or auto-detection
+        resolved: ProviderType
+        if provider is None:
+            resolved = detect_provider(file_path)
+        else:
+            resolved = "claude" if provider.lower() == "claude" else "openai"
+
+        with console.status("[bold green]Indexing conversations...") as status:
+            index = ExportIndex.build(
+                file_path,
+                provider=resolved,
+                progress_callback=lambda count: status.update(
+                    f"[bold green]Indexing conversations... {count:,}"
+                ),
+            )
+
+        console.print(
+            f"[green]✓ Indexed {index.conversation_count:,} conversations → "
+            f"{index.index_path}[/green]"
+        )
+        if not supports_random_access(file_path):
+            console.print(
+                "[yellow]Note: lookups in this compressed export decompress it from the "
+                "start; 'echomine pack' writes a layout they can seek in.[/yellow]"
+            )
+
+        if search:
+            adapter = ClaudeAdapter() if resolved == "claude" else OpenAIAdapter()
+            with console.status("[bold green]Building search index...") as status:
+                search_index = adapter.build_search_index(
+                    file_path,
+                    progress_callback=lambda count: status.update(
+                        f"[bold green]Building search index... {count:,}"
+                    ),
+                )
+
+            console.print(
+                f"[green]✓ Search index for {search_index.conversation_count:,} "
+                f"conversations → {search_index.index_path}[/green]"
+            )
+
+    except FileNotFoundError:
+        console.print(f"[red]Error: File not found: {file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except PermissionError as e:
+        console.print(f"[red]Error: Permission denied: {e.filename or file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except (ParseError, ValueError) as e:
+        console.print(f"[red]Error: Invalid export file: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted by user[/yellow]")
+        raise typer.Exit(code=130) from None
+
+    except typer.Exit:
+        # Re-raise typer.Exit to preserve exit code
+        raise
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from None
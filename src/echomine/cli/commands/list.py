@@ -17,7 +17,24 @@ Command Contract:
         file_path: Path to OpenAI export JSON file
 
     Options:
-        --format: Output format ('text' or 'json', default: 'text')
+        --format: Output format ('text', 'json', 'jsonl', or 'csv', default: 'text')
+        --sort: date (default), title, messages, or none (export order)
+        --run-size: Headers sorted in memory at once (default: 100,000)
+        --cache/--no-cache: Replay a header snapshot when the export is
+            unchanged (default: only if $ECHOMINE_CACHE_DIR is set)
+
+    Streaming:
+        With --sort none, json/jsonl/csv records are written to stdout as
+        conversations are parsed (constant memory, first record immediately).
+        Sorted listings with --limit keep only the top N headers (bounded
+        heap); without a limit they are sorted externally: runs of at most
+        --run-size headers are sorted and spilled to temp files, then merged
+        while writing.
+
+    Snapshot Cache:
+        A full read of the export records its headers in a binary snapshot
+        (echomine.index.snapshot); later runs against the unchanged export
+        replay it instead of parsing.
 
     Exit Codes:
         0: Success
@@ -31,6 +48,11 @@ Command Contract:
 
 from __future__ import annotations
 
+import heapq
+import sys
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from typing import Annotated
 
@@ -40,14 +62,25 @@ from rich.console import Console
 
 from echomine.cli.formatters import (
     create_rich_table,
-    format_json,
     format_text_table,
     is_rich_enabled,
+    write_json_array,
+    write_jsonl,
 )
 from echomine.cli.provider import get_adapter
 from echomine.exceptions import ParseError, ValidationError
 from echomine.export.csv import CSVExporter
-from echomine.models.conversation import Conversation
+from echomine.index.snapshot import cache_enabled, stream_cached_headers
+from echomine.models.conversation import ConversationHeader
+from echomine.utils.external_sort import DEFAULT_RUN_SIZE, external_sorted
+
+
+# Compact run-file record of a header: id, title, created_at and updated_at
+# (microseconds since the epoch, exact and cheap to pickle), message_count
+_HeaderRecord = tuple[str, str, int, int | None, int]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
 
 
 def list_conversations(
@@ -65,7 +98,7 @@ def list_conversations(
     format: Annotated[
         str,
         typer.Option(
-            help="Output format (text or json)",
+            help="Output format: text, json, jsonl, or csv",
             case_sensitive=False,
         ),
     ] = "text",
@@ -80,7 +113,7 @@ def list_conversations(
         str,
         typer.Option(
             "--sort",
-            help="Sort by: date (default), title, or messages",
+            help="Sort by: date (default), title, messages, or none (export order, streamed)",
             case_sensitive=False,
         ),
     ] = "date",
@@ -92,6 +125,22 @@ def list_conversations(
             case_sensitive=False,
         ),
     ] = "",
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Parse the export in N processes (default: 1)",
+            min=1,
+        ),
+    ] = 1,
+    run_size: Annotated[
+        int,
+        typer.Option(
+            "--run-size",
+            help="Sort at most N headers in memory; larger listings spill sorted runs to temp files",
+            min=1,
+        ),
+    ] = DEFAULT_RUN_SIZE,
     provider: Annotated[
         str | None,
         typer.Option(
@@ -101,6 +150,17 @@ def list_conversations(
             case_sensitive=False,
         ),
     ] = None,
+    *,
+    cache: Annotated[
+        bool | None,
+        typer.Option(
+            "--cache/--no-cache",
+            help=(
+                "Replay headers from the snapshot cache when the export is unchanged "
+                "(default: only if $ECHOMINE_CACHE_DIR is set)"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """[bold]List all conversations[/bold] from export file.
 
@@ -126,6 +186,15 @@ def list_conversations(
         [dim]# Pipeline with jq[/dim]
         $ [green]echomine list[/green] export.json [cyan]--format[/cyan] json | jq '.[0].title'
 
+        [dim]# Stream JSON Lines in export order (constant memory)[/dim]
+        $ [green]echomine list[/green] export.json [cyan]--format[/cyan] jsonl [cyan]--sort[/cyan] none | jq -r .title
+
+    With [cyan]--cache[/cyan], repeat runs on an unchanged export replay a
+    header snapshot from the cache directory ([cyan]$ECHOMINE_CACHE_DIR[/cyan],
+    default [cyan]~/.cache/echomine[/cyan]) instead of parsing. Setting
+    [cyan]$ECHOMINE_CACHE_DIR[/cyan] turns it on by default; [cyan]--no-cache[/cyan]
+    then disables it.
+
     [bold]Exit Codes:[/bold]
         [green]0[/green]: Success
         [red]1[/red]: File not found, permission denied, parse error, validation error
@@ -143,18 +212,18 @@ def list_conversations(
     try:
         # Validate format option
         format_lower = format.lower()
-        if format_lower not in ("text", "json", "csv"):
+        if format_lower not in ("text", "json", "jsonl", "csv"):
             typer.echo(
-                f"Error: Invalid format '{format}'. Must be 'text', 'json', or 'csv'.",
+                f"Error: Invalid format '{format}'. Must be 'text', 'json', 'jsonl', or 'csv'.",
                 err=True,
             )
             raise typer.Exit(code=1)
 
         # Validate sort option (FR-048a)
         sort_lower = sort.lower()
-        if sort_lower not in ("date", "title", "messages"):
+        if sort_lower not in ("date", "title", "messages", "none"):
             typer.echo(
-                f"Error: Invalid --sort '{sort}'. Must be 'date', 'title', or 'messages'.",
+                f"Error: Invalid --sort '{sort}'. Must be 'date', 'title', 'messages', or 'none'.",
                 err=True,
             )
             raise typer.Exit(code=2)
@@ -181,66 +250,46 @@ def list_conversations(
 
         # Get appropriate adapter (auto-detect or explicit provider)
         adapter = get_adapter(provider, file_path)
-        conversations = list(adapter.stream_conversations(file_path))
-
-        # Sort conversations based on parameters (FR-048a-c)
-        def get_list_sort_key(conv: Conversation) -> tuple[float | str | int, str]:
-            """Get sort key for list command.
-
-            Returns tuple for multi-level sorting:
-            - Primary: sort field value
-            - Secondary: conversation_id (tie-breaker)
-
-            FR-046a: For date sort, use updated_at or fall back to created_at
-            FR-047: Title sort is case-insensitive
-            """
-            if sort_lower == "date":
-                # Use updated_at if present, otherwise created_at
-                sort_date = conv.updated_at if conv.updated_at is not None else conv.created_at
-                primary_key: float | str | int = sort_date.timestamp()
-            elif sort_lower == "title":
-                # Case-insensitive title sort
-                primary_key = conv.title.lower()
-            elif sort_lower == "messages":
-                # Sort by message count
-                primary_key = conv.message_count
-            else:
-                # Should never happen due to validation above, but defensive
-                primary_key = conv.created_at.timestamp()
-
-            # Tie-breaking by conversation_id (ascending)
-            return (primary_key, conv.id)
-
-        # Apply sorting
-        reverse_sort = order_lower == "desc"
-        conversations.sort(key=get_list_sort_key, reverse=reverse_sort)
+        # Header-only streaming: no Message models are built for listing
+        headers = (
+            stream_cached_headers(adapter, file_path, workers=workers)
+            if cache_enabled(cache)
+            else adapter.stream_conversation_headers(file_path, workers=workers)
+        )
 
-        # Apply limit if specified (FR-443)
-        if limit is not None:
-            conversations = conversations[:limit]
+        conversations: Iterable[ConversationHeader]
+        if sort_lower == "none":
+            # Export order: nothing is collected, records are written as parsed
+            conversations = islice(headers, limit) if limit is not None else headers
+        else:
+            conversations = _sorted_headers(
+                headers, sort_lower, order_lower, limit, run_size=run_size
+            )
 
         # Format output based on requested format
         if format_lower == "csv":
-            # Conversation-level CSV output (FR-049, FR-050)
-            exporter = CSVExporter()
-            output = exporter.export_conversations(conversations)
-            typer.echo(output, nl=False)
+            # Conversation-level CSV output (FR-049, FR-050), rows streamed to stdout
+            CSVExporter().write_conversations(conversations, sys.stdout)
         elif format_lower == "json":
-            output = format_json(conversations)
-            # Write JSON output to stdout (CHK031)
-            typer.echo(output, nl=False)
+            # Write JSON output to stdout (CHK031), one record at a time
+            write_json_array(conversations, sys.stdout)
+        elif format_lower == "jsonl":
+            write_jsonl(conversations, sys.stdout)
         else:
+            # Tables need every row up front (column widths)
+            rows = list(conversations)
+
             # Check if Rich formatting should be used (FR-036, FR-040, FR-041)
             use_rich = is_rich_enabled(json_flag=False)
 
             if use_rich:
                 # Rich table output (FR-036)
-                table = create_rich_table(conversations)
+                table = create_rich_table(rows)
                 console = Console()
                 console.print(table)
             else:
                 # Plain text table output (default for pipes/redirects)
-                output = format_text_table(conversations)
+                output = format_text_table(rows)
                 typer.echo(output, nl=False)
 
         # Return normally for success (exit code 0)
@@ -294,3 +343,95 @@ def list_conversations(
             err=True,
         )
         raise typer.Exit(code=1)
+
+
+def _sorted_headers(
+    headers: Iterable[ConversationHeader],
+    sort: str,
+    order: str,
+    limit: int | None,
+    *,
+    run_size: int = DEFAULT_RUN_SIZE,
+) -> Iterable[ConversationHeader]:
+    """Sort conversation headers, keeping only the top ``limit`` (FR-048a-c, FR-443).
+
+    With a limit, a bounded heap selects the result in one pass, so memory is
+    O(limit) rather than O(conversations). Without one, an external merge
+    sort holds at most ``run_size`` headers in memory.
+
+    Args:
+        headers: Conversation headers in export order
+        sort: "date", "title", or "messages"
+        order: "asc" or "desc"
+        limit: Keep only the first N after sorting (None = all)
+        run_size: Headers sorted in memory per run when there is no limit
+
+    Returns:
+        Sorted headers (an iterator, when there is no limit)
+    """
+
+    def get_list_sort_key(conv: ConversationHeader) -> tuple[float | str | int, str]:
+        """Get sort key for list command.
+
+        Returns tuple for multi-level sorting:
+        - Primary: sort field value
+        - Secondary: conversation_id (tie-breaker)
+
+        FR-046a: For date sort, use updated_at or fall back to created_at
+        FR-047: Title sort is case-insensitive
+        """
+        if sort == "date":
+            # Use updated_at if present, otherwise created_at
+            sort_date = conv.updated_at if conv.updated_at is not None else conv.created_at
+            primary_key: float | str | int = sort_date.timestamp()
+        elif sort == "title":
+            # Case-insensitive title sort
+            primary_key = conv.title.lower()
+        elif sort == "messages":
+            # Sort by message count
+            primary_key = conv.message_count
+        else:
+            # Should never happen due to validation above, but defensive
+            primary_key = conv.created_at.timestamp()
+
+        # Tie-breaking by conversation_id (ascending)
+        return (primary_key, conv.id)
+
+    if limit is not None:
+        # Apply limit (FR-443) while selecting: holds at most `limit` headers,
+        # O(n log limit); nlargest/nsmallest equal sorted(..., reverse)[:limit]
+        select = heapq.nlargest if order == "desc" else heapq.nsmallest
+        return select(limit, headers, key=get_list_sort_key)
+
+    return external_sorted(
+        headers,
+        key=get_list_sort_key,
+        reverse=order == "desc",
+        run_size=run_size,
+        encode=_header_record,
+        decode=_header_from_record,
+    )
+
+
+def _header_record(header: ConversationHeader) -> _HeaderRecord:
+    """Reduce a header to the tuple written to sort run files."""
+    updated_at = header.updated_at
+    return (
+        header.id,
+        header.title,
+        (header.created_at - _EPOCH) // _MICROSECOND,
+        (updated_at - _EPOCH) // _MICROSECOND if updated_at is not None else None,
+        header.message_count,
+    )
+
+
+def _header_from_record(record: _HeaderRecord) -> ConversationHeader:
+    """Rebuild a header from a sort run record."""
+    conversation_id, title, created_at, updated_at, message_count = record
+    return ConversationHeader(
+        id=conversation_id,
+        title=title,
+        created_at=_EPOCH + created_at * _MICROSECOND,
+        updated_at=_EPOCH + updated_at * _MICROSECOND if updated_at is not None else None,
+        message_count=message_count,
+    )
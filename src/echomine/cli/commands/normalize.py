@@ -0,0 +1,201 @@
+"""Normalize command implementation.
+
+This module implements the 'normalize' command, which parses an export once
+and writes its conversations as normalized NDJSON: one ``Conversation`` per
+line, in the ``model_dump_json`` schema. Every read command accepts the
+result in place of the export (the format is auto-detected) and reads it
+without provider-specific parsing, in parallel at line boundaries.
+
+Constitution Compliance:
+    - Principle I: Library-first (delegates to adapters.ndjson.write_ndjson)
+    - CHK031: Data on stdout, progress/errors on stderr
+    - CHK032: Exit codes 0 (success), 1 (error), 2 (invalid arguments)
+
+Command Contract:
+    Usage:
+        echomine normalize <file_path> [OPTIONS]
+
+    Arguments:
+        file_path: Export JSON file, ZIP archive or compressed file
+
+    Options:
+        --output, -o: NDJSON file path (default: <name>.ndjson next to the input)
+        --workers: Parse the export in N processes (default: 1)
+        --provider, -p: Export provider (openai or claude). Auto-detected if omitted.
+
+    Exit Codes:
+        0: Success (NDJSON file written)
+        1: File not found, permission denied, parse error, write error
+        2: Invalid arguments
+
+    Output Streams:
+        stdout: Empty
+        stderr: Progress indicator, success message, error messages
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from echomine.adapters.ndjson import NDJSONAdapter, ndjson_provider, write_ndjson
+from echomine.cli.provider import get_adapter
+from echomine.exceptions import ParseError
+
+
+# Console for stderr output (progress, success messages, errors)
+console = Console(stderr=True)
+
+# Suffixes dropped from the input name to derive the default output name
+_INPUT_SUFFIXES = (".json", ".zip", ".gz", ".bz2", ".xz")
+
+
+def _default_output(file_path: Path) -> Path:
+    """Derive ``<name>.ndjson`` next to the input (export.json.gz → export.ndjson)."""
+    name = file_path.name
+    while (suffix := Path(name).suffix.lower()) in _INPUT_SUFFIXES:
+        name = name[: -len(suffix)]
+    return file_path.with_name(f"{name}.ndjson")
+
+
+def normalize_command(
+    file_path: Annotated[
+        Path,
+        typer.Argument(
+            help="Path to export file (JSON, ZIP archive, or gzip/bz2/xz)",
+            exists=False,  # Manual check for exit code 1
+            file_okay=True,
+            dir_okay=False,
+            readable=False,  # Manual check for exit code 1
+            resolve_path=True,
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="NDJSON file path (default: <name>.ndjson next to the input)",
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Parse the export in N processes (default: 1)",
+            min=1,
+        ),
+    ] = 1,
+    provider: Annotated[
+        str | None,
+        typer.Option(
+            "--provider",
+            "-p",
+            help="Export provider (openai or claude). Auto-detected if omitted.",
+            case_sensitive=False,
+        ),
+    ] = None,
+) -> None:
+    """[bold]Normalize an export[/bold] to NDJSON, one conversation per line.
+
+    Parses the export once and writes every conversation, in export order,
+    as one JSON line. Commands given the [cyan].ndjson[/cyan] file read it
+    like the export, skipping provider-specific parsing: repeat listings,
+    searches and statistics run several times faster, and
+    [cyan]--workers[/cyan] splits the file at line boundaries.
+
+    [bold]Examples:[/bold]
+        [dim]# Normalize once → export.ndjson[/dim]
+        $ [green]echomine normalize[/green] export.zip
+
+        [dim]# Analyze the normalized file[/dim]
+        $ [green]echomine search[/green] export.ndjson [cyan]-k[/cyan] python [cyan]--workers[/cyan] 8
+
+    [bold]Exit Codes:[/bold]
+        [green]0[/green]: Success
+        [red]1[/red]: File not found, permission denied, parse error, write error
+        [yellow]2[/yellow]: Invalid arguments
+    """
+    try:
+        if provider is not None and provider.lower() not in ("openai", "claude"):
+            console.print(
+                f"[red]Error: Invalid provider '{provider}'. Must be 'openai' or 'claude'.[/red]"
+            )
+            raise typer.Exit(code=2)
+
+        # Check file exists (manual check for exit code 1)
+        if not file_path.exists():
+            console.print(f"[red]Error: File not found: {file_path}[/red]")
+            raise typer.Exit(code=1)
+
+        destination = output if output is not None else _default_output(file_path)
+        if destination == file_path:
+            console.print(
+                f"[red]Error: Output would overwrite the input: {file_path}. "
+                "Choose another path with --output.[/red]"
+            )
+            raise typer.Exit(code=2)
+
+        adapter = get_adapter(provider.lower() if provider else None, file_path)
+        # Recorded in the header line, so lookups match IDs like the provider's adapter
+        source = (
+            ndjson_provider(file_path) if isinstance(adapter, NDJSONAdapter) else adapter.provider
+        )
+        skipped: list[str] = []
+
+        def record_skip(conversation_id: str, _reason: str) -> None:
+            skipped.append(conversation_id)
+
+        start = time.perf_counter()
+        with console.status("[bold green]Normalizing conversations...") as status:
+            conversations = adapter.stream_conversations(
+                file_path,
+                progress_callback=lambda count: status.update(
+                    f"[bold green]Normalizing conversations... {count:,}"
+                ),
+                on_skip=record_skip,
+                workers=workers,
+            )
+            written = write_ndjson(conversations, destination, provider=source)
+        elapsed = time.perf_counter() - start
+
+        console.print(
+            f"[green]✓ Normalized {written:,} conversations → {destination} "
+            f"({destination.stat().st_size / 1_048_576:.1f} MiB) in {elapsed:.1f}s[/green]"
+        )
+        if skipped:
+            console.print(f"[yellow]Skipped {len(skipped):,} malformed conversations[/yellow]")
+
+    except FileNotFoundError:
+        console.print(f"[red]Error: File not found: {file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except PermissionError as e:
+        console.print(f"[red]Error: Permission denied: {e.filename or file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except (ParseError, ValueError) as e:
+        console.print(f"[red]Error: Invalid export file: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except OSError as e:
+        console.print(f"[red]Error: Failed to write file: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted by user[/yellow]")
+        raise typer.Exit(code=130) from None
+
+    except typer.Exit:
+        # Re-raise typer.Exit to preserve exit code
+        raise
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from None
@@ -0,0 +1,158 @@
+"""Pack command implementation.
+
+This module implements the 'pack' command, which compresses an export into
+the packed layout: gzip split into independently compressed blocks. Every
+command reads packed files directly, and sidecar index lookups on them
+decompress only the blocks holding the requested conversation, where a
+plain gzip/bz2/xz file must be decompressed from the start.
+
+Constitution Compliance:
+    - Principle I: Library-first (delegates to utils.archive.pack_export)
+    - CHK031: Data on stdout, progress/errors on stderr
+    - CHK032: Exit codes 0 (success), 1 (error), 2 (invalid arguments)
+
+Command Contract:
+    Usage:
+        echomine pack <file_path> [OPTIONS]
+
+    Arguments:
+        file_path: Export JSON file, ZIP archive or compressed file
+
+    Options:
+        --output, -o: Packed file path (default: <name>.json.gz next to the input)
+        --block-size: Uncompressed KiB per block (default: 1024)
+
+    Exit Codes:
+        0: Success (packed file written)
+        1: File not found, permission denied, parse error
+        2: Invalid arguments
+
+    Output Streams:
+        stdout: Empty
+        stderr: Progress indicator, success message, error messages
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from echomine.exceptions import ParseError
+from echomine.utils.archive import PACK_BLOCK_SIZE, pack_export
+
+
+# Console for stderr output (progress, success messages, errors)
+console = Console(stderr=True)
+
+# Suffixes dropped from the input name to derive the default output name
+_INPUT_SUFFIXES = (".json", ".zip", ".gz", ".bz2", ".xz")
+
+
+def _default_output(file_path: Path) -> Path:
+    """Derive ``<name>.json.gz`` next to the input (export.json.xz → export.json.gz)."""
+    name = file_path.name
+    while (suffix := Path(name).suffix.lower()) in _INPUT_SUFFIXES:
+        name = name[: -len(suffix)]
+    return file_path.with_name(f"{name}.json.gz")
+
+
+def pack_command(
+    file_path: Annotated[
+        Path,
+        typer.Argument(
+            help="Path to export file (JSON, ZIP archive, or gzip/bz2/xz)",
+            exists=False,  # Manual check for exit code 1
+            file_okay=True,
+            dir_okay=False,
+            readable=False,  # Manual check for exit code 1
+            resolve_path=True,
+        ),
+    ],
+    output: Annotated[
+        Path | None,
+        typer.Option(
+            "--output",
+            "-o",
+            help="Packed file path (default: <name>.json.gz next to the input)",
+            dir_okay=False,
+            resolve_path=True,
+        ),
+    ] = None,
+    block_size: Annotated[
+        int,
+        typer.Option(
+            "--block-size",
+            help="Uncompressed KiB per block (smaller: cheaper lookups, larger file)",
+            min=1,
+        ),
+    ] = PACK_BLOCK_SIZE // 1024,
+) -> None:
+    """[bold]Compress an export[/bold] into a seekable packed file.
+
+    Writes the export's conversations JSON as gzip split into independently
+    compressed blocks. The result is an ordinary [cyan].json.gz[/cyan] to
+    other tools; echomine reads it like the original, and lookups through a
+    sidecar index ([green]echomine index build[/green]) decompress only the
+    blocks they need.
+
+    [bold]Examples:[/bold]
+        [dim]# Pack the provider's ZIP export → export.json.gz[/dim]
+        $ [green]echomine pack[/green] export.zip
+
+        [dim]# Index the packed file for fast ID lookups[/dim]
+        $ [green]echomine index build[/green] export.json.gz
+
+    [bold]Exit Codes:[/bold]
+        [green]0[/green]: Success
+        [red]1[/red]: File not found, permission denied, parse error
+        [yellow]2[/yellow]: Invalid arguments
+    """
+    try:
+        # Check file exists (manual check for exit code 1)
+        if not file_path.exists():
+            console.print(f"[red]Error: File not found: {file_path}[/red]")
+            raise typer.Exit(code=1)
+
+        destination = output if output is not None else _default_output(file_path)
+        if destination == file_path:
+            console.print(
+                f"[red]Error: Output would overwrite the input: {file_path}. "
+                "Choose another path with --output.[/red]"
+            )
+            raise typer.Exit(code=2)
+
+        with console.status("[bold green]Packing export..."):
+            size = pack_export(file_path, destination, block_size=block_size * 1024)
+
+        packed_size = destination.stat().st_size
+        console.print(
+            f"[green]✓ Packed {size:,} bytes → {destination} "
+            f"({packed_size:,} bytes, {packed_size / max(size, 1):.0%})[/green]"
+        )
+
+    except FileNotFoundError:
+        console.print(f"[red]Error: File not found: {file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except PermissionError as e:
+        console.print(f"[red]Error: Permission denied: {e.filename or file_path}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except ParseError as e:
+        console.print(f"[red]Error: Invalid export file: {e}[/red]")
+        raise typer.Exit(code=1) from None
+
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Interrupted by user[/yellow]")
+        raise typer.Exit(code=130) from None
+
+    except typer.Exit:
+        # Re-raise typer.Exit to preserve exit code
+        raise
+
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1) from None
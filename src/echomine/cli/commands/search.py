@@ -22,8 +22,10 @@ Command Contract:
         --from-date DATE: Filter from date (YYYY-MM-DD format)
         --to-date DATE: Filter to date (YYYY-MM-DD format)
         --limit, -n INTEGER: Limit number of results (default: None/unlimited)
-        --format, -f [text|json]: Output format (default: text)
+        --format, -f [text|json|jsonl|csv]: Output format (default: text)
         --quiet, -q: Suppress progress indicators
+        --low-memory: Two-pass search holding only the top results (O(limit) memory)
+        --workers INTEGER: Parse the export in N processes (default: 1)
 
     Exit Codes:
         0: Success (including zero results)
@@ -40,9 +42,11 @@ from __future__ import annotations
 
 import sys
 import time
+from collections.abc import Callable, Iterable, Iterator
 from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Annotated, Literal, cast
+from typing import Annotated, Literal, TextIO, cast
 
 import typer
 from pydantic import ValidationError as PydanticValidationError
@@ -53,11 +57,13 @@ from echomine.cli.formatters import (
     format_search_results,
     format_search_results_json,
     is_rich_enabled,
+    write_search_results_jsonl,
 )
 from echomine.cli.provider import get_adapter
 from echomine.exceptions import ParseError, ValidationError
 from echomine.export.csv import CSVExporter
-from echomine.models.search import SearchQuery
+from echomine.models.conversation import Conversation
+from echomine.models.search import SearchQuery, SearchResult
 
 
 def parse_date(value: str) -> date:
@@ -116,6 +122,31 @@ def _build_search_suggestions(
     return suggestions
 
 
+def _stream_counted(
+    results: Iterable[SearchResult[Conversation]],
+    write: Callable[[Iterable[SearchResult[Conversation]], TextIO], int],
+) -> int:
+    """Stream search results to stdout with a ``write_*`` function.
+
+    Args:
+        results: Search results, consumed lazily
+        write: A CSVExporter ``write_*`` method or ``write_search_results_jsonl``
+
+    Returns:
+        Number of search results written
+    """
+    count = 0
+
+    def counted() -> Iterator[SearchResult[Conversation]]:
+        nonlocal count
+        for result in results:
+            count += 1
+            yield result
+
+    write(counted(), sys.stdout)
+    return count
+
+
 def search_conversations(
     file_path: Annotated[
         Path,
@@ -231,7 +262,7 @@ def search_conversations(
         typer.Option(
             "--format",
             "-f",
-            help="Output format (text or json)",
+            help="Output format: text, json, jsonl (one result per line), or csv",
             case_sensitive=False,
         ),
     ] = "text",
@@ -257,6 +288,21 @@ def search_conversations(
             help="Output message-level CSV (mutually exclusive with --format csv)",
         ),
     ] = False,
+    low_memory: Annotated[
+        bool,
+        typer.Option(
+            "--low-memory",
+            help="Stream the export twice, keeping only the top results in memory",
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Parse the export in N processes (default: 1)",
+            min=1,
+        ),
+    ] = 1,
     provider: Annotated[
         str | None,
         typer.Option(
@@ -327,9 +373,9 @@ def search_conversations(
             )
             raise typer.Exit(code=2)
 
-        if format_lower not in ("text", "json", "csv"):
+        if format_lower not in ("text", "json", "jsonl", "csv"):
             typer.echo(
-                f"Error: Invalid format '{format}'. Must be 'text', 'json', or 'csv'.",
+                f"Error: Invalid format '{format}'. Must be 'text', 'json', 'jsonl', or 'csv'.",
                 err=True,
             )
             raise typer.Exit(code=1)
@@ -497,23 +543,37 @@ def search_conversations(
 
         # Search conversations with appropriate adapter
         adapter = get_adapter(provider, file_path)
-        results = list(
-            adapter.search(
-                file_path,
-                query,
-                progress_callback=progress_callback if not quiet else None,
-            )
+        result_stream = adapter.search(
+            file_path,
+            query,
+            progress_callback=progress_callback if not quiet else None,
+            low_memory=low_memory,
+            workers=workers,
         )
+        # Apply actual limit if specified and different from query limit
+        if limit is not None:
+            result_stream = islice(result_stream, limit)
+
+        results: list[SearchResult[Conversation]] = []
+        if csv_messages:
+            # Message-level CSV output (FR-051, FR-052): rows are streamed to
+            # stdout as results arrive instead of collected into one string
+            result_count = _stream_counted(result_stream, CSVExporter().write_messages_from_results)
+        elif format_lower == "csv":
+            # Conversation-level CSV output with scores (FR-049, FR-050)
+            result_count = _stream_counted(result_stream, CSVExporter().write_search_results)
+        elif format_lower == "jsonl":
+            # One JSON result per line, written as results arrive
+            result_count = _stream_counted(result_stream, write_search_results_jsonl)
+        else:
+            results = list(result_stream)
+            result_count = len(results)
 
         # Calculate elapsed time
         elapsed_seconds = time.time() - start_time
 
-        # Apply actual limit if specified and different from query limit
-        if limit is not None:
-            results = results[:limit]
-
         # Provide zero-results guidance if no matches (FR-097, TTY-aware)
-        if len(results) == 0 and sys.stderr.isatty():
+        if result_count == 0 and sys.stderr.isatty():
             typer.echo(
                 "No conversations matched your search criteria.",
                 err=True,
@@ -534,16 +594,9 @@ def search_conversations(
             typer.echo("", err=True)  # Blank line for readability
 
         # Format output based on requested format
-        if csv_messages:
-            # Message-level CSV output (FR-051, FR-052)
-            exporter = CSVExporter()
-            output = exporter.export_messages_from_results(results)
-            typer.echo(output, nl=False)
-        elif format_lower == "csv":
-            # Conversation-level CSV output with scores (FR-049, FR-050)
-            exporter = CSVExporter()
-            output = exporter.export_search_results(results)
-            typer.echo(output, nl=False)
+        if csv_messages or format_lower in ("csv", "jsonl"):
+            # Rows were already streamed to stdout while searching
+            pass
         elif format_lower == "json":
             # FR-301-306: Pass metadata to JSON formatter
             # Convert dates to ISO 8601 format for metadata
@@ -18,6 +18,8 @@ Command Contract:
 
     Options:
         --json: Output as JSON (FR-012)
+        --cache/--no-cache: Replay a header snapshot when the export is
+            unchanged (default: only if $ECHOMINE_CACHE_DIR is set)
 
     Exit Codes:
         0: Success (statistics generated)
@@ -46,6 +48,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from echomine.exceptions import ParseError
+from echomine.index.snapshot import cache_enabled
 from echomine.statistics import calculate_statistics
 
 
@@ -280,6 +283,7 @@ def stats_command(
             resolve_path=True,
         ),
     ],
+    *,
     json_output: Annotated[
         bool,
         typer.Option(
@@ -294,6 +298,14 @@ def stats_command(
             help="Show statistics for specific conversation ID (FR-018)",
         ),
     ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Parse the export in N processes (default: 1)",
+            min=1,
+        ),
+    ] = 1,
     provider: Annotated[
         str | None,
         typer.Option(
@@ -303,6 +315,16 @@ def stats_command(
             case_sensitive=False,
         ),
     ] = None,
+    cache: Annotated[
+        bool | None,
+        typer.Option(
+            "--cache/--no-cache",
+            help=(
+                "Replay headers from the snapshot cache when the export is unchanged "
+                "(default: only if $ECHOMINE_CACHE_DIR is set)"
+            ),
+        ),
+    ] = None,
 ) -> None:
     """[bold]Display statistics[/bold] for export or conversation.
 
@@ -332,6 +354,12 @@ def stats_command(
         [dim]# Per-conversation stats as JSON[/dim]
         $ [green]echomine stats[/green] export.json [cyan]--conversation[/cyan] [yellow]abc-123[/yellow] [cyan]--json[/cyan]
 
+    With [cyan]--cache[/cyan], repeat runs on an unchanged export replay a
+    header snapshot from the cache directory ([cyan]$ECHOMINE_CACHE_DIR[/cyan],
+    default [cyan]~/.cache/echomine[/cyan]) instead of parsing. Setting
+    [cyan]$ECHOMINE_CACHE_DIR[/cyan] turns it on by default; [cyan]--no-cache[/cyan]
+    then disables it.
+
     [bold]Exit Codes:[/bold]
         [green]0[/green]: Success (statistics displayed)
         [red]1[/red]: File not found, permission denied, parse error, conversation not found
@@ -389,6 +417,7 @@ def stats_command(
         from echomine.cli.provider import get_adapter
 
         adapter = get_adapter(provider, file_path)
+        use_cache = cache_enabled(cache)
 
         # Calculate statistics using library function (Principle I: Library-first)
         # Use Rich progress indicator for visual feedback
@@ -405,12 +434,16 @@ def stats_command(
                     file_path,
                     adapter=adapter,
                     progress_callback=on_progress,
+                    workers=workers,
+                    cache=use_cache,
                 )
 
                 progress.update(task, completed=True)
         else:
             # No progress indicator for JSON output (stdout must be clean)
-            stats = calculate_statistics(file_path, adapter=adapter)
+            stats = calculate_statistics(
+                file_path, adapter=adapter, workers=workers, cache=use_cache
+            )
 
         # Display statistics (stdout)
         if json_output:
@@ -16,29 +16,38 @@ Constitution Compliance:
 
 Architecture:
     - format_text_table(): Default human-readable output (plain text)
-    - format_json(): Machine-readable JSON for pipelines (NDJSON)
+    - format_json(): Machine-readable JSON array for pipelines
+    - write_json_array() / write_jsonl(): Streaming JSON / JSON Lines writers
+      (one record at a time, constant memory)
+    - write_search_results_jsonl(): Streaming JSON Lines for search results
     - create_rich_table(): Rich table format for TTY output
     - get_score_color(): Color coding for relevance scores
     - get_role_color(): Color coding for message roles
     - is_rich_enabled(): TTY detection for Rich formatting
-    - Both functions are pure: input -> output, no I/O
+    - format_* functions are pure: input -> output, no I/O; write_* functions
+      only write to the text stream they are given
 """
 
 from __future__ import annotations
 
 import json
 import sys
-from typing import TYPE_CHECKING, Literal
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Literal, TextIO
 
 from rich.table import Table
 
 
 if TYPE_CHECKING:
-    from echomine.models.conversation import Conversation
+    from echomine.models.conversation import Conversation, ConversationHeader
     from echomine.models.search import SearchResult
 
 
-def format_text_table(conversations: list[Conversation]) -> str:
+# Compact JSON separators (no whitespace) for pipeline output
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def format_text_table(conversations: Sequence[Conversation | ConversationHeader]) -> str:
     """Format conversations as simple text table (CHK040).
 
     Creates a pipeline-friendly text table with fixed-width columns:
@@ -51,7 +60,7 @@ def format_text_table(conversations: list[Conversation]) -> str:
     compatibility with Unix tools (grep, awk, head, tail).
 
     Args:
-        conversations: List of Conversation objects to format
+        conversations: Conversations or ConversationHeaders to format
 
     Returns:
         Formatted text table as string (includes trailing newline)
@@ -115,7 +124,7 @@ def format_text_table(conversations: list[Conversation]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def format_json(conversations: list[Conversation]) -> str:
+def format_json(conversations: Sequence[Conversation | ConversationHeader]) -> str:
     """Format conversations as JSON array.
 
     Creates a standard JSON array (not NDJSON) for programmatic use.
@@ -135,7 +144,7 @@ def format_json(conversations: list[Conversation]) -> str:
         - This ensures JSON consumers always get valid timestamps
 
     Args:
-        conversations: List of Conversation objects to format
+        conversations: Conversations or ConversationHeaders to format
 
     Returns:
         JSON array string (compact format, includes trailing newline)
@@ -151,26 +160,104 @@ def format_json(conversations: list[Conversation]) -> str:
         - FR-301-306: JSON output schema with created_at/updated_at
         - CLI spec: --format json flag
     """
-    # Build list of conversation dicts
-    conv_dicts = []
-    for conv in conversations:
-        conv_dict = {
-            "id": conv.id,
-            "title": conv.title,
-            "created_at": conv.created_at.strftime("%Y-%m-%dT%H:%M:%S"),
-            "updated_at": conv.updated_at_or_created.strftime("%Y-%m-%dT%H:%M:%S"),
-            "message_count": conv.message_count,
-        }
-        conv_dicts.append(conv_dict)
-
     # Serialize to JSON (compact format for pipeline efficiency)
     # separators=(',', ':') removes whitespace for compact output
-    json_output = json.dumps(conv_dicts, separators=(",", ":"), ensure_ascii=False)
+    json_output = json.dumps(
+        [_conversation_json_dict(conv) for conv in conversations],
+        separators=_COMPACT_SEPARATORS,
+        ensure_ascii=False,
+    )
 
     # Return with trailing newline (Unix convention)
     return json_output + "\n"
 
 
+def write_json_array(
+    conversations: Iterable[Conversation | ConversationHeader], out: TextIO
+) -> int:
+    """Write conversations as a JSON array, one record at a time.
+
+    Streaming counterpart of ``format_json``: the output is byte-for-byte
+    identical, but each record is written as soon as ``conversations``
+    yields it, so memory stays constant and consumers (``jq``) see the first
+    record without waiting for the whole export.
+
+    Args:
+        conversations: Conversations or ConversationHeaders (any iterable)
+        out: Text stream to write to
+
+    Returns:
+        Number of records written
+    """
+    out.write("[")
+    count = 0
+    for conv in conversations:
+        if count:
+            out.write(",")
+        out.write(
+            json.dumps(
+                _conversation_json_dict(conv), separators=_COMPACT_SEPARATORS, ensure_ascii=False
+            )
+        )
+        count += 1
+    out.write("]\n")
+    return count
+
+
+def write_jsonl(conversations: Iterable[Conversation | ConversationHeader], out: TextIO) -> int:
+    """Write conversations as JSON Lines (one compact object per line).
+
+    Same record fields as ``format_json``. Each line is a complete JSON
+    document, so consumers can process records as they arrive
+    (``jq -c``, ``while read``, bulk loaders).
+
+    Args:
+        conversations: Conversations or ConversationHeaders (any iterable)
+        out: Text stream to write to
+
+    Returns:
+        Number of records written
+    """
+    return _write_lines((_conversation_json_dict(conv) for conv in conversations), out)
+
+
+def write_search_results_jsonl(results: Iterable[SearchResult[Conversation]], out: TextIO) -> int:
+    """Write search results as JSON Lines (one compact object per line).
+
+    Each line has the fields of a ``format_search_results_json`` result
+    entry; there is no metadata wrapper.
+
+    Args:
+        results: Search results (any iterable, e.g. ``adapter.search(...)``)
+        out: Text stream to write to
+
+    Returns:
+        Number of records written
+    """
+    return _write_lines((_search_result_json_dict(result) for result in results), out)
+
+
+def _write_lines(records: Iterable[dict[str, Any]], out: TextIO) -> int:
+    """Write one compact JSON document per line."""
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, separators=_COMPACT_SEPARATORS, ensure_ascii=False))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def _conversation_json_dict(conv: Conversation | ConversationHeader) -> dict[str, Any]:
+    """JSON record of a conversation for list output."""
+    return {
+        "id": conv.id,
+        "title": conv.title,
+        "created_at": conv.created_at.strftime("%Y-%m-%dT%H:%M:%S"),
+        "updated_at": conv.updated_at_or_created.strftime("%Y-%m-%dT%H:%M:%S"),
+        "message_count": conv.message_count,
+    }
+
+
 def format_search_results(results: list[SearchResult[Conversation]]) -> str:
     """Format search results as human-readable text table.
 
@@ -326,25 +413,7 @@ def format_search_results_json(
         - CHK031: Output to stdout (caller responsibility)
     """
     # Build results array with flattened structure (FR-302)
-    results_array = []
-    for result in results:
-        conv = result.conversation
-        # FR-304: ISO 8601 with UTC timezone (append 'Z' for UTC)
-        created_at = conv.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-        updated_at = conv.updated_at_or_created.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-        results_array.append(
-            {
-                "conversation_id": conv.id,  # FR-302: Use conversation_id not nested id
-                "title": conv.title,
-                "created_at": created_at,
-                "updated_at": updated_at,
-                "score": result.score,
-                "matched_message_ids": result.matched_message_ids,
-                "message_count": conv.message_count,
-                "snippet": result.snippet,  # FR-024: Snippet in JSON output
-            }
-        )
+    results_array = [_search_result_json_dict(result) for result in results]
 
     # Build metadata object (FR-303)
     metadata = {
@@ -374,6 +443,22 @@ def format_search_results_json(
     return json.dumps(output, indent=2, ensure_ascii=False) + "\n"
 
 
+def _search_result_json_dict(result: SearchResult[Conversation]) -> dict[str, Any]:
+    """Flattened JSON record of a search result (FR-302, FR-304)."""
+    conv = result.conversation
+    return {
+        "conversation_id": conv.id,  # FR-302: Use conversation_id not nested id
+        "title": conv.title,
+        # FR-304: ISO 8601 with UTC timezone (append 'Z' for UTC)
+        "created_at": conv.created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "updated_at": conv.updated_at_or_created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "score": result.score,
+        "matched_message_ids": result.matched_message_ids,
+        "message_count": conv.message_count,
+        "snippet": result.snippet,  # FR-024: Snippet in JSON output
+    }
+
+
 # ============================================================================
 # Rich Formatting Functions (FR-036 to FR-041)
 # ============================================================================
@@ -482,7 +567,7 @@ def is_rich_enabled(json_flag: bool, force: bool = False) -> bool:
     return sys.stdout.isatty()
 
 
-def create_rich_table(conversations: list[Conversation]) -> Table:
+def create_rich_table(conversations: Sequence[Conversation | ConversationHeader]) -> Table:
     """Create Rich table for conversation list display.
 
     Creates a visually enhanced table with:
@@ -492,7 +577,7 @@ def create_rich_table(conversations: list[Conversation]) -> Table:
         - Formatted timestamps
 
     Args:
-        conversations: List of Conversation objects to display
+        conversations: Conversations or ConversationHeaders to display
 
     Returns:
         Rich Table instance ready for console.print()
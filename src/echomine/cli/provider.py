@@ -4,12 +4,21 @@ This module implements auto-detection of export providers (OpenAI vs Claude)
 based on JSON structure analysis, enabling seamless multi-provider support.
 
 Detection Algorithm:
-    1. Stream first conversation object from JSON array (O(1) memory)
-    2. Check for provider-specific keys:
+    1. Walk the parse events of the first conversation object (ijson.parse),
+       without building the object
+    2. Stop at the first provider-specific top-level key:
        - Claude: "chat_messages" key present (FR-047)
        - OpenAI: "mapping" key present (FR-048)
     3. Return provider identifier or raise ValueError
 
+Both keys come early in real exports, so detection normally reads a single
+chunk of the file, however large the first conversation is. Reading stops
+after ``DETECTION_BYTE_BUDGET`` bytes; if neither key was seen by then, other
+top-level keys decide (e.g. Claude's "uuid", OpenAI's "create_time").
+
+Normalized NDJSON files (``echomine normalize``) are recognized before
+provider detection and read with NDJSONAdapter.
+
 Functions:
     detect_provider: Auto-detect provider from file structure
     get_adapter: Get appropriate adapter based on provider flag or auto-detection
@@ -17,7 +26,7 @@ Functions:
 Constitution Compliance:
     - Principle I: Library-first (returns adapter instances, no business logic)
     - Principle VI: Strict typing with mypy --strict
-    - Principle VIII: O(1) memory usage with ijson streaming
+    - Principle VIII: O(1) memory usage with ijson event streaming
 
 FR Coverage:
     - FR-046: Auto-detect provider from JSON schema structure
@@ -40,32 +49,66 @@ Usage:
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal
+from typing import IO, Literal
 
 import ijson
 
 from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.ndjson import NDJSONAdapter, is_ndjson
 from echomine.adapters.openai import OpenAIAdapter
+from echomine.exceptions import ParseError
+from echomine.utils.archive import open_export
 
 
 # Type aliases for clarity
 ProviderType = Literal["openai", "claude"]
-AdapterType = OpenAIAdapter | ClaudeAdapter
+AdapterType = OpenAIAdapter | ClaudeAdapter | NDJSONAdapter
+
+DETECTION_BYTE_BUDGET = 64 * 1024
+"""Most bytes of an export read to detect its provider."""
+
+# Bytes handed to the parser per read (one read usually decides)
+_DETECTION_CHUNK = 4096
+
+# Top-level conversation keys that decide the provider (FR-047, FR-048)
+_PROVIDER_KEYS: dict[str, ProviderType] = {"chat_messages": "claude", "mapping": "openai"}
+
+# Top-level keys only one provider uses, consulted when no deciding key
+# appears within the byte budget
+_HINT_KEYS: dict[str, ProviderType] = {
+    "uuid": "claude",
+    "created_at": "claude",
+    "account": "claude",
+    "create_time": "openai",
+    "current_node": "openai",
+    "conversation_id": "openai",
+}
+
+_UNSUPPORTED_FORMAT = (
+    "Unsupported export format. "
+    "Expected OpenAI export (with 'mapping' key) or "
+    "Claude export (with 'chat_messages' key)."
+)
 
 
 def detect_provider(file_path: Path) -> ProviderType:
     """Auto-detect export provider from file structure.
 
-    Streams the first conversation object from the JSON array and inspects
-    it for provider-specific keys using ijson for O(1) memory usage.
+    Walks the parse events of the first conversation object and stops at
+    the first provider-specific key, reading at most
+    ``DETECTION_BYTE_BUDGET`` bytes (O(1) memory and time, whatever the size
+    of the first conversation).
 
     Detection Rules:
         1. If "chat_messages" key present → Claude (FR-047)
         2. If "mapping" key present → OpenAI (FR-048)
-        3. Otherwise → raise ValueError (FR-050)
+        3. Neither key within the byte budget → decide by other top-level
+           keys only one provider uses
+        4. Otherwise → raise ValueError (FR-050)
 
     Args:
-        file_path: Path to export JSON file
+        file_path: Path to export JSON file (or ZIP archive containing
+            conversations.json, or gzip/bz2/xz/packed file)
 
     Returns:
         Provider identifier: "openai" or "claude"
@@ -85,42 +128,87 @@ def detect_provider(file_path: Path) -> ProviderType:
         ```
 
     Constitution Compliance:
-        - Principle VIII: O(1) memory - only reads first object
+        - Principle VIII: O(1) memory - reads a bounded prefix of the file
         - FR-046: Auto-detection from JSON structure
         - FR-047: Claude detection via chat_messages key
         - FR-048: OpenAI detection via mapping key
         - FR-050: Clear error messages
     """
+    hints: set[ProviderType] = set()
     try:
-        with open(file_path, "rb") as f:
-            # Use ijson to stream first object only (O(1) memory)
-            # "item" prefix reads array elements
-            parser = ijson.items(f, "item")
-            first_obj = next(parser, None)
-
-            # Handle empty file - default to OpenAI for backwards compatibility
-            # Empty JSON arrays are valid exports with zero conversations
-            if first_obj is None:
-                return "openai"  # Default provider for empty files
-
-            # FR-047: Detect Claude by chat_messages key
-            if "chat_messages" in first_obj:
-                return "claude"
-
-            # FR-048: Detect OpenAI by mapping key
-            if "mapping" in first_obj:
-                return "openai"
-
-            # FR-050: Unrecognized format with clear error message
-            raise ValueError(
-                "Unsupported export format. "
-                "Expected OpenAI export (with 'mapping' key) or "
-                "Claude export (with 'chat_messages' key)."
-            )
-
-    except ijson.JSONError as e:
-        # FR-050: Clear error for invalid JSON
-        raise ValueError(f"Invalid JSON: {e}") from e
+        with open_export(file_path) as f:
+            reader = _BudgetReader(f, DETECTION_BYTE_BUDGET)
+            try:
+                return _detect_from_events(reader, hints)
+            except ijson.JSONError as e:
+                if not reader.exhausted:
+                    # FR-050: Clear error for invalid JSON
+                    raise ValueError(f"Invalid JSON: {e}") from e
+
+    except ParseError as e:
+        # Not a valid ZIP archive, or no conversations.json member
+        raise ValueError(str(e)) from e
+
+    # Byte budget spent inside the first conversation without a deciding key
+    if len(hints) == 1:
+        return hints.pop()
+    raise ValueError(
+        f"Could not detect the export provider from the first "
+        f"{DETECTION_BYTE_BUDGET // 1024} KiB: no 'mapping' or 'chat_messages' key "
+        "found. Specify the provider explicitly (--provider)."
+    )
+
+
+def _detect_from_events(f: _BudgetReader, hints: set[ProviderType]) -> ProviderType:
+    """Decide the provider from the first conversation's top-level keys.
+
+    Top-level keys only one provider uses are collected into ``hints`` on
+    the way, for the caller to fall back on if the budget runs out.
+    """
+    # Conversations are array items; a single conversation object at the
+    # root is also accepted
+    conversation = "item"
+    for prefix, event, value in ijson.parse(f, buf_size=_DETECTION_CHUNK):
+        if prefix == "" and event == "start_map":
+            conversation = ""
+        elif prefix == "" and event == "start_array":
+            continue
+        elif prefix == conversation and event == "map_key":
+            if value in _PROVIDER_KEYS:
+                return _PROVIDER_KEYS[value]
+            if value in _HINT_KEYS:
+                hints.add(_HINT_KEYS[value])
+        elif prefix == conversation and event == "end_map":
+            # FR-050: First conversation has neither key
+            raise ValueError(_UNSUPPORTED_FORMAT)
+        elif prefix == conversation and event != "start_map":
+            # First array item is not an object
+            raise ValueError(_UNSUPPORTED_FORMAT)
+        elif prefix == "":
+            # Empty array (or scalar root) - default to OpenAI for backwards
+            # compatibility; empty arrays are valid exports with zero conversations
+            return "openai"
+    return "openai"
+
+
+class _BudgetReader:
+    """Binary reader that reports end of file after ``budget`` bytes."""
+
+    def __init__(self, f: IO[bytes], budget: int) -> None:
+        self._file = f
+        self._remaining = budget
+
+    @property
+    def exhausted(self) -> bool:
+        """True once ``budget`` bytes have been read."""
+        return self._remaining == 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
 
 
 def get_adapter(
@@ -130,14 +218,15 @@ def get_adapter(
     """Get appropriate adapter based on provider flag or auto-detection.
 
     If provider is explicitly specified, returns that adapter without
-    inspecting the file. If provider is None, auto-detects from file structure.
+    inspecting the file. If provider is None, returns NDJSONAdapter for a
+    normalized NDJSON file and otherwise auto-detects from file structure.
 
     Args:
         provider: Explicit provider ("openai", "claude") or None for auto-detect
         file_path: Path to export file (used only for auto-detection)
 
     Returns:
-        OpenAIAdapter or ClaudeAdapter instance
+        OpenAIAdapter, ClaudeAdapter or NDJSONAdapter instance
 
     Raises:
         ValueError: If provider is invalid or auto-detection fails
@@ -165,6 +254,9 @@ def get_adapter(
     if provider == "claude":
         return ClaudeAdapter()
     if provider is None:
+        # Normalized files carry conversations of either provider
+        if is_ndjson(file_path):
+            return NDJSONAdapter()
         # FR-046: Auto-detect provider from file structure
         detected = detect_provider(file_path)
         if detected == "claude":
@@ -142,11 +142,45 @@ class SchemaVersionError(EchomineError):
     """
 
 
+class AmbiguousIdError(EchomineError):
+    """Partial conversation ID matching more than one conversation.
+
+    Raised by ``get_conversation_by_id`` and ``get_conversations_by_ids``
+    when a requested ID is not a full conversation ID but a prefix of
+    several, instead of silently returning the first match. Retry with a
+    longer prefix or the full ID.
+
+    Attributes:
+        conversation_id: The requested (partial) ID
+        matches: Conversation IDs the prefix matches (the first few)
+        more: True if the prefix matches more IDs than listed
+
+    Example:
+        ```python
+        try:
+            conv = adapter.get_conversation_by_id(Path("export.json"), "a1b2")
+        except AmbiguousIdError as e:
+            print(f"Did you mean one of: {', '.join(e.matches)}?")
+        ```
+    """
+
+    def __init__(self, conversation_id: str, matches: list[str], *, more: bool = False) -> None:
+        self.conversation_id = conversation_id
+        self.matches = matches
+        self.more = more
+        listed = ", ".join(matches) + (", ..." if more else "")
+        super().__init__(
+            f"Conversation ID '{conversation_id}' is ambiguous; it matches {listed}. "
+            "Use a longer prefix or the full ID."
+        )
+
+
 # ============================================================================
 # Exception Exports
 # ============================================================================
 
 __all__ = [
+    "AmbiguousIdError",
     "EchomineError",
     "ParseError",
     "SchemaVersionError",
@@ -0,0 +1,455 @@
+"""Bulk export of every conversation in an archive to one file each.
+
+Exporting conversations one ID at a time rescans the export for every
+conversation. A bulk export reads the archive once and turns each parsed
+conversation into a file right away:
+
+    - ``ConversationWriter`` wraps an adapter's ``_parse_or_skip`` hook: it
+      parses one raw conversation, renders it (markdown via
+      ``MarkdownExporter.export_conversation_from_model`` or JSON) and writes
+      it to the output directory
+    - Adapters run the writer like any other parse hook (see
+      ``OpenAIAdapter.export_all``), so with ``workers > 1`` parsing,
+      rendering and writing all happen in the worker processes and only a
+      small ``ExportedFile`` record travels back to the caller
+    - File names come from the title and ID of the conversation
+      (``conversation_filename``), so workers never need to coordinate names
+    - Each file is written to a temporary name and renamed into place, so an
+      interrupted export never leaves truncated files behind
+
+Incremental Sync (``sync_export``):
+    - A manifest in the output directory (``.echomine-manifest.json``)
+      records ``{conversation_id: updated_at, content_hash, path}`` for every
+      file exported
+    - Conversations whose ``updated_at`` (or ``created_at``) matches the
+      manifest, and whose file still exists, are recognized from their header
+      alone: no Message models are built, nothing is rendered or written
+    - Changed conversations are re-rendered; the file is only rewritten when
+      its content hash differs, and the old file is removed when a title
+      change renamed it
+    - With ``prune=True``, files of conversations no longer in the export are
+      deleted (only files recorded in the manifest are ever touched)
+    - A manifest written for another format or metadata setting is ignored,
+      so the next sync rewrites everything
+
+Constitution Compliance:
+    - Principle I: Library-first (CLI ``export-all`` wraps ``adapter.export_all``
+      and ``sync_export``)
+    - Principle VIII: Memory efficiency (one conversation per worker at a time)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+
+from echomine.export.markdown import MarkdownExporter
+from echomine.models.conversation import Conversation, ConversationHeader
+
+
+if TYPE_CHECKING:
+    # Adapters import this module; runtime imports would be circular
+    from echomine.adapters.claude import ClaudeAdapter
+    from echomine.adapters.ndjson import NDJSONAdapter
+    from echomine.adapters.openai import OpenAIAdapter
+    from echomine.adapters.parallel import ParseHook, Skipped
+    from echomine.models.protocols import OnSkipCallback, ProgressCallback
+    from echomine.models.search import SearchQuery
+
+
+logger = logging.getLogger(__name__)
+
+BulkExportFormat = Literal["markdown", "json"]
+
+# File extension for each bulk export format
+FORMAT_EXTENSIONS: dict[str, str] = {"markdown": ".md", "json": ".json"}
+
+# Sync manifest file name (inside the output directory) and schema version
+MANIFEST_NAME = ".echomine-manifest.json"
+MANIFEST_VERSION = 1
+
+# Maximum number of title characters kept in a file name
+_SLUG_LENGTH = 60
+
+_SLUG_RE = re.compile(r"[^\w]+")
+_ID_RE = re.compile(r"[^\w-]+")
+
+
+class ExportedFile(NamedTuple):
+    """One conversation handled by a bulk export.
+
+    Attributes:
+        conversation_id: ID of the exported conversation
+        path: File holding the conversation
+        size: Number of bytes written (0 if the file was left as is)
+        updated_at: ISO 8601 ``updated_at`` (or ``created_at``) of the conversation
+        content_hash: SHA-256 hex digest of the file content
+        written: False if a sync found the file already up to date
+    """
+
+    conversation_id: str
+    path: Path
+    size: int
+    updated_at: str
+    content_hash: str
+    written: bool = True
+
+
+class ManifestEntry(NamedTuple):
+    """Sync manifest record of one exported conversation.
+
+    Attributes:
+        updated_at: ISO 8601 ``updated_at`` (or ``created_at``) when exported
+        content_hash: SHA-256 hex digest of the file content
+        path: File name, relative to the output directory
+    """
+
+    updated_at: str
+    content_hash: str
+    path: str
+
+
+class SyncResult(NamedTuple):
+    """Outcome of ``sync_export``.
+
+    Attributes:
+        written: Conversations rendered and (re)written
+        unchanged: Conversations whose file was already up to date
+        pruned: Files removed because their conversation left the export
+    """
+
+    written: int
+    unchanged: int
+    pruned: int
+
+
+def conversation_filename(conversation_id: str, title: str, format: BulkExportFormat) -> str:
+    """Build the bulk-export file name of a conversation.
+
+    The name is a slug of the title followed by the conversation ID, e.g.
+    ``python-asyncio-tutorial_conv-abc123.md``. Including the ID keeps names
+    unique without comparing titles across conversations.
+
+    Args:
+        conversation_id: Conversation ID
+        title: Conversation title
+        format: "markdown" or "json" (selects the extension)
+
+    Returns:
+        File name (no directory part)
+    """
+    slug = _SLUG_RE.sub("-", title.lower()).strip("-_")[:_SLUG_LENGTH].rstrip("-_")
+    safe_id = _ID_RE.sub("_", conversation_id)
+    return f"{slug or 'untitled'}_{safe_id}{FORMAT_EXTENSIONS[format]}"
+
+
+class ConversationWriter:
+    """Parse hook that writes each parsed conversation to its own file.
+
+    Instances are picklable (as long as ``parse`` is), so adapters can hand
+    them to worker processes in place of ``_parse_or_skip``.
+
+    Args:
+        parse: Adapter parse hook returning Conversation, Skipped or None
+        out_dir: Existing directory the files are written to
+        format: "markdown" or "json"
+        include_metadata: Markdown only - include YAML frontmatter and
+            message IDs
+        header: Adapter header hook (``_parse_header_or_skip``). When given,
+            the writer syncs against the manifest in ``out_dir``:
+            conversations it lists as up to date are reported without being
+            parsed, rendered or written
+    """
+
+    def __init__(
+        self,
+        parse: ParseHook,
+        out_dir: Path,
+        format: BulkExportFormat = "markdown",
+        *,
+        include_metadata: bool = True,
+        header: ParseHook | None = None,
+    ) -> None:
+        self.parse = parse
+        self.out_dir = out_dir
+        self.format = format
+        self.include_metadata = include_metadata
+        self.header = header
+        # Workers load the manifest themselves (once, see _cached_manifest)
+        # rather than receiving a copy with every pickled batch
+        manifest_path = out_dir / MANIFEST_NAME
+        self.manifest_mtime_ns = (
+            manifest_path.stat().st_mtime_ns
+            if header is not None and manifest_path.is_file()
+            else None
+        )
+
+    def __call__(
+        self, raw_conversation: Any, prefilter: SearchQuery | None = None
+    ) -> ExportedFile | Skipped | None:
+        """Parse, render and write one raw conversation.
+
+        Args:
+            raw_conversation: Raw conversation from export (as the parse hook
+                takes it: a dict, or an NDJSON line)
+            prefilter: Optional SearchQuery forwarded to the parse hook
+
+        Returns:
+            ExportedFile for the conversation's file, or the parse hook's
+            Skipped / None outcome
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        if self.header is not None:
+            unchanged = self._unchanged(raw_conversation, prefilter)
+            if unchanged is not None:
+                return unchanged
+
+        outcome = self.parse(raw_conversation, prefilter)
+        if not isinstance(outcome, Conversation):
+            return outcome  # type: ignore[no-any-return]
+        return self.write(outcome)
+
+    def write(self, conversation: Conversation) -> ExportedFile:
+        """Render one conversation and write it atomically.
+
+        When syncing, a file whose content hash matches the manifest is left
+        untouched.
+
+        Args:
+            conversation: Parsed conversation
+
+        Returns:
+            ExportedFile describing the file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        if self.format == "json":
+            content = conversation.model_dump_json(indent=2)
+        else:
+            content = MarkdownExporter().export_conversation_from_model(
+                conversation,
+                include_metadata=self.include_metadata,
+                include_message_ids=self.include_metadata,
+            )
+        data = content.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        updated_at = conversation.updated_at_or_created.isoformat()
+
+        path = self.out_dir / conversation_filename(
+            conversation.id, conversation.title, self.format
+        )
+        entry = self._previous().get(conversation.id)
+        if (
+            entry is not None
+            and entry.content_hash == content_hash
+            and entry.path == path.name
+            and path.is_file()
+        ):
+            return ExportedFile(conversation.id, path, 0, updated_at, content_hash, written=False)
+
+        _write_atomic(path, data)
+        return ExportedFile(conversation.id, path, len(data), updated_at, content_hash)
+
+    def _previous(self) -> dict[str, ManifestEntry]:
+        """Manifest entries of the last sync (empty when not syncing)."""
+        if self.manifest_mtime_ns is None:
+            return {}
+        return _cached_manifest(
+            self.out_dir, self.manifest_mtime_ns, self.format, self.include_metadata
+        )
+
+    def _unchanged(
+        self, raw_conversation: Any, prefilter: SearchQuery | None
+    ) -> ExportedFile | None:
+        """Report a conversation as up to date, judging by its header alone."""
+        assert self.header is not None
+        header = self.header(raw_conversation, prefilter)
+        if not isinstance(header, ConversationHeader):
+            # Malformed or excluded: let the full parse report it
+            return None
+        entry = self._previous().get(header.id)
+        updated_at = header.updated_at_or_created.isoformat()
+        if entry is None or entry.updated_at != updated_at:
+            return None
+        path = self.out_dir / entry.path
+        if not path.is_file():
+            return None
+        return ExportedFile(header.id, path, 0, updated_at, entry.content_hash, written=False)
+
+
+def sync_export(
+    file_path: Path,
+    out_dir: Path,
+    *,
+    adapter: OpenAIAdapter | ClaudeAdapter | NDJSONAdapter,
+    format: BulkExportFormat = "markdown",
+    include_metadata: bool = True,
+    prune: bool = False,
+    progress_callback: ProgressCallback | None = None,
+    on_skip: OnSkipCallback | None = None,
+    workers: int = 1,
+) -> SyncResult:
+    """Bring a directory written by ``export_all`` up to date with an export.
+
+    Runs ``adapter.export_all(..., sync=True)``, so only new or changed
+    conversations are parsed, rendered and written (see the module docstring
+    for how changes are detected), then rewrites the manifest in ``out_dir``.
+
+    Args:
+        file_path: Path to export file
+        out_dir: Output directory (created if missing)
+        adapter: Adapter matching the export's provider (or NDJSONAdapter)
+        format: "markdown" (default) or "json"
+        include_metadata: Markdown only - include YAML frontmatter and
+            message IDs (default: True)
+        prune: Delete files of conversations no longer in the export
+        progress_callback: Optional callback invoked every 100 conversations
+        on_skip: Optional callback invoked when malformed entries skipped
+        workers: Number of processes (1 = export in this process)
+
+    Returns:
+        SyncResult with written, unchanged and pruned counts
+
+    Raises:
+        FileNotFoundError: If file_path doesn't exist
+        ParseError: If JSON is malformed (syntax errors)
+        OSError: If out_dir, a file or the manifest cannot be written
+
+    Example:
+        ```python
+        from echomine import OpenAIAdapter
+        from echomine.export.bulk import sync_export
+
+        result = sync_export(
+            Path("export.json"), Path("notes"), adapter=OpenAIAdapter(), prune=True
+        )
+        print(f"{result.written} written, {result.unchanged} unchanged")
+        ```
+
+    Time Complexity: O(M) header reads for M conversations in file, plus
+        parsing, rendering and writing of changed conversations only
+    """
+    previous = load_manifest(out_dir, format=format, include_metadata=include_metadata)
+    # Without pruning, conversations missing from this export keep their entries
+    entries = {} if prune else dict(previous)
+    written = 0
+    unchanged = 0
+
+    for exported in adapter.export_all(
+        file_path,
+        out_dir,
+        format=format,
+        include_metadata=include_metadata,
+        progress_callback=progress_callback,
+        on_skip=on_skip,
+        workers=workers,
+        sync=True,
+    ):
+        old = previous.get(exported.conversation_id)
+        if exported.written:
+            written += 1
+            if old is not None and old.path != exported.path.name:
+                # Title changed: drop the file written under the old name
+                (out_dir / old.path).unlink(missing_ok=True)
+        else:
+            unchanged += 1
+        entries[exported.conversation_id] = ManifestEntry(
+            exported.updated_at, exported.content_hash, exported.path.name
+        )
+
+    pruned = 0
+    if prune:
+        for conversation_id, old in previous.items():
+            if conversation_id not in entries:
+                (out_dir / old.path).unlink(missing_ok=True)
+                pruned += 1
+
+    _save_manifest(out_dir, entries, format=format, include_metadata=include_metadata)
+    return SyncResult(written, unchanged, pruned)
+
+
+def load_manifest(
+    out_dir: Path, *, format: BulkExportFormat, include_metadata: bool
+) -> dict[str, ManifestEntry]:
+    """Read the sync manifest of an output directory.
+
+    Args:
+        out_dir: Output directory of a previous sync
+        format: Format of the sync about to run
+        include_metadata: Metadata setting of the sync about to run
+
+    Returns:
+        Entries by conversation ID. Empty if the manifest is missing,
+        unreadable, from another schema version, or was written for another
+        format or metadata setting (the files must then all be re-rendered).
+    """
+    manifest_path = out_dir / MANIFEST_NAME
+    try:
+        data = json.loads(manifest_path.read_bytes())
+        if (
+            data["version"] != MANIFEST_VERSION
+            or data["format"] != format
+            or data["include_metadata"] != include_metadata
+        ):
+            return {}
+        return {
+            conversation_id: ManifestEntry(
+                entry["updated_at"], entry["content_hash"], entry["path"]
+            )
+            for conversation_id, entry in data["conversations"].items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, LookupError, TypeError, AttributeError) as e:
+        logger.warning(
+            "Ignoring unreadable sync manifest",
+            extra={"manifest_path": str(manifest_path), "reason": str(e)},
+        )
+        return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_manifest(
+    out_dir: Path, _mtime_ns: int, format: BulkExportFormat, include_metadata: bool
+) -> dict[str, ManifestEntry]:
+    """Load a manifest once per process (a new mtime invalidates the cache)."""
+    return load_manifest(out_dir, format=format, include_metadata=include_metadata)
+
+
+def _save_manifest(
+    out_dir: Path,
+    entries: dict[str, ManifestEntry],
+    *,
+    format: BulkExportFormat,
+    include_metadata: bool,
+) -> None:
+    """Write the sync manifest atomically."""
+    data = {
+        "version": MANIFEST_VERSION,
+        "format": format,
+        "include_metadata": include_metadata,
+        "conversations": {
+            conversation_id: entry._asdict() for conversation_id, entry in sorted(entries.items())
+        },
+    }
+    _write_atomic(out_dir / MANIFEST_NAME, json.dumps(data, indent=1).encode("utf-8"))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file under a temporary name and rename it into place."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -39,19 +39,52 @@ API Example:
     # Message-level CSV (FR-052)
     csv_messages = exporter.export_messages_from_results(results)
     Path("messages.csv").write_text(csv_messages)
+
+    # Stream rows straight to a file instead of building a string
+    with Path("messages.csv").open("w", encoding="utf-8", newline="") as f:
+        exporter.write_messages_from_results(adapter.search(path, query), f)
     ```
+
+Streaming:
+    Each ``export_*`` method has a ``write_*`` counterpart that accepts any
+    iterable (e.g. an adapter generator) and writes rows to a text stream as
+    they are produced. The ``export_*`` methods are thin wrappers that write
+    into a StringIO and return its value.
 """
 
 from __future__ import annotations
 
 import csv
-from collections.abc import Sequence
+from collections.abc import Iterable
+from datetime import datetime
 from io import StringIO
+from typing import TextIO
 
-from echomine.models.conversation import Conversation
+from echomine.models.conversation import Conversation, ConversationHeader
 from echomine.models.search import SearchResult
 
 
+# CSV header rows (FR-050, FR-052)
+_CONVERSATION_COLUMNS = ["conversation_id", "title", "created_at", "updated_at", "message_count"]
+_SEARCH_RESULT_COLUMNS = [*_CONVERSATION_COLUMNS, "score"]
+_MESSAGE_COLUMNS = ["conversation_id", "message_id", "role", "timestamp", "content"]
+
+
+def _format_timestamp(timestamp: datetime | None) -> str:
+    """ISO 8601 with Z suffix; empty string for NULL (FR-053a)."""
+    return timestamp.strftime("%Y-%m-%dT%H:%M:%SZ") if timestamp is not None else ""
+
+
+def _conversation_row(conversation: Conversation | ConversationHeader) -> list[object]:
+    return [
+        conversation.id,
+        conversation.title,
+        _format_timestamp(conversation.created_at),
+        _format_timestamp(conversation.updated_at),  # Empty string if NULL (FR-053a)
+        conversation.message_count,
+    ]
+
+
 class CSVExporter:
     """RFC 4180 compliant CSV exporter for conversation data.
 
@@ -64,15 +97,16 @@ class CSVExporter:
         - NULL values as empty fields (FR-053a)
         - Newlines preserved in quoted fields (FR-053b)
         - Compatible with Python csv module and pandas (FR-053c)
-        - Streaming-friendly for large datasets (FR-054)
+        - Streaming export to any text stream (FR-054)
 
     Memory Characteristics:
-        - O(1) memory usage for export operations
-        - Uses StringIO for efficient in-memory CSV generation
-        - No unbounded data structures
+        - ``write_*`` methods: O(1) memory, one row at a time, when given an
+          iterator (e.g. ``adapter.search(...)``)
+        - ``export_*`` methods: O(output size), the CSV is returned as a string
 
     Example:
         ```python
+        import sys
         from echomine.export.csv import CSVExporter
 
         exporter = CSVExporter()
@@ -87,14 +121,20 @@ class CSVExporter:
 
         # Export messages from conversation
         csv_messages = exporter.export_messages(conversation)
+
+        # Stream message rows of every result to stdout
+        exporter.write_messages_from_results(adapter.search(path, query), sys.stdout)
         ```
     """
 
-    def export_conversations(self, conversations: Sequence[Conversation]) -> str:
+    def export_conversations(
+        self, conversations: Iterable[Conversation | ConversationHeader]
+    ) -> str:
         """Export conversations to CSV format without scores.
 
         Generates conversation-level CSV with fields: conversation_id, title,
-        created_at, updated_at, message_count. This is used by the list command.
+        created_at, updated_at, message_count. Same output as
+        ``write_conversations``, returned as a string.
 
         CSV Schema (FR-050):
             - conversation_id: Unique conversation identifier
@@ -104,7 +144,7 @@ class CSVExporter:
             - message_count: Number of messages in conversation
 
         Args:
-            conversations: Sequence of Conversation objects to export
+            conversations: Conversation or ConversationHeader objects
 
         Returns:
             CSV string with header and data rows
@@ -124,44 +164,45 @@ class CSVExporter:
             - FR-050: Conversation-level CSV schema
             - FR-053: RFC 4180 escaping
             - FR-053a: NULL values as empty fields
-            - FR-054: O(1) memory usage
         """
         output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
+        self.write_conversations(conversations, output)
+        return output.getvalue()
 
-        # Write header (FR-050)
-        writer.writerow(["conversation_id", "title", "created_at", "updated_at", "message_count"])
+    def write_conversations(
+        self, conversations: Iterable[Conversation | ConversationHeader], out: TextIO
+    ) -> int:
+        """Write conversation-level CSV to a text stream, one row at a time.
 
-        # Write data rows
-        for conversation in conversations:
-            # Format timestamps as ISO 8601 with Z suffix
-            created_at_str = conversation.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            # NULL handling (FR-053a): empty string for NULL updated_at
-            updated_at_str = (
-                conversation.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-                if conversation.updated_at is not None
-                else ""
-            )
+        Streaming counterpart of ``export_conversations``; used by the list
+        command. Rows are written as ``conversations`` is consumed.
 
-            writer.writerow(
-                [
-                    conversation.id,
-                    conversation.title,
-                    created_at_str,
-                    updated_at_str,  # Empty string if NULL (FR-053a)
-                    conversation.message_count,
-                ]
-            )
+        Args:
+            conversations: Conversation or ConversationHeader objects (any iterable)
+            out: Text stream to write to (open files with ``newline=""``)
 
-        return output.getvalue()
+        Returns:
+            Number of data rows written
 
-    def export_search_results(self, results: Sequence[SearchResult[Conversation]]) -> str:
+        Compliance:
+            - FR-050: Conversation-level CSV schema
+            - FR-054: O(1) memory usage
+        """
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(_CONVERSATION_COLUMNS)
+
+        rows = 0
+        for conversation in conversations:
+            writer.writerow(_conversation_row(conversation))
+            rows += 1
+        return rows
+
+    def export_search_results(self, results: Iterable[SearchResult[Conversation]]) -> str:
         """Export search results to CSV format with relevance scores.
 
         Generates conversation-level CSV with fields: conversation_id, title,
-        created_at, updated_at, message_count, score. This is used by the
-        search command with --format csv.
+        created_at, updated_at, message_count, score. Same output as
+        ``write_search_results``, returned as a string.
 
         CSV Schema (FR-050):
             - conversation_id: Unique conversation identifier
@@ -169,10 +210,10 @@ class CSVExporter:
             - created_at: Creation timestamp (ISO 8601 with Z suffix)
             - updated_at: Update timestamp (ISO 8601 with Z suffix, empty if NULL)
             - message_count: Number of messages in conversation
-            - score: Relevance score (0.0-1.0, formatted to 3 decimal places)
+            - score: Relevance score (0.0-1.0)
 
         Args:
-            results: Sequence of SearchResult objects containing conversations and scores
+            results: SearchResult objects containing conversations and scores
 
         Returns:
             CSV string with header and data rows including scores
@@ -193,47 +234,38 @@ class CSVExporter:
             - FR-050: Search result CSV schema with score
             - FR-053: RFC 4180 escaping
             - FR-053a: NULL values as empty fields
-            - FR-054: O(1) memory usage
         """
         output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-
-        # Write header with score column (FR-050)
-        writer.writerow(
-            [
-                "conversation_id",
-                "title",
-                "created_at",
-                "updated_at",
-                "message_count",
-                "score",
-            ]
-        )
+        self.write_search_results(results, output)
+        return output.getvalue()
 
-        # Write data rows
-        for result in results:
-            conversation = result.conversation
-            created_at_str = conversation.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            # NULL handling (FR-053a)
-            updated_at_str = (
-                conversation.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-                if conversation.updated_at is not None
-                else ""
-            )
+    def write_search_results(
+        self, results: Iterable[SearchResult[Conversation]], out: TextIO
+    ) -> int:
+        """Write search-result CSV (with scores) to a text stream, one row at a time.
 
-            writer.writerow(
-                [
-                    conversation.id,
-                    conversation.title,
-                    created_at_str,
-                    updated_at_str,
-                    conversation.message_count,
-                    result.score,  # Score column
-                ]
-            )
+        Streaming counterpart of ``export_search_results``; used by the
+        search command with --format csv.
 
-        return output.getvalue()
+        Args:
+            results: SearchResult objects (any iterable, e.g. ``adapter.search(...)``)
+            out: Text stream to write to (open files with ``newline=""``)
+
+        Returns:
+            Number of data rows written
+
+        Compliance:
+            - FR-050: Search result CSV schema with score
+            - FR-054: O(1) memory usage
+        """
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(_SEARCH_RESULT_COLUMNS)
+
+        rows = 0
+        for result in results:
+            writer.writerow([*_conversation_row(result.conversation), result.score])
+            rows += 1
+        return rows
 
     def export_messages(self, conversation: Conversation) -> str:
         """Export messages from a single conversation to CSV format.
@@ -275,35 +307,35 @@ class CSVExporter:
             - FR-052: Message-level CSV schema
             - FR-053: RFC 4180 escaping
             - FR-053b: Newlines preserved in content
-            - FR-054: O(1) memory usage
         """
         output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
-
-        # Write header (FR-052)
-        writer.writerow(["conversation_id", "message_id", "role", "timestamp", "content"])
-
-        # Write message rows
-        for message in conversation.messages:
-            timestamp_str = message.timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            writer.writerow(
-                [
-                    conversation.id,
-                    message.id,
-                    message.role,
-                    timestamp_str,
-                    message.content,  # Newlines preserved per FR-053b
-                ]
-            )
-
+        self.write_messages(conversation, output)
         return output.getvalue()
 
-    def export_messages_from_results(self, results: Sequence[SearchResult[Conversation]]) -> str:
+    def write_messages(self, conversation: Conversation, out: TextIO) -> int:
+        """Write message-level CSV of one conversation to a text stream.
+
+        Streaming counterpart of ``export_messages``.
+
+        Args:
+            conversation: Conversation object containing messages to export
+            out: Text stream to write to (open files with ``newline=""``)
+
+        Returns:
+            Number of message rows written
+
+        Compliance:
+            - FR-052: Message-level CSV schema
+            - FR-053b: Newlines preserved in content
+        """
+        return self._write_message_rows([conversation], out)
+
+    def export_messages_from_results(self, results: Iterable[SearchResult[Conversation]]) -> str:
         """Export messages from all conversations in search results to CSV format.
 
-        Generates message-level CSV for all messages across multiple search results.
-        Used by search command with --csv-messages flag.
+        Generates message-level CSV for all messages across multiple search
+        results. Same output as ``write_messages_from_results``, returned as
+        a string.
 
         CSV Schema (FR-052):
             - conversation_id: Parent conversation identifier
@@ -313,7 +345,7 @@ class CSVExporter:
             - content: Message text content
 
         Args:
-            results: Sequence of SearchResult objects containing conversations
+            results: SearchResult objects containing conversations
 
         Returns:
             CSV string with header and all message rows
@@ -332,30 +364,49 @@ class CSVExporter:
             - FR-052: Message-level CSV schema
             - FR-053: RFC 4180 escaping
             - FR-053b: Newlines preserved in content
-            - FR-054: O(1) memory usage
         """
         output = StringIO()
-        writer = csv.writer(output, lineterminator="\n")
+        self.write_messages_from_results(results, output)
+        return output.getvalue()
 
-        # Write header (FR-052)
-        writer.writerow(["conversation_id", "message_id", "role", "timestamp", "content"])
+    def write_messages_from_results(
+        self, results: Iterable[SearchResult[Conversation]], out: TextIO
+    ) -> int:
+        """Write message-level CSV of every search result to a text stream.
 
-        # Write message rows from all conversations
-        total_messages = 0
-        for result in results:
-            conversation = result.conversation
-            for message in conversation.messages:
-                timestamp_str = message.timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+        Streaming counterpart of ``export_messages_from_results``; used by
+        the search command with --csv-messages. Each result's messages are
+        written as soon as the result is produced.
+
+        Args:
+            results: SearchResult objects (any iterable, e.g. ``adapter.search(...)``)
+            out: Text stream to write to (open files with ``newline=""``)
+
+        Returns:
+            Number of message rows written
 
+        Compliance:
+            - FR-052: Message-level CSV schema
+            - FR-054: O(1) memory usage (one conversation at a time)
+        """
+        return self._write_message_rows((result.conversation for result in results), out)
+
+    def _write_message_rows(self, conversations: Iterable[Conversation], out: TextIO) -> int:
+        """Write the message CSV header and one row per message."""
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(_MESSAGE_COLUMNS)
+
+        rows = 0
+        for conversation in conversations:
+            for message in conversation.messages:
                 writer.writerow(
                     [
                         conversation.id,
                         message.id,
                         message.role,
-                        timestamp_str,
-                        message.content,
+                        _format_timestamp(message.timestamp),
+                        message.content,  # Newlines preserved per FR-053b
                     ]
                 )
-                total_messages += 1
-
-        return output.getvalue()
+                rows += 1
+        return rows
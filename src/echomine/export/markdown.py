@@ -12,9 +12,15 @@ Constitution Compliance:
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
+
+from echomine.exceptions import ParseError
+from echomine.index.export_index import ExportIndex
+from echomine.index.scanner import iter_element_spans
+from echomine.utils.archive import open_export
 
 
 if TYPE_CHECKING:
@@ -200,48 +206,174 @@ class MarkdownExporter:
             )
             ```
         """
-        # Load conversation data
-        with open(export_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Find the conversation
-        conversation_data = self._find_conversation(data, conversation_id)
-        if conversation_data is None:
+        match = next(self._iter_conversation_data(export_file, [conversation_id]), None)
+        if match is None:
             raise ValueError(f"Conversation {conversation_id} not found in {export_file}")
 
-        # Extract messages from mapping structure
-        messages = self._extract_messages(conversation_data)
-
-        # Convert to markdown with conversation metadata
-        return self._render_markdown(
-            messages,
-            conversation_data,
+        return self._render_conversation_data(
+            match[1],
             include_metadata=include_metadata,
             include_message_ids=include_message_ids,
         )
 
-    def _find_conversation(self, data: Any, conversation_id: str) -> dict[str, Any] | None:
-        """Find conversation by ID in OpenAI export data.
+    def export_conversations(
+        self,
+        export_file: Path,
+        conversation_ids: Iterable[str],
+        *,
+        include_metadata: bool = True,
+        include_message_ids: bool = True,
+    ) -> dict[str, str]:
+        """Export several conversations in one pass (OpenAI format only).
+
+        Same rendering as ``export_conversation``, but the export is read
+        once for all IDs and reading stops as soon as every ID was found.
 
         Args:
-            data: Parsed JSON data (list or single conversation)
-            conversation_id: ID to search for
+            export_file: Path to OpenAI export JSON file
+            conversation_ids: IDs of conversations to export
+            include_metadata: Include YAML frontmatter (default: True)
+            include_message_ids: Include message IDs in headers (default: True)
 
         Returns:
-            Conversation dict if found, None otherwise
+            Mapping of conversation ID to markdown, in the order the
+            conversations appear in the export. IDs not present in the export
+            are absent from the result.
+
+        Raises:
+            FileNotFoundError: If export_file does not exist
+            json.JSONDecodeError: If export file is not valid JSON
+
+        Example:
+            ```python
+            exporter = MarkdownExporter()
+            rendered = exporter.export_conversations(Path("export.json"), ["abc", "def"])
+            for conversation_id, markdown in rendered.items():
+                Path(f"{conversation_id}.md").write_text(markdown)
+            ```
         """
-        # Handle both list of conversations and single conversation
-        conversations: list[Any] = data if isinstance(data, list) else [data]
+        return {
+            conversation_id: self._render_conversation_data(
+                conversation_data,
+                include_metadata=include_metadata,
+                include_message_ids=include_message_ids,
+            )
+            for conversation_id, conversation_data in self._iter_conversation_data(
+                export_file, conversation_ids
+            )
+        }
 
-        for conv in conversations:
-            if not isinstance(conv, dict):
-                continue
-            if conv.get("id") == conversation_id or conv.get("conversation_id") == conversation_id:
-                # Type narrowed to dict[str, Any] by isinstance check
-                return dict(conv)
+    def _iter_conversation_data(
+        self, export_file: Path, conversation_ids: Iterable[str]
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield (requested_id, raw conversation) for each requested ID found.
 
+        Seeks straight to the conversations whose ``id`` a current OpenAI
+        offset index resolves. IDs it does not resolve (the index records
+        ``id`` only, not ``conversation_id``), or every ID when there is no
+        index, are looked up by streaming the export once, reading only the
+        top-level fields of non-matching conversations, until every ID was
+        found. The first conversation matching an ID wins.
+
+        Args:
+            export_file: Path to OpenAI export JSON file
+            conversation_ids: IDs to look up (``id`` or ``conversation_id``)
+
+        Yields:
+            (conversation_id, conversation dict): index hits in file order,
+            then the remaining matches in file order
+
+        Raises:
+            FileNotFoundError: If export_file does not exist
+            json.JSONDecodeError: If export file is not valid JSON
+        """
+        remaining = set(conversation_ids)
+        if not remaining:
+            return
+
+        index = ExportIndex.load(export_file)
+        if index is not None and index.provider == "openai":
+            found = sorted(
+                (spans[0], conversation_id)
+                for conversation_id in remaining
+                if (spans := index.find(conversation_id, prefix=False))
+            )
+            with open_export(export_file) as f:
+                for (start, end), conversation_id in found:
+                    yield conversation_id, self._read_conversation(f, start, end)
+                    remaining.discard(conversation_id)
+            if not remaining:
+                return
+
+        with open_export(export_file) as f:
+            if f.read(1024).lstrip(b" \t\r\n").startswith(b"{"):
+                # Single conversation at the root instead of an array
+                f.seek(0)
+                data = json.load(f)
+                match = self._match_conversation_id(data, remaining)
+                if match is not None:
+                    yield match, data
+                return
+
+            f.seek(0)
+            with open_export(export_file) as reader:
+                try:
+                    for span in iter_element_spans(f):
+                        match = self._match_conversation_id(span.fields, remaining)
+                        if match is None:
+                            continue
+                        yield match, self._read_conversation(reader, span.start, span.end)
+                        remaining.discard(match)
+                        if not remaining:
+                            return
+                except ParseError as e:
+                    raise json.JSONDecodeError(str(e), "", 0) from e
+
+    def _match_conversation_id(self, fields: dict[str, Any], ids: set[str]) -> str | None:
+        """Return the requested ID a conversation matches, if any.
+
+        Args:
+            fields: Conversation dict (or its top-level scalar fields)
+            ids: Requested conversation IDs
+
+        Returns:
+            Matching ``id`` or ``conversation_id`` value, None otherwise
+        """
+        for key in ("id", "conversation_id"):
+            value = fields.get(key)
+            if isinstance(value, str) and value in ids:
+                return value
         return None
 
+    def _read_conversation(self, f: IO[bytes], start: int, end: int) -> dict[str, Any]:
+        """Decode the conversation stored at a byte range of the export.
+
+        Uses the standard ``json`` decoder so values (e.g. float timestamps)
+        are the same as when loading the whole file.
+        """
+        f.seek(start)
+        conversation: dict[str, Any] = json.loads(f.read(end - start))
+        return conversation
+
+    def _render_conversation_data(
+        self,
+        conversation_data: dict[str, Any],
+        *,
+        include_metadata: bool,
+        include_message_ids: bool,
+    ) -> str:
+        """Render a raw OpenAI conversation dict to markdown."""
+        # Extract messages from mapping structure
+        messages = self._extract_messages(conversation_data)
+
+        # Convert to markdown with conversation metadata
+        return self._render_markdown(
+            messages,
+            conversation_data,
+            include_metadata=include_metadata,
+            include_message_ids=include_message_ids,
+        )
+
     def _extract_messages(self, conversation_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract messages from OpenAI conversation mapping structure.
 
@@ -0,0 +1,53 @@
+"""Sidecar indexes for random access into export files.
+
+Public API:
+    - ExportIndex: Byte-offset index (conversation ID -> byte range) stored
+      next to the export as ``<export>.emidx``
+    - SearchIndex: Inverted index with BM25 statistics stored next to the
+      export as ``<export>.emsearch``; answers ``search()`` without reparsing
+    - iter_element_spans: Chunked scanner yielding byte ranges of top-level
+      array elements
+    - find_conversations_by_title: Title substring lookup reading only ids
+      and titles (from the index when current, else a streaming scan)
+    - stream_cached_headers: Conversation headers replayed from a binary
+      snapshot in the user cache directory (written on the first full read)
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (seek to one conversation instead of
+      streaming the whole export; search reads postings, not the export)
+    - Principle I: Library-first design (CLI ``index`` commands wrap this API)
+"""
+
+from echomine.index.export_index import (
+    INDEX_SUFFIX,
+    ExportIndex,
+    compute_fingerprint,
+    find_conversations_by_title,
+)
+from echomine.index.scanner import ElementSpan, iter_element_spans
+from echomine.index.search_index import SEARCH_INDEX_SUFFIX, SearchHit, SearchIndex
+from echomine.index.snapshot import (
+    SNAPSHOT_SUFFIX,
+    cache_enabled,
+    default_cache_dir,
+    snapshot_path,
+    stream_cached_headers,
+)
+
+
+__all__ = [
+    "INDEX_SUFFIX",
+    "SEARCH_INDEX_SUFFIX",
+    "SNAPSHOT_SUFFIX",
+    "ElementSpan",
+    "ExportIndex",
+    "SearchHit",
+    "SearchIndex",
+    "cache_enabled",
+    "compute_fingerprint",
+    "default_cache_dir",
+    "find_conversations_by_title",
+    "iter_element_spans",
+    "snapshot_path",
+    "stream_cached_headers",
+]
@@ -0,0 +1,609 @@
+"""Sidecar byte-offset index for random access into export files.
+
+An export index is a small SQLite database stored next to the export
+(``conversations.json`` -> ``conversations.json.emidx``). It maps each
+conversation ID, and each message ID, to the byte range of the conversation's
+JSON object so lookups can ``seek()`` directly to the conversation and parse
+only that slice instead of streaming the whole file.
+
+Index Lifecycle:
+    - Built explicitly in one streaming pass (``ExportIndex.build`` or
+      ``echomine index build``)
+    - Loaded opportunistically by adapters (``ExportIndex.load``); a missing,
+      corrupt, or stale index is silently ignored and callers fall back to
+      streaming
+    - Invalidated when the export's size, mtime, or content fingerprint
+      (SHA-256 of size + first/last 64 KiB) no longer match
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (index build is a chunked scan,
+      lookups read only the requested byte range)
+    - Principle I: Library-first (CLI ``index build`` wraps ``ExportIndex.build``)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import IO, Any, Literal
+
+import ijson
+
+from echomine.exceptions import AmbiguousIdError, ParseError
+from echomine.index.scanner import iter_element_spans
+from echomine.models.protocols import ProgressCallback
+from echomine.utils.archive import open_export
+from echomine.utils.id_lookup import MAX_REPORTED_MATCHES, MIN_PREFIX_LENGTH, lookup_key
+
+
+logger = logging.getLogger(__name__)
+
+IndexProvider = Literal["openai", "claude"]
+
+INDEX_SUFFIX = ".emidx"
+"""File suffix appended to the export path for the sidecar index."""
+
+INDEX_FORMAT_VERSION = 3
+"""Schema version; indexes written with a different version are treated as stale."""
+
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+"""Bytes hashed from the head and tail of the export for the fingerprint."""
+
+# Top-level field holding the conversation ID for each provider
+_ID_FIELDS: dict[str, str] = {"openai": "id", "claude": "uuid"}
+
+# Top-level field holding the conversation title for each provider
+_TITLE_FIELDS: dict[str, str] = {"openai": "title", "claude": "name"}
+
+# Top-level field holding the messages for each provider
+_MESSAGES_FIELDS: dict[str, str] = {"openai": "mapping", "claude": "chat_messages"}
+
+# Rows buffered before each executemany()
+_BATCH_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE conversations (
+    ordinal INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    lookup_key TEXT NOT NULL,
+    title TEXT,
+    start_offset INTEGER NOT NULL,
+    end_offset INTEGER NOT NULL
+);
+CREATE INDEX conversations_lookup_key ON conversations (lookup_key);
+CREATE TABLE messages (
+    message_id TEXT NOT NULL,
+    ordinal INTEGER NOT NULL
+);
+"""
+
+# Created once the messages table is filled (faster than indexing per insert)
+_MESSAGES_INDEX = "CREATE INDEX messages_message_id ON messages (message_id)"
+
+
+def compute_fingerprint(export_path: Path) -> str:
+    """Compute a cheap content fingerprint for an export file.
+
+    Hashes the file size plus the first and last ``FINGERPRINT_SAMPLE_BYTES``
+    bytes. This catches in-place rewrites that preserve size and mtime without
+    reading the whole (possibly multi-GB) file.
+
+    Args:
+        export_path: Path to export file
+
+    Returns:
+        Hex-encoded SHA-256 digest
+
+    Raises:
+        FileNotFoundError: If export_path does not exist
+        PermissionError: If export_path is not readable
+    """
+    digest = hashlib.sha256()
+    with open(export_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        digest.update(str(size).encode())
+        f.seek(0)
+        digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        if size > FINGERPRINT_SAMPLE_BYTES:
+            f.seek(max(FINGERPRINT_SAMPLE_BYTES, size - FINGERPRINT_SAMPLE_BYTES))
+            digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+    return digest.hexdigest()
+
+
+def read_element(f: IO[bytes], start: int, end: int) -> dict[str, Any]:
+    """Parse the raw conversation object stored at a byte range of an export.
+
+    Values match what ``ijson.items(f, "item")`` would yield for the same
+    element (e.g. numbers as ``Decimal``).
+
+    Args:
+        f: Export file opened in binary mode
+        start: Offset of the element's opening ``{``
+        end: Offset one past the element's closing ``}``
+
+    Returns:
+        Raw conversation dict
+
+    Raises:
+        ParseError: If the slice is not a valid JSON object
+    """
+    f.seek(start)
+    return parse_element(f.read(end - start), start=start, name=_stream_name(f))
+
+
+def _stream_name(f: IO[bytes]) -> str:
+    """Name of an export stream for messages (bz2/xz streams have none)."""
+    return str(getattr(f, "name", "export"))
+
+
+def parse_element(data: bytes, *, start: int, name: str) -> dict[str, Any]:
+    """Parse the raw conversation object in an element's bytes.
+
+    Like ``read_element``, for bytes already read from the export.
+
+    Args:
+        data: Bytes of the element
+        start: Offset of the element in the export (for error messages)
+        name: Name of the export (for error messages)
+
+    Returns:
+        Raw conversation dict
+
+    Raises:
+        ParseError: If the bytes are not a valid JSON object
+    """
+    end = start + len(data)
+    try:
+        raw = next(ijson.items(io.BytesIO(data), ""), None)
+    except ijson.JSONError as e:
+        raise ParseError(
+            f"Export index points at invalid JSON (bytes {start}-{end}) in "
+            f"'{name}': {e}. Rebuild with 'echomine index build'."
+        ) from e
+    if not isinstance(raw, dict):
+        raise ParseError(
+            f"Export index points at a non-object (bytes {start}-{end}) in "
+            f"'{name}'. Rebuild with 'echomine index build'."
+        )
+    return raw
+
+
+class ExportIndex:
+    """Read-only handle on a valid sidecar index for one export file.
+
+    Instances are only returned by ``build()`` and ``load()``, which guarantee
+    the index matched the export at the time of the call. Every query opens a
+    short-lived read-only SQLite connection, so instances are cheap and safe
+    to share across threads.
+
+    Example:
+        ```python
+        from pathlib import Path
+        from echomine.index import ExportIndex
+
+        export = Path("conversations.json")
+        ExportIndex.build(export, provider="openai")
+
+        index = ExportIndex.load(export)
+        if index is not None:
+            for raw in index.iter_raw_conversations(index.find("conv-123")):
+                print(raw["title"])
+        ```
+    """
+
+    def __init__(
+        self,
+        export_path: Path,
+        index_path: Path,
+        provider: IndexProvider,
+        conversation_count: int,
+    ) -> None:
+        self.export_path = export_path
+        self.index_path = index_path
+        self.provider = provider
+        self.conversation_count = conversation_count
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def path_for(export_path: Path) -> Path:
+        """Return the sidecar index path for an export file."""
+        return export_path.with_name(export_path.name + INDEX_SUFFIX)
+
+    @classmethod
+    def build(
+        cls,
+        export_path: Path,
+        *,
+        provider: IndexProvider,
+        progress_callback: ProgressCallback | None = None,
+    ) -> ExportIndex:
+        """Build (or rebuild) the sidecar index in a single streaming pass.
+
+        The index is written to a temporary file and atomically moved into
+        place, so concurrent readers never observe a half-written index.
+
+        Args:
+            export_path: Path to export file
+            provider: Export provider ("openai" or "claude")
+            progress_callback: Optional callback invoked every 100 conversations
+
+        Returns:
+            ExportIndex for the freshly built sidecar
+
+        Raises:
+            FileNotFoundError: If export_path does not exist
+            PermissionError: If export_path is not readable or the sidecar
+                cannot be written
+            ParseError: If the export is not a JSON array
+        """
+        id_field = _ID_FIELDS[provider]
+        messages_field = _MESSAGES_FIELDS[provider]
+        index_path = cls.path_for(export_path)
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+
+        stat = export_path.stat()
+        count = 0
+        try:
+            with (
+                open_export(export_path) as f,
+                contextlib.closing(sqlite3.connect(tmp_path)) as conn,
+            ):
+                conn.executescript(_SCHEMA)
+                rows: list[tuple[int, str, str, str | None, int, int]] = []
+                message_rows: list[tuple[str, int]] = []
+                for span in iter_element_spans(f, nested_fields=(messages_field,)):
+                    conv_id = span.fields.get(id_field)
+                    if isinstance(conv_id, str):
+                        rows.append(
+                            (
+                                count,
+                                conv_id,
+                                cls._lookup_key(provider, conv_id),
+                                _conversation_title(span.fields, provider),
+                                *span[:2],
+                            )
+                        )
+                        message_rows.extend(
+                            (message_id, count)
+                            for message_id in _message_ids(
+                                span.fields.get(messages_field), provider
+                            )
+                        )
+                    count += 1
+                    if progress_callback and count % 100 == 0:
+                        progress_callback(count)
+                    if len(rows) >= _BATCH_SIZE:
+                        conn.executemany(
+                            "INSERT INTO conversations VALUES (?, ?, ?, ?, ?, ?)", rows
+                        )
+                        rows.clear()
+                    if len(message_rows) >= _BATCH_SIZE:
+                        conn.executemany("INSERT INTO messages VALUES (?, ?)", message_rows)
+                        message_rows.clear()
+                conn.executemany("INSERT INTO conversations VALUES (?, ?, ?, ?, ?, ?)", rows)
+                conn.executemany("INSERT INTO messages VALUES (?, ?)", message_rows)
+                conn.execute(_MESSAGES_INDEX)
+                conn.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [
+                        ("format_version", str(INDEX_FORMAT_VERSION)),
+                        ("provider", provider),
+                        ("file_size", str(stat.st_size)),
+                        ("file_mtime_ns", str(stat.st_mtime_ns)),
+                        ("fingerprint", compute_fingerprint(export_path)),
+                        ("conversation_count", str(count)),
+                    ],
+                )
+                conn.commit()
+            tmp_path.replace(index_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if progress_callback:
+            progress_callback(count)
+
+        return cls(export_path, index_path, provider, count)
+
+    @classmethod
+    def load(cls, export_path: Path) -> ExportIndex | None:
+        """Load the sidecar index for an export if it exists and is current.
+
+        Args:
+            export_path: Path to export file
+
+        Returns:
+            ExportIndex if a valid index exists, None if the sidecar is
+            missing, unreadable, from another format version, or stale
+
+        Raises:
+            FileNotFoundError: If export_path does not exist
+            PermissionError: If export_path is not readable
+        """
+        stat = export_path.stat()
+        index_path = cls.path_for(export_path)
+        if not index_path.is_file():
+            return None
+
+        try:
+            with contextlib.closing(cls._connect(index_path)) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error as e:
+            logger.warning(
+                "Ignoring unreadable export index",
+                extra={"index_path": str(index_path), "reason": str(e)},
+            )
+            return None
+
+        if (
+            meta.get("format_version") != str(INDEX_FORMAT_VERSION)
+            or meta.get("file_size") != str(stat.st_size)
+            or meta.get("file_mtime_ns") != str(stat.st_mtime_ns)
+            or meta.get("provider") not in _ID_FIELDS
+            or meta.get("fingerprint") != compute_fingerprint(export_path)
+        ):
+            logger.debug("Ignoring stale export index", extra={"index_path": str(index_path)})
+            return None
+
+        return cls(
+            export_path,
+            index_path,
+            meta["provider"],
+            int(meta.get("conversation_count", "0")),
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def find(self, conversation_id: str, *, prefix: bool = True) -> list[tuple[int, int]]:
+        """Return byte ranges of the conversations an ID names, in file order.
+
+        Matching follows the adapters' ``get_conversation_by_id`` semantics
+        (see ``echomine.utils.id_lookup``): a full ID match wins; otherwise
+        an ID of 4+ characters must be the prefix of exactly one distinct
+        conversation ID. Claude IDs compare case-insensitively. Ambiguity is
+        detected with a range query over the sorted ``lookup_key`` index, so
+        it costs O(log N) whatever the number of conversations.
+
+        Args:
+            conversation_id: Conversation ID or ID prefix
+            prefix: Also resolve unique prefixes (False: full IDs only)
+
+        Returns:
+            List of (start, end) byte offsets, empty if nothing matches (one
+            range per copy of a conversation listed more than once)
+
+        Raises:
+            AmbiguousIdError: If the ID is a prefix of several conversation IDs
+        """
+        key = self._lookup_key(self.provider, conversation_id)
+        sql = (
+            "SELECT start_offset, end_offset FROM conversations "
+            "WHERE lookup_key = ? ORDER BY ordinal"
+        )
+        with contextlib.closing(self._connect(self.index_path)) as conn:
+            spans = [(start, end) for start, end in conn.execute(sql, (key,))]
+            if spans or not prefix or len(key) < MIN_PREFIX_LENGTH:
+                return spans
+
+            # Distinct IDs in [key, key's successor): a prefix range scan
+            matches = conn.execute(
+                "SELECT lookup_key, MIN(id) FROM conversations "
+                "WHERE lookup_key >= ? AND lookup_key < ? "
+                "GROUP BY lookup_key ORDER BY lookup_key LIMIT ?",
+                (key, key[:-1] + chr(ord(key[-1]) + 1), MAX_REPORTED_MATCHES + 1),
+            ).fetchall()
+            if len(matches) > 1:
+                raise AmbiguousIdError(
+                    conversation_id,
+                    [match_id for _, match_id in matches[:MAX_REPORTED_MATCHES]],
+                    more=len(matches) > MAX_REPORTED_MATCHES,
+                )
+            if not matches:
+                return []
+            return [(start, end) for start, end in conn.execute(sql, (matches[0][0],))]
+
+    def find_message(self, message_id: str) -> list[tuple[int, int]]:
+        """Return byte ranges of conversations containing a message ID, in file order.
+
+        Message IDs match exactly, as in ``Conversation.get_message_by_id``.
+        A range only says the raw conversation lists the ID; parsing may
+        still drop the message (or the conversation) as malformed.
+
+        Args:
+            message_id: Message ID
+
+        Returns:
+            List of (start, end) byte offsets, empty if no conversation has it
+        """
+        sql = (
+            "SELECT DISTINCT c.ordinal, c.start_offset, c.end_offset FROM messages m "
+            "JOIN conversations c ON c.ordinal = m.ordinal "
+            "WHERE m.message_id = ? ORDER BY c.ordinal"
+        )
+        with contextlib.closing(self._connect(self.index_path)) as conn:
+            return [(start, end) for _, start, end in conn.execute(sql, (message_id,))]
+
+    def titles(self) -> Iterator[tuple[str, str]]:
+        """Yield (conversation_id, title) of every titled conversation, in file order.
+
+        Titles follow the provider adapter's mapping (Claude's empty ``name``
+        becomes "(No title)"); conversations without a string title are
+        omitted.
+
+        Yields:
+            (conversation_id, title) tuples
+        """
+        sql = "SELECT id, title FROM conversations WHERE title IS NOT NULL ORDER BY ordinal"
+        with contextlib.closing(self._connect(self.index_path)) as conn:
+            yield from conn.execute(sql)
+
+    def iter_raw_conversations(self, spans: Iterable[tuple[int, int]]) -> Iterator[dict[str, Any]]:
+        """Parse raw conversation dicts from byte ranges of the export.
+
+        Opens the export once, seeks to each range, and ijson-parses only
+        that slice. Values match what ``ijson.items(f, "item")`` would yield
+        for the same element (e.g. numbers as ``Decimal``).
+
+        Args:
+            spans: (start, end) byte offsets as returned by ``find()``
+
+        Yields:
+            Raw conversation dict for each span
+
+        Raises:
+            ParseError: If a slice is not a valid JSON object
+        """
+        with open_export(self.export_path) as f:
+            for start, end in spans:
+                yield read_element(f, start, end)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _lookup_key(provider: str, conversation_id: str) -> str:
+        """Normalize an ID for lookup (Claude IDs match case-insensitively)."""
+        return lookup_key(conversation_id, case_sensitive=provider != "claude")
+
+    @staticmethod
+    def _connect(index_path: Path) -> sqlite3.Connection:
+        """Open a read-only connection to the sidecar database."""
+        return sqlite3.connect(f"{index_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def find_conversations_by_title(
+    export_path: Path,
+    title: str,
+    *,
+    provider: IndexProvider | None = None,
+) -> list[tuple[str, str]]:
+    """Find conversations whose title contains a substring (case-insensitive).
+
+    Reads only the id and title of each conversation: from the sidecar
+    index's title column when a current index exists, otherwise from the
+    top-level scalar fields reported by the byte-level scanner. Message
+    content is never parsed, so memory is bounded by the largest single
+    conversation rather than the export.
+
+    Args:
+        export_path: Path to export file
+        title: Title substring to search for (case-insensitive)
+        provider: Export provider; None recognizes Claude entries by their
+            ``uuid`` field and treats everything else as OpenAI
+
+    Returns:
+        (conversation_id, title) tuples in file order, empty if nothing matches
+
+    Raises:
+        FileNotFoundError: If export_path does not exist
+        PermissionError: If export_path is not readable
+        ParseError: If the export is not valid JSON
+
+    Example:
+        ```python
+        from pathlib import Path
+        from echomine.index import find_conversations_by_title
+
+        for conv_id, conv_title in find_conversations_by_title(
+            Path("conversations.json"), "python"
+        ):
+            print(conv_id, conv_title)
+        ```
+    """
+    title_lower = title.lower()
+    return [
+        (conv_id, conv_title)
+        for conv_id, conv_title in _iter_titles(export_path, provider)
+        if title_lower in conv_title.lower()
+    ]
+
+
+def _iter_titles(export_path: Path, provider: IndexProvider | None) -> Iterator[tuple[str, str]]:
+    """Yield (conversation_id, title) of every titled conversation."""
+    index = ExportIndex.load(export_path)
+    if index is not None and provider in (None, index.provider):
+        yield from index.titles()
+        return
+
+    with open_export(export_path) as f:
+        for fields in _iter_top_level_fields(f):
+            conv_provider = provider or ("claude" if "uuid" in fields else "openai")
+            conv_id = fields.get(_ID_FIELDS[conv_provider])
+            if conv_provider == "openai" and not conv_id:
+                conv_id = fields.get("conversation_id")
+            conv_title = _conversation_title(fields, conv_provider)
+            if isinstance(conv_id, str) and conv_id and conv_title is not None:
+                yield conv_id, conv_title
+
+
+def _iter_top_level_fields(f: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Yield the scalar fields of each conversation in an export.
+
+    Exports are normally an array of conversations; a single conversation
+    object at the root is also accepted.
+    """
+    head = f.read(1024).lstrip(b" \t\r\n")
+    f.seek(0)
+    if not head.startswith(b"{"):
+        for span in iter_element_spans(f):
+            yield span.fields
+        return
+
+    try:
+        raw = next(ijson.items(f, ""), None)
+    except ijson.JSONError as e:
+        raise ParseError(f"Invalid JSON in '{_stream_name(f)}': {e}") from e
+    if isinstance(raw, dict):
+        yield {key: value for key, value in raw.items() if not isinstance(value, (dict, list))}
+
+
+def _message_ids(messages: Any, provider: str) -> Iterator[str]:
+    """Yield the message IDs of a raw conversation's messages member.
+
+    Mirrors what the adapters use as ``Message.id``: ``message.id`` of each
+    OpenAI mapping node, ``uuid`` of each Claude chat message. Malformed
+    entries are ignored.
+    """
+    entries: Iterable[Any]
+    if provider == "openai":
+        nodes = messages.values() if isinstance(messages, dict) else ()
+        entries = (node.get("message") for node in nodes if isinstance(node, dict))
+        id_field = "id"
+    else:
+        entries = messages if isinstance(messages, list) else ()
+        id_field = "uuid"
+    for entry in entries:
+        if isinstance(entry, dict):
+            message_id = entry.get(id_field)
+            if isinstance(message_id, str):
+                yield message_id
+
+
+def _conversation_title(fields: dict[str, Any], provider: str) -> str | None:
+    """Map a conversation's top-level title field the way the adapter does.
+
+    Claude's empty ``name`` becomes "(No title)" (FR-003); a missing or
+    non-string title yields None.
+    """
+    title = fields.get(_TITLE_FIELDS[provider])
+    if provider == "claude" and not title:
+        return "(No title)"
+    return title if isinstance(title, str) else None
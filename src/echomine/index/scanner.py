@@ -0,0 +1,196 @@
+"""Byte-level scanner for top-level JSON array elements.
+
+This module locates the byte range of every element of the top-level JSON
+array in an export file. It is the foundation of the sidecar offset index:
+once the byte range of a conversation is known, a reader can ``seek()``
+straight to it and parse only that slice.
+
+Scanning Strategy:
+    - The file is read in fixed-size chunks and decoded incrementally
+      (O(chunk + largest element) memory, independent of file size)
+    - Each element is consumed with the C-accelerated ``json`` decoder
+      (``JSONDecoder.raw_decode``), which reports where the element ends
+    - Character positions are converted back to byte offsets by re-encoding
+      only the element text, so non-ASCII content is handled exactly
+    - Scalar fields of each element object (``id``, ``title``,
+      ``create_time``...) are reported alongside the span so callers can
+      record conversation metadata without touching ``mapping``/``chat_messages``;
+      nested members are only reported when named in ``nested_fields``
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (chunked reads, one element at a time)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Collection, Iterator
+from typing import IO, Any, NamedTuple
+
+from echomine.exceptions import ParseError
+
+
+# Read size for scanner refills (1 MiB keeps syscalls low, memory bounded)
+SCAN_CHUNK_SIZE = 1024 * 1024
+
+# Errors this close to the end of the buffer may just mean "element continues
+# in the next chunk" (truncated literal, escape, or delimiter)
+_TRUNCATION_WINDOW = 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE_RE = re.compile(r"[ \t\r\n]*")
+
+
+class ElementSpan(NamedTuple):
+    """Byte range and scalar fields of one top-level array element.
+
+    Attributes:
+        start: Offset of the element's opening ``{``
+        end: Offset one past the element's closing ``}``
+        fields: Scalar (string/number/bool/null) members of the element object,
+            plus the nested members requested from ``iter_element_spans``
+    """
+
+    start: int
+    end: int
+    fields: dict[str, Any]
+
+
+class _TextWindow:
+    """Incrementally decoded window over a binary stream.
+
+    Undecodable bytes are mapped through ``surrogateescape`` so re-encoding a
+    slice always yields exactly the original number of bytes.
+    """
+
+    def __init__(self, stream: IO[bytes], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")("surrogateescape")
+        self.text = ""
+        self.eof = False
+
+    def read_more(self, size: int | None = None) -> bool:
+        """Append the next chunk; return False once the stream is exhausted."""
+        if self.eof:
+            return False
+        chunk = self.stream.read(size or self.chunk_size)
+        self.eof = not chunk
+        self.text += self.decoder.decode(chunk, final=self.eof)
+        return bool(chunk)
+
+    def next_char(self, pos: int) -> tuple[int, str]:
+        """Skip whitespace from ``pos``; return the position and char there ('' at EOF)."""
+        while True:
+            pos = _WHITESPACE_RE.match(self.text, pos).end()  # type: ignore[union-attr]
+            if pos < len(self.text):
+                return pos, self.text[pos]
+            if not self.read_more():
+                return pos, ""
+
+    def drop(self, pos: int) -> None:
+        """Discard consumed text before ``pos`` (caller rebases positions)."""
+        self.text = self.text[pos:]
+
+
+def iter_element_spans(
+    stream: IO[bytes],
+    *,
+    chunk_size: int = SCAN_CHUNK_SIZE,
+    nested_fields: Collection[str] = (),
+) -> Iterator[ElementSpan]:
+    """Yield the byte range of each object in the top-level JSON array.
+
+    The stream must be positioned at the start of a JSON document whose root
+    is an array. Non-object elements are skipped.
+
+    Args:
+        stream: Binary file object positioned at the document start
+        chunk_size: Number of bytes read per refill
+        nested_fields: Names of object/array members to report in ``fields``
+            as well (e.g. ``mapping`` to collect message IDs)
+
+    Yields:
+        ElementSpan for each object element, in file order
+
+    Raises:
+        ParseError: If the document root is not an array, an element is not
+            valid JSON, or the file ends before the array is closed
+
+    Example:
+        ```python
+        with open("export.json", "rb") as f:
+            for span in iter_element_spans(f):
+                print(span.start, span.end, span.fields.get("id"))
+        ```
+
+    Memory Complexity: O(chunk_size + largest element)
+    Time Complexity: O(file size)
+    """
+    window = _TextWindow(stream, chunk_size)
+    pos, char = window.next_char(0)
+    if char != "[":
+        raise ParseError("Export root must be a JSON array of conversations")
+
+    # Byte offset corresponding to text position ``pos`` (whitespace and
+    # delimiters between elements are ASCII, so they advance 1 byte per char)
+    byte_pos = len(window.text[: pos + 1].encode("utf-8", "surrogateescape"))
+    pos += 1
+    expect_element = True
+    first = True
+
+    while True:
+        new_pos, char = window.next_char(pos)
+        byte_pos += new_pos - pos
+        pos = new_pos
+
+        if char == "]" and (first or not expect_element):
+            return
+        if char == "":
+            raise ParseError("Unexpected end of file: top-level JSON array is not closed")
+        if not expect_element:
+            if char != ",":
+                raise ParseError(f"Expected ',' between array elements at byte {byte_pos}")
+            pos += 1
+            byte_pos += 1
+            expect_element = True
+            continue
+
+        element, end = _decode_element(window, pos, byte_pos)
+        size = len(window.text[pos:end].encode("utf-8", "surrogateescape"))
+        if isinstance(element, dict):
+            fields = {
+                k: v
+                for k, v in element.items()
+                if not isinstance(v, (dict, list)) or k in nested_fields
+            }
+            yield ElementSpan(byte_pos, byte_pos + size, fields)
+        byte_pos += size
+        pos = end
+        expect_element = False
+        first = False
+
+        # Keep the window bounded: drop consumed text once per chunk
+        if pos > window.chunk_size:
+            window.drop(pos)
+            pos = 0
+
+
+def _decode_element(window: _TextWindow, pos: int, byte_pos: int) -> tuple[Any, int]:
+    """Decode one JSON value at ``pos``, reading more input while it is incomplete."""
+    read_size = window.chunk_size
+    while True:
+        try:
+            return _DECODER.raw_decode(window.text, pos)
+        except json.JSONDecodeError as e:
+            truncated = e.msg.startswith("Unterminated string") or (
+                e.pos >= len(window.text) - _TRUNCATION_WINDOW
+            )
+            if not truncated or not window.read_more(read_size):
+                raise ParseError(
+                    f"Invalid JSON in array element at byte {byte_pos}: {e.msg}"
+                ) from e
+            read_size *= 2  # Large element: grow geometrically (amortized O(n))
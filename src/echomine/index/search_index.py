@@ -0,0 +1,715 @@
+"""Persistent inverted index answering BM25 searches without reparsing.
+
+A search index is a SQLite database stored next to the export
+(``conversations.json`` -> ``conversations.json.emsearch``). It holds
+everything ``search()`` computes while streaming, so a query touches only
+the postings of its own terms:
+
+    - Postings: term -> (conversation, message position, role, term frequency);
+      title tokens are stored at position -1 with no role
+    - Per-conversation token counts (title and per role), from which document
+      lengths and avgdl are derived for any role filter
+    - Header metadata used by SearchQuery filters (title, creation date,
+      message count) and by result sorting (sort timestamp, lowercase title)
+    - Byte range of each conversation, so only returned conversations are
+      re-read from the export
+
+Scores are computed by BM25Scorer from the stored statistics with the same
+arithmetic as a streaming search, so scores, ordering and
+``matched_message_ids`` are identical.
+
+Index Lifecycle:
+    - Built explicitly (``OpenAIAdapter.build_search_index``,
+      ``ClaudeAdapter.build_search_index`` or ``echomine index build``)
+    - Loaded opportunistically by ``search()``; a missing, corrupt, or stale
+      index is silently ignored and search streams the export as before
+    - Invalidated exactly like ExportIndex (size, mtime, fingerprint)
+    - Validated indexes are remembered per process, keyed by the stat of the
+      export and the sidecar, so repeated searches skip the fingerprint
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (queries read postings, not the export)
+    - Principle I: Library-first (CLI ``index build`` wraps the adapters)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import logging
+import os
+import sqlite3
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from stat import S_ISREG
+from typing import Any, NamedTuple
+
+from echomine.index.export_index import IndexProvider, compute_fingerprint, read_element
+from echomine.index.scanner import iter_element_spans
+from echomine.models.conversation import Conversation
+from echomine.models.protocols import ProgressCallback
+from echomine.models.search import SearchQuery
+from echomine.search.ranking import (
+    BM25Scorer,
+    CorpusStatistics,
+    TokenizedDocument,
+    all_terms_present,
+    exclude_filter,
+    tokenize,
+    tokenize_keywords,
+)
+from echomine.utils.archive import open_export
+
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_SUFFIX = ".emsearch"
+"""File suffix appended to the export path for the search index."""
+
+SEARCH_INDEX_FORMAT_VERSION = 1
+"""Schema version; indexes written with a different version are treated as stale."""
+
+# Message position used for title postings
+_TITLE_POSITION = -1
+
+# Per-role count/length columns (role values come from the Message.role Literal)
+_ROLES = ("user", "assistant", "system")
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE conversations (
+    ordinal INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    title_lower TEXT NOT NULL,
+    created_date TEXT NOT NULL,
+    sort_timestamp REAL NOT NULL,
+    message_count INTEGER NOT NULL,
+    title_length INTEGER NOT NULL,
+    user_count INTEGER NOT NULL,
+    user_length INTEGER NOT NULL,
+    assistant_count INTEGER NOT NULL,
+    assistant_length INTEGER NOT NULL,
+    system_count INTEGER NOT NULL,
+    system_length INTEGER NOT NULL,
+    start_offset INTEGER NOT NULL,
+    end_offset INTEGER NOT NULL
+);
+CREATE TABLE postings (
+    term TEXT NOT NULL,
+    ordinal INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    role TEXT,
+    tf INTEGER NOT NULL
+);
+"""
+
+# Created after the bulk load (much faster than maintaining it per insert)
+_POSTINGS_INDEX = "CREATE INDEX postings_term ON postings (term, ordinal)"
+
+_INSERT_CONVERSATION = (
+    "INSERT INTO conversations VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_POSTING = "INSERT INTO postings VALUES (?, ?, ?, ?, ?)"
+
+# Validated indexes by export path: (export stamp, sidecar stamp, index).
+# A stamp includes ctime and inode, which no in-place rewrite can preserve.
+_FileStamp = tuple[int, int, int, int]
+_loaded: dict[Path, tuple[_FileStamp, _FileStamp, SearchIndex]] = {}
+_LOADED_MAX = 16
+
+ConversationParser = Callable[[dict[str, Any]], Conversation | None]
+"""Parses a raw export object, returning None for entries search would skip."""
+
+
+class SearchHit(NamedTuple):
+    """One ranked search result answered from the index.
+
+    Attributes:
+        conversation_id: Conversation ID
+        score: Normalized relevance score (0.0-1.0)
+        matched_positions: Positions in ``Conversation.messages`` of messages
+            containing a keyword token, ascending
+        start: Offset of the conversation's opening ``{`` in the export
+        end: Offset one past the conversation's closing ``}``
+    """
+
+    conversation_id: str
+    score: float
+    matched_positions: tuple[int, ...]
+    start: int
+    end: int
+
+
+class SearchIndex:
+    """Read-only handle on a valid search index for one export file.
+
+    Instances are only returned by ``build()`` and ``load()``, which guarantee
+    the index matched the export at the time of the call. Every query opens a
+    short-lived read-only SQLite connection.
+
+    Example:
+        ```python
+        from pathlib import Path
+        from echomine.adapters import OpenAIAdapter
+        from echomine.index import SearchIndex
+        from echomine.models import SearchQuery
+
+        export = Path("conversations.json")
+        OpenAIAdapter().build_search_index(export)
+
+        # search() now answers from the index automatically
+        for result in OpenAIAdapter().search(export, SearchQuery(keywords=["python"])):
+            print(result.score, result.conversation.title)
+
+        # Or query the index directly
+        index = SearchIndex.load(export)
+        if index is not None:
+            for hit in index.search(SearchQuery(keywords=["python"])):
+                print(hit.conversation_id, hit.score)
+        ```
+    """
+
+    def __init__(
+        self,
+        export_path: Path,
+        index_path: Path,
+        provider: IndexProvider,
+        conversation_count: int,
+        total_length: int,
+    ) -> None:
+        self.export_path = export_path
+        self.index_path = index_path
+        self.provider = provider
+        self.conversation_count = conversation_count
+        self.total_length = total_length
+
+    @property
+    def avg_doc_length(self) -> float:
+        """Average document length (title + all messages) over the export."""
+        if self.conversation_count == 0:
+            return 0.0
+        return self.total_length / self.conversation_count
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def path_for(export_path: Path) -> Path:
+        """Return the search index path for an export file."""
+        return export_path.with_name(export_path.name + SEARCH_INDEX_SUFFIX)
+
+    @classmethod
+    def build(
+        cls,
+        export_path: Path,
+        *,
+        provider: IndexProvider,
+        parse_conversation: ConversationParser,
+        progress_callback: ProgressCallback | None = None,
+    ) -> SearchIndex:
+        """Build (or rebuild) the search index in a single pass over the export.
+
+        Each top-level element is parsed with ``parse_conversation`` (the
+        provider adapter's parser); entries it rejects are left out, exactly
+        as streaming search skips them. The index is written to a temporary
+        file and atomically moved into place.
+
+        Args:
+            export_path: Path to export file
+            provider: Export provider ("openai" or "claude")
+            parse_conversation: Adapter parser returning None for malformed entries
+            progress_callback: Optional callback invoked every 100 conversations
+
+        Returns:
+            SearchIndex for the freshly built sidecar
+
+        Raises:
+            FileNotFoundError: If export_path does not exist
+            PermissionError: If export_path is not readable or the sidecar
+                cannot be written
+            ParseError: If the export is not a JSON array
+        """
+        index_path = cls.path_for(export_path)
+        tmp_path = index_path.with_name(index_path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+
+        stat = export_path.stat()
+        count = 0
+        indexed = 0
+        total_length = 0
+        try:
+            with (
+                open_export(export_path) as scan,
+                open_export(export_path) as reader,
+                contextlib.closing(sqlite3.connect(tmp_path)) as conn,
+            ):
+                conn.executescript(_SCHEMA)
+                conversations: list[tuple[Any, ...]] = []
+                postings: list[tuple[str, int, int, str | None, int]] = []
+                for span in iter_element_spans(scan):
+                    count += 1
+                    if progress_callback and count % 100 == 0:
+                        progress_callback(count)
+
+                    conversation = parse_conversation(read_element(reader, span.start, span.end))
+                    if conversation is None:
+                        continue
+
+                    row = cls._index_conversation(indexed, conversation, span[:2], postings)
+                    total_length += row[6] + row[8] + row[10] + row[12]
+                    conversations.append(row)
+                    indexed += 1
+
+                    if len(postings) >= 10000:
+                        conn.executemany(_INSERT_CONVERSATION, conversations)
+                        conn.executemany(_INSERT_POSTING, postings)
+                        conversations.clear()
+                        postings.clear()
+
+                conn.executemany(_INSERT_CONVERSATION, conversations)
+                conn.executemany(_INSERT_POSTING, postings)
+                conn.execute(_POSTINGS_INDEX)
+                conn.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [
+                        ("format_version", str(SEARCH_INDEX_FORMAT_VERSION)),
+                        ("provider", provider),
+                        ("file_size", str(stat.st_size)),
+                        ("file_mtime_ns", str(stat.st_mtime_ns)),
+                        ("fingerprint", compute_fingerprint(export_path)),
+                        ("conversation_count", str(indexed)),
+                        ("total_length", str(total_length)),
+                    ],
+                )
+                conn.commit()
+            tmp_path.replace(index_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if progress_callback:
+            progress_callback(count)
+
+        return cls(export_path, index_path, provider, indexed, total_length)
+
+    @classmethod
+    def load(cls, export_path: Path) -> SearchIndex | None:
+        """Load the search index for an export if it exists and is current.
+
+        A validated index is remembered until the export or the sidecar
+        changes on disk, so only the first load of an unchanged export reads
+        the sidecar metadata and fingerprints the export.
+
+        Args:
+            export_path: Path to export file
+
+        Returns:
+            SearchIndex if a valid index exists, None if the sidecar is
+            missing, unreadable, from another format version, or stale
+
+        Raises:
+            FileNotFoundError: If export_path does not exist
+            PermissionError: If export_path is not readable
+        """
+        stat = export_path.stat()
+        index_path = cls.path_for(export_path)
+        try:
+            index_stat = index_path.stat()
+        except OSError:
+            return None
+        if not S_ISREG(index_stat.st_mode):
+            return None
+
+        key = export_path.absolute()
+        export_stamp = _file_stamp(stat)
+        index_stamp = _file_stamp(index_stat)
+        cached = _loaded.get(key)
+        if cached is not None and cached[:2] == (export_stamp, index_stamp):
+            return cached[2]
+
+        try:
+            with contextlib.closing(cls._connect(index_path)) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error as e:
+            logger.warning(
+                "Ignoring unreadable search index",
+                extra={"index_path": str(index_path), "reason": str(e)},
+            )
+            return None
+
+        if (
+            meta.get("format_version") != str(SEARCH_INDEX_FORMAT_VERSION)
+            or meta.get("file_size") != str(stat.st_size)
+            or meta.get("file_mtime_ns") != str(stat.st_mtime_ns)
+            or meta.get("provider") not in ("openai", "claude")
+            or meta.get("fingerprint") != compute_fingerprint(export_path)
+        ):
+            logger.debug("Ignoring stale search index", extra={"index_path": str(index_path)})
+            return None
+
+        index = cls(
+            export_path,
+            index_path,
+            meta["provider"],
+            int(meta.get("conversation_count", "0")),
+            int(meta.get("total_length", "0")),
+        )
+        _loaded.pop(key, None)
+        if len(_loaded) >= _LOADED_MAX:
+            del _loaded[next(iter(_loaded))]
+        _loaded[key] = (export_stamp, index_stamp, index)
+        return index
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def supports(query: SearchQuery) -> bool:
+        """Check whether the index can answer a query exactly.
+
+        Phrase matching is a substring test on raw message text, which the
+        index does not store; phrase queries must stream the export.
+
+        Args:
+            query: Search query
+
+        Returns:
+            True if ``search()`` gives the same results as streaming search
+        """
+        return not query.has_phrase_search()
+
+    def search(self, query: SearchQuery) -> list[SearchHit]:
+        """Rank conversations for a query using only the index.
+
+        Applies the same filters, match mode, exclusion, BM25 scoring, sort
+        order and limit as the adapters' streaming ``search()``.
+
+        Args:
+            query: Search query (must satisfy ``supports()``)
+
+        Returns:
+            Up to ``query.limit`` hits in result order
+
+        Raises:
+            ValueError: If the query contains phrases
+        """
+        if not self.supports(query):
+            raise ValueError("Phrase queries cannot be answered from the search index")
+
+        where, params = self._candidate_filter(query)
+        length_expr = self._length_expression(query)
+
+        with contextlib.closing(self._connect(self.index_path)) as conn:
+            # Corpus statistics over the filtered candidates (N, total length)
+            if where == "1":
+                document_count, total_length = self.conversation_count, self.total_length
+            else:
+                document_count, total_length = conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM({length_expr}), 0) "  # noqa: S608
+                    f"FROM conversations c WHERE {where}",
+                    params,
+                ).fetchone()
+            if document_count == 0:
+                return []
+
+            keyword_tokens = tokenize_keywords(query.keywords or [])
+            exclude_tokens = tokenize_keywords(query.exclude_keywords or [])
+
+            scored: Iterable[tuple[tuple[Any, ...], float, tuple[int, ...]]]
+            if query.has_keyword_search():
+                ranked = self._load_keyword_candidates(
+                    conn,
+                    query,
+                    where=where,
+                    params=params,
+                    keyword_tokens=keyword_tokens,
+                    exclude_tokens=exclude_tokens,
+                )
+
+                # IDF only needs the keyword tokens' document frequencies
+                statistics = CorpusStatistics(keyword_tokens)
+                statistics.document_count = document_count
+                statistics.total_length = total_length
+                for _, document, _ in ranked:
+                    for term in statistics.document_frequencies:
+                        if term in document:
+                            statistics.document_frequencies[term] += 1
+
+                scorer = BM25Scorer.from_statistics(statistics)
+                scored = self._score(query, scorer, ranked)
+            else:
+                # Filter-only query: every candidate matches with score 1.0
+                excluded = self._ordinals_with_terms(conn, query, where, params, exclude_tokens)
+                scored = (
+                    (tuple(row[1:]), 1.0, ())
+                    for row in conn.execute(
+                        "SELECT ordinal, id, title_lower, sort_timestamp, message_count, "  # noqa: S608
+                        f"start_offset, end_offset FROM conversations c WHERE {where} "
+                        "ORDER BY ordinal",
+                        params,
+                    )
+                    if row[0] not in excluded
+                )
+
+            return self._select(query, scored)
+
+    def iter_raw_conversations(self, hits: Iterable[SearchHit]) -> Iterator[dict[str, Any]]:
+        """Parse raw conversation dicts for search hits from the export.
+
+        Args:
+            hits: Hits as returned by ``search()``
+
+        Yields:
+            Raw conversation dict for each hit
+
+        Raises:
+            ParseError: If a byte range is not a valid JSON object
+        """
+        with open_export(self.export_path) as f:
+            for hit in hits:
+                yield read_element(f, hit.start, hit.end)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _index_conversation(
+        ordinal: int,
+        conversation: Conversation,
+        span: tuple[int, int],
+        postings: list[tuple[str, int, int, str | None, int]],
+    ) -> tuple[Any, ...]:
+        """Tokenize one conversation, appending its postings.
+
+        Returns:
+            Row for the conversations table
+        """
+        title_tokens = Counter(tokenize(conversation.title))
+        postings.extend(
+            (term, ordinal, _TITLE_POSITION, None, tf) for term, tf in title_tokens.items()
+        )
+
+        counts = dict.fromkeys(_ROLES, 0)
+        lengths = dict.fromkeys(_ROLES, 0)
+        for position, message in enumerate(conversation.messages):
+            tokens = tokenize(message.content)
+            counts[message.role] += 1
+            lengths[message.role] += len(tokens)
+            postings.extend(
+                (term, ordinal, position, message.role, tf) for term, tf in Counter(tokens).items()
+            )
+
+        return (
+            ordinal,
+            conversation.id,
+            conversation.title.lower(),
+            conversation.created_at.date().isoformat(),
+            conversation.updated_at_or_created.timestamp(),
+            conversation.message_count,
+            title_tokens.total(),
+            *(value for role in _ROLES for value in (counts[role], lengths[role])),
+            *span,
+        )
+
+    @staticmethod
+    def _candidate_filter(query: SearchQuery) -> tuple[str, list[Any]]:
+        """Translate the query's conversation filters into SQL on ``conversations c``."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if query.has_title_filter():
+            assert query.title_filter is not None  # Type narrowing
+            clauses.append("instr(c.title_lower, ?) > 0")
+            params.append(query.title_filter.lower())
+        if query.from_date is not None:
+            clauses.append("c.created_date >= ?")
+            params.append(query.from_date.isoformat())
+        if query.to_date is not None:
+            clauses.append("c.created_date <= ?")
+            params.append(query.to_date.isoformat())
+        if query.min_messages is not None:
+            clauses.append("c.message_count >= ?")
+            params.append(query.min_messages)
+        if query.max_messages is not None:
+            clauses.append("c.message_count <= ?")
+            params.append(query.max_messages)
+        if query.role_filter is not None:
+            clauses.append(f"c.{query.role_filter}_count > 0")
+        return " AND ".join(clauses) or "1", params
+
+    @staticmethod
+    def _length_expression(query: SearchQuery) -> str:
+        """SQL for the searched document length (role messages, or title + all)."""
+        if query.role_filter is not None:
+            return f"c.{query.role_filter}_length"
+        return "c.title_length + " + " + ".join(f"c.{role}_length" for role in _ROLES)
+
+    @staticmethod
+    def _postings_filter(query: SearchQuery, terms: list[str]) -> tuple[str, list[Any]]:
+        """SQL restricting postings ``p`` to the terms and the searched text."""
+        sql = f"p.term IN ({', '.join('?' * len(terms))})"
+        params: list[Any] = list(terms)
+        if query.role_filter is not None:
+            sql += " AND p.role = ?"
+            params.append(query.role_filter)
+        return sql, params
+
+    def _ordinals_with_terms(
+        self,
+        conn: sqlite3.Connection,
+        query: SearchQuery,
+        where: str,
+        params: list[Any],
+        terms: list[str],
+    ) -> set[int]:
+        """Return candidate ordinals whose searched text contains any of the terms."""
+        if not terms:
+            return set()
+        postings_sql, postings_params = self._postings_filter(query, terms)
+        return {
+            ordinal
+            for (ordinal,) in conn.execute(
+                "SELECT DISTINCT p.ordinal FROM postings p "  # noqa: S608
+                f"JOIN conversations c ON c.ordinal = p.ordinal WHERE {postings_sql} AND {where}",
+                [*postings_params, *params],
+            )
+        }
+
+    def _load_keyword_candidates(
+        self,
+        conn: sqlite3.Connection,
+        query: SearchQuery,
+        *,
+        where: str,
+        params: list[Any],
+        keyword_tokens: list[str],
+        exclude_tokens: list[str],
+    ) -> list[tuple[tuple[Any, ...], TokenizedDocument, tuple[int, ...]]]:
+        """Load postings for candidates containing any query term.
+
+        Returns:
+            (sort_row, document, matched_positions) per conversation in file
+            order, where sort_row is (id, title_lower, sort_timestamp,
+            message_count, start, end) and document holds the term
+            frequencies of the query terms plus the full document length
+        """
+        terms = sorted(set(keyword_tokens) | set(exclude_tokens))
+        if not terms:
+            return []
+        keyword_set = set(keyword_tokens)
+        postings_sql, postings_params = self._postings_filter(query, terms)
+
+        rows = conn.execute(
+            "SELECT p.ordinal, p.term, p.position, p.tf, c.id, c.title_lower, "  # noqa: S608
+            "c.sort_timestamp, c.message_count, c.start_offset, c.end_offset, "
+            f"{self._length_expression(query)} "
+            "FROM postings p JOIN conversations c ON c.ordinal = p.ordinal "
+            f"WHERE {postings_sql} AND {where} ORDER BY p.ordinal",
+            [*postings_params, *params],
+        )
+
+        ranked: list[tuple[tuple[Any, ...], TokenizedDocument, tuple[int, ...]]] = []
+        current: int | None = None
+        sort_row: tuple[Any, ...] = ()
+        length = 0
+        frequencies: Counter[str] = Counter()
+        positions: set[int] = set()
+
+        def flush() -> None:
+            ranked.append(
+                (
+                    sort_row,
+                    TokenizedDocument(frequencies, length=length),
+                    tuple(sorted(positions)),
+                )
+            )
+
+        for ordinal, term, position, tf, *row, doc_length in rows:
+            if ordinal != current:
+                if current is not None:
+                    flush()
+                current, sort_row, length = ordinal, tuple(row), doc_length
+                frequencies, positions = Counter(), set()
+            frequencies[term] += tf
+            if position != _TITLE_POSITION and term in keyword_set:
+                positions.add(position)
+        if current is not None:
+            flush()
+
+        return ranked
+
+    @staticmethod
+    def _score(
+        query: SearchQuery,
+        scorer: BM25Scorer,
+        ranked: list[tuple[tuple[Any, ...], TokenizedDocument, tuple[int, ...]]],
+    ) -> Iterator[tuple[tuple[Any, ...], float, tuple[int, ...]]]:
+        """Apply match mode, BM25 scoring and exclusion (mirrors the adapters)."""
+        assert query.keywords is not None  # Type narrowing
+        for sort_row, document, positions in ranked:
+            if query.match_mode == "all":
+                if not all_terms_present(document, query.keywords, scorer):
+                    continue
+                score = scorer.score(document, query.keywords)
+            else:
+                score = scorer.score(document, query.keywords)
+                if score <= 0.0:
+                    continue
+
+            if query.has_exclude_keywords():
+                assert query.exclude_keywords is not None  # Type narrowing
+                if exclude_filter(document, query.exclude_keywords, scorer):
+                    continue
+
+            yield sort_row, score, positions
+
+    @staticmethod
+    def _select(
+        query: SearchQuery,
+        scored: Iterable[tuple[tuple[Any, ...], float, tuple[int, ...]]],
+    ) -> list[SearchHit]:
+        """Sort, limit and normalize exactly like the adapters' search()."""
+
+        def get_sort_key(
+            item: tuple[tuple[Any, ...], float, tuple[int, ...]],
+        ) -> tuple[float | str | int, str]:
+            (conv_id, title_lower, sort_timestamp, message_count, _, _), score, _ = item
+            primary_key: float | str | int
+            if query.sort_by == "score":
+                primary_key = score
+            elif query.sort_by == "date":
+                primary_key = sort_timestamp
+            elif query.sort_by == "title":
+                primary_key = title_lower
+            else:  # query.sort_by == "messages"
+                primary_key = message_count
+            return (primary_key, conv_id)
+
+        select = heapq.nlargest if query.sort_order == "desc" else heapq.nsmallest
+        return [
+            SearchHit(
+                conversation_id=sort_row[0],
+                score=score / (score + 1.0) if score > 0 else 0.0,
+                matched_positions=positions,
+                start=sort_row[4],
+                end=sort_row[5],
+            )
+            for sort_row, score, positions in select(query.limit, scored, key=get_sort_key)
+        ]
+
+    @staticmethod
+    def _connect(index_path: Path) -> sqlite3.Connection:
+        """Open a read-only connection to the sidecar database."""
+        return sqlite3.connect(f"{index_path.resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _file_stamp(stat: os.stat_result) -> _FileStamp:
+    """Return the stat fields that change whenever a file is rewritten."""
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino)
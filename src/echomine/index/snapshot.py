@@ -0,0 +1,356 @@
+"""Binary snapshot cache of conversation headers for warm restarts.
+
+``list`` and ``stats`` only need conversation headers (id, title,
+timestamps, message count), yet every invocation reparses the export's JSON
+to get them. The first run records the headers, and the entries it skipped,
+in a compact binary snapshot in the user's cache directory; later runs
+against the unchanged export replay the snapshot from an ``mmap`` instead of
+parsing.
+
+Snapshot Layout (little-endian, stdlib ``struct``):
+    - Preamble: magic, format version, echomine version, export size and
+      mtime (ns), content fingerprint digest, name of the adapter that parsed
+      the export, and the byte length of the records that follow
+    - Records, in export order: a fixed part (kind, created_at and updated_at
+      in microseconds since the epoch, message count, two string lengths)
+      followed by two UTF-8 strings: id and title for a header, id and reason
+      for a skipped entry
+
+Snapshot Lifecycle:
+    - One file per export path (``<sha256 of the resolved path>.emsnap``) in
+      ``default_cache_dir()``, replaced whenever the export changes
+    - Valid only for the echomine version and adapter class that wrote it
+      (parsing rules change between releases) and while the export's size,
+      mtime and fingerprint (``compute_fingerprint``) match; a missing,
+      stale, truncated or foreign snapshot means the export is parsed again
+    - Written to a temporary file while headers stream and moved into place
+      only once the stream completes, so a partial read (``list --limit``,
+      Ctrl+C, parse error) never leaves a snapshot behind
+    - Best-effort: an unwritable cache directory only disables writing
+    - Opt-in for the CLI: ``list`` and ``stats`` use snapshots with
+      ``--cache``, or by default once ``$ECHOMINE_CACHE_DIR`` is set
+      (``cache_enabled``)
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (records stream to and from disk)
+    - Principle I: Library-first (CLI ``list``/``stats`` wrap
+      ``stream_cached_headers``)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from echomine import __version__
+from echomine.index.export_index import compute_fingerprint
+from echomine.models.conversation import ConversationHeader
+from echomine.models.protocols import OnSkipCallback, ProgressCallback
+from echomine.models.trusted import trusted_header
+
+
+if TYPE_CHECKING:
+    from echomine.adapters.claude import ClaudeAdapter
+    from echomine.adapters.ndjson import NDJSONAdapter
+    from echomine.adapters.openai import OpenAIAdapter
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".emsnap"
+"""File suffix of header snapshots in the cache directory."""
+
+SNAPSHOT_FORMAT_VERSION = 2
+"""Layout version; snapshots written with a different version are treated as stale."""
+
+CACHE_DIR_ENV = "ECHOMINE_CACHE_DIR"
+"""Environment variable overriding the snapshot cache directory."""
+
+_MAGIC = b"EMSNAP\r\n"
+
+# Everything a snapshot must match to be replayed, then the record byte length
+_STAMP = struct.Struct("<8sI32sQq32s32s")
+_LENGTH = struct.Struct("<Q")
+_PREAMBLE_SIZE = _STAMP.size + _LENGTH.size
+
+# kind, created_at, updated_at, message_count, len(first), len(second)
+_RECORD = struct.Struct("<BqqIII")
+
+# Record kinds
+_HEADER = 0
+_HEADER_UPDATED = 1
+_SKIPPED = 2
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def default_cache_dir() -> Path:
+    """Return the directory holding header snapshots.
+
+    ``$ECHOMINE_CACHE_DIR`` if set, else ``$XDG_CACHE_HOME/echomine``, else
+    ``~/.cache/echomine``.
+    """
+    if configured := os.environ.get(CACHE_DIR_ENV):
+        return Path(configured)
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "echomine"
+
+
+def cache_enabled(cache: bool | None = None) -> bool:
+    """Resolve a ``--cache/--no-cache`` choice.
+
+    An explicit choice wins; otherwise snapshots are used only when
+    ``$ECHOMINE_CACHE_DIR`` is set, so nothing is written to the user's
+    cache directory unless asked for.
+    """
+    if cache is not None:
+        return cache
+    return bool(os.environ.get(CACHE_DIR_ENV))
+
+
+def snapshot_path(export_path: Path, cache_dir: Path | None = None) -> Path:
+    """Return the snapshot file for an export path."""
+    key = hashlib.sha256(str(export_path.resolve()).encode()).hexdigest()[:32]
+    return (default_cache_dir() if cache_dir is None else cache_dir) / f"{key}{SNAPSHOT_SUFFIX}"
+
+
+def stream_cached_headers(
+    adapter: OpenAIAdapter | ClaudeAdapter | NDJSONAdapter,
+    file_path: Path,
+    *,
+    cache_dir: Path | None = None,
+    progress_callback: ProgressCallback | None = None,
+    on_skip: OnSkipCallback | None = None,
+    workers: int = 1,
+) -> Iterator[ConversationHeader]:
+    """Stream conversation headers, from the snapshot cache when it is current.
+
+    Yields exactly what ``adapter.stream_conversation_headers(file_path)``
+    yields, in export order, and reports the same skipped entries and
+    progress. A current snapshot is replayed without opening the export
+    beyond its fingerprint; otherwise the export is parsed and, once the
+    stream has been read to the end, the snapshot is (re)written.
+
+    Args:
+        adapter: Adapter used to parse the export on a cache miss
+        file_path: Path to export file
+        cache_dir: Snapshot directory (default: ``default_cache_dir()``)
+        progress_callback: Optional callback invoked every 100 conversations (FR-069)
+        on_skip: Optional callback invoked when malformed entries skipped (FR-107)
+        workers: Number of parsing processes on a cache miss (1 = this process)
+
+    Yields:
+        ConversationHeader for each well-formed conversation, in file order
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file is not readable
+        ParseError: If JSON is malformed (syntax errors)
+
+    Example:
+        ```python
+        adapter = OpenAIAdapter()
+        for header in stream_cached_headers(adapter, Path("export.json")):
+            print(f"{header.title}: {header.message_count} messages")
+        ```
+    """
+    path = snapshot_path(file_path, cache_dir)
+    stat = file_path.stat()
+    stamp = _STAMP.pack(
+        _MAGIC,
+        SNAPSHOT_FORMAT_VERSION,
+        __version__.encode(),
+        stat.st_size,
+        stat.st_mtime_ns,
+        bytes.fromhex(compute_fingerprint(file_path)),
+        type(adapter).__name__.encode(),
+    )
+
+    with _mapped_snapshot(path, stamp) as records:
+        if records is not None:
+            logger.debug("Replaying header snapshot", extra={"snapshot_path": str(path)})
+            yield from _replay(records, progress_callback, on_skip)
+            return
+
+    writer = _SnapshotWriter(path, stamp)
+
+    def record_skip(conversation_id: str, reason: str) -> None:
+        writer.add(_SKIPPED, conversation_id, reason)
+        if on_skip:
+            on_skip(conversation_id, reason)
+
+    try:
+        for header in adapter.stream_conversation_headers(
+            file_path,
+            progress_callback=progress_callback,
+            on_skip=record_skip,
+            workers=workers,
+        ):
+            updated_at = header.updated_at
+            writer.add(
+                _HEADER if updated_at is None else _HEADER_UPDATED,
+                header.id,
+                header.title,
+                created_at=(header.created_at - _EPOCH) // _MICROSECOND,
+                updated_at=(updated_at - _EPOCH) // _MICROSECOND if updated_at is not None else 0,
+                message_count=header.message_count,
+            )
+            yield header
+        writer.commit()
+    finally:
+        writer.discard()
+
+
+@contextlib.contextmanager
+def _mapped_snapshot(path: Path, stamp: bytes) -> Iterator[mmap.mmap | None]:
+    """Map a snapshot read-only, yielding None unless it matches ``stamp``."""
+    try:
+        f = open(path, "rb")  # noqa: SIM115
+    except OSError:
+        yield None
+        return
+
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(f)
+        try:
+            mapped = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError):  # ValueError: empty file
+            mapped = None
+        if (
+            mapped is None
+            or len(mapped) < _PREAMBLE_SIZE
+            or mapped[: _STAMP.size] != stamp
+            or len(mapped) != _PREAMBLE_SIZE + _LENGTH.unpack_from(mapped, _STAMP.size)[0]
+        ):
+            logger.debug("Ignoring stale header snapshot", extra={"snapshot_path": str(path)})
+            mapped = None
+        yield mapped
+
+
+def _replay(
+    records: mmap.mmap,
+    progress_callback: ProgressCallback | None,
+    on_skip: OnSkipCallback | None,
+) -> Iterator[ConversationHeader]:
+    """Yield the headers of a snapshot, reporting its skipped entries."""
+    unpack = _RECORD.unpack_from
+    offset = _PREAMBLE_SIZE
+    end = len(records)
+    count = 0
+    while offset < end:
+        kind, created_at, updated_at, message_count, first_len, second_len = unpack(records, offset)
+        offset += _RECORD.size
+        first = records[offset : offset + first_len].decode("utf-8", "surrogatepass")
+        offset += first_len
+        second = records[offset : offset + second_len].decode("utf-8", "surrogatepass")
+        offset += second_len
+
+        if kind == _SKIPPED:
+            if on_skip:
+                on_skip(first, second)
+            logger.warning(
+                "Skipped malformed conversation",
+                extra={"conversation_id": first, "reason": second},
+            )
+            continue
+
+        count += 1
+        if progress_callback and count % 100 == 0:
+            progress_callback(count)
+
+        yield trusted_header(
+            id=first,
+            title=second,
+            created_at=_EPOCH + created_at * _MICROSECOND,
+            updated_at=_EPOCH + updated_at * _MICROSECOND if kind == _HEADER_UPDATED else None,
+            message_count=message_count,
+        )
+
+
+class _SnapshotWriter:
+    """Append records to a temporary snapshot; ``commit()`` moves it into place.
+
+    Any OSError (unwritable cache directory, full disk) drops the snapshot
+    for this run instead of failing the command.
+    """
+
+    def __init__(self, path: Path, stamp: bytes) -> None:
+        self._path = path
+        self._tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        self._file: IO[bytes] | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self._tmp_path, "wb")  # noqa: SIM115
+            self._file.write(stamp + _LENGTH.pack(0))
+        except OSError as e:
+            self._drop(e)
+
+    def add(
+        self,
+        kind: int,
+        first: str,
+        second: str,
+        *,
+        created_at: int = 0,
+        updated_at: int = 0,
+        message_count: int = 0,
+    ) -> None:
+        """Append one header or skipped-entry record."""
+        if self._file is None:
+            return
+        first_bytes = first.encode("utf-8", "surrogatepass")
+        second_bytes = second.encode("utf-8", "surrogatepass")
+        try:
+            self._file.write(
+                _RECORD.pack(
+                    kind,
+                    created_at,
+                    updated_at,
+                    message_count,
+                    len(first_bytes),
+                    len(second_bytes),
+                )
+            )
+            self._file.write(first_bytes)
+            self._file.write(second_bytes)
+        except (OSError, struct.error) as e:
+            self._drop(e)
+
+    def commit(self) -> None:
+        """Fill in the record length and atomically replace the snapshot."""
+        if self._file is None:
+            return
+        try:
+            length = self._file.tell() - _PREAMBLE_SIZE
+            self._file.seek(_STAMP.size)
+            self._file.write(_LENGTH.pack(length))
+            self._file.close()
+            self._file = None
+            self._tmp_path.replace(self._path)
+        except OSError as e:
+            self._drop(e)
+
+    def discard(self) -> None:
+        """Remove the temporary snapshot (no-op after a successful commit)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        with contextlib.suppress(OSError):
+            self._tmp_path.unlink(missing_ok=True)
+
+    def _drop(self, error: Exception) -> None:
+        logger.debug(
+            "Not writing header snapshot",
+            extra={"snapshot_path": str(self._path), "reason": str(error)},
+        )
+        self.discard()
@@ -47,13 +47,14 @@ Example:
     ```
 """
 
-from echomine.models.conversation import Conversation
+from echomine.models.conversation import Conversation, ConversationHeader
 from echomine.models.message import Message
 from echomine.models.search import SearchQuery, SearchResult
 
 
 __all__ = [
     "Conversation",
+    "ConversationHeader",
     "Message",
     "SearchQuery",
     "SearchResult",
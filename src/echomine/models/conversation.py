@@ -14,11 +14,42 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from echomine.models.message import Message
 
 
+class _MessageTree:
+    """Lookup tables for tree navigation over one messages list.
+
+    Built on first navigation call and cached on the Conversation, turning
+    every lookup into a dict access instead of a scan over all messages.
+
+    Attributes:
+        messages: The list the tables were built from (identity-checked, so a
+            model_copy with new messages rebuilds the index)
+        by_id: Message ID to message (first occurrence wins, like a scan)
+        children: Parent ID to child messages, in message order
+    """
+
+    __slots__ = ("by_id", "children", "messages")
+
+    def __init__(self, messages: list[Message]) -> None:
+        self.messages = messages
+        self.by_id: dict[str, Message] = {}
+        self.children: dict[str | None, list[Message]] = {}
+        for message in messages:
+            self.by_id.setdefault(message.id, message)
+            self.children.setdefault(message.parent_id, []).append(message)
+
+    def __eq__(self, other: object) -> bool:
+        # A cache never makes two conversations unequal (Pydantic compares
+        # private attributes in BaseModel.__eq__)
+        return other is None or isinstance(other, _MessageTree)
+
+    __hash__ = None  # type: ignore[assignment]
+
+
 class Conversation(BaseModel):
     """Immutable conversation structure with tree navigation (per FR-222, FR-227, FR-278).
 
@@ -31,7 +62,8 @@ class Conversation(BaseModel):
         Use .model_copy(update={...}) to create modified instances.
 
     Tree Navigation:
-        Conversations support tree navigation via helper methods:
+        Conversations support tree navigation via helper methods (an
+        id/parent index is built on first use, so each lookup is O(1)):
         - get_root_messages(): Entry points for conversation traversal
         - get_message_by_id(): Fast lookup for specific messages
         - get_children(): Get direct replies to a message
@@ -119,6 +151,9 @@ class Conversation(BaseModel):
         description="Provider-specific fields NOT part of stable API (e.g., moderation_results, plugin_ids)",
     )
 
+    # Lazily built navigation index (not a field: excluded from dumps and equality)
+    _tree: _MessageTree | None = PrivateAttr(default=None)
+
     # Timestamp Validators (per FR-244, FR-245, FR-246, FR-273)
     @field_validator("created_at")
     @classmethod
@@ -242,6 +277,17 @@ class Conversation(BaseModel):
 
     # Tree Navigation Methods (per FR-278, FR-280)
 
+    def _message_tree(self) -> _MessageTree:
+        """Return the navigation index, building it on first use.
+
+        Memory: O(N) once per conversation; Time: O(N) to build, O(1) after
+        """
+        tree = self._tree
+        if tree is None or tree.messages is not self.messages:
+            tree = _MessageTree(self.messages)
+            self._tree = tree
+        return tree
+
     def get_message_by_id(self, message_id: str) -> Message | None:
         """Find message by ID.
 
@@ -261,7 +307,7 @@ class Conversation(BaseModel):
         Requirements:
             - FR-278: Support message lookup by ID
         """
-        return next((m for m in self.messages if m.id == message_id), None)
+        return self._message_tree().by_id.get(message_id)
 
     def get_root_messages(self) -> list[Message]:
         """Get all root messages (parent_id is None).
@@ -281,7 +327,7 @@ class Conversation(BaseModel):
         Requirements:
             - FR-278: Support identifying conversation entry points
         """
-        return [m for m in self.messages if m.parent_id is None]
+        return list(self._message_tree().children.get(None, ()))
 
     def get_children(self, message_id: str) -> list[Message]:
         """Get all direct children of a message.
@@ -302,7 +348,7 @@ class Conversation(BaseModel):
         Requirements:
             - FR-278: Support tree navigation via parent-child relationships
         """
-        return [m for m in self.messages if m.parent_id == message_id]
+        return list(self._message_tree().children.get(message_id, ()))
 
     def get_thread(self, message_id: str) -> list[Message]:
         """Get message and all ancestors up to root.
@@ -325,14 +371,21 @@ class Conversation(BaseModel):
 
         Requirements:
             - FR-278: Support retrieving conversation context for a message
+
+        Time Complexity: O(depth)
         """
+        by_id = self._message_tree().by_id
         thread: list[Message] = []
-        current = self.get_message_by_id(message_id)
+        seen: set[str] = set()
+        current = by_id.get(message_id)
 
-        while current:
-            thread.insert(0, current)  # Prepend (oldest first)
-            current = self.get_message_by_id(current.parent_id) if current.parent_id else None
+        # Walk up to the root; stop on a parent_id cycle in malformed data
+        while current is not None and current.id not in seen:
+            seen.add(current.id)
+            thread.append(current)
+            current = by_id.get(current.parent_id) if current.parent_id else None
 
+        thread.reverse()  # Oldest first
         return thread
 
     def get_all_threads(self) -> list[list[Message]]:
@@ -362,30 +415,27 @@ class Conversation(BaseModel):
         Requirements:
             - FR-278: Support comprehensive tree traversal
             - FR-280: Enable analysis of all conversation branches
+
+        Time Complexity: O(total length of the returned threads); iterative,
+        so deep trees cannot hit the recursion limit
         """
+        children = self._message_tree().children
         threads: list[list[Message]] = []
-
-        def build_threads(msg: Message, path: list[Message]) -> None:
-            """Recursive helper to build all threads from a message.
-
-            Args:
-                msg: Current message in traversal
-                path: Accumulated messages from root to current
-            """
-            path = [*path, msg]  # Extend path with current message
-            children = self.get_children(msg.id)
-
-            if not children:
+        path: list[Message] = []
+
+        # Depth-first from each root; children pushed in reverse so threads
+        # come out in message order
+        stack: list[tuple[Message, int]] = [(root, 0) for root in reversed(children.get(None, ()))]
+        while stack:
+            message, depth = stack.pop()
+            del path[depth:]
+            path.append(message)
+            replies = children.get(message.id)
+            if not replies:
                 # Leaf node: complete thread
-                threads.append(path)
+                threads.append(path.copy())
             else:
-                # Branch node: recurse into children
-                for child in children:
-                    build_threads(child, path)
-
-        # Start traversal from each root
-        for root in self.get_root_messages():
-            build_threads(root, [])
+                stack.extend((child, depth + 1) for child in reversed(replies))
 
         return threads
 
@@ -409,3 +459,84 @@ class Conversation(BaseModel):
             - FR-322: Enable full-text search across conversation content
         """
         return " ".join(msg.content for msg in self.messages)
+
+
+class ConversationHeader(BaseModel):
+    """Immutable conversation metadata without messages.
+
+    Yielded by ``stream_conversation_headers()`` for callers that need only
+    id, title, timestamps and message count (``list``, ``stats``). The
+    message count is read from the raw export structure, so no Message model
+    is ever built.
+
+    Immutability:
+        This model is FROZEN - attempting to modify fields will raise ValidationError.
+        Use .model_copy(update={...}) to create modified instances.
+
+    Example:
+        ```python
+        for header in adapter.stream_conversation_headers(Path("export.json")):
+            print(f"{header.title}: {header.message_count} messages")
+        ```
+
+    Attributes:
+        id: Unique conversation identifier (non-empty string)
+        title: Conversation title (non-empty, any UTF-8)
+        created_at: Conversation creation timestamp (timezone-aware UTC, REQUIRED)
+        updated_at: Last modification timestamp (timezone-aware UTC, None if never updated)
+        message_count: Number of messages in the export entry (at least 1, like
+            ``Conversation.messages``)
+
+    Computed Properties:
+        updated_at_or_created: Returns updated_at if set, else created_at (never None)
+    """
+
+    model_config = ConfigDict(
+        frozen=True,  # Immutability
+        strict=True,  # Strict validation
+        extra="forbid",  # Reject unknown fields
+        validate_assignment=True,
+        arbitrary_types_allowed=False,
+    )
+
+    id: str = Field(
+        ...,
+        min_length=1,
+        description="Unique conversation identifier (non-empty)",
+    )
+    title: str = Field(
+        ...,
+        min_length=1,
+        description="Conversation title (non-empty, any UTF-8)",
+    )
+    created_at: datetime = Field(
+        ...,
+        description="Conversation creation timestamp (timezone-aware UTC, REQUIRED)",
+    )
+    updated_at: datetime | None = Field(
+        default=None,
+        description="Last modification timestamp (timezone-aware UTC, None if never updated)",
+    )
+    message_count: int = Field(
+        ...,
+        ge=1,
+        description="Number of messages in conversation (at least 1)",
+    )
+
+    # Timestamp Validators: same rules as Conversation (FR-244, FR-245, FR-273)
+    @field_validator("created_at")
+    @classmethod
+    def validate_created_at_timezone_aware(cls, v: datetime) -> datetime:
+        """Ensure created_at is timezone-aware and normalized to UTC."""
+        return Conversation.validate_created_at_timezone_aware(v)
+
+    @field_validator("updated_at")
+    @classmethod
+    def validate_updated_at_timezone_aware(cls, v: datetime | None, info: Any) -> datetime | None:
+        """Ensure updated_at is timezone-aware and >= created_at (if provided)."""
+        return Conversation.validate_updated_at_timezone_aware(v, info)
+
+    @property
+    def updated_at_or_created(self) -> datetime:
+        """Get the last update timestamp, falling back to created_at if not set."""
+        return self.updated_at if self.updated_at is not None else self.created_at
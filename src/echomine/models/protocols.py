@@ -16,7 +16,7 @@ protocol method signatures with proper types, exceptions, and guarantees.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Protocol, TypeVar, runtime_checkable
@@ -207,6 +207,9 @@ class ConversationProvider(Protocol[ConversationT]):
         conv = adapter.get_conversation_by_id(Path("export.json"), "conv-uuid-123")
         if conv:
             print(conv.title)
+
+        # Get several conversations in one pass
+        found = adapter.get_conversations_by_ids(Path("export.json"), ["conv-1", "conv-2"])
         ```
 
     Requirements:
@@ -321,7 +324,8 @@ class ConversationProvider(Protocol[ConversationT]):
 
         Args:
             file_path: Path to export file
-            conversation_id: Conversation UUID from export
+            conversation_id: Conversation UUID from export, or a prefix of at
+                least 4 characters matching exactly one conversation
 
         Returns:
             ConversationT: Provider-specific conversation object if found
@@ -332,6 +336,7 @@ class ConversationProvider(Protocol[ConversationT]):
             PermissionError: If file_path is not readable (per FR-051)
             ParseError: If export format is invalid (per FR-036)
             SchemaVersionError: If schema version unsupported (per FR-036, FR-085)
+            AmbiguousIdError: If a prefix matches several conversations
 
         Requirements:
             - FR-151: Generic return type (Optional[ConversationT])
@@ -339,3 +344,34 @@ class ConversationProvider(Protocol[ConversationT]):
             - FR-155: Returns None if not found (not exception)
         """
         ...
+
+    def get_conversations_by_ids(
+        self,
+        file_path: Path,
+        conversation_ids: Iterable[str],
+    ) -> dict[str, ConversationT]:
+        """Retrieve several conversations by UUID in one pass over the export.
+
+        Performance Contract: MUST NOT scan the export once per ID. Entries that
+        match no requested ID SHOULD be skipped without building models, and
+        streaming SHOULD stop once every ID has been found.
+
+        Args:
+            file_path: Path to export file
+            conversation_ids: Conversation UUIDs from export (duplicates ignored)
+
+        Returns:
+            dict mapping each requested ID that was found to its conversation,
+            in request order (IDs not found are absent, not an exception)
+
+        Raises:
+            FileNotFoundError: If file_path does not exist (per FR-049)
+            PermissionError: If file_path is not readable (per FR-051)
+            ParseError: If export format is invalid (per FR-036)
+            AmbiguousIdError: If a prefix matches several conversations
+
+        Requirements:
+            - Same matching rules as get_conversation_by_id
+            - FR-153: Memory-efficient (O(1) for file size)
+        """
+        ...
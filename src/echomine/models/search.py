@@ -18,7 +18,7 @@ Advanced Search Features (v1.1.0):
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import UTC, date, datetime
 from typing import Generic, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -277,6 +277,76 @@ class SearchQuery(BaseModel):
         """
         return self.min_messages is not None or self.max_messages is not None
 
+    def has_header_filter(self) -> bool:
+        """Check if any filter can be decided from conversation header fields.
+
+        Header filters (title, date range, min_messages) can reject a
+        conversation before its messages are parsed. max_messages and
+        role_filter depend on parsed messages and are not header filters.
+
+        Returns:
+            True if title_filter, from_date/to_date, or min_messages is set
+
+        Example:
+            ```python
+            query = SearchQuery(keywords=["python"], from_date=date(2024, 1, 1))
+            assert query.has_header_filter() is True
+
+            query2 = SearchQuery(keywords=["python"], max_messages=5)
+            assert query2.has_header_filter() is False
+            ```
+        """
+        return self.has_title_filter() or self.has_date_filter() or self.min_messages is not None
+
+    def excludes_header(
+        self,
+        *,
+        title: str | None = None,
+        created_at: datetime | None = None,
+        max_message_count: int | None = None,
+    ) -> bool:
+        """Check if header values alone rule out a match (predicate pushdown).
+
+        Adapters call this on raw header fields before building Message and
+        Conversation models. Semantics match the post-parse filters exactly,
+        so a True result means the conversation could never be returned.
+        Unknown values (None) never exclude.
+
+        Args:
+            title: Conversation title as the adapter would parse it
+            created_at: Timezone-aware creation time as the adapter would parse it
+            max_message_count: Upper bound on the parsed message count
+
+        Returns:
+            True if the conversation is certainly excluded, False otherwise
+
+        Example:
+            ```python
+            query = SearchQuery(title_filter="python", min_messages=5)
+            assert query.excludes_header(title="Rust notes") is True
+            assert query.excludes_header(title="Python tips", max_message_count=3) is True
+            assert query.excludes_header(title="Python tips") is False
+            ```
+        """
+        if title is not None and self.has_title_filter():
+            assert self.title_filter is not None  # Type narrowing
+            if self.title_filter.lower() not in title.lower():
+                return True
+
+        # Naive datetimes fail Conversation validation; let the parser report them
+        if created_at is not None and created_at.tzinfo is not None and self.has_date_filter():
+            conv_date = created_at.astimezone(UTC).date()
+            if self.from_date is not None and conv_date < self.from_date:
+                return True
+            if self.to_date is not None and conv_date > self.to_date:
+                return True
+
+        return (
+            max_message_count is not None
+            and self.min_messages is not None
+            and max_message_count < self.min_messages
+        )
+
 
 class SearchResult(BaseModel, Generic[ConversationT]):
     """Generic search result with relevance scoring.
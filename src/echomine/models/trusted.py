@@ -0,0 +1,175 @@
+"""Unvalidated construction of Message and Conversation for trusted exports.
+
+Full Pydantic validation (strict types, Literal roles, min_length, timestamp
+validators) is one of the largest per-message costs of parsing. Exports that
+have already been parsed successfully (e.g. nightly re-reads of the same
+archive) do not need it on every run, so
+``stream_conversations(..., trusted=True)`` builds models through this module
+instead, as does the header snapshot cache (``echomine.index.snapshot``) when
+it restores headers that were validated on the run that wrote them.
+
+What is still checked (cheap, and needed so the same entries are skipped):
+    - Non-empty string ids and titles
+    - At least one message per conversation
+    - Timezone-aware timestamps, normalized to UTC
+    - updated_at >= created_at
+
+Violations raise Pydantic's ValidationError, as the validating constructor
+would. Field types are NOT checked: malformed input can produce models whose
+values do not match their annotations.
+
+Note:
+    ``BaseModel.model_construct`` is not used: with pydantic-core it is slower
+    than validating. Instances are created the way ``model_construct`` does it
+    internally, minus the per-field bookkeeping.
+
+Constitution Compliance:
+    - Principle VI: Strict typing with mypy --strict
+    - FR-223, FR-227: Models stay frozen (immutability is enforced on assignment)
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic import ValidationError as PydanticValidationError
+
+from echomine.models.conversation import Conversation, ConversationHeader
+from echomine.models.message import Message
+
+
+def trusted_message(**fields: Any) -> Message:
+    """Build a Message without field validation.
+
+    Args:
+        **fields: Message fields, as passed to ``Message(...)``
+
+    Returns:
+        Message equal to ``Message(**fields)`` for well-formed input
+
+    Raises:
+        PydanticValidationError: If id is empty or timestamp is timezone-naive
+    """
+    _require_text(Message, fields, "id")
+    _require_utc(Message, fields, "timestamp")
+    message: Message = _construct(Message, fields)
+    return message
+
+
+def trusted_conversation(**fields: Any) -> Conversation:
+    """Build a Conversation without field validation.
+
+    Args:
+        **fields: Conversation fields, as passed to ``Conversation(...)``
+
+    Returns:
+        Conversation equal to ``Conversation(**fields)`` for well-formed input
+
+    Raises:
+        PydanticValidationError: If id or title is empty, there are no
+            messages, a timestamp is timezone-naive, or updated_at < created_at
+    """
+    _require_text(Conversation, fields, "id")
+    _require_text(Conversation, fields, "title")
+    if not fields.get("messages"):
+        raise _error(
+            Conversation, "messages", fields.get("messages"), "at least 1 message required"
+        )
+
+    created_at = _require_utc(Conversation, fields, "created_at")
+    if fields.get("updated_at") is not None:
+        updated_at = _require_utc(Conversation, fields, "updated_at")
+        if updated_at < created_at:
+            raise _error(
+                Conversation,
+                "updated_at",
+                updated_at,
+                f"updated_at ({updated_at}) must be >= created_at ({created_at})",
+            )
+    conversation: Conversation = _construct(Conversation, fields)
+    return conversation
+
+
+def trusted_header(**fields: Any) -> ConversationHeader:
+    """Build a ConversationHeader without field validation.
+
+    Args:
+        **fields: Header fields, as passed to ``ConversationHeader(...)``
+
+    Returns:
+        ConversationHeader equal to ``ConversationHeader(**fields)`` for
+        well-formed input
+
+    Raises:
+        PydanticValidationError: If id or title is empty or a timestamp is
+            timezone-naive
+    """
+    _require_text(ConversationHeader, fields, "id")
+    _require_text(ConversationHeader, fields, "title")
+    _require_utc(ConversationHeader, fields, "created_at")
+    if fields.get("updated_at") is not None:
+        _require_utc(ConversationHeader, fields, "updated_at")
+    header: ConversationHeader = _construct(ConversationHeader, fields)
+    return header
+
+
+def _construct(model: type[BaseModel], fields: dict[str, Any]) -> Any:
+    """Create a model instance from already-correct field values.
+
+    Values are stored in declaration order (serialization follows it),
+    missing fields get their declared defaults, and ``model_fields_set``
+    holds the fields that were passed, as after validation.
+    """
+    names = model.__pydantic_fields__.keys()
+    try:
+        values = {name: fields[name] for name in names}
+    except KeyError:
+        values = {
+            name: fields[name] if name in fields else info.get_default(call_default_factory=True)
+            for name, info in model.__pydantic_fields__.items()
+        }
+    instance = model.__new__(model)
+    # Same attributes BaseModel.model_construct sets
+    _set = object.__setattr__
+    _set(instance, "__dict__", values)
+    _set(instance, "__pydantic_fields_set__", set(fields))
+    _set(instance, "__pydantic_extra__", None)
+    _set(instance, "__pydantic_private__", None)
+    if model.__pydantic_post_init__:
+        # Initializes private attributes to their defaults
+        instance.model_post_init(None)
+    return instance
+
+
+def _require_text(model: type[BaseModel], fields: dict[str, Any], name: str) -> None:
+    """Reject a missing, empty or non-string identifier/title field."""
+    value = fields.get(name)
+    if not isinstance(value, str) or not value:
+        raise _error(model, name, value, f"{name} must be a non-empty string")
+
+
+def _require_utc(model: type[BaseModel], fields: dict[str, Any], name: str) -> datetime:
+    """Reject a timezone-naive timestamp field and normalize it to UTC in place."""
+    value = fields.get(name)
+    if not isinstance(value, datetime) or value.utcoffset() is None:
+        raise _error(model, name, value, f"{name} must be timezone-aware: {value}")
+    if value.tzinfo is not UTC:
+        value = fields[name] = value.astimezone(UTC)
+    return value
+
+
+def _error(model: type[BaseModel], name: str, value: Any, message: str) -> PydanticValidationError:
+    """Build the ValidationError the validating constructor would raise."""
+    return PydanticValidationError.from_exception_data(
+        model.__name__,
+        [
+            {
+                "type": "value_error",
+                "loc": (name,),
+                "input": value,
+                "ctx": {"error": ValueError(message)},
+            }
+        ],
+    )
@@ -0,0 +1,413 @@
+"""Provider-neutral search pipeline: filter, tokenize, score, rank, snippet.
+
+Adapters differ only in how they read conversations from an export. Their
+``search()`` hands ``search_conversations`` a ``ConversationStream`` and
+gets back the ranked results; filtering, BM25 scoring, match modes,
+exclusion, sorting and snippet extraction are implemented once, here.
+When a current SearchIndex exists, ``search_indexed`` turns its hits into
+the same results without streaming the export.
+
+Pipeline:
+    1. Stream conversations, with header filters pushed down to the reader
+    2. Apply title, date, message count and role filters
+    3. Tokenize each candidate once (``TokenizedDocument``)
+    4. Score with BM25 (keywords) and substring matching (phrases)
+    5. Drop excluded conversations, keep the top ``limit`` in sort order
+    6. Normalize scores and extract snippets
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (candidates stream; low_memory keeps
+      O(limit) results)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Protocol
+
+from echomine.models.conversation import Conversation
+from echomine.models.message import Message
+from echomine.models.protocols import OnSkipCallback, ProgressCallback
+from echomine.models.search import SearchQuery, SearchResult
+from echomine.search.ranking import (
+    BM25Scorer,
+    CorpusStatistics,
+    TokenizedDocument,
+    all_terms_present,
+    exclude_filter,
+    phrase_matches,
+    tokenize_keywords,
+)
+from echomine.search.snippet import extract_snippet_from_messages
+
+
+if TYPE_CHECKING:
+    from echomine.index.search_index import SearchIndex
+
+
+# (conversation, raw_score, matched_message_ids, filtered_messages)
+_Scored = tuple[Conversation, float, list[str], list[Message]]
+
+# (conversation, filtered_messages, document)
+_Candidate = tuple[Conversation, list[Message], TokenizedDocument]
+
+
+class ConversationStream(Protocol):
+    """Opens a fresh stream of an export's parsed conversations.
+
+    Called once per search pass. ``prefilter`` is a query whose header
+    filters the reader may apply before parsing (None: nothing to push
+    down); the pipeline re-checks every filter, so ignoring it is correct.
+    ``on_skip`` receives the entries the reader skips as malformed.
+    """
+
+    def __call__(
+        self, *, prefilter: SearchQuery | None, on_skip: OnSkipCallback | None
+    ) -> Iterator[Conversation]: ...
+
+
+def search_conversations(
+    stream: ConversationStream,
+    query: SearchQuery,
+    *,
+    progress_callback: ProgressCallback | None = None,
+    on_skip: OnSkipCallback | None = None,
+    low_memory: bool = False,
+) -> Iterator[SearchResult[Conversation]]:
+    """Search a conversation stream with BM25 relevance ranking.
+
+    Args:
+        stream: Opens the conversations to search (see ``ConversationStream``)
+        query: SearchQuery with keywords, phrases, filters, sort and limit
+        progress_callback: Optional callback invoked per conversation processed
+        on_skip: Optional callback for malformed entries (reported once,
+            also in low-memory mode)
+        low_memory: Open the stream twice instead of holding every
+            candidate: pass 1 gathers BM25 statistics, pass 2 scores and
+            keeps only the top ``query.limit`` results
+
+    Yields:
+        SearchResult[Conversation] in result order
+
+    Raises:
+        Whatever opening or reading ``stream`` raises (FileNotFoundError,
+        ParseError)
+    """
+    candidates: Iterable[_Candidate]
+    if low_memory:
+        # Pass 1: document count, lengths and keyword document frequencies only
+        statistics = CorpusStatistics(tokenize_keywords(query.keywords or []))
+        for _, _, document in _search_candidates(stream, query, progress_callback, on_skip):
+            statistics.add(document)
+
+        # Handle empty results
+        if statistics.document_count == 0:
+            return  # Empty iterator
+
+        scorer = BM25Scorer.from_statistics(statistics)
+
+        # Pass 2: re-stream and score; only the top `limit` results are retained
+        candidates = _search_candidates(stream, query, None, None)
+    else:
+        candidates = list(_search_candidates(stream, query, progress_callback, on_skip))
+
+        # Handle empty results
+        if not candidates:
+            return  # Empty iterator
+
+        # Calculate average document length for BM25 (token counts are cached)
+        documents = [document for _, _, document in candidates]
+        avg_doc_length = sum(doc.length for doc in documents) / len(documents)
+        scorer = BM25Scorer(corpus=documents, avg_doc_length=avg_doc_length)
+
+    # Score all conversations, dropping non-matches
+    scored_conversations = (
+        scored
+        for conv, filtered_msgs, document in candidates
+        if (scored := _score_candidate(conv, filtered_msgs, document, query, scorer)) is not None
+    )
+
+    # Apply limit (always positive integer per SearchQuery validation) while
+    # ordering with reverse based on sort_order (FR-044); holds at most `limit` results
+    select = heapq.nlargest if query.sort_order == "desc" else heapq.nsmallest
+    top_conversations = select(query.limit, scored_conversations, key=_sort_key(query))
+
+    # Build keywords list for snippet extraction
+    snippet_keywords = [*(query.keywords or []), *(query.phrases or [])]
+
+    # Yield SearchResult objects with snippet extraction (FR-021-025)
+    for conv, score, matched_message_ids, filtered_msgs in top_conversations:
+        snippet, _ = extract_snippet_from_messages(
+            filtered_msgs,
+            snippet_keywords,
+            matched_message_ids,
+        )
+
+        yield SearchResult[Conversation](
+            conversation=conv,
+            # Normalize scores to [0.0, 1.0] (FR-319): score_raw / (score_raw + 1)
+            score=score / (score + 1.0) if score > 0 else 0.0,
+            matched_message_ids=matched_message_ids,
+            snippet=snippet,
+        )
+
+
+def search_indexed(
+    search_index: SearchIndex,
+    query: SearchQuery,
+    parse_conversation: Callable[[dict[str, Any]], Conversation],
+    *,
+    progress_callback: ProgressCallback | None = None,
+) -> Iterator[SearchResult[Conversation]]:
+    """Yield search results ranked by a search index.
+
+    Only the returned conversations are re-read from the export and parsed.
+
+    Args:
+        search_index: Current search index for the export
+        query: SearchQuery without phrases (``SearchIndex.supports``)
+        parse_conversation: Provider parser for one raw export object
+        progress_callback: Optional callback, invoked once with the indexed count
+
+    Yields:
+        SearchResult[Conversation] in result order
+    """
+    hits = search_index.search(query)
+
+    if progress_callback:
+        progress_callback(search_index.conversation_count)
+
+    for hit, raw in zip(hits, search_index.iter_raw_conversations(hits)):
+        conv = parse_conversation(raw)
+        if query.role_filter is not None:
+            filtered_msgs = [m for m in conv.messages if m.role == query.role_filter]
+        else:
+            filtered_msgs = list(conv.messages)
+        matched_message_ids = [conv.messages[i].id for i in hit.matched_positions]
+
+        snippet, _ = extract_snippet_from_messages(
+            filtered_msgs,
+            list(query.keywords or []),
+            matched_message_ids,
+        )
+
+        yield SearchResult[Conversation](
+            conversation=conv,
+            score=hit.score,
+            matched_message_ids=matched_message_ids,
+            snippet=snippet,
+        )
+
+
+def _sort_key(query: SearchQuery) -> Callable[[_Scored], tuple[float | str | int, str]]:
+    """Return the result sort key for a query (FR-043-048).
+
+    Keys are tuples for multi-level sorting:
+    - Primary: sort_by field value
+    - Secondary: conversation_id (tie-breaker, FR-043a; heapq selection is
+      stable, so it equals sorted()[:limit], FR-043b)
+
+    FR-046a: For date sort, use updated_at or fall back to created_at if None
+    FR-047: Title sort is case-insensitive
+    """
+
+    def key(item: _Scored) -> tuple[float | str | int, str]:
+        conv, score, _, _ = item
+
+        primary_key: float | str | int
+        if query.sort_by == "score":
+            # Sort by BM25 relevance score
+            primary_key = score
+        elif query.sort_by == "date":
+            # FR-046a: Use updated_at if present, otherwise created_at
+            sort_date = conv.updated_at if conv.updated_at is not None else conv.created_at
+            # Convert datetime to timestamp for numeric sorting
+            primary_key = sort_date.timestamp()
+        elif query.sort_by == "title":
+            # FR-047: Case-insensitive title sort
+            primary_key = conv.title.lower()
+        else:  # query.sort_by == "messages"
+            # Sort by message count
+            primary_key = conv.message_count
+
+        # FR-043a: Tie-breaking by conversation_id (ascending)
+        return (primary_key, conv.id)
+
+    return key
+
+
+def _search_candidates(
+    stream: ConversationStream,
+    query: SearchQuery,
+    progress_callback: ProgressCallback | None,
+    on_skip: OnSkipCallback | None,
+) -> Iterator[_Candidate]:
+    """Stream conversations passing the query's filters, tokenized once.
+
+    Applies title, date, message count and role filters, then tokenizes
+    the searchable text. Both search passes use this, so the candidate
+    set is identical whether or not search runs in low-memory mode.
+
+    Args:
+        stream: Opens the conversations to search
+        query: SearchQuery whose filters select candidates
+        progress_callback: Optional callback invoked per conversation processed
+        on_skip: Optional callback for malformed entries
+
+    Yields:
+        (conversation, filtered_messages, document) for each candidate
+    """
+    # Header filters are pushed down into the stream (skips model building);
+    # the checks below still run so results are exact
+    prefilter = query if query.has_header_filter() else None
+
+    # Later stages only look up these tokens; cached documents keep no others
+    query_terms = tokenize_keywords([*(query.keywords or []), *(query.exclude_keywords or [])])
+
+    count = 0
+    for conv in stream(prefilter=prefilter, on_skip=on_skip):
+        count += 1
+
+        # Progress callback (every 100 items per FR-069)
+        if progress_callback and count % 100 == 0:
+            progress_callback(count)
+
+        # Title filter (fast metadata check)
+        if query.has_title_filter():
+            assert query.title_filter is not None  # Type narrowing
+            if query.title_filter.lower() not in conv.title.lower():
+                continue  # Skip non-matching titles
+
+        # Date range filter
+        if query.has_date_filter():
+            conv_date = conv.created_at.date()
+
+            # Check from_date (inclusive)
+            if query.from_date is not None and conv_date < query.from_date:
+                continue
+
+            # Check to_date (inclusive)
+            if query.to_date is not None and conv_date > query.to_date:
+                continue
+
+        # FR-006: Message count filter (streaming approach for O(1) memory)
+        if query.has_message_count_filter():
+            msg_count = conv.message_count
+
+            # Check min_messages (inclusive)
+            if query.min_messages is not None and msg_count < query.min_messages:
+                continue
+
+            # Check max_messages (inclusive)
+            if query.max_messages is not None and msg_count > query.max_messages:
+                continue
+
+        # FR-018: Filter messages by role before text aggregation
+        if query.role_filter is not None:
+            filtered_messages = [m for m in conv.messages if m.role == query.role_filter]
+        else:
+            filtered_messages = list(conv.messages)
+
+        # Skip conversations with no messages matching the role filter
+        if query.role_filter is not None and not filtered_messages:
+            continue
+
+        # Tokenize once; scoring, match mode, exclusion and message matching reuse it
+        # When role_filter is set, only search in filtered message content (not title)
+        # When role_filter is None, include title for metadata-based matching
+        document = TokenizedDocument.from_messages(
+            (m.content for m in filtered_messages),
+            title=conv.title if query.role_filter is None else None,
+        ).restricted_to(query_terms)
+
+        yield conv, filtered_messages, document
+
+    # Final progress callback
+    if progress_callback:
+        progress_callback(count)
+
+
+def _score_candidate(
+    conv: Conversation,
+    filtered_msgs: list[Message],
+    document: TokenizedDocument,
+    query: SearchQuery,
+    scorer: BM25Scorer,
+) -> _Scored | None:
+    """Score one candidate conversation against the query.
+
+    Args:
+        conv: Candidate conversation
+        filtered_msgs: Messages remaining after the role filter
+        document: Cached tokens of the candidate's searchable text
+        query: SearchQuery with keywords, phrases, match mode and exclusions
+        scorer: BM25Scorer holding the corpus statistics
+
+    Returns:
+        (conversation, raw_score, matched_message_ids, filtered_messages),
+        or None if the conversation does not match or is excluded
+    """
+    score = 0.0
+    matched_message_ids: list[str] = []
+    has_keyword_match = False
+    has_phrase_match = False
+
+    # Check keyword matches (BM25 scoring)
+    if query.has_keyword_search():
+        assert query.keywords is not None  # Type narrowing
+
+        # FR-009: match_mode='all' requires ALL keywords present
+        if query.match_mode == "all":
+            if all_terms_present(document, query.keywords, scorer):
+                # All keywords present - calculate score
+                score = scorer.score(document, query.keywords)
+                matched_message_ids = [
+                    filtered_msgs[i].id for i in document.matching_messages(query.keywords)
+                ]
+                has_keyword_match = True
+            # else: keywords don't all match, but may still match phrases (checked below)
+        else:
+            # Default 'any' mode: regular BM25 scoring
+            score = scorer.score(document, query.keywords)
+            matched_message_ids = [
+                filtered_msgs[i].id for i in document.matching_messages(query.keywords)
+            ]
+            if score > 0.0:
+                has_keyword_match = True
+
+    # Check phrase matches (exact substring matching)
+    # FR-002: Multiple phrases use OR logic
+    # FR-004: Phrases can be combined with keywords (OR logic)
+    if query.has_phrase_search():
+        assert query.phrases is not None  # Type narrowing
+        conv_text = " ".join(m.content for m in filtered_msgs)
+        if query.role_filter is None:
+            conv_text = f"{conv.title} {conv_text}"
+        if phrase_matches(conv_text, query.phrases):
+            has_phrase_match = True
+            # If phrase matches but no keyword score, use 1.0
+            if score == 0.0:
+                score = 1.0
+            # Find messages that match the phrases (from filtered messages only)
+            for message in filtered_msgs:
+                if phrase_matches(message.content, query.phrases):
+                    if message.id not in matched_message_ids:
+                        matched_message_ids.append(message.id)
+
+    # Skip conversations with no matches (neither keyword nor phrase)
+    if not has_keyword_match and not has_phrase_match:
+        # If no keywords or phrases specified, include all (title/date filter only)
+        if not query.has_keyword_search() and not query.has_phrase_search():
+            score = 1.0
+        else:
+            return None
+
+    # FR-014: Apply exclude filter after matching, before ranking
+    if query.has_exclude_keywords():
+        assert query.exclude_keywords is not None  # Type narrowing
+        if exclude_filter(document, query.exclude_keywords, scorer):
+            return None  # Skip conversations containing excluded terms
+
+    return conv, score, matched_message_ids, filtered_msgs
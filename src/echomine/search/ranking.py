@@ -26,6 +26,12 @@ Constitution Compliance:
 Advanced Search Features (v1.1.0):
     - FR-001-006: phrase_matches() for exact phrase matching
     - FR-012-016: exclude_filter() for exclusion filtering
+
+Tokenization Cache:
+    Each conversation is tokenized exactly once per search into a
+    TokenizedDocument. IDF calculation, BM25 scoring, match_mode='all',
+    exclusion and per-message matching all read from that cache instead of
+    re-running the tokenizer regexes over the same text.
 """
 
 from __future__ import annotations
@@ -34,6 +40,245 @@ import math
 import re
 from collections import Counter
 from collections import Counter as CounterType
+from collections.abc import Collection, Iterable, Sequence
+
+
+# Latin alphanumeric runs, and single non-Latin word characters (CJK etc.)
+_LATIN_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NON_LATIN_TOKEN_RE = re.compile(r"[^\W\d_a-z]")
+
+
+def tokenize(text: str) -> list[str]:
+    """Tokenize text into lowercase words, separating Latin from non-Latin scripts.
+
+    This is the single tokenizer shared by BM25 scoring, match modes,
+    exclusion filtering and per-message keyword matching (FR-010, FR-015).
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of lowercase tokens (Latin tokens first, then non-Latin)
+
+    Example:
+        ```python
+        tokenize("Python很适合")
+        # Returns: ["python", "很", "适", "合"]
+        ```
+    """
+    text_lower = text.lower()
+    return _LATIN_TOKEN_RE.findall(text_lower) + _NON_LATIN_TOKEN_RE.findall(text_lower)
+
+
+def tokenize_keywords(keywords: Iterable[str]) -> list[str]:
+    """Tokenize query keywords with the document tokenizer.
+
+    Args:
+        keywords: Query keywords (multi-character keywords may yield several tokens)
+
+    Returns:
+        Flat list of keyword tokens, in keyword order
+
+    Example:
+        ```python
+        tokenize_keywords(["Python", "编程"])
+        # Returns: ["python", "编", "程"]
+        ```
+    """
+    tokens: list[str] = []
+    for keyword in keywords:
+        tokens.extend(tokenize(keyword))
+    return tokens
+
+
+class TokenizedDocument:
+    """Token statistics for one conversation, computed once per search.
+
+    Holds everything later search stages need so no stage re-tokenizes the
+    conversation text: term frequencies (BM25 TF and IDF), document length
+    (BM25 length normalization and avgdl), and one token set per message
+    (matched_message_ids).
+
+    Attributes:
+        term_frequencies: Token -> occurrence count over the whole document
+        length: Total number of tokens in the document
+        message_tokens: Token set of each message, aligned with the input order
+
+    Example:
+        ```python
+        doc = TokenizedDocument.from_messages(
+            ["How do I sort a list?", "Use sorted()"], title="Python lists"
+        )
+        doc.term_frequencies["python"]  # 1 (from the title)
+        doc.matching_messages(["sorted"])  # [1]
+        ```
+    """
+
+    __slots__ = ("length", "message_tokens", "term_frequencies")
+
+    def __init__(
+        self,
+        term_frequencies: CounterType[str],
+        message_tokens: list[frozenset[str]] | None = None,
+        *,
+        length: int | None = None,
+    ) -> None:
+        """Initialize from precomputed token statistics.
+
+        Args:
+            term_frequencies: Token -> occurrence count over the whole document
+            message_tokens: Optional per-message token sets
+            length: Total token count, when term_frequencies holds only a
+                subset of the document's terms (e.g. loaded from a search index)
+        """
+        self.term_frequencies = term_frequencies
+        self.length = sum(term_frequencies.values()) if length is None else length
+        self.message_tokens = message_tokens if message_tokens is not None else []
+
+    @classmethod
+    def from_text(cls, text: str) -> TokenizedDocument:
+        """Tokenize a plain document (no per-message breakdown).
+
+        Args:
+            text: Document text
+
+        Returns:
+            TokenizedDocument with empty message_tokens
+        """
+        return cls(Counter(tokenize(text)))
+
+    @classmethod
+    def from_messages(
+        cls,
+        message_texts: Iterable[str],
+        *,
+        title: str | None = None,
+    ) -> TokenizedDocument:
+        """Tokenize a conversation message by message in a single pass.
+
+        Term statistics equal those of tokenizing ``f"{title} " + " ".join(texts)``
+        (the search corpus text), since tokens never span the joining spaces.
+
+        Args:
+            message_texts: Message contents, in the order used for matching
+            title: Optional title counted in term statistics but not in any message
+
+        Returns:
+            TokenizedDocument with one token set per message
+        """
+        term_frequencies: CounterType[str] = Counter()
+        if title is not None:
+            term_frequencies.update(tokenize(title))
+
+        message_tokens: list[frozenset[str]] = []
+        for text in message_texts:
+            tokens = tokenize(text)
+            term_frequencies.update(tokens)
+            message_tokens.append(frozenset(tokens))
+
+        return cls(term_frequencies, message_tokens)
+
+    def restricted_to(self, terms: Collection[str]) -> TokenizedDocument:
+        """Drop every token except ``terms``, keeping the document length.
+
+        Search only ever looks up the query's keyword and exclusion tokens,
+        so candidates held until ranking need nothing else; this keeps the
+        cached documents from outweighing the conversations themselves.
+
+        Args:
+            terms: Tokens to keep (e.g. tokenized keywords and exclusions)
+
+        Returns:
+            TokenizedDocument with identical BM25 statistics for ``terms``
+        """
+        wanted = frozenset(terms)
+        term_frequencies: CounterType[str] = Counter(
+            {term: self.term_frequencies[term] for term in wanted if term in self.term_frequencies}
+        )
+        message_tokens = [tokens & wanted for tokens in self.message_tokens]
+        return TokenizedDocument(term_frequencies, message_tokens, length=self.length)
+
+    def __contains__(self, token: object) -> bool:
+        """Check whether a token occurs anywhere in the document."""
+        return token in self.term_frequencies
+
+    def __bool__(self) -> bool:
+        """A document is truthy when it contains at least one token."""
+        return self.length > 0
+
+    def matching_messages(self, keywords: list[str]) -> list[int]:
+        """Return indices of messages containing any keyword token.
+
+        Args:
+            keywords: Query keywords (tokenized with the document tokenizer)
+
+        Returns:
+            Message indices in order, for messages sharing at least one token
+        """
+        keyword_tokens = set(tokenize_keywords(keywords))
+        if not keyword_tokens:
+            return []
+        return [
+            i
+            for i, tokens in enumerate(self.message_tokens)
+            if not keyword_tokens.isdisjoint(tokens)
+        ]
+
+
+class CorpusStatistics:
+    """Streaming accumulator for the BM25 corpus statistics.
+
+    Two-pass search feeds every candidate document through add() and then
+    discards it, so memory stays proportional to the tracked terms rather
+    than to the corpus. Only the document frequencies of the tracked terms
+    (the query keyword tokens) are kept; they are the only IDF values
+    scoring ever reads.
+
+    Attributes:
+        document_count: Number of documents added (N)
+        total_length: Sum of document lengths in tokens
+        document_frequencies: Tracked term -> documents containing it
+
+    Example:
+        ```python
+        stats = CorpusStatistics(["python"])
+        stats.add(TokenizedDocument.from_text("python and rust"))
+        stats.add(TokenizedDocument.from_text("go"))
+        stats.document_frequencies["python"]  # 1
+        stats.avg_doc_length  # 2.0
+        ```
+    """
+
+    __slots__ = ("document_count", "document_frequencies", "total_length")
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            terms: Tokens whose document frequencies should be tracked
+        """
+        self.document_count = 0
+        self.total_length = 0
+        self.document_frequencies: CounterType[str] = Counter(dict.fromkeys(terms, 0))
+
+    def add(self, document: TokenizedDocument) -> None:
+        """Account for one document.
+
+        Args:
+            document: Tokenized candidate document
+        """
+        self.document_count += 1
+        self.total_length += document.length
+        for term in self.document_frequencies:
+            if term in document:
+                self.document_frequencies[term] += 1
+
+    @property
+    def avg_doc_length(self) -> float:
+        """Average document length in tokens (0.0 for an empty corpus)."""
+        if self.document_count == 0:
+            return 0.0
+        return self.total_length / self.document_count
 
 
 class BM25Scorer:
@@ -76,11 +321,15 @@ class BM25Scorer:
     K1: float = 1.5  # Term frequency saturation
     B: float = 0.75  # Length normalization
 
-    def __init__(self, corpus: list[str], avg_doc_length: float) -> None:
+    def __init__(
+        self,
+        corpus: Sequence[str | TokenizedDocument],
+        avg_doc_length: float,
+    ) -> None:
         """Initialize BM25 scorer with corpus statistics.
 
         Args:
-            corpus: List of document texts (conversation content)
+            corpus: Document texts or pre-tokenized documents (conversation content)
             avg_doc_length: Average document length (for normalization)
 
         Example:
@@ -96,6 +345,39 @@ class BM25Scorer:
         # Calculate IDF scores for all terms
         self.idf_scores: dict[str, float] = self._calculate_idf(corpus)
 
+        # Keyword tokenization is identical for every document scored
+        self._keyword_tokens: dict[tuple[str, ...], list[str]] = {}
+
+    @classmethod
+    def from_statistics(cls, statistics: CorpusStatistics) -> BM25Scorer:
+        """Create a scorer from statistics gathered in a streaming pass.
+
+        Used by two-pass (low-memory) search: the corpus is never held in
+        memory, only the document count, average length and the document
+        frequencies of the tracked terms. Terms that were not tracked get
+        IDF 0, exactly as terms absent from the corpus do.
+
+        Args:
+            statistics: Statistics accumulated over every candidate document
+
+        Returns:
+            BM25Scorer giving the same scores as one built from the full corpus
+            for every tracked term
+
+        Example:
+            ```python
+            stats = CorpusStatistics(tokenize_keywords(["python"]))
+            for doc in documents:
+                stats.add(doc)
+            scorer = BM25Scorer.from_statistics(stats)
+            ```
+        """
+        scorer = cls(corpus=[], avg_doc_length=statistics.avg_doc_length)
+        scorer.corpus_size = statistics.document_count
+        # Unary + drops terms seen in no document, matching _calculate_idf
+        scorer.idf_scores = scorer._idf_from_frequencies(+statistics.document_frequencies)
+        return scorer
+
     def _tokenize(self, text: str) -> list[str]:
         """Tokenize text into words, handling punctuation and Unicode.
 
@@ -118,27 +400,9 @@ class BM25Scorer:
             # Each Chinese character is a separate token
             ```
         """
-        text_lower = text.lower()
-
-        # Split on word boundaries, but separate Latin from non-Latin scripts
-        # Pattern explanation:
-        # - [a-z0-9]+ : Latin letters and digits (one or more)
-        # - \w : Any other word character (including Unicode)
-        # This splits "python很适合" into ["python", "很", "适", "合"]
-        tokens: list[str] = []
+        return tokenize(text)
 
-        # Match Latin alphanumeric sequences
-        for match in re.finditer(r"[a-z0-9]+", text_lower):
-            tokens.append(match.group())
-
-        # Match non-Latin word characters (one at a time for CJK)
-        # This allows matching "python" in "python很适合初学者"
-        for match in re.finditer(r"[^\W\d_a-z]", text_lower):
-            tokens.append(match.group())
-
-        return tokens
-
-    def _calculate_idf(self, corpus: list[str]) -> dict[str, float]:
+    def _calculate_idf(self, corpus: Sequence[str | TokenizedDocument]) -> dict[str, float]:
         """Calculate IDF scores for all terms in corpus.
 
         IDF(t) = log((N - df(t) + 0.5) / (df(t) + 0.5) + 1)
@@ -148,7 +412,7 @@ class BM25Scorer:
         - df(t): Document frequency of term t (documents containing t)
 
         Args:
-            corpus: List of document texts
+            corpus: Document texts or pre-tokenized documents
 
         Returns:
             Dictionary mapping term -> IDF score
@@ -165,10 +429,22 @@ class BM25Scorer:
         df_counter: CounterType[str] = Counter()
 
         for doc in corpus:
-            terms = set(self._tokenize(doc))  # Unique terms per doc
-            for term in terms:
-                df_counter[term] += 1
+            if isinstance(doc, TokenizedDocument):
+                df_counter.update(doc.term_frequencies.keys())  # Unique terms per doc
+            else:
+                df_counter.update(set(self._tokenize(doc)))
+
+        return self._idf_from_frequencies(df_counter)
+
+    def _idf_from_frequencies(self, df_counter: CounterType[str]) -> dict[str, float]:
+        """Convert document frequencies into IDF scores for this corpus size.
+
+        Args:
+            df_counter: Term -> number of documents containing the term
 
+        Returns:
+            Dictionary mapping term -> IDF score
+        """
         # Calculate IDF for each term
         idf_scores: dict[str, float] = {}
         N = self.corpus_size
@@ -179,15 +455,16 @@ class BM25Scorer:
 
         return idf_scores
 
-    def score(self, document: str, keywords: list[str]) -> float:
+    def score(self, document: str | TokenizedDocument, keywords: list[str]) -> float:
         """Score a document for given keywords using BM25.
 
         Tokenizes both document and keywords using the same method to ensure
         consistent matching. Multi-character keywords (e.g., Chinese "编程")
-        are split into individual character tokens.
+        are split into individual character tokens. Pre-tokenized documents
+        are scored without re-tokenizing.
 
         Args:
-            document: Document text (conversation content)
+            document: Document text or TokenizedDocument (conversation content)
             keywords: List of query keywords (will be tokenized)
 
         Returns:
@@ -205,17 +482,17 @@ class BM25Scorer:
             For each keyword token qi:
                 IDF(qi) * (f(qi, D) * (k1 + 1)) / (f(qi, D) + k1 * (1 - b + b * |D|/avgdl))
         """
-        # Tokenize document using improved tokenization
-        doc_terms = self._tokenize(document)
-        doc_length = len(doc_terms)
-
-        # Count term frequencies
-        tf_counter: CounterType[str] = Counter(doc_terms)
-
-        # Tokenize keywords (handles multi-character keywords like "编程")
-        keyword_tokens: list[str] = []
-        for keyword in keywords:
-            keyword_tokens.extend(self._tokenize(keyword))
+        if not isinstance(document, TokenizedDocument):
+            document = TokenizedDocument.from_text(document)
+        doc_length = document.length
+        tf_counter = document.term_frequencies
+
+        # Tokenize keywords once per query (handles multi-character keywords like "编程")
+        cache_key = tuple(keywords)
+        keyword_tokens = self._keyword_tokens.get(cache_key)
+        if keyword_tokens is None:
+            keyword_tokens = tokenize_keywords(keywords)
+            self._keyword_tokens[cache_key] = keyword_tokens
 
         # Calculate BM25 score
         score = 0.0
@@ -280,7 +557,9 @@ def phrase_matches(text: str, phrases: list[str]) -> bool:
     return any(phrase.lower() in text_lower for phrase in phrases)
 
 
-def all_terms_present(text: str, keywords: list[str], scorer: BM25Scorer) -> bool:
+def all_terms_present(
+    text: str | TokenizedDocument, keywords: list[str], scorer: BM25Scorer
+) -> bool:
     """Check if ALL keyword tokens are present in the text.
 
     Uses the same tokenization as BM25Scorer to ensure consistent matching
@@ -288,7 +567,7 @@ def all_terms_present(text: str, keywords: list[str], scorer: BM25Scorer) -> boo
     match_mode='all' to succeed.
 
     Args:
-        text: Text to check
+        text: Text or TokenizedDocument to check
         keywords: Keywords to find (will be tokenized)
         scorer: BM25Scorer instance for tokenization
 
@@ -312,28 +591,24 @@ def all_terms_present(text: str, keywords: list[str], scorer: BM25Scorer) -> boo
     if not keywords:
         return True
 
-    # Tokenize the text using BM25Scorer's tokenization
-    text_tokens = set(scorer._tokenize(text))  # noqa: SLF001
-
-    # Tokenize all keywords and check if each token is present
-    for keyword in keywords:
-        keyword_tokens = scorer._tokenize(keyword)  # noqa: SLF001
-        # All tokens from this keyword must be present
-        for token in keyword_tokens:
-            if token not in text_tokens:
-                return False
+    # Tokenize the text using BM25Scorer's tokenization (reuse cached tokens)
+    if not isinstance(text, TokenizedDocument):
+        text = TokenizedDocument(Counter(scorer._tokenize(text)))  # noqa: SLF001
 
-    return True
+    # All tokens from every keyword must be present
+    return all(token in text for token in tokenize_keywords(keywords))
 
 
-def exclude_filter(text: str, exclude_keywords: list[str], scorer: BM25Scorer) -> bool:
+def exclude_filter(
+    text: str | TokenizedDocument, exclude_keywords: list[str], scorer: BM25Scorer
+) -> bool:
     """Check if text contains any excluded keywords.
 
     Uses the same tokenization as BM25Scorer to ensure consistent matching
     behavior between inclusion and exclusion.
 
     Args:
-        text: Text to check for excluded terms
+        text: Text or TokenizedDocument to check for excluded terms
         exclude_keywords: Keywords to exclude (will be tokenized)
         scorer: BM25Scorer instance for tokenization
 
@@ -361,15 +636,9 @@ def exclude_filter(text: str, exclude_keywords: list[str], scorer: BM25Scorer) -
     if not text:
         return False
 
-    # Tokenize the text using BM25Scorer's tokenization
-    text_tokens = set(scorer._tokenize(text))  # noqa: SLF001
+    # Tokenize the text using BM25Scorer's tokenization (reuse cached tokens)
+    if not isinstance(text, TokenizedDocument):
+        text = TokenizedDocument(Counter(scorer._tokenize(text)))  # noqa: SLF001
 
     # Check if ANY excluded token is present (OR logic for exclusion)
-    for keyword in exclude_keywords:
-        keyword_tokens = scorer._tokenize(keyword)  # noqa: SLF001
-        # If any token from this keyword is present, exclude
-        for token in keyword_tokens:
-            if token in text_tokens:
-                return True
-
-    return False
+    return any(token in text for token in tokenize_keywords(exclude_keywords))
@@ -27,6 +27,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from echomine.index.snapshot import stream_cached_headers
 from echomine.models.conversation import Conversation
 from echomine.models.protocols import OnSkipCallback, ProgressCallback
 from echomine.models.statistics import (
@@ -39,6 +40,7 @@ from echomine.models.statistics import (
 
 if TYPE_CHECKING:
     from echomine.adapters.claude import ClaudeAdapter
+    from echomine.adapters.ndjson import NDJSONAdapter
     from echomine.adapters.openai import OpenAIAdapter
 
 
@@ -49,9 +51,11 @@ logger = logging.getLogger(__name__)
 def calculate_statistics(
     file_path: Path,
     *,
-    adapter: OpenAIAdapter | ClaudeAdapter,
+    adapter: OpenAIAdapter | ClaudeAdapter | NDJSONAdapter,
     progress_callback: ProgressCallback | None = None,
     on_skip: OnSkipCallback | None = None,
+    workers: int = 1,
+    cache: bool = False,
 ) -> ExportStatistics:
     """Calculate statistics for entire export file (FR-016).
 
@@ -67,9 +71,14 @@ def calculate_statistics(
 
     Args:
         file_path: Path to export JSON file (OpenAI or Claude format)
-        adapter: ConversationProvider adapter (OpenAIAdapter or ClaudeAdapter)
+        adapter: ConversationProvider adapter (OpenAIAdapter, ClaudeAdapter or NDJSONAdapter)
         progress_callback: Optional callback invoked every 100 conversations (FR-069)
         on_skip: Optional callback for malformed entries (conversation_id, reason)
+        workers: Number of processes parsing the export (1 = this process)
+        cache: Read headers through the snapshot cache
+            (``echomine.index.stream_cached_headers``): replayed when the
+            export is unchanged since the last full read, else parsed and
+            recorded
 
     Returns:
         ExportStatistics with aggregated statistics
@@ -144,13 +153,25 @@ def calculate_statistics(
         if on_skip:
             on_skip(conversation_id, reason)
 
-    # Stream conversations one at a time
+    # Stream conversation headers one at a time (no Message models are built)
     # Memory: O(1) - each conversation processed and discarded
-    for conversation in adapter.stream_conversations(
-        file_path,
-        progress_callback=progress_callback,
-        on_skip=on_skip_wrapper,
-    ):
+    headers = (
+        stream_cached_headers(
+            adapter,
+            file_path,
+            progress_callback=progress_callback,
+            on_skip=on_skip_wrapper,
+            workers=workers,
+        )
+        if cache
+        else adapter.stream_conversation_headers(
+            file_path,
+            progress_callback=progress_callback,
+            on_skip=on_skip_wrapper,
+            workers=workers,
+        )
+    )
+    for conversation in headers:
         # Track total conversations
         total_conversations += 1
 
@@ -0,0 +1,420 @@
+"""Read exports straight from ZIP archives and compressed files.
+
+OpenAI and Claude both deliver exports as ZIP bundles holding a
+``conversations.json`` member (plus assets and other files), and archived
+exports are often kept gzip/bz2/xz-compressed. ``open_export`` opens the JSON
+of any of these without extracting it, so every reader of an export
+(adapters, sidecar indexes, provider detection, the markdown exporter)
+accepts them directly:
+
+    - Plain files are opened as they are
+    - A stored (uncompressed) ZIP member is opened as a seekable window over
+      the archive file, so byte-range reads cost the same as in a plain file
+    - A compressed ZIP member, or a gzip/bz2/xz file, is decompressed as it
+      is read; seeking forward decompresses up to the target and seeking
+      backward starts over, so byte-range reads are only cheap in file order
+    - A packed file (see ``pack_export``) is gzip split into independently
+      compressed blocks; a byte-range read decompresses only the blocks it
+      touches
+
+The ZIP member is ``conversations.json`` at the archive root or, failing
+that, the shallowest ``conversations.json`` in a subdirectory. Archives are
+recognized by their ``.zip`` suffix (case-insensitive); compressed files by
+their magic bytes, whatever their name.
+
+Packed layout:
+    A sequence of gzip members, each holding up to ``PACK_BLOCK_SIZE``
+    uncompressed bytes, so the file is an ordinary ``.gz`` to other tools.
+    Each member header carries an extra subfield ``EM`` with the member's
+    compressed and uncompressed sizes (two little-endian uint32), which lets
+    readers build the block table by hopping from header to header.
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (members are streamed, never
+      extracted or loaded whole)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+import bisect
+import bz2
+import gzip
+import io
+import lzma
+import os
+import struct
+import zipfile
+import zlib
+from pathlib import Path, PurePosixPath
+from typing import IO, cast
+
+from echomine.exceptions import ParseError
+
+
+ZIP_SUFFIX = ".zip"
+"""Suffix of export archives (compared case-insensitively)."""
+
+CONVERSATIONS_MEMBER = "conversations.json"
+"""Name of the archive member holding the conversations."""
+
+# Local file header: signature, then name and extra field lengths at 26..30
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+PACK_BLOCK_SIZE = 1 << 20
+"""Uncompressed bytes per block of a packed export by default."""
+
+# Read buffer of a stored member window / packed file
+_BUFFER_SIZE = 1 << 16
+
+# Magic bytes of the compressed formats read by open_export
+_GZIP_MAGIC = b"\x1f\x8b"
+_BZIP2_MAGIC = b"BZh"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+# Packed block header: gzip header with FEXTRA holding one 8-byte "EM"
+# subfield (member size, uncompressed size); the trailer is CRC32 + ISIZE
+_PACK_HEADER = struct.Struct("<4sIBBH2sHII")
+_PACK_FLAGS = 0x04  # FEXTRA only
+_PACK_XLEN = 12
+_PACK_SUBFIELD = b"EM"
+_PACK_TRAILER_SIZE = 8
+_PACK_DEFAULT_LEVEL = 6
+
+
+def is_zip_export(file_path: Path) -> bool:
+    """Return True if the export path names a ZIP archive."""
+    return file_path.suffix.lower() == ZIP_SUFFIX
+
+
+def open_export(file_path: Path) -> IO[bytes]:
+    """Open an export's conversations JSON for binary reading.
+
+    Args:
+        file_path: Path to an export JSON file or ZIP archive
+
+    Returns:
+        Readable, seekable binary stream positioned at the start of the JSON
+
+    Raises:
+        FileNotFoundError: If file_path does not exist
+        PermissionError: If file_path is not readable
+        ParseError: If a ``.zip`` path is not a valid archive or has no
+            ``conversations.json`` member
+    """
+    if not is_zip_export(file_path):
+        return _open_file(file_path)
+
+    with _open_archive(file_path) as archive:
+        info = _conversations_member(archive, file_path)
+        offset = _stored_data_offset(archive, info)
+        if offset is not None:
+            # The window owns (and closes) this handle on the archive file
+            archive_file = open(file_path, "rb")  # noqa: SIM115
+            raw = _StoredMember(archive_file, offset, info.file_size, str(file_path))
+            return io.BufferedReader(raw, buffer_size=_BUFFER_SIZE)
+        # The member stream keeps the archive file open after the archive closes
+        return archive.open(info)
+
+
+def supports_random_access(file_path: Path) -> bool:
+    """Return True if byte ranges of the export can be read without rereading it.
+
+    True for plain files, stored archive members and packed files; False for
+    compressed members and gzip/bz2/xz files, where reaching an offset means
+    decompressing everything before.
+
+    Raises:
+        FileNotFoundError: If file_path does not exist
+        ParseError: If a ``.zip`` path is not a valid archive
+    """
+    if not is_zip_export(file_path):
+        with open(file_path, "rb") as f:
+            magic = f.read(len(_XZ_MAGIC))
+            if not _is_compressed(magic):
+                return True
+            f.seek(0)
+            return magic.startswith(_GZIP_MAGIC) and _packed_blocks(f) is not None
+    with _open_archive(file_path) as archive:
+        info = _conversations_member(archive, file_path)
+        return _stored_data_offset(archive, info) is not None
+
+
+def pack_export(
+    source: Path,
+    destination: Path,
+    *,
+    block_size: int = PACK_BLOCK_SIZE,
+    compresslevel: int = _PACK_DEFAULT_LEVEL,
+) -> int:
+    """Write an export's JSON as a packed (seekable block-gzip) file.
+
+    The source may be in any form ``open_export`` reads. The destination is
+    written to a temporary file and atomically moved into place, and stays
+    readable by any gzip tool.
+
+    Args:
+        source: Export JSON file, ZIP archive or compressed file
+        destination: Path of the packed file (conventionally ``*.json.gz``)
+        block_size: Uncompressed bytes per block; smaller blocks make
+            byte-range reads cheaper and compression slightly worse
+        compresslevel: zlib compression level (1-9)
+
+    Returns:
+        Number of uncompressed bytes written
+
+    Raises:
+        FileNotFoundError: If source does not exist
+        ParseError: If source is a ``.zip`` without a usable member
+        ValueError: If block_size is out of range or destination is source
+
+    Example:
+        ```python
+        pack_export(Path("export.zip"), Path("export.json.gz"))
+        ExportIndex.build(Path("export.json.gz"), provider="openai")
+        ```
+
+    Memory Complexity: O(block_size)
+    """
+    if not 0 < block_size < 1 << 32:
+        msg = f"block_size must be between 1 and 2**32 - 1, got {block_size}"
+        raise ValueError(msg)
+    if destination.resolve() == source.resolve():
+        msg = f"Cannot pack '{source}' onto itself"
+        raise ValueError(msg)
+
+    total = 0
+    tmp_path = destination.with_name(f".{destination.name}.tmp")
+    try:
+        with open_export(source) as reader, open(tmp_path, "wb") as writer:
+            block = reader.read(block_size)
+            while True:
+                writer.write(_pack_block(block, compresslevel))
+                total += len(block)
+                block = reader.read(block_size)
+                if not block:
+                    break
+        tmp_path.replace(destination)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return total
+
+
+def _pack_block(data: bytes, compresslevel: int) -> bytes:
+    """Compress one block as a gzip member carrying its sizes."""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(data) + compressor.flush()
+    member_size = _PACK_HEADER.size + len(body) + _PACK_TRAILER_SIZE
+    header = _PACK_HEADER.pack(
+        _GZIP_MAGIC + b"\x08" + bytes([_PACK_FLAGS]),
+        0,  # MTIME: none, so packing is reproducible
+        0,  # XFL
+        255,  # OS: unknown
+        _PACK_XLEN,
+        _PACK_SUBFIELD,
+        8,
+        member_size,
+        len(data),
+    )
+    trailer = struct.pack("<II", zlib.crc32(data), len(data))
+    return header + body + trailer
+
+
+def _open_file(file_path: Path) -> IO[bytes]:
+    """Open a plain, compressed or packed export file by its magic bytes."""
+    f = open(file_path, "rb")  # noqa: SIM115
+    try:
+        magic = f.read(len(_XZ_MAGIC))
+        f.seek(0)
+        if not _is_compressed(magic):
+            return f
+        if magic.startswith(_GZIP_MAGIC):
+            packed = _packed_blocks(f)
+            if packed is not None:
+                # The reader owns (and closes) the file
+                raw = _PackedFile(f, *packed, str(file_path))
+                return io.BufferedReader(raw, buffer_size=_BUFFER_SIZE)
+    except BaseException:
+        f.close()
+        raise
+    # Decompressors opened by name own (and close) their file
+    f.close()
+    if magic.startswith(_GZIP_MAGIC):
+        return cast("IO[bytes]", gzip.open(file_path, "rb"))
+    if magic.startswith(_BZIP2_MAGIC):
+        return cast("IO[bytes]", bz2.open(file_path, "rb"))
+    return cast("IO[bytes]", lzma.open(file_path, "rb"))
+
+
+def _is_compressed(magic: bytes) -> bool:
+    """Return True if leading bytes are gzip, bzip2 or xz magic."""
+    return magic.startswith((_GZIP_MAGIC, _BZIP2_MAGIC, _XZ_MAGIC))
+
+
+def _packed_blocks(f: IO[bytes]) -> tuple[list[tuple[int, int, int]], int] | None:
+    """Read a packed file's block table from its member headers.
+
+    Returns:
+        (uncompressed start, file offset, member size) per block and the
+        total uncompressed size, or None if any member lacks the packed
+        header (an ordinary gzip file)
+    """
+    blocks: list[tuple[int, int, int]] = []
+    offset = start = 0
+    f.seek(0, os.SEEK_END)
+    file_size = f.tell()
+    while offset < file_size:
+        f.seek(offset)
+        header = f.read(_PACK_HEADER.size)
+        if len(header) < _PACK_HEADER.size:
+            return None
+        magic, _, _, _, xlen, subfield, length, member_size, size = _PACK_HEADER.unpack(header)
+        if (
+            magic != _GZIP_MAGIC + b"\x08" + bytes([_PACK_FLAGS])
+            or (xlen, subfield, length) != (_PACK_XLEN, _PACK_SUBFIELD, 8)
+            or member_size < _PACK_HEADER.size + _PACK_TRAILER_SIZE
+        ):
+            return None
+        blocks.append((start, offset, int(member_size)))
+        start += int(size)
+        offset += int(member_size)
+    f.seek(0)
+    return (blocks, start) if blocks and offset == file_size else None
+
+
+def _open_archive(file_path: Path) -> zipfile.ZipFile:
+    """Open a ZIP archive for reading, reporting a corrupt one as ParseError."""
+    try:
+        return zipfile.ZipFile(file_path)
+    except zipfile.BadZipFile as e:
+        raise ParseError(f"Invalid ZIP archive '{file_path}': {e}") from e
+
+
+def _conversations_member(archive: zipfile.ZipFile, file_path: Path) -> zipfile.ZipInfo:
+    """Find the conversations member: at the root, else the shallowest one."""
+    members = [
+        info
+        for info in archive.infolist()
+        if not info.is_dir() and PurePosixPath(info.filename).name == CONVERSATIONS_MEMBER
+    ]
+    if not members:
+        raise ParseError(f"ZIP archive '{file_path}' has no {CONVERSATIONS_MEMBER} member")
+    return min(members, key=lambda info: info.filename.count("/"))
+
+
+def _stored_data_offset(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> int | None:
+    """Return where a stored, unencrypted member's bytes start in the archive.
+
+    None for compressed or encrypted members, which cannot be read in place.
+    """
+    if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return None
+    fp = archive.fp
+    if fp is None:
+        return None
+    fp.seek(info.header_offset)
+    header = fp.read(_LOCAL_HEADER_SIZE)
+    if len(header) < _LOCAL_HEADER_SIZE or header[:4] != _LOCAL_HEADER_SIGNATURE:
+        raise ParseError(f"Invalid ZIP archive: bad local header for {info.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    return info.header_offset + _LOCAL_HEADER_SIZE + int(name_length) + int(extra_length)
+
+
+class _RandomAccess(io.RawIOBase):
+    """Seekable read-only stream of ``size`` bytes backed by ``file``."""
+
+    def __init__(self, file: IO[bytes], size: int, name: str) -> None:
+        super().__init__()
+        self._file = file
+        self._size = size
+        self._pos = 0
+        self.name = name
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += self._size
+        elif whence != os.SEEK_SET:
+            msg = f"Invalid whence: {whence}"
+            raise ValueError(msg)
+        if offset < 0:
+            msg = f"Negative seek position {offset}"
+            raise ValueError(msg)
+        self._pos = offset
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._file.close()
+        super().close()
+
+
+class _StoredMember(_RandomAccess):
+    """Seekable view of a stored member's bytes in the archive file."""
+
+    def __init__(self, archive_file: IO[bytes], offset: int, size: int, name: str) -> None:
+        super().__init__(archive_file, size, name)
+        self._offset = offset
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        count = min(len(buffer), self._size - self._pos)
+        if count <= 0:
+            return 0
+        self._file.seek(self._offset + self._pos)
+        read = self._file.readinto(memoryview(buffer)[:count])  # type: ignore[attr-defined]
+        self._pos += read
+        return int(read)
+
+
+class _PackedFile(_RandomAccess):
+    """Seekable view of a packed file's uncompressed bytes.
+
+    Keeps the most recently decompressed block, so sequential reads
+    decompress every block once.
+    """
+
+    def __init__(
+        self, file: IO[bytes], blocks: list[tuple[int, int, int]], size: int, name: str
+    ) -> None:
+        super().__init__(file, size, name)
+        self._starts = [start for start, _, _ in blocks]
+        self._blocks = blocks
+        self._cached = -1
+        self._data = b""
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        if self._pos >= self._size:
+            return 0
+        index = bisect.bisect_right(self._starts, self._pos) - 1
+        if index != self._cached:
+            self._data = self._decompress(index)
+            self._cached = index
+        begin = self._pos - self._starts[index]
+        chunk = self._data[begin : begin + len(buffer)]
+        memoryview(buffer)[: len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def _decompress(self, index: int) -> bytes:
+        _, offset, member_size = self._blocks[index]
+        self._file.seek(offset)
+        member = self._file.read(member_size)
+        expected = _PACK_HEADER.unpack(member[: _PACK_HEADER.size])[-1]
+        try:
+            data = zlib.decompress(member[_PACK_HEADER.size : -_PACK_TRAILER_SIZE], -zlib.MAX_WBITS)
+        except zlib.error as e:
+            raise ParseError(f"Corrupt packed block at offset {offset} in {self.name}: {e}") from e
+        if len(data) != expected:
+            raise ParseError(f"Corrupt packed block at offset {offset} in {self.name}")
+        return data
@@ -1,12 +1,19 @@
-"""Resolve OpenAI asset pointers to actual files in the export bundle."""
+"""Resolve OpenAI asset pointers to actual files in the export bundle.
+
+The bundle is either the extracted export directory or the export's ZIP
+archive itself; archive members are matched and sniffed without extracting.
+"""
 
 from __future__ import annotations
 
 import re
-from pathlib import Path
+import zipfile
+from pathlib import Path, PurePosixPath
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from echomine.utils.archive import is_zip_export
+
 
 _SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://")
 
@@ -25,10 +32,15 @@ _WEBP_SIGNATURE = b"WEBP"
 class ResolvedAsset(BaseModel):
     model_config = ConfigDict(frozen=True, strict=True, extra="forbid")
 
-    path: Path = Field(..., description="Absolute path to the resolved file on disk")
+    path: Path = Field(
+        ..., description="Absolute path to the resolved file (or ZIP archive) on disk"
+    )
     detected_type: str = Field(..., description="MIME type detected via magic bytes")
     original_extension: str = Field(..., description="Original file extension from disk")
     file_id: str = Field(..., min_length=1, description="Extracted file ID from asset pointer")
+    member: str | None = Field(
+        default=None, description="Member name within the ZIP archive at path, if archived"
+    )
 
 
 _SIGNATURES: list[tuple[bytes, int, str]] = [
@@ -45,7 +57,10 @@ def _detect_mime_type(file_path: Path) -> str:
             header = f.read(12)
     except OSError:
         return "application/octet-stream"
+    return _mime_type_from_header(header)
+
 
+def _mime_type_from_header(header: bytes) -> str:
     for sig, length, mime in _SIGNATURES:
         if header[:length] == sig:
             return mime
@@ -62,10 +77,11 @@ def _extract_file_id(asset_pointer: str) -> str:
 
 
 def resolve_asset(export_dir: Path, asset_pointer: str) -> ResolvedAsset | None:
-    """Resolve an asset pointer to a file in the export directory.
+    """Resolve an asset pointer to a file in the export directory or archive.
 
     Args:
-        export_dir: Directory containing export files
+        export_dir: Directory containing export files, or the export's ZIP
+            archive (assets are then matched against member file names)
         asset_pointer: Asset URI (e.g., "sediment://file_abc123")
 
     Returns:
@@ -75,6 +91,9 @@ def resolve_asset(export_dir: Path, asset_pointer: str) -> ResolvedAsset | None:
     if not file_id:
         return None
 
+    if is_zip_export(export_dir):
+        return _resolve_archived_asset(export_dir, file_id)
+
     for candidate in export_dir.iterdir():
         if candidate.is_file() and candidate.name.startswith(file_id):
             detected_type = _detect_mime_type(candidate)
@@ -86,3 +105,26 @@ def resolve_asset(export_dir: Path, asset_pointer: str) -> ResolvedAsset | None:
             )
 
     return None
+
+
+def _resolve_archived_asset(archive_path: Path, file_id: str) -> ResolvedAsset | None:
+    """Resolve a file ID to a member of a ZIP export (at any depth)."""
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            name = PurePosixPath(info.filename)
+            if info.is_dir() or not name.name.startswith(file_id):
+                continue
+            try:
+                with archive.open(info) as member:
+                    detected_type = _mime_type_from_header(member.read(12))
+            except (OSError, zipfile.BadZipFile):
+                detected_type = "application/octet-stream"
+            return ResolvedAsset(
+                path=archive_path.resolve(),
+                detected_type=detected_type,
+                original_extension=name.suffix,
+                file_id=file_id,
+                member=info.filename,
+            )
+
+    return None
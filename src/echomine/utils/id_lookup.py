@@ -0,0 +1,142 @@
+"""Conversation ID resolution: full IDs and unique prefixes.
+
+Both adapters resolve a requested conversation ID the same way:
+
+    - A full ID match wins, even if the ID is also a prefix of other IDs
+    - Otherwise an ID of at least ``MIN_PREFIX_LENGTH`` characters is a
+      prefix, and must match exactly one distinct conversation ID; a prefix
+      of several IDs raises ``AmbiguousIdError`` instead of picking one
+    - Claude IDs compare case-insensitively, OpenAI IDs case-sensitively
+      (see ``lookup_key``)
+
+Ambiguity is decided on the raw IDs in the export, so a prefix shared with a
+malformed conversation is ambiguous too. The sidecar index answers these
+rules with range queries over its sorted ID column (``ExportIndex.find``);
+``IdResolver`` applies them while streaming, looking at each entry's ID
+before it is parsed.
+
+Constitution Compliance:
+    - Principle VIII: Memory efficiency (only candidate conversations are
+      parsed and kept)
+    - Principle VI: Strict typing with mypy --strict
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+from echomine.exceptions import AmbiguousIdError
+
+
+# Conversation (or any value) recorded per conversation ID
+_T = TypeVar("_T")
+
+MIN_PREFIX_LENGTH = 4
+"""Shortest requested ID treated as a prefix (shorter IDs match in full only)."""
+
+MAX_REPORTED_MATCHES = 10
+"""Matching IDs listed in an ``AmbiguousIdError``."""
+
+
+def lookup_key(conversation_id: str, *, case_sensitive: bool) -> str:
+    """Normalize an ID for comparison (lowercased unless case-sensitive)."""
+    return conversation_id if case_sensitive else conversation_id.lower()
+
+
+class IdResolver(Generic[_T]):
+    """Resolve requested IDs against the conversations of a streamed export.
+
+    Call ``wants()`` with each entry's raw ID before parsing it, ``add()``
+    with each entry that parsed, and ``resolve()`` once the stream ends or
+    ``done`` is True. Only the first well-formed conversation per ID is kept,
+    and of a prefix's candidates only the first is parsed (a second one makes
+    the prefix ambiguous).
+
+    Example:
+        ```python
+        resolver = IdResolver(["a1b2", "c3d4e5f6-..."], case_sensitive=False)
+        for raw in entries:
+            if resolver.wants(raw["uuid"]):
+                resolver.add(raw["uuid"], parse(raw))
+                if resolver.done:
+                    break
+        found = resolver.resolve()
+        ```
+    """
+
+    def __init__(self, conversation_ids: Iterable[str], *, case_sensitive: bool) -> None:
+        self._case_sensitive = case_sensitive
+        # Requested ID -> lookup key, in request order
+        self._requested = {
+            cid: lookup_key(cid, case_sensitive=case_sensitive) for cid in conversation_ids
+        }
+        self._keys = set(self._requested.values())
+        self._prefixes = {key for key in self._keys if len(key) >= MIN_PREFIX_LENGTH}
+        self._prefix_lengths = sorted({len(key) for key in self._prefixes})
+        # Keys still waiting for a well-formed full match
+        self._pending = set(self._keys)
+        # Keys whose full match appeared in the export (well-formed or not)
+        self._seen: set[str] = set()
+        # Prefix -> matching key -> raw ID (first MAX_REPORTED_MATCHES + 1)
+        self._candidates: dict[str, dict[str, str]] = {}
+        self._found: dict[str, _T] = {}
+
+    @property
+    def done(self) -> bool:
+        """True once every requested ID has a well-formed full match."""
+        return not self._pending
+
+    def wants(self, conversation_id: str) -> bool:
+        """Record an entry's ID and tell whether the entry must be parsed."""
+        key = lookup_key(conversation_id, case_sensitive=self._case_sensitive)
+        if key in self._found:
+            return False
+        wanted = key in self._keys
+        if wanted:
+            self._seen.add(key)
+        for length in self._prefix_lengths:
+            if length >= len(key):
+                break
+            prefix = key[:length]
+            if prefix not in self._prefixes:
+                continue
+            candidates = self._candidates.setdefault(prefix, {})
+            if key not in candidates and len(candidates) <= MAX_REPORTED_MATCHES:
+                candidates[key] = conversation_id
+            wanted = wanted or next(iter(candidates)) == key
+        return wanted
+
+    def add(self, conversation_id: str, conversation: _T) -> None:
+        """Keep a parsed conversation (the first one per ID wins)."""
+        key = lookup_key(conversation_id, case_sensitive=self._case_sensitive)
+        self._found.setdefault(key, conversation)
+        self._pending.discard(key)
+
+    def resolve(self) -> dict[str, _T]:
+        """Return requested ID -> conversation, in request order.
+
+        Returns:
+            Conversations of the requested IDs that were found
+
+        Raises:
+            AmbiguousIdError: For the first requested prefix (in request
+                order) that matches several conversation IDs
+        """
+        resolved: dict[str, _T] = {}
+        for cid, key in self._requested.items():
+            match = key
+            if key not in self._seen:
+                # No full match: the prefix's only candidate, if unique
+                candidates = list(self._candidates.get(key, {}).items())
+                if len(candidates) > 1:
+                    raise AmbiguousIdError(
+                        cid,
+                        [raw_id for _, raw_id in candidates[:MAX_REPORTED_MATCHES]],
+                        more=len(candidates) > MAX_REPORTED_MATCHES,
+                    )
+                if candidates:
+                    match = candidates[0][0]
+            if match in self._found:
+                resolved[cid] = self._found[match]
+        return resolved
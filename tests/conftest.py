@@ -23,6 +23,8 @@ from typing import Any
 
 import pytest
 
+from tests.factories import make_numbered_openai_conversations, write_export
+
 
 # =============================================================================
 # Sample Data Fixtures
@@ -147,6 +149,21 @@ def tmp_empty_export_file(tmp_path: Path) -> Path:
     return export_file
 
 
+@pytest.fixture
+def tmp_openai_export(tmp_path: Path) -> Path:
+    """Create a temporary OpenAI export with three one-message conversations.
+
+    Conversations ``conv-0`` to ``conv-2`` from
+    ``make_numbered_openai_conversations``; CLI integration tests compare a
+    command's output on this file with its output on another form of the
+    same export.
+
+    Returns:
+        Path to temporary export file
+    """
+    return write_export(make_numbered_openai_conversations(3), tmp_path / "export.json")
+
+
 @pytest.fixture
 def tmp_large_export_file(tmp_path: Path) -> Path:
     """Create a temporary large export file for performance testing.
@@ -214,6 +231,29 @@ def fixed_datetime() -> datetime:
     return datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
 
 
+# =============================================================================
+# Isolation Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def tmp_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Per-test header snapshot cache directory.
+
+    Setting $ECHOMINE_CACHE_DIR turns on the header snapshots of ``list``
+    and ``stats``; each test gets an empty directory, so snapshots neither
+    leak into the home directory nor carry over between tests.
+
+    Returns:
+        Path exported as $ECHOMINE_CACHE_DIR for the test
+    """
+    cache_dir = tmp_path_factory.mktemp("cache")
+    monkeypatch.setenv("ECHOMINE_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 # =============================================================================
 # Pytest Configuration
 # =============================================================================
@@ -350,6 +350,59 @@ class TestCLIGetConversationContract:
         # Assert: stdout empty on error
         assert len(result.stdout) == 0, "stdout should be empty on error"
 
+    def test_get_multiple_conversations_json_array(
+        self, cli_command: list[str], get_test_export: Path
+    ) -> None:
+        """Test several IDs produce a JSON array in the order given."""
+        result = subprocess.run(
+            [
+                *cli_command,
+                "get",
+                "conversation",
+                str(get_test_export),
+                "conv-get-002",
+                "conv-get-001",
+                "--format",
+                "json",
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            env={**os.environ, "PYTHONUTF8": "1"},
+        )
+
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert [conv["id"] for conv in data] == ["conv-get-002", "conv-get-001"]
+        assert data[1]["message_count"] == 2
+
+    def test_get_multiple_conversations_missing_id_exits_1(
+        self, cli_command: list[str], get_test_export: Path
+    ) -> None:
+        """Test found conversations are printed and missing IDs reported with exit 1."""
+        result = subprocess.run(
+            [
+                *cli_command,
+                "get",
+                "conversation",
+                str(get_test_export),
+                "conv-get-001",
+                "conv-nonexistent",
+                "--format",
+                "json",
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            env={**os.environ, "PYTHONUTF8": "1"},
+        )
+
+        assert result.returncode == 1
+        assert [conv["id"] for conv in json.loads(result.stdout)] == ["conv-get-001"]
+        assert "conv-nonexistent" in result.stderr
+
     def test_get_conversation_file_not_found_exits_1(self, cli_command: list[str]) -> None:
         """Test missing file returns exit code 1.
 
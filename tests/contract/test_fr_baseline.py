@@ -213,16 +213,18 @@ class TestFR016CalculateStatisticsSignature:
 
         import echomine.statistics
         from echomine.adapters.claude import ClaudeAdapter
+        from echomine.adapters.ndjson import NDJSONAdapter
         from echomine.adapters.openai import OpenAIAdapter
         from echomine.statistics import calculate_statistics
 
         # Get type hints with module globals augmented with TYPE_CHECKING imports
-        # Since OpenAIAdapter and ClaudeAdapter are only imported under TYPE_CHECKING,
+        # Since the adapters are only imported under TYPE_CHECKING,
         # we need to provide them explicitly to resolve the type annotations
         namespace = {
             **vars(echomine.statistics),
             "OpenAIAdapter": OpenAIAdapter,
             "ClaudeAdapter": ClaudeAdapter,
+            "NDJSONAdapter": NDJSONAdapter,
         }
         hints = typing.get_type_hints(calculate_statistics, globalns=namespace)
 
@@ -88,6 +88,22 @@ def make_openai_export(
     ]
 
 
+def make_numbered_openai_conversations(count: int) -> list[dict[str, object]]:
+    """Build ``count`` one-message OpenAI conversations.
+
+    Conversation ``i`` is ``conv-{i}`` titled ``Title {i}``; its message
+    ``msg-{i}`` reads ``Body {i}``.
+    """
+    return [
+        make_openai_conversation(
+            [make_openai_message(id=f"msg-{i}", parts=[f"Body {i}"])],
+            conv_id=f"conv-{i}",
+            title=f"Title {i}",
+        )
+        for i in range(count)
+    ]
+
+
 # ── Claude ─────────────────────────────────────────────────────────────
 
 
@@ -143,3 +159,8 @@ def write_export(data: list[dict[str, object]], path: Path) -> Path:
     """Write export data as JSON and return the path."""
     path.write_text(json.dumps(data), encoding="utf-8")
     return path
+
+
+def cli_args(args: list[str], path: Path) -> list[str]:
+    """Fill the ``{path}`` placeholders of a parametrized CLI argv."""
+    return [arg.replace("{path}", str(path)) for arg in args]
@@ -0,0 +1,111 @@
+"""Integration tests for the 'export-all' CLI command.
+
+Verifies `echomine export-all` writes one file per conversation, keeps stdout
+empty, and reports a summary (with throughput) on stderr.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from echomine.cli.app import app
+from tests.factories import (
+    make_numbered_openai_conversations,
+    make_openai_conversation,
+    write_export,
+)
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Create Typer CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """OpenAI export with three conversations and one malformed entry."""
+    conversations = make_numbered_openai_conversations(3)
+    conversations.append(make_openai_conversation([], conv_id="empty"))
+    return write_export(conversations, tmp_path / "export.json")
+
+
+class TestExportAll:
+    """`echomine export-all` contract."""
+
+    def test_markdown_files_written(
+        self, cli_runner: CliRunner, openai_export: Path, tmp_path: Path
+    ) -> None:
+        out_dir = tmp_path / "notes"
+
+        result = cli_runner.invoke(app, ["export-all", str(openai_export), "-o", str(out_dir)])
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        assert "Exported 3 conversations" in result.stderr
+        assert "conversations/s" in result.stderr
+        assert "Skipped 1" in result.stderr
+        assert sorted(p.name for p in out_dir.iterdir()) == [
+            "title-0_conv-0.md",
+            "title-1_conv-1.md",
+            "title-2_conv-2.md",
+        ]
+        assert "Body 1" in (out_dir / "title-1_conv-1.md").read_text(encoding="utf-8")
+
+    def test_json_with_jobs(
+        self, cli_runner: CliRunner, openai_export: Path, tmp_path: Path
+    ) -> None:
+        out_dir = tmp_path / "json"
+
+        result = cli_runner.invoke(
+            app,
+            ["export-all", str(openai_export), "-o", str(out_dir), "-f", "json", "-j", "2"],
+        )
+
+        assert result.exit_code == 0
+        data = json.loads((out_dir / "title-0_conv-0.json").read_text(encoding="utf-8"))
+        assert data["id"] == "conv-0"
+
+    def test_missing_file(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        result = cli_runner.invoke(
+            app, ["export-all", str(tmp_path / "missing.json"), "-o", str(tmp_path / "out")]
+        )
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stderr
+
+    def test_invalid_provider(
+        self, cli_runner: CliRunner, openai_export: Path, tmp_path: Path
+    ) -> None:
+        result = cli_runner.invoke(
+            app,
+            ["export-all", str(openai_export), "-o", str(tmp_path / "out"), "-p", "gemini"],
+        )
+
+        assert result.exit_code == 2
+
+    def test_sync_reports_unchanged(
+        self, cli_runner: CliRunner, openai_export: Path, tmp_path: Path
+    ) -> None:
+        out_dir = tmp_path / "notes"
+        cli_runner.invoke(app, ["export-all", str(openai_export), "-o", str(out_dir), "--sync"])
+
+        result = cli_runner.invoke(
+            app, ["export-all", str(openai_export), "-o", str(out_dir), "--sync", "--prune"]
+        )
+
+        assert result.exit_code == 0
+        assert "0 written, 3 unchanged, 0 pruned" in result.stderr
+
+    def test_prune_requires_sync(
+        self, cli_runner: CliRunner, openai_export: Path, tmp_path: Path
+    ) -> None:
+        result = cli_runner.invoke(
+            app, ["export-all", str(openai_export), "-o", str(tmp_path / "out"), "--prune"]
+        )
+
+        assert result.exit_code == 2
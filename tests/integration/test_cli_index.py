@@ -0,0 +1,124 @@
+"""Integration tests for the 'index' CLI command group.
+
+Verifies `echomine index build` writes a sidecar that ID-based commands
+(get conversation, get message -c, export) pick up transparently.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from echomine.cli.app import app
+from tests.factories import (
+    cli_args,
+    make_claude_export,
+    make_claude_message,
+    make_numbered_openai_conversations,
+    write_export,
+)
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Create Typer CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """OpenAI export with two conversations."""
+    return write_export(make_numbered_openai_conversations(2), tmp_path / "export.json")
+
+
+class TestIndexBuild:
+    """`echomine index build` contract."""
+
+    def test_build_creates_sidecar(self, cli_runner: CliRunner, openai_export: Path) -> None:
+        result = cli_runner.invoke(app, ["index", "build", str(openai_export)])
+
+        assert result.exit_code == 0
+        assert "Indexed 2 conversations" in result.stderr
+        assert result.stdout == ""
+        assert openai_export.with_name("export.json.emidx").is_file()
+
+    def test_build_claude_export(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        export = write_export(
+            make_claude_export([make_claude_message(text="hi")]), tmp_path / "claude.json"
+        )
+
+        result = cli_runner.invoke(app, ["index", "build", str(export)])
+
+        assert result.exit_code == 0
+        assert "Indexed 1 conversations" in result.stderr
+
+    def test_build_creates_search_index(self, cli_runner: CliRunner, openai_export: Path) -> None:
+        result = cli_runner.invoke(app, ["index", "build", str(openai_export)])
+
+        assert result.exit_code == 0
+        assert "Search index for 2 conversations" in result.stderr
+        assert openai_export.with_name("export.json.emsearch").is_file()
+
+    def test_no_search_skips_search_index(self, cli_runner: CliRunner, openai_export: Path) -> None:
+        result = cli_runner.invoke(app, ["index", "build", str(openai_export), "--no-search"])
+
+        assert result.exit_code == 0
+        assert openai_export.with_name("export.json.emidx").is_file()
+        assert not openai_export.with_name("export.json.emsearch").exists()
+
+    def test_missing_file_exits_1(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        result = cli_runner.invoke(app, ["index", "build", str(tmp_path / "missing.json")])
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stderr
+
+    def test_invalid_provider_exits_2(self, cli_runner: CliRunner, openai_export: Path) -> None:
+        result = cli_runner.invoke(app, ["index", "build", str(openai_export), "-p", "gemini"])
+
+        assert result.exit_code == 2
+
+
+class TestCommandsUseIndex:
+    """ID lookups return identical output with and without the sidecar."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["get", "conversation", "{path}", "conv-1", "-f", "json"],
+            ["get", "message", "{path}", "msg-1", "-c", "conv-1", "-f", "json"],
+            ["export", "{path}", "conv-1", "-f", "json"],
+        ],
+    )
+    def test_output_identical_with_index(
+        self, cli_runner: CliRunner, openai_export: Path, args: list[str]
+    ) -> None:
+        argv = cli_args(args, openai_export)
+        before = cli_runner.invoke(app, argv)
+        cli_runner.invoke(app, ["index", "build", str(openai_export)])
+
+        after = cli_runner.invoke(app, argv)
+
+        assert before.exit_code == after.exit_code == 0
+        assert after.stdout == before.stdout
+        assert "conv-1" in json.dumps(json.loads(after.stdout))
+
+    def test_export_not_found_with_index(self, cli_runner: CliRunner, openai_export: Path) -> None:
+        cli_runner.invoke(app, ["index", "build", str(openai_export)])
+
+        result = cli_runner.invoke(app, ["export", str(openai_export), "conv-404"])
+
+        assert result.exit_code == 1
+        assert "not found" in result.stderr
+
+    def test_search_identical_with_index(self, cli_runner: CliRunner, openai_export: Path) -> None:
+        argv = ["search", str(openai_export), "-k", "body", "-f", "json", "-q"]
+        before = cli_runner.invoke(app, argv)
+        cli_runner.invoke(app, ["index", "build", str(openai_export)])
+
+        after = cli_runner.invoke(app, argv)
+
+        assert before.exit_code == after.exit_code == 0
+        assert json.loads(after.stdout)["results"] == json.loads(before.stdout)["results"]
@@ -0,0 +1,114 @@
+"""Integration tests for the 'normalize' CLI command and NDJSON input.
+
+Verifies `echomine normalize` writes one conversation per line next to the
+export, and that read commands given the normalized file print exactly what
+they print for the export.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from echomine.cli.app import app
+from tests.factories import cli_args
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Create Typer CLI test runner."""
+    return CliRunner()
+
+
+class TestNormalize:
+    """`echomine normalize` contract."""
+
+    def test_writes_ndjson(self, cli_runner: CliRunner, tmp_openai_export: Path) -> None:
+        result = cli_runner.invoke(app, ["normalize", str(tmp_openai_export)])
+
+        ndjson = tmp_openai_export.with_name("export.ndjson")
+        assert result.exit_code == 0
+        assert "Normalized 3 conversations" in result.stderr
+        assert result.stdout == ""
+        header, *lines = ndjson.read_text(encoding="utf-8").splitlines()
+        assert json.loads(header) == {"echomine_ndjson": 1, "provider": "openai"}
+        assert [json.loads(line)["id"] for line in lines] == ["conv-0", "conv-1", "conv-2"]
+
+    def test_output_option(
+        self, cli_runner: CliRunner, tmp_openai_export: Path, tmp_path: Path
+    ) -> None:
+        output = tmp_path / "out" / "normalized.ndjson"
+        output.parent.mkdir()
+
+        result = cli_runner.invoke(app, ["normalize", str(tmp_openai_export), "-o", str(output)])
+
+        assert result.exit_code == 0
+        assert len(output.read_text(encoding="utf-8").splitlines()) == 4  # Header + 3
+
+    def test_refuses_to_overwrite_input(
+        self, cli_runner: CliRunner, tmp_openai_export: Path
+    ) -> None:
+        result = cli_runner.invoke(
+            app, ["normalize", str(tmp_openai_export), "-o", str(tmp_openai_export)]
+        )
+
+        assert result.exit_code == 2
+        assert "overwrite" in result.stderr
+
+    def test_missing_file_exits_1(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        result = cli_runner.invoke(app, ["normalize", str(tmp_path / "missing.json")])
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stderr
+
+
+class TestNormalizedInput:
+    """Commands read the normalized file like the export."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["list", "{path}", "--format", "json"],
+            ["get", "conversation", "{path}", "conv-1", "-f", "json"],
+            ["get", "message", "{path}", "msg-2", "-f", "json"],
+            ["stats", "{path}", "--json"],
+            ["export", "{path}", "--title", "Title 2", "-f", "json"],
+        ],
+    )
+    def test_output_identical(
+        self, cli_runner: CliRunner, tmp_openai_export: Path, args: list[str]
+    ) -> None:
+        ndjson = tmp_openai_export.with_name("export.ndjson")
+        cli_runner.invoke(app, ["normalize", str(tmp_openai_export)])
+
+        plain = cli_runner.invoke(app, cli_args(args, tmp_openai_export))
+        result = cli_runner.invoke(app, cli_args(args, ndjson))
+
+        assert plain.exit_code == result.exit_code == 0
+        assert result.stdout == plain.stdout.replace(str(tmp_openai_export), str(ndjson))
+
+    def test_search_results_identical(self, cli_runner: CliRunner, tmp_openai_export: Path) -> None:
+        ndjson = tmp_openai_export.with_name("export.ndjson")
+        cli_runner.invoke(app, ["normalize", str(tmp_openai_export)])
+        args = ["-k", "body", "-f", "json", "-q"]
+
+        plain = cli_runner.invoke(app, ["search", str(tmp_openai_export), *args])
+        result = cli_runner.invoke(app, ["search", str(ndjson), "--workers", "2", *args])
+
+        assert plain.exit_code == result.exit_code == 0
+        # Metadata holds the elapsed time; results must match exactly
+        assert json.loads(result.stdout)["results"] == json.loads(plain.stdout)["results"]
+
+    def test_index_build_rejects_ndjson(
+        self, cli_runner: CliRunner, tmp_openai_export: Path
+    ) -> None:
+        ndjson = tmp_openai_export.with_name("export.ndjson")
+        cli_runner.invoke(app, ["normalize", str(tmp_openai_export)])
+
+        result = cli_runner.invoke(app, ["index", "build", str(ndjson)])
+
+        assert result.exit_code == 1
+        assert "need no index" in result.stderr
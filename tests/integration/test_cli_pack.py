@@ -0,0 +1,126 @@
+"""Integration tests for the 'pack' CLI command and compressed input.
+
+Verifies `echomine pack` writes a packed file next to the export, and that
+commands given a packed or gzip-compressed export print exactly what they
+print for the plain JSON.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from echomine.cli.app import app
+from tests.factories import cli_args
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Create Typer CLI test runner."""
+    return CliRunner()
+
+
+class TestPack:
+    """`echomine pack` contract."""
+
+    def test_pack_writes_json_gz(self, cli_runner: CliRunner, tmp_openai_export: Path) -> None:
+        result = cli_runner.invoke(app, ["pack", str(tmp_openai_export)])
+
+        packed = tmp_openai_export.with_name("export.json.gz")
+        assert result.exit_code == 0
+        assert "Packed" in result.stderr
+        assert result.stdout == ""
+        assert gzip.decompress(packed.read_bytes()) == tmp_openai_export.read_bytes()
+
+    def test_output_option(
+        self, cli_runner: CliRunner, tmp_openai_export: Path, tmp_path: Path
+    ) -> None:
+        output = tmp_path / "archive" / "packed.gz"
+        output.parent.mkdir()
+
+        result = cli_runner.invoke(
+            app, ["pack", str(tmp_openai_export), "-o", str(output), "--block-size", "1"]
+        )
+
+        assert result.exit_code == 0
+        assert gzip.decompress(output.read_bytes()) == tmp_openai_export.read_bytes()
+
+    def test_refuses_to_overwrite_input(
+        self, cli_runner: CliRunner, tmp_openai_export: Path
+    ) -> None:
+        compressed = tmp_openai_export.with_name("export.json.gz")
+        compressed.write_bytes(gzip.compress(tmp_openai_export.read_bytes()))
+
+        result = cli_runner.invoke(app, ["pack", str(compressed)])
+
+        assert result.exit_code == 2
+        assert "overwrite" in result.stderr
+
+    def test_missing_file_exits_1(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        result = cli_runner.invoke(app, ["pack", str(tmp_path / "missing.json")])
+
+        assert result.exit_code == 1
+        assert "File not found" in result.stderr
+
+
+def _compress(cli_runner: CliRunner, export: Path, *, packed: bool) -> Path:
+    """Write a gzip copy of the export, with `echomine pack` or plain gzip."""
+    compressed = export.with_name("compressed.json.gz")
+    if packed:
+        cli_runner.invoke(app, ["pack", str(export), "-o", str(compressed)])
+    else:
+        compressed.write_bytes(gzip.compress(export.read_bytes()))
+    return compressed
+
+
+class TestCompressedExports:
+    """Commands read compressed exports like the plain JSON."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["list", "{path}", "--format", "json"],
+            ["get", "conversation", "{path}", "conv-1", "-f", "json"],
+        ],
+    )
+    @pytest.mark.parametrize("packed", [False, True])
+    def test_output_identical(
+        self, cli_runner: CliRunner, tmp_openai_export: Path, args: list[str], packed: bool
+    ) -> None:
+        compressed = _compress(cli_runner, tmp_openai_export, packed=packed)
+
+        plain = cli_runner.invoke(app, cli_args(args, tmp_openai_export))
+        result = cli_runner.invoke(app, cli_args(args, compressed))
+
+        assert plain.exit_code == result.exit_code == 0
+        assert result.stdout == plain.stdout
+
+    @pytest.mark.parametrize("packed", [False, True])
+    def test_search_results_identical(
+        self, cli_runner: CliRunner, tmp_openai_export: Path, packed: bool
+    ) -> None:
+        compressed = _compress(cli_runner, tmp_openai_export, packed=packed)
+        args = ["-k", "body", "-f", "json", "-q"]
+
+        plain = cli_runner.invoke(app, ["search", str(tmp_openai_export), *args])
+        result = cli_runner.invoke(app, ["search", str(compressed), *args])
+
+        assert plain.exit_code == result.exit_code == 0
+        # Metadata holds the elapsed time; results must match exactly
+        assert json.loads(result.stdout)["results"] == json.loads(plain.stdout)["results"]
+
+    def test_index_build_notes_unpacked_input(
+        self, cli_runner: CliRunner, tmp_openai_export: Path
+    ) -> None:
+        compressed = tmp_openai_export.with_name("compressed.json.gz")
+        compressed.write_bytes(gzip.compress(tmp_openai_export.read_bytes()))
+
+        result = cli_runner.invoke(app, ["index", "build", str(compressed), "--no-search"])
+
+        assert result.exit_code == 0
+        # Rich wraps the note at the console width
+        assert "echomine pack" in " ".join(result.stderr.split())
@@ -0,0 +1,102 @@
+"""Integration tests for the header snapshot cache behind 'list' and 'stats'.
+
+Verifies the first run writes a snapshot to $ECHOMINE_CACHE_DIR, and that
+warm runs, --no-cache runs and runs after the export changed print exactly
+what a run without the cache prints. Without $ECHOMINE_CACHE_DIR, only
+--cache writes a snapshot.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from echomine.cli.app import app
+from tests.factories import (
+    cli_args,
+    make_numbered_openai_conversations,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def cli_runner() -> CliRunner:
+    """Create Typer CLI test runner."""
+    return CliRunner()
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """OpenAI export with three conversations (one malformed)."""
+    conversations = make_numbered_openai_conversations(3)
+    del conversations[1]["title"]
+    return write_export(conversations, tmp_path / "export.json")
+
+
+COMMANDS = [
+    ["list", "{path}", "--format", "json"],
+    ["list", "{path}", "--format", "jsonl", "--sort", "none"],
+    ["stats", "{path}", "--json"],
+]
+
+
+@pytest.mark.parametrize("args", COMMANDS)
+class TestSnapshotCache:
+    """Cached runs print what uncached runs print."""
+
+    def test_warm_run_identical(
+        self, cli_runner: CliRunner, openai_export: Path, tmp_cache_dir: Path, args: list[str]
+    ) -> None:
+        argv = cli_args(args, openai_export)
+
+        uncached = cli_runner.invoke(app, [*argv, "--no-cache"])
+        assert list(tmp_cache_dir.iterdir()) == []
+
+        cold = cli_runner.invoke(app, argv)
+        assert [p.suffix for p in tmp_cache_dir.iterdir()] == [".emsnap"]
+        warm = cli_runner.invoke(app, argv)
+
+        assert uncached.exit_code == cold.exit_code == warm.exit_code == 0
+        assert cold.stdout == warm.stdout == uncached.stdout
+
+    def test_changed_export_not_served_from_cache(
+        self, cli_runner: CliRunner, openai_export: Path, args: list[str]
+    ) -> None:
+        argv = cli_args(args, openai_export)
+        cli_runner.invoke(app, argv)
+        write_export(
+            [make_openai_conversation([make_openai_message()], conv_id="conv-new", title="New")],
+            openai_export,
+        )
+
+        result = cli_runner.invoke(app, argv)
+
+        assert result.exit_code == 0
+        assert "conv-new" in result.stdout
+        assert result.stdout == cli_runner.invoke(app, [*argv, "--no-cache"]).stdout
+
+
+@pytest.mark.parametrize("args", COMMANDS)
+def test_cache_is_opt_in(
+    cli_runner: CliRunner,
+    openai_export: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    args: list[str],
+) -> None:
+    monkeypatch.delenv("ECHOMINE_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    argv = cli_args(args, openai_export)
+
+    default = cli_runner.invoke(app, argv)
+    assert default.exit_code == 0
+    assert not (tmp_path / "xdg").exists()
+
+    cached = cli_runner.invoke(app, [*argv, "--cache"])
+    assert cached.exit_code == 0
+    assert [p.suffix for p in (tmp_path / "xdg" / "echomine").iterdir()] == [".emsnap"]
+    assert cached.stdout == default.stdout
@@ -0,0 +1,89 @@
+"""Performance benchmarks for compressed export input.
+
+Compares streaming throughput over the same export stored raw, as
+gzip/bz2/xz, and packed (``echomine pack``), and indexed ID lookups on raw,
+gzip and packed files. Run with:
+
+    pytest tests/performance/test_compressed_input_benchmark.py --benchmark-group-by=group
+
+Measurement Tools:
+- pytest-benchmark: Throughput and latency metrics
+"""
+
+import bz2
+import gzip
+import lzma
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.index import ExportIndex
+from echomine.utils.archive import pack_export
+from tests.factories import make_openai_conversation, make_openai_message, write_export
+
+
+CODECS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+LOOKUP_IDS = [f"conv-{i:05d}" for i in range(4999, 0, -500)]
+
+
+@pytest.fixture(scope="module")
+def exports(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """5,000 conversations x 10 messages, raw and in every compressed form."""
+    directory = tmp_path_factory.mktemp("compressed")
+    conversations = [
+        make_openai_conversation(
+            [
+                make_openai_message(id=f"m-{i}-{j}", parts=[f"Message {j} of conversation {i}"])
+                for j in range(10)
+            ],
+            conv_id=f"conv-{i:05d}",
+            title=f"Conversation {i}",
+        )
+        for i in range(5000)
+    ]
+    raw = write_export(conversations, directory / "export.json")
+    paths = {"raw": raw}
+    for codec, compress in CODECS.items():
+        paths[codec] = directory / f"export.json.{codec}"
+        paths[codec].write_bytes(compress(raw.read_bytes()))
+    paths["packed"] = directory / "export.packed.json.gz"
+    pack_export(raw, paths["packed"])
+    return paths
+
+
+@pytest.mark.performance
+class TestCompressedInputPerformance:
+    """Raw vs compressed input over the same export."""
+
+    @pytest.mark.parametrize("form", ["raw", "gzip", "bz2", "xz", "packed"])
+    def test_stream_conversations(
+        self, exports: dict[str, Path], benchmark: Any, form: str
+    ) -> None:
+        benchmark.group = "compressed-stream"
+        adapter = OpenAIAdapter()
+
+        def stream_all() -> int:
+            return sum(c.message_count for c in adapter.stream_conversations(exports[form]))
+
+        assert benchmark(stream_all) == 50_000
+
+    @pytest.mark.parametrize("form", ["raw", "gzip", "packed"])
+    def test_indexed_lookup(self, exports: dict[str, Path], benchmark: Any, form: str) -> None:
+        benchmark.group = "compressed-lookup"
+        adapter = OpenAIAdapter()
+        ExportIndex.build(exports[form], provider="openai")
+
+        def lookup_all() -> int:
+            # Descending IDs: a plain gzip stream restarts for every lookup
+            found = [adapter.get_conversation_by_id(exports[form], cid) for cid in LOOKUP_IDS]
+            return sum(conv is not None for conv in found)
+
+        assert benchmark(lookup_all) == len(LOOKUP_IDS)
@@ -0,0 +1,89 @@
+"""Performance benchmarks for normalized NDJSON input.
+
+Compares the same 5,000 conversations read from the raw OpenAI export and
+from its normalized NDJSON file (``echomine normalize``): streaming,
+header listing, search and ID lookups. Run with:
+
+    pytest tests/performance/test_ndjson_benchmark.py --benchmark-group-by=group
+
+Measurement Tools:
+- pytest-benchmark: Throughput and latency metrics
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.ndjson import NDJSONAdapter, write_ndjson
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.models.search import SearchQuery
+from tests.factories import make_openai_conversation, make_openai_message, write_export
+
+
+ADAPTERS = {"raw": OpenAIAdapter, "ndjson": NDJSONAdapter}
+
+
+@pytest.fixture(scope="module")
+def exports(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """5,000 conversations x 10 messages, raw and normalized."""
+    directory = tmp_path_factory.mktemp("ndjson")
+    conversations = [
+        make_openai_conversation(
+            [
+                make_openai_message(id=f"m-{i}-{j}", parts=[f"Message {j} of conversation {i}"])
+                for j in range(10)
+            ],
+            conv_id=f"conv-{i:05d}",
+            title=f"Conversation {i}",
+        )
+        for i in range(5000)
+    ]
+    raw = write_export(conversations, directory / "export.json")
+    ndjson = directory / "export.ndjson"
+    write_ndjson(OpenAIAdapter().stream_conversations(raw), ndjson)
+    return {"raw": raw, "ndjson": ndjson}
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("form", list(ADAPTERS))
+class TestNDJSONPerformance:
+    """Raw export vs normalized NDJSON over the same conversations."""
+
+    def test_stream_conversations(
+        self, exports: dict[str, Path], benchmark: Any, form: str
+    ) -> None:
+        benchmark.group = "ndjson-stream"
+        adapter = ADAPTERS[form]()
+
+        def stream_all() -> int:
+            return sum(c.message_count for c in adapter.stream_conversations(exports[form]))
+
+        assert benchmark(stream_all) == 50_000
+
+    def test_stream_headers(self, exports: dict[str, Path], benchmark: Any, form: str) -> None:
+        benchmark.group = "ndjson-headers"
+        adapter = ADAPTERS[form]()
+
+        def list_all() -> int:
+            return sum(1 for _ in adapter.stream_conversation_headers(exports[form]))
+
+        assert benchmark(list_all) == 5000
+
+    def test_search(self, exports: dict[str, Path], benchmark: Any, form: str) -> None:
+        benchmark.group = "ndjson-search"
+        adapter = ADAPTERS[form]()
+        query = SearchQuery(keywords=["conversation"], limit=10)
+
+        assert len(benchmark(lambda: list(adapter.search(exports[form], query)))) == 10
+
+    def test_lookups(self, exports: dict[str, Path], benchmark: Any, form: str) -> None:
+        benchmark.group = "ndjson-lookup"
+        adapter = ADAPTERS[form]()
+
+        def lookup() -> bool:
+            conv = adapter.get_conversation_by_id(exports[form], "conv-04999")
+            found = adapter.get_message_by_id(exports[form], "m-4999-9")
+            return conv is not None and found is not None
+
+        assert benchmark(lookup)
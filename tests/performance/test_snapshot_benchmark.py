@@ -0,0 +1,77 @@
+"""Performance benchmarks for the header snapshot cache.
+
+Compares cold runs (no snapshot: the export is parsed and the snapshot
+written) with warm runs (the snapshot is replayed) for header streaming and
+export statistics. Run with:
+
+    pytest tests/performance/test_snapshot_benchmark.py --benchmark-group-by=group
+
+Measurement Tools:
+- pytest-benchmark: Throughput and latency metrics
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.index import snapshot_path, stream_cached_headers
+from echomine.statistics import calculate_statistics
+from tests.factories import make_openai_conversation, make_openai_message, write_export
+
+
+@pytest.fixture(scope="module")
+def export(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """5,000 conversations x 10 messages."""
+    conversations = [
+        make_openai_conversation(
+            [
+                make_openai_message(id=f"m-{i}-{j}", parts=[f"Message {j} of conversation {i}"])
+                for j in range(10)
+            ],
+            conv_id=f"conv-{i:05d}",
+            title=f"Conversation {i}",
+        )
+        for i in range(5000)
+    ]
+    return write_export(conversations, tmp_path_factory.mktemp("snapshot") / "export.json")
+
+
+def _prepare(export: Path, run: str) -> None:
+    """Remove the snapshot for a cold run, make sure it exists for a warm one."""
+    if run == "cold":
+        snapshot_path(export).unlink(missing_ok=True)
+    else:
+        sum(1 for _ in stream_cached_headers(OpenAIAdapter(), export))
+
+
+@pytest.mark.performance
+class TestSnapshotPerformance:
+    """Cold (parse + write snapshot) vs warm (replay snapshot) runs."""
+
+    @pytest.mark.parametrize("run", ["cold", "warm"])
+    def test_stream_headers(self, export: Path, benchmark: Any, run: str) -> None:
+        benchmark.group = "snapshot-headers"
+        adapter = OpenAIAdapter()
+
+        def stream_all() -> int:
+            return sum(h.message_count for h in stream_cached_headers(adapter, export))
+
+        result = benchmark.pedantic(
+            stream_all, setup=lambda: _prepare(export, run), rounds=5, iterations=1
+        )
+        assert result == 50_000
+
+    @pytest.mark.parametrize("run", ["cold", "warm"])
+    def test_statistics(self, export: Path, benchmark: Any, run: str) -> None:
+        benchmark.group = "snapshot-stats"
+        adapter = OpenAIAdapter()
+
+        stats = benchmark.pedantic(
+            lambda: calculate_statistics(export, adapter=adapter, cache=True),
+            setup=lambda: _prepare(export, run),
+            rounds=5,
+            iterations=1,
+        )
+        assert stats.total_conversations == 5000
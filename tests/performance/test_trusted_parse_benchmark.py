@@ -0,0 +1,72 @@
+"""Performance benchmarks for trusted (unvalidated) parsing.
+
+Compares ``stream_conversations(..., trusted=True)`` against the default
+validating path on the same export. Run with:
+
+    pytest tests/performance/test_trusted_parse_benchmark.py --benchmark-group-by=group
+
+Measurement Tools:
+- pytest-benchmark: Throughput and latency metrics
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.openai import OpenAIAdapter
+
+
+@pytest.fixture(scope="module")
+def message_heavy_export(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """2,000 conversations x 20 messages: per-message construction dominates."""
+    conversations = []
+    for i in range(2000):
+        mapping = {}
+        for j in range(20):
+            msg_id = f"msg-{i:04d}-{j:02d}"
+            mapping[msg_id] = {
+                "id": msg_id,
+                "message": {
+                    "id": msg_id,
+                    "author": {"role": "user" if j % 2 == 0 else "assistant"},
+                    "content": {"content_type": "text", "parts": [f"Message {j} of {i}"]},
+                    "create_time": 1710000000.0 + i * 100 + j,
+                    "update_time": None,
+                    "metadata": {"model_slug": "gpt-4o"} if j % 2 else {},
+                },
+                "parent": f"msg-{i:04d}-{j - 1:02d}" if j else None,
+                "children": [],
+            }
+        conversations.append(
+            {
+                "id": f"conv-{i:04d}",
+                "title": f"Conversation {i}",
+                "create_time": 1710000000.0 + i * 100,
+                "update_time": 1710000000.0 + i * 100 + 60,
+                "mapping": mapping,
+            }
+        )
+
+    export_file = tmp_path_factory.mktemp("trusted") / "export.json"
+    export_file.write_text(json.dumps(conversations))
+    return export_file
+
+
+@pytest.mark.performance
+class TestTrustedParsePerformance:
+    """Validated vs trusted construction over the same export."""
+
+    @pytest.mark.parametrize("trusted", [False, True], ids=["validated", "trusted"])
+    def test_stream_conversations(
+        self, message_heavy_export: Path, benchmark: Any, trusted: bool
+    ) -> None:
+        benchmark.group = "trusted-parse"
+        adapter = OpenAIAdapter()
+
+        def stream_all() -> int:
+            conversations = adapter.stream_conversations(message_heavy_export, trusted=trusted)
+            return sum(c.message_count for c in conversations)
+
+        assert benchmark(stream_all) == 40_000
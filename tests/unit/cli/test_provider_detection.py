@@ -19,6 +19,7 @@ Constitution Compliance:
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 import pytest
@@ -320,3 +321,96 @@ def test_get_adapter_invalid_provider_raises_error() -> None:
     assert "invalid-provider" in error_msg
     assert "openai" in error_msg
     assert "claude" in error_msg
+
+
+# Bounded detection: parse events, stop at the deciding key
+def test_detection_reads_only_a_prefix(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Detection stops at the deciding key instead of parsing the conversation.
+
+    Given an export whose first conversation is several MB
+    When detect_provider() is called
+    Then it returns "openai" after reading a single chunk of the file
+    """
+    from echomine.cli import provider
+
+    export = tmp_path / "large_first.json"
+    export.write_text(
+        '[{"title": "big", "mapping": {"m": {"text": "' + "x" * 5_000_000 + '"}}}]',
+        encoding="utf-8",
+    )
+    reads: list[int] = []
+
+    class CountingFile(io.BytesIO):
+        def read(self, size: int | None = -1) -> bytes:
+            data = super().read(size)
+            reads.append(len(data))
+            return data
+
+    monkeypatch.setattr(provider, "open_export", lambda path: CountingFile(path.read_bytes()))
+
+    assert provider.detect_provider(export) == "openai"
+    assert sum(reads) <= provider._DETECTION_CHUNK
+
+
+def test_detection_budget_falls_back_to_hint_keys(tmp_path: Path) -> None:
+    """Past the byte budget, provider-specific secondary keys decide.
+
+    Given a Claude conversation whose chat_messages key follows a long summary
+    When detect_provider() is called
+    Then it returns "claude" from the "uuid" key seen within the budget
+    """
+    from echomine.cli.provider import DETECTION_BYTE_BUDGET, detect_provider
+
+    export = tmp_path / "late_key.json"
+    summary = "s" * (2 * DETECTION_BYTE_BUDGET)
+    export.write_text(
+        f'[{{"uuid": "c-1", "summary": "{summary}", "chat_messages": []}}]', encoding="utf-8"
+    )
+
+    assert detect_provider(export) == "claude"
+
+
+def test_detection_budget_without_hints_error(tmp_path: Path) -> None:
+    """Past the byte budget with no telling key, the error asks for --provider.
+
+    Given a first conversation whose only early keys are shared by providers
+    When detect_provider() is called
+    Then it raises ValueError suggesting --provider
+    """
+    from echomine.cli.provider import DETECTION_BYTE_BUDGET, detect_provider
+
+    export = tmp_path / "ambiguous.json"
+    title = "t" * (2 * DETECTION_BYTE_BUDGET)
+    export.write_text(f'[{{"id": "1", "title": "{title}", "mapping": {{}}}}]', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="--provider"):
+        detect_provider(export)
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('{"uuid": "c-1", "chat_messages": []}', "claude"),
+        ('[{"id": "1", "mapping": {"chat_messages": 1}}]', "openai"),
+    ],
+    ids=["root-object", "nested-key-ignored"],
+)
+def test_detection_uses_top_level_keys(tmp_path: Path, content: str, expected: str) -> None:
+    """Only top-level keys of the first conversation decide the provider."""
+    from echomine.cli.provider import detect_provider
+
+    export = tmp_path / "export.json"
+    export.write_text(content, encoding="utf-8")
+
+    assert detect_provider(export) == expected
+
+
+def test_first_item_not_an_object_error(tmp_path: Path) -> None:
+    """FR-050: An array of non-objects is an unsupported format."""
+    from echomine.cli.provider import detect_provider
+
+    export = tmp_path / "numbers.json"
+    export.write_text("[1, 2, 3]", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Unsupported export format"):
+        detect_provider(export)
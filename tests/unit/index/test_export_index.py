@@ -0,0 +1,365 @@
+"""Unit tests for the sidecar byte-offset export index.
+
+Covers index build/load, staleness detection (size, mtime, fingerprint,
+format version, corruption), adapter lookups served from the index
+returning the same objects as a streaming lookup, and title lookups.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.exceptions import AmbiguousIdError, ParseError
+from echomine.index import ExportIndex, export_index, find_conversations_by_title
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Three-conversation OpenAI export (middle one malformed: no title)."""
+    conversations = [
+        make_openai_conversation(
+            [make_openai_message(id=f"msg-{i}", parts=[f"content {i}"])],
+            conv_id=f"conv-{i}",
+            title=f"Conversation {i}",
+        )
+        for i in range(3)
+    ]
+    del conversations[1]["title"]
+    return write_export(conversations, tmp_path / "conversations.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Two-conversation Claude export with mixed-case UUIDs."""
+    data = make_claude_export(
+        [make_claude_message(uuid="m-1", text="first")], conv_id="ABCD-1111"
+    ) + make_claude_export([make_claude_message(uuid="m-2", text="second")], conv_id="abce-2222")
+    return write_export(data, tmp_path / "claude.json")
+
+
+class TestBuildAndLoad:
+    """Index lifecycle: build writes a sidecar that load() accepts."""
+
+    def test_build_writes_sidecar(self, openai_export: Path) -> None:
+        index = ExportIndex.build(openai_export, provider="openai")
+
+        assert index.index_path == openai_export.with_name("conversations.json.emidx")
+        assert index.index_path.is_file()
+        assert index.conversation_count == 3
+        assert not index.index_path.with_name("conversations.json.emidx.tmp").exists()
+
+    def test_load_returns_none_without_sidecar(self, openai_export: Path) -> None:
+        assert ExportIndex.load(openai_export) is None
+
+    def test_load_after_build(self, openai_export: Path) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+
+        index = ExportIndex.load(openai_export)
+
+        assert index is not None
+        assert index.provider == "openai"
+        assert index.conversation_count == 3
+
+    def test_progress_callback_reports_final_count(self, openai_export: Path) -> None:
+        counts: list[int] = []
+
+        ExportIndex.build(openai_export, provider="openai", progress_callback=counts.append)
+
+        assert counts[-1] == 3
+
+    def test_missing_export_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            ExportIndex.load(tmp_path / "missing.json")
+
+
+class TestStaleness:
+    """Any change to the export invalidates the index."""
+
+    def test_size_change_invalidates(self, openai_export: Path) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+        with open(openai_export, "ab") as f:
+            f.write(b"\n")
+
+        assert ExportIndex.load(openai_export) is None
+
+    def test_mtime_change_invalidates(self, openai_export: Path) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+        stat = openai_export.stat()
+        os.utime(openai_export, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert ExportIndex.load(openai_export) is None
+
+    def test_same_size_rewrite_invalidates(self, openai_export: Path) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+        stat = openai_export.stat()
+        data = openai_export.read_bytes().replace(b"conv-0", b"conv-9")
+        openai_export.write_bytes(data)
+        os.utime(openai_export, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert ExportIndex.load(openai_export) is None
+
+    def test_other_format_version_invalidates(self, openai_export: Path) -> None:
+        index = ExportIndex.build(openai_export, provider="openai")
+        with sqlite3.connect(index.index_path) as conn:
+            conn.execute("UPDATE meta SET value = '0' WHERE key = 'format_version'")
+
+        assert ExportIndex.load(openai_export) is None
+
+    def test_corrupt_sidecar_ignored(self, openai_export: Path) -> None:
+        ExportIndex.path_for(openai_export).write_bytes(b"not a database")
+
+        assert ExportIndex.load(openai_export) is None
+
+
+class TestFind:
+    """find() mirrors each adapter's ID matching semantics."""
+
+    def test_openai_exact_match(self, openai_export: Path) -> None:
+        index = ExportIndex.build(openai_export, provider="openai")
+
+        assert len(index.find("conv-2")) == 1
+        assert index.find("conv", prefix=False) == []
+        assert index.find("CONV-2") == []
+
+    def test_claude_case_insensitive_and_prefix(self, claude_export: Path) -> None:
+        index = ExportIndex.build(claude_export, provider="claude")
+
+        assert len(index.find("abcd-1111")) == 1
+        assert len(index.find("abc")) == 0  # Prefix shorter than 4 chars
+        assert len(index.find("ABC")) == 0
+        assert len(index.find("abcd")) == 1
+        assert len(index.find("ABCE")) == 1
+
+    def test_unique_prefix_and_ambiguity(self, tmp_path: Path) -> None:
+        conversations = [
+            make_openai_conversation([make_openai_message()], conv_id=conv_id)
+            for conv_id in ("abcd-1", "abcd-12", "abce-1", "abcd-2")
+        ]
+        index = ExportIndex.build(
+            write_export(conversations, tmp_path / "export.json"), provider="openai"
+        )
+
+        assert index.find("abce") == index.find("abce-1")
+        assert len(index.find("abcd-1")) == 1  # Full match wins over abcd-12
+        assert index.find("ABCE") == []  # OpenAI IDs are case-sensitive
+        assert index.find("abc") == []  # Prefix shorter than 4 chars
+        with pytest.raises(AmbiguousIdError) as excinfo:
+            index.find("abcd")
+        assert excinfo.value.matches == ["abcd-1", "abcd-12", "abcd-2"]
+        assert not excinfo.value.more
+
+    def test_ambiguity_lists_first_matches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(export_index, "MAX_REPORTED_MATCHES", 2)
+        data = [
+            entry
+            for conv_id in ("ABCD-3", "abcd-1", "Abcd-2")
+            for entry in make_claude_export([make_claude_message()], conv_id=conv_id)
+        ]
+        index = ExportIndex.build(write_export(data, tmp_path / "claude.json"), provider="claude")
+
+        with pytest.raises(AmbiguousIdError) as excinfo:
+            index.find("ABCD-")
+
+        assert excinfo.value.matches == ["abcd-1", "Abcd-2"]
+        assert excinfo.value.more
+
+    def test_spans_slice_conversation(self, openai_export: Path) -> None:
+        index = ExportIndex.build(openai_export, provider="openai")
+
+        (raw,) = index.iter_raw_conversations(index.find("conv-2"))
+
+        assert raw["id"] == "conv-2"
+        assert raw["title"] == "Conversation 2"
+
+
+class TestFindMessage:
+    """find_message() maps message IDs to their conversations' byte ranges."""
+
+    def test_openai_message_ids(self, openai_export: Path) -> None:
+        index = ExportIndex.build(openai_export, provider="openai")
+
+        (raw,) = index.iter_raw_conversations(index.find_message("msg-2"))
+
+        assert raw["id"] == "conv-2"
+        # Listed even when the conversation itself is malformed
+        assert len(index.find_message("msg-1")) == 1
+        assert index.find_message("MSG-2") == []
+        assert index.find_message("conv-2") == []
+
+    def test_claude_message_ids(self, claude_export: Path) -> None:
+        index = ExportIndex.build(claude_export, provider="claude")
+
+        (raw,) = index.iter_raw_conversations(index.find_message("m-2"))
+
+        assert raw["uuid"] == "abce-2222"
+
+    def test_message_in_several_conversations(self, tmp_path: Path) -> None:
+        conversations = [
+            make_openai_conversation(
+                [make_openai_message(id="shared", parts=[f"copy {i}"])], conv_id=f"conv-{i}"
+            )
+            for i in range(3)
+        ]
+        export_file = write_export(conversations, tmp_path / "export.json")
+        index = ExportIndex.build(export_file, provider="openai")
+
+        raws = list(index.iter_raw_conversations(index.find_message("shared")))
+
+        assert [raw["id"] for raw in raws] == ["conv-0", "conv-1", "conv-2"]
+
+
+class TestAdapterLookups:
+    """Adapters serve ID lookups from a current index."""
+
+    def test_openai_index_lookup_matches_streaming(self, openai_export: Path) -> None:
+        adapter = OpenAIAdapter()
+        streamed = adapter.get_conversation_by_id(openai_export, "conv-2")
+        ExportIndex.build(openai_export, provider="openai")
+
+        indexed = adapter.get_conversation_by_id(openai_export, "conv-2")
+
+        assert indexed == streamed
+
+    def test_openai_malformed_entry_still_skipped(self, openai_export: Path) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+
+        assert OpenAIAdapter().get_conversation_by_id(openai_export, "conv-1") is None
+
+    def test_index_used_instead_of_streaming(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+        adapter = OpenAIAdapter()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("streamed despite current index")
+
+        monkeypatch.setattr(adapter, "stream_conversations", fail)
+
+        conv = adapter.get_conversation_by_id(openai_export, "conv-0")
+        assert conv is not None
+        result = adapter.get_message_by_id(openai_export, "msg-0", conversation_id="conv-0")
+        assert result is not None
+
+    @pytest.mark.parametrize("message_id", ["msg-0", "msg-1", "msg-2", "missing"])
+    def test_openai_message_lookup_matches_streaming(
+        self, openai_export: Path, message_id: str
+    ) -> None:
+        adapter = OpenAIAdapter()
+        streamed = adapter.get_message_by_id(openai_export, message_id)
+        ExportIndex.build(openai_export, provider="openai")
+
+        assert adapter.get_message_by_id(openai_export, message_id) == streamed
+
+    def test_message_lookup_without_hint_uses_index(
+        self, claude_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ExportIndex.build(claude_export, provider="claude")
+        adapter = ClaudeAdapter()
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("streamed despite current index")
+
+        monkeypatch.setattr(adapter, "stream_conversations", fail)
+
+        result = adapter.get_message_by_id(claude_export, "m-2")
+        assert result is not None
+        message, conversation = result
+        assert (message.content, conversation.id) == ("second", "abce-2222")
+        assert adapter.get_message_by_id(claude_export, "missing") is None
+
+    def test_stale_index_falls_back_to_streaming(self, openai_export: Path) -> None:
+        ExportIndex.build(openai_export, provider="openai")
+        data = openai_export.read_bytes().replace(b"Conversation 2", b"Renamed conv 2")
+        openai_export.write_bytes(data + b" ")
+
+        conv = OpenAIAdapter().get_conversation_by_id(openai_export, "conv-2")
+
+        assert conv is not None
+        assert conv.title == "Renamed conv 2"
+
+    def test_claude_prefix_lookup_via_index(self, claude_export: Path) -> None:
+        adapter = ClaudeAdapter()
+        streamed = adapter.get_conversation_by_id(claude_export, "abce")
+        ExportIndex.build(claude_export, provider="claude")
+
+        indexed = adapter.get_conversation_by_id(claude_export, "abce")
+
+        assert indexed is not None
+        assert indexed == streamed
+        assert indexed.id == "abce-2222"
+
+    def test_index_for_other_provider_ignored(self, claude_export: Path) -> None:
+        ExportIndex.build(claude_export, provider="openai")
+
+        conv = ClaudeAdapter().get_conversation_by_id(claude_export, "ABCD-1111")
+
+        assert conv is not None
+
+
+class TestTitleLookup:
+    """find_conversations_by_title() streams ids/titles or reads the index."""
+
+    def test_openai_substring_case_insensitive(self, openai_export: Path) -> None:
+        matches = find_conversations_by_title(openai_export, "CONVERSATION")
+
+        # Untitled conv-1 is skipped, as the adapter would skip it
+        assert matches == [("conv-0", "Conversation 0"), ("conv-2", "Conversation 2")]
+
+    def test_claude_uses_name_and_untitled_mapping(self, tmp_path: Path) -> None:
+        data = make_claude_export(
+            [make_claude_message()], conv_id="c-1", title="Rust lifetimes"
+        ) + make_claude_export([make_claude_message()], conv_id="c-2", title="")
+        export = write_export(data, tmp_path / "claude.json")
+
+        for provider in ("claude", None):
+            assert find_conversations_by_title(export, "rust", provider=provider) == [
+                ("c-1", "Rust lifetimes")
+            ]
+            assert find_conversations_by_title(export, "no title", provider=provider) == [
+                ("c-2", "(No title)")
+            ]
+
+    def test_single_object_export(self, tmp_path: Path) -> None:
+        conversation = make_openai_conversation([make_openai_message()], title="Lone")
+        export = tmp_path / "single.json"
+        export.write_text(json.dumps(conversation))
+
+        assert find_conversations_by_title(export, "lone") == [("conv-001", "Lone")]
+
+    def test_invalid_json_raises(self, tmp_path: Path) -> None:
+        for text in ("{invalid json", "[{invalid json"):
+            export = tmp_path / "broken.json"
+            export.write_text(text)
+
+            with pytest.raises(ParseError):
+                find_conversations_by_title(export, "x")
+
+    def test_index_titles_used_when_current(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        streamed = find_conversations_by_title(openai_export, "conversation")
+        ExportIndex.build(openai_export, provider="openai")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("scanned despite current index")
+
+        monkeypatch.setattr("echomine.index.export_index.iter_element_spans", fail)
+
+        assert find_conversations_by_title(openai_export, "conversation") == streamed
@@ -0,0 +1,138 @@
+"""Unit tests for the top-level array element scanner.
+
+The scanner underpins the sidecar offset index: every span it reports must
+slice out exactly one array element, regardless of how the file is chunked.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from echomine.exceptions import ParseError
+from echomine.index.scanner import iter_element_spans
+from tests.factories import make_claude_export, make_claude_message
+
+
+FIXTURES = Path(__file__).parents[2] / "fixtures"
+
+
+def _spans(data: bytes, chunk_size: int = 7) -> list[tuple[int, int, dict[str, object]]]:
+    return [tuple(s) for s in iter_element_spans(io.BytesIO(data), chunk_size=chunk_size)]  # type: ignore[misc]
+
+
+class TestElementSpans:
+    """Span boundaries slice out each element exactly."""
+
+    @pytest.mark.parametrize(
+        "fixture",
+        ["sample_export.json", "date_test_conversations.json", "claude/sample_export.json"],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_spans_round_trip_fixture(self, fixture: str, chunk_size: int) -> None:
+        data = (FIXTURES / fixture).read_bytes()
+        expected = json.loads(data)
+
+        spans = _spans(data, chunk_size)
+
+        assert len(spans) == len(expected)
+        for (start, end, _), element in zip(spans, expected, strict=True):
+            assert json.loads(data[start:end]) == element
+
+    def test_brackets_and_escapes_inside_strings_ignored(self) -> None:
+        export = [
+            {"id": 'a"}]{[', "title": 'back\\slash \\" ]', "mapping": {}},
+            {"id": "b", "title": "plain", "mapping": {"n": {"message": None}}},
+        ]
+        data = json.dumps(export).encode()
+
+        spans = _spans(data)
+
+        assert [fields["id"] for _, _, fields in spans] == ['a"}]{[', "b"]
+
+    def test_empty_array_yields_nothing(self) -> None:
+        assert _spans(b"  [ ]  ") == []
+
+    def test_non_ascii_content_offsets_exact(self) -> None:
+        export = [{"id": "一", "title": "日本語 ✓ émoji 🎉"}, {"id": "二", "title": "x"}]
+        data = json.dumps(export, ensure_ascii=False).encode()
+
+        spans = _spans(data, chunk_size=3)
+
+        assert [json.loads(data[s:e]) for s, e, _ in spans] == export
+
+    def test_non_object_elements_skipped(self) -> None:
+        data = b'[1, "x", [2, 3], {"id": "only"}]'
+
+        spans = _spans(data)
+
+        assert len(spans) == 1
+        assert data[spans[0][0] : spans[0][1]] == b'{"id": "only"}'
+
+
+class TestScalarFields:
+    """Top-level scalar members are captured without parsing subtrees."""
+
+    def test_captures_scalars_regardless_of_key_order(self) -> None:
+        conv = {
+            "mapping": {"node": {"id": "nested-id", "message": None}},
+            "title": "Title",
+            "create_time": 1700000000.5,
+            "archived": False,
+            "gizmo": None,
+            "id": "conv-last",
+        }
+
+        (_, _, fields) = _spans(json.dumps([conv]).encode())[0]
+
+        assert fields == {
+            "title": "Title",
+            "create_time": 1700000000.5,
+            "archived": False,
+            "gizmo": None,
+            "id": "conv-last",
+        }
+
+    def test_nested_keys_not_captured(self) -> None:
+        export = make_claude_export([make_claude_message(uuid="msg-inner", text="hi")])
+
+        (_, _, fields) = _spans(json.dumps(export).encode())[0]
+
+        assert fields["uuid"] == "conv-test"
+        assert "text" not in fields
+
+    def test_pretty_printed_whitespace(self) -> None:
+        data = json.dumps([{"id": "x", "n": 3}], indent=4).encode()
+
+        (_, _, fields) = _spans(data, chunk_size=2)[0]
+
+        assert fields == {"id": "x", "n": 3}
+
+
+class TestMalformedInput:
+    """Structural errors surface as ParseError."""
+
+    def test_root_object_rejected(self) -> None:
+        with pytest.raises(ParseError, match="JSON array"):
+            _spans(b'{"id": "x"}')
+
+    def test_unclosed_array_rejected(self) -> None:
+        with pytest.raises(ParseError, match="not closed"):
+            _spans(b'[{"id": "x"}, {"id": "y"}')
+
+    def test_truncated_element_rejected(self) -> None:
+        with pytest.raises(ParseError, match="Invalid JSON"):
+            _spans(b'[{"id": "x"}, {"id": "y"')
+
+    def test_syntax_error_mid_file_rejected(self) -> None:
+        data = b'[{"id": "x", oops}, ' + b" " * 10_000 + b'{"id": "y"}]'
+
+        with pytest.raises(ParseError, match="Invalid JSON"):
+            _spans(data, chunk_size=64)
+
+    def test_unterminated_string_rejected(self) -> None:
+        with pytest.raises(ParseError, match="Unterminated string"):
+            _spans(b'[{"id": "x')
@@ -0,0 +1,254 @@
+"""Unit tests for the persistent search index (inverted index + BM25 statistics).
+
+Covers build/load and staleness, and verifies that search() answered from
+the index returns exactly what streaming search returns: same conversations,
+order, scores, matched_message_ids and snippets.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.index import SearchIndex
+from echomine.models.search import SearchQuery
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+_TOPICS = [
+    "python sorting",
+    "rust ownership",
+    "python python async",
+    "java streams",
+    "编程 python",
+]
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Twenty OpenAI conversations plus one malformed entry (no title)."""
+    conversations = [
+        make_openai_conversation(
+            [
+                make_openai_message(
+                    id=f"m-{i}-{j}",
+                    role=("user", "assistant")[j % 2],
+                    parts=[t],
+                    create_time=1704067200.0 + i * 3600 + j,
+                )
+                for j, t in enumerate(_TOPICS[i % 5 : i % 5 + 1 + i % 3])
+            ],
+            conv_id=f"conv-{i:02d}",
+            title=f"Session {i % 4} rust" if i % 6 == 0 else f"Session {i % 4}",
+            create_time=1704067200.0 + i * 3600 * 8,
+            update_time=1704067200.0 + i * 3600 * 8 + (20 - i) * 60,
+        )
+        for i in range(20)
+    ]
+    malformed = make_openai_conversation([make_openai_message(parts=["python"])], conv_id="bad")
+    del malformed["title"]
+    return write_export([*conversations, malformed], tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Twenty Claude conversations with varied topics, lengths and dates."""
+    data: list[dict[str, object]] = []
+    for i in range(20):
+        created = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(hours=i * 8)
+        data += make_claude_export(
+            [
+                make_claude_message(uuid=f"m-{i}-{j}", sender=("human", "assistant")[j % 2], text=t)
+                for j, t in enumerate(_TOPICS[i % 5 : i % 5 + 1 + i % 3])
+            ],
+            conv_id=f"conv-{i:02d}",
+            title=f"Session {i % 4} rust" if i % 6 == 0 else f"Session {i % 4}",
+            created_at=created.isoformat().replace("+00:00", "Z"),
+        )
+    return write_export(data, tmp_path / "claude.json")
+
+
+QUERIES = [
+    SearchQuery(keywords=["python"], limit=100),
+    SearchQuery(keywords=["python"], limit=3),
+    SearchQuery(keywords=["python", "rust"], limit=100),
+    SearchQuery(keywords=["rust"], limit=100),
+    SearchQuery(keywords=["python", "async"], match_mode="all", limit=100),
+    SearchQuery(keywords=["python"], exclude_keywords=["编程"], limit=100),
+    SearchQuery(keywords=["编程"], limit=100),
+    SearchQuery(keywords=["python"], role_filter="assistant", limit=100),
+    SearchQuery(keywords=["rust"], role_filter="user", limit=100),
+    SearchQuery(keywords=["python"], title_filter="session 1", limit=100),
+    SearchQuery(keywords=["python"], from_date=date(2024, 1, 3), to_date=date(2024, 1, 5)),
+    SearchQuery(keywords=["python"], min_messages=2, max_messages=2, limit=100),
+    SearchQuery(keywords=["python"], sort_by="date", sort_order="asc", limit=5),
+    SearchQuery(keywords=["python"], sort_by="title", limit=100),
+    SearchQuery(keywords=["python"], sort_by="messages", sort_order="asc", limit=7),
+    SearchQuery(title_filter="session 2", limit=100),
+    SearchQuery(min_messages=3, exclude_keywords=["java"], limit=100),
+    SearchQuery(role_filter="assistant", sort_by="title", limit=100),
+]
+
+
+def _results(adapter: Any, path: Path, query: SearchQuery) -> list[Any]:
+    return [
+        (r.conversation, r.score, r.matched_message_ids, r.snippet)
+        for r in adapter.search(path, query)
+    ]
+
+
+class TestBuildAndLoad:
+    """Index lifecycle: build writes a sidecar that load() accepts."""
+
+    def test_build_writes_sidecar(self, openai_export: Path) -> None:
+        index = OpenAIAdapter().build_search_index(openai_export)
+
+        assert index.index_path == openai_export.with_name("openai.json.emsearch")
+        assert index.index_path.is_file()
+        assert index.conversation_count == 20  # Malformed entry left out
+        assert index.avg_doc_length > 0
+
+    def test_load_returns_current_index(self, openai_export: Path) -> None:
+        built = OpenAIAdapter().build_search_index(openai_export)
+
+        loaded = SearchIndex.load(openai_export)
+
+        assert loaded is not None
+        assert loaded.provider == "openai"
+        assert loaded.total_length == built.total_length
+
+    def test_missing_index(self, openai_export: Path) -> None:
+        assert SearchIndex.load(openai_export) is None
+
+    def test_stale_after_modification(self, openai_export: Path) -> None:
+        OpenAIAdapter().build_search_index(openai_export)
+        stat = openai_export.stat()
+        os.utime(openai_export, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert SearchIndex.load(openai_export) is None
+
+    def test_repeated_load_skips_fingerprint(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        OpenAIAdapter().build_search_index(openai_export)
+        first = SearchIndex.load(openai_export)
+
+        def fail(path: Path) -> str:
+            raise AssertionError("fingerprint recomputed")
+
+        monkeypatch.setattr("echomine.index.search_index.compute_fingerprint", fail)
+
+        assert SearchIndex.load(openai_export) is first
+
+    def test_repeated_load_sees_rebuild(self, openai_export: Path) -> None:
+        OpenAIAdapter().build_search_index(openai_export)
+        first = SearchIndex.load(openai_export)
+        OpenAIAdapter().build_search_index(openai_export)
+
+        second = SearchIndex.load(openai_export)
+
+        assert second is not None
+        assert second is not first
+
+    def test_corrupt_index_ignored(self, openai_export: Path) -> None:
+        SearchIndex.path_for(openai_export).write_bytes(b"not a database")
+
+        assert SearchIndex.load(openai_export) is None
+
+    def test_progress_callback(self, openai_export: Path) -> None:
+        counts: list[int] = []
+
+        OpenAIAdapter().build_search_index(openai_export, progress_callback=counts.append)
+
+        assert counts == [21]
+
+
+class TestIndexedSearchMatchesStreaming:
+    """search() answered from the index equals streaming search."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    @pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+    def test_results_identical(
+        self,
+        adapter_cls: type[Any],
+        query: SearchQuery,
+        openai_export: Path,
+        claude_export: Path,
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        adapter = adapter_cls()
+        streamed = _results(adapter, path, query)
+
+        adapter.build_search_index(path)
+        indexed = _results(adapter, path, query)
+
+        assert indexed == streamed
+        assert streamed  # Fixture guarantees each query has matches
+
+    def test_no_candidates(self, openai_export: Path) -> None:
+        OpenAIAdapter().build_search_index(openai_export)
+
+        query = SearchQuery(keywords=["python"], title_filter="nothing")
+
+        assert list(OpenAIAdapter().search(openai_export, query)) == []
+
+    def test_only_returned_conversations_parsed(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        adapter = OpenAIAdapter()
+        adapter.build_search_index(openai_export)
+        parsed: list[str] = []
+        original = adapter._parse_conversation
+
+        def spy(raw: dict[str, Any], **kwargs: Any) -> Any:
+            conv = original(raw, **kwargs)
+            parsed.append(conv.id)
+            return conv
+
+        monkeypatch.setattr(adapter, "_parse_conversation", spy)
+
+        results = list(adapter.search(openai_export, SearchQuery(keywords=["async"], limit=2)))
+
+        assert parsed == [r.conversation.id for r in results]
+        assert len(parsed) == 2
+
+    def test_phrase_queries_stream(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        adapter = OpenAIAdapter()
+        query = SearchQuery(phrases=["java streams"], limit=100)
+        streamed = _results(adapter, openai_export, query)
+        adapter.build_search_index(openai_export)
+
+        def fail(self: SearchIndex, query: SearchQuery) -> list[Any]:
+            raise AssertionError("phrase query answered from index")
+
+        monkeypatch.setattr(SearchIndex, "search", fail)
+
+        assert _results(adapter, openai_export, query) == streamed
+
+    def test_index_for_other_provider_ignored(self, openai_export: Path) -> None:
+        OpenAIAdapter().build_search_index(openai_export)
+        index = SearchIndex.load(openai_export)
+        assert index is not None
+
+        # Claude adapter must not use an OpenAI index (falls back to streaming)
+        assert list(ClaudeAdapter().search(openai_export, SearchQuery(keywords=["x"]))) == []
+
+    def test_direct_search_rejects_phrases(self, openai_export: Path) -> None:
+        index = OpenAIAdapter().build_search_index(openai_export)
+
+        with pytest.raises(ValueError, match="Phrase"):
+            index.search(SearchQuery(phrases=["python"]))
@@ -0,0 +1,229 @@
+"""Unit tests for the binary header snapshot cache.
+
+Covers replay equivalence with parsing (headers, skipped entries, progress),
+invalidation (export change, adapter, corruption), partial reads that must
+not leave a snapshot, best-effort writing, and calculate_statistics(cache=True).
+"""
+
+from __future__ import annotations
+
+import os
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.index import SNAPSHOT_SUFFIX, cache_enabled, snapshot_path, stream_cached_headers
+from echomine.statistics import calculate_statistics
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """250 OpenAI conversations; conv-100 is malformed (no title), some never updated."""
+    conversations = []
+    for i in range(250):
+        conv = make_openai_conversation(
+            [make_openai_message(id=f"m-{i}-{j}") for j in range(1 + i % 4)],
+            conv_id=f"conv-{i:03d}",
+            title=f"Café ☃ session {i}",
+            create_time=1700000000.0 + i,
+            update_time=1700000500.123456 + i,
+        )
+        if i % 3 == 0:
+            conv["update_time"] = None
+        if i == 100:
+            del conv["title"]
+        conversations.append(conv)
+    return write_export(conversations, tmp_path / "export.json")
+
+
+def _replay_only(monkeypatch: pytest.MonkeyPatch, adapter_class: type[Any]) -> None:
+    """Make parsing fail, so any header read must come from the snapshot."""
+
+    def fail(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("export was parsed")
+
+    monkeypatch.setattr(adapter_class, "stream_conversation_headers", fail)
+
+
+def _read(adapter: OpenAIAdapter | ClaudeAdapter, export: Path) -> tuple[list[Any], ...]:
+    """Headers, skipped entries and progress counts of one cached read."""
+    skipped: list[tuple[str, str]] = []
+    progress: list[int] = []
+    headers = list(
+        stream_cached_headers(
+            adapter,
+            export,
+            progress_callback=progress.append,
+            on_skip=lambda cid, reason: skipped.append((cid, reason)),
+        )
+    )
+    return headers, skipped, progress
+
+
+class TestReplay:
+    """A current snapshot replays exactly what parsing produced."""
+
+    def test_warm_read_matches_parse(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        adapter = OpenAIAdapter()
+        expected = list(adapter.stream_conversation_headers(openai_export))
+
+        cold = _read(adapter, openai_export)
+        _replay_only(monkeypatch, OpenAIAdapter)
+        warm = _read(adapter, openai_export)
+
+        assert cold[0] == warm[0] == expected
+        assert [h.updated_at for h in warm[0][:2]] == [None, expected[1].updated_at]
+        assert warm[1] == cold[1]
+        assert [cid for cid, _ in warm[1]] == ["conv-100"]
+        assert warm[2] == cold[2] == [100, 200]
+        assert snapshot_path(openai_export).suffix == SNAPSHOT_SUFFIX
+
+    def test_claude_and_parallel_cold_read(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        data: list[dict[str, object]] = []
+        for i in range(30):
+            data += make_claude_export(
+                [make_claude_message(uuid=f"m-{i}", text="hi")], conv_id=f"conv-{i:02d}"
+            )
+        export = write_export(data, tmp_path / "claude.json")
+        adapter = ClaudeAdapter()
+        expected = list(adapter.stream_conversation_headers(export))
+
+        cold = list(stream_cached_headers(adapter, export, workers=2))
+        _replay_only(monkeypatch, ClaudeAdapter)
+
+        assert cold == list(stream_cached_headers(adapter, export)) == expected
+
+    def test_statistics_from_snapshot(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        adapter = OpenAIAdapter()
+        expected = calculate_statistics(openai_export, adapter=adapter)
+
+        assert calculate_statistics(openai_export, adapter=adapter, cache=True) == expected
+        _replay_only(monkeypatch, OpenAIAdapter)
+        assert calculate_statistics(openai_export, adapter=adapter, cache=True) == expected
+
+
+class TestInvalidation:
+    """Anything that does not match the export falls back to parsing."""
+
+    def test_changed_export_reparsed(self, openai_export: Path) -> None:
+        adapter = OpenAIAdapter()
+        list(stream_cached_headers(adapter, openai_export))
+        write_export(
+            [make_openai_conversation([make_openai_message()], conv_id="new", title="New")],
+            openai_export,
+        )
+
+        assert [h.id for h in stream_cached_headers(adapter, openai_export)] == ["new"]
+        assert [h.id for h in stream_cached_headers(adapter, openai_export)] == ["new"]
+
+    def test_same_content_new_mtime_reparsed(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        adapter = OpenAIAdapter()
+        list(stream_cached_headers(adapter, openai_export))
+        stat = openai_export.stat()
+        os.utime(openai_export, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        _replay_only(monkeypatch, OpenAIAdapter)
+
+        with pytest.raises(AssertionError, match="export was parsed"):
+            list(stream_cached_headers(adapter, openai_export))
+
+    def test_other_echomine_version_reparsed(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        adapter = OpenAIAdapter()
+        list(stream_cached_headers(adapter, openai_export))
+        monkeypatch.setattr("echomine.index.snapshot.__version__", "0.0.1")
+        _replay_only(monkeypatch, OpenAIAdapter)
+
+        with pytest.raises(AssertionError, match="export was parsed"):
+            list(stream_cached_headers(adapter, openai_export))
+
+    def test_other_adapter_not_replayed(self, openai_export: Path) -> None:
+        list(stream_cached_headers(OpenAIAdapter(), openai_export))
+
+        # Parsed as Claude: every entry is malformed, none may come from the snapshot
+        assert list(stream_cached_headers(ClaudeAdapter(), openai_export)) == []
+
+    @pytest.mark.parametrize("damage", ["truncate", "empty", "garbage"])
+    def test_damaged_snapshot_ignored(self, openai_export: Path, damage: str) -> None:
+        adapter = OpenAIAdapter()
+        expected = list(stream_cached_headers(adapter, openai_export))
+        path = snapshot_path(openai_export)
+        data = path.read_bytes()
+        path.write_bytes({"truncate": data[:-7], "empty": b"", "garbage": b"x" * len(data)}[damage])
+
+        assert list(stream_cached_headers(adapter, openai_export)) == expected
+        # Rewritten by the fallback read
+        assert path.read_bytes() == data
+
+
+class TestCacheEnabled:
+    """Snapshots are opt-in: an explicit choice, else $ECHOMINE_CACHE_DIR."""
+
+    @pytest.mark.parametrize(
+        ("cache", "env", "expected"),
+        [
+            (None, None, False),
+            (None, "cache", True),
+            (True, None, True),
+            (False, "cache", False),
+        ],
+    )
+    def test_resolution(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        cache: bool | None,
+        env: str | None,
+        expected: bool,
+    ) -> None:
+        if env is None:
+            monkeypatch.delenv("ECHOMINE_CACHE_DIR")
+        else:
+            monkeypatch.setenv("ECHOMINE_CACHE_DIR", str(tmp_path / env))
+
+        assert cache_enabled(cache) is expected
+
+
+class TestWriting:
+    """Snapshots are written only after a complete read, and best-effort."""
+
+    def test_partial_read_leaves_no_snapshot(
+        self, openai_export: Path, tmp_cache_dir: Path
+    ) -> None:
+        headers = stream_cached_headers(OpenAIAdapter(), openai_export)
+        assert len(list(islice(headers, 5))) == 5
+        headers.close()
+
+        assert list(tmp_cache_dir.iterdir()) == []
+
+    def test_unwritable_cache_dir(self, openai_export: Path, tmp_path: Path) -> None:
+        not_a_dir = tmp_path / "cache"
+        not_a_dir.write_text("")
+        adapter = OpenAIAdapter()
+
+        assert list(stream_cached_headers(adapter, openai_export, cache_dir=not_a_dir)) == list(
+            adapter.stream_conversation_headers(openai_export)
+        )
+
+    def test_missing_export(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            list(stream_cached_headers(OpenAIAdapter(), tmp_path / "missing.json"))
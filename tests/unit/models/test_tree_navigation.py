@@ -686,3 +686,113 @@ def test_get_all_threads_with_complex_tree(
     for thread in threads:
         timestamps = [msg.timestamp for msg in thread]
         assert timestamps == sorted(timestamps), "Messages within thread must be chronological"
+
+
+# ============================================================================
+# Navigation Index: Lazily Built id/parent Lookup Tables
+# ============================================================================
+
+
+def _chain_conversation(length: int, *, branch_every: int = 0) -> Conversation:
+    """Build a linear chain of messages, optionally with a side reply every N."""
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    messages = [
+        Message(
+            id=f"msg-{i}",
+            content=f"Message {i}",
+            role="user" if i % 2 == 0 else "assistant",
+            timestamp=base + timedelta(seconds=i),
+            parent_id=f"msg-{i - 1}" if i else None,
+        )
+        for i in range(length)
+    ]
+    if branch_every:
+        messages += [
+            Message(
+                id=f"alt-{i}",
+                content=f"Alternative {i}",
+                role="assistant",
+                timestamp=base + timedelta(seconds=i, milliseconds=500),
+                parent_id=f"msg-{i}",
+            )
+            for i in range(0, length, branch_every)
+        ]
+    return Conversation(
+        id="conv-chain", title="Chain", created_at=base, updated_at=None, messages=messages
+    )
+
+
+def test_get_all_threads_matches_recursive_order(
+    complex_tree_conversation: Conversation,
+) -> None:
+    """Iterative traversal yields threads in the same order as a recursive DFS."""
+
+    def recursive(conv: Conversation) -> list[list[str]]:
+        def walk(msg: Message, path: list[str]) -> list[list[str]]:
+            path = [*path, msg.id]
+            children = [m for m in conv.messages if m.parent_id == msg.id]
+            if not children:
+                return [path]
+            return [t for child in children for t in walk(child, path)]
+
+        roots = [m for m in conv.messages if m.parent_id is None]
+        return [t for root in roots for t in walk(root, [])]
+
+    for conv in (complex_tree_conversation, _chain_conversation(50, branch_every=7)):
+        threads = [[m.id for m in thread] for thread in conv.get_all_threads()]
+        assert threads == recursive(conv)
+
+
+def test_get_all_threads_on_deep_tree_does_not_recurse() -> None:
+    """Trees deeper than the recursion limit are traversed iteratively."""
+    conversation = _chain_conversation(5000, branch_every=1000)
+
+    threads = conversation.get_all_threads()
+
+    assert len(threads) == 6
+    assert [len(t) for t in threads] == [5000, 4002, 3002, 2002, 1002, 2]
+    assert len(conversation.get_thread("msg-4999")) == 5000
+
+
+def test_get_thread_stops_on_parent_cycle() -> None:
+    """Malformed parent_id cycles terminate instead of looping forever."""
+    now = datetime.now(UTC)
+    messages = [
+        Message(id="a", content="A", role="user", timestamp=now, parent_id="b"),
+        Message(id="b", content="B", role="assistant", timestamp=now, parent_id="a"),
+    ]
+    conversation = Conversation(id="conv-cycle", title="Cycle", created_at=now, messages=messages)
+
+    assert [m.id for m in conversation.get_thread("a")] == ["b", "a"]
+
+
+def test_navigation_index_survives_copy_and_ignores_equality(
+    branching_conversation: Conversation,
+) -> None:
+    """The cached index never leaks into equality, dumps, or copies."""
+    fresh = branching_conversation.model_copy()
+    assert branching_conversation.get_children("msg-1")  # Builds the index
+
+    assert branching_conversation == fresh
+    assert "_tree" not in branching_conversation.model_dump()
+
+    trimmed = branching_conversation.model_copy(
+        update={"messages": branching_conversation.messages[:1]}
+    )
+    assert trimmed.get_children("msg-1") == []
+    assert [m.id for m in trimmed.get_all_threads()[0]] == ["msg-1"]
+
+
+def test_get_message_by_id_returns_first_duplicate() -> None:
+    """Duplicate IDs resolve to the first message, like a linear scan."""
+    now = datetime.now(UTC)
+    messages = [
+        Message(id="dup", content="first", role="user", timestamp=now),
+        Message(id="dup", content="second", role="assistant", timestamp=now),
+    ]
+    conversation = Conversation(id="conv-dup", title="Dup", created_at=now, messages=messages)
+
+    message = conversation.get_message_by_id("dup")
+
+    assert message is not None
+    assert message.content == "first"
@@ -0,0 +1,197 @@
+"""Unit tests for trusted (unvalidated) model construction.
+
+``stream_conversations(..., trusted=True)`` must produce models identical to the
+validating path for well-formed exports, and still skip the entries whose
+conversation-level invariants (ids, titles, messages, timestamps) fail.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.models.conversation import Conversation
+from echomine.models.message import Message
+from echomine.models.trusted import trusted_conversation, trusted_message
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+CREATED = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+
+
+def _message_fields(**overrides: Any) -> dict[str, Any]:
+    fields: dict[str, Any] = {
+        "id": "msg-1",
+        "content": "Hello",
+        "role": "user",
+        "timestamp": CREATED,
+        "metadata": {"content_type": "text"},
+    }
+    fields.update(overrides)
+    return fields
+
+
+class TestTrustedMessage:
+    """trusted_message() equals Message() for valid input."""
+
+    def test_equal_to_validated(self) -> None:
+        trusted = trusted_message(**_message_fields())
+        validated = Message(**_message_fields())
+
+        assert trusted == validated
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert trusted.images == []
+        assert trusted.model is None
+
+    def test_normalizes_to_utc(self) -> None:
+        plus_two = CREATED.astimezone(timezone(timedelta(hours=2)))
+
+        message = trusted_message(**_message_fields(timestamp=plus_two))
+
+        assert message.timestamp.tzinfo is UTC
+        assert message.timestamp == CREATED
+
+    def test_still_frozen(self) -> None:
+        message = trusted_message(**_message_fields())
+
+        with pytest.raises(ValidationError):
+            message.content = "changed"  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"id": ""},
+            {"id": None},
+            {"timestamp": CREATED.replace(tzinfo=None)},
+            {"timestamp": "2024"},
+        ],
+    )
+    def test_rejects_broken_invariants(self, overrides: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            trusted_message(**_message_fields(**overrides))
+
+
+class TestTrustedConversation:
+    """trusted_conversation() keeps the conversation-level checks."""
+
+    def _fields(self, **overrides: Any) -> dict[str, Any]:
+        fields: dict[str, Any] = {
+            "id": "conv-1",
+            "title": "Title",
+            "created_at": CREATED,
+            "updated_at": CREATED + timedelta(minutes=1),
+            "messages": [Message(**_message_fields())],
+        }
+        fields.update(overrides)
+        return fields
+
+    def test_equal_to_validated(self) -> None:
+        trusted = trusted_conversation(**self._fields())
+        validated = Conversation(**self._fields())
+
+        assert trusted == validated
+        assert trusted.model_dump_json() == validated.model_dump_json()
+        assert trusted.models_used == []
+        assert trusted.message_count == 1
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"id": ""},
+            {"title": None},
+            {"title": ""},
+            {"messages": []},
+            {"created_at": CREATED.replace(tzinfo=None)},
+            {"updated_at": CREATED - timedelta(seconds=1)},
+        ],
+    )
+    def test_rejects_broken_invariants(self, overrides: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            Conversation(**self._fields(**overrides))
+        with pytest.raises(ValidationError):
+            trusted_conversation(**self._fields(**overrides))
+
+
+class TestTrustedAdapters:
+    """stream_conversations(trusted=True) yields the same conversations and skips."""
+
+    @pytest.fixture
+    def openai_export(self, tmp_path: Path) -> Path:
+        conversations: list[dict[str, Any]] = [
+            make_openai_conversation(
+                [
+                    make_openai_message(
+                        id=f"m-{i}-{j}",
+                        role="user" if j % 2 == 0 else "assistant",
+                        parts=[f"text {j}"],
+                        metadata={"model_slug": "gpt-4o"} if j % 2 else {},
+                    )
+                    for j in range(3)
+                ],
+                conv_id=f"conv-{i}",
+                title=f"Session {i}",
+            )
+            for i in range(4)
+        ]
+        conversations[1]["title"] = None
+        conversations[2]["mapping"] = {}
+        return write_export(conversations, tmp_path / "openai.json")
+
+    @pytest.fixture
+    def claude_export(self, tmp_path: Path) -> Path:
+        data: list[dict[str, object]] = []
+        for i in range(4):
+            data += make_claude_export(
+                [make_claude_message(uuid=f"m-{i}-{j}", text=f"text {j}") for j in range(i)],
+                conv_id=f"conv-{i}",
+                title="" if i == 2 else f"Session {i}",
+                created_at="2025-10-01T20:00:00+02:00",
+                updated_at="2025-10-01T18:05:00Z",
+            )
+        data[3]["updated_at"] = "2025-10-01T17:00:00Z"
+        return write_export(data, tmp_path / "claude.json")
+
+    @pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+    def test_same_conversations_and_skips(
+        self, adapter_cls: type[Any], openai_export: Path, claude_export: Path
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        skips: dict[bool, list[str]] = {False: [], True: []}
+        results: dict[bool, list[Conversation]] = {}
+
+        for trusted in (False, True):
+            results[trusted] = list(
+                adapter_cls().stream_conversations(
+                    path,
+                    on_skip=lambda conv_id, reason, t=trusted: skips[t].append(conv_id),
+                    trusted=trusted,
+                )
+            )
+
+        assert results[True] == results[False]
+        assert [c.model_dump_json() for c in results[True]] == [
+            c.model_dump_json() for c in results[False]
+        ]
+        assert skips[True] == skips[False]
+        assert len(skips[True]) == (2 if adapter_cls is OpenAIAdapter else 1)
+
+    def test_trusted_parallel(self, openai_export: Path) -> None:
+        serial = list(OpenAIAdapter().stream_conversations(openai_export, trusted=True))
+        parallel = list(
+            OpenAIAdapter().stream_conversations(openai_export, workers=2, trusted=True)
+        )
+
+        assert parallel == serial
@@ -0,0 +1,186 @@
+"""Unit tests for two-pass, bounded-memory search (low_memory=True).
+
+Pass 1 gathers only BM25 corpus statistics; pass 2 re-streams the export,
+scores each candidate and keeps the top ``limit`` results in a heap. Results
+must be identical to the default single-pass search.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.models.search import SearchQuery
+from echomine.search.ranking import (
+    BM25Scorer,
+    CorpusStatistics,
+    TokenizedDocument,
+    tokenize_keywords,
+)
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+_TOPICS = [
+    "python sorting",
+    "rust ownership",
+    "python python async",
+    "java streams",
+    "编程 python",
+]
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Twenty OpenAI conversations with varied topics, lengths and dates."""
+    conversations = [
+        make_openai_conversation(
+            [
+                make_openai_message(id=f"m-{i}-{j}", role=("user", "assistant")[j % 2], parts=[t])
+                for j, t in enumerate(_TOPICS[i % 5 : i % 5 + 1 + i % 3])
+            ],
+            conv_id=f"conv-{i:02d}",
+            title=f"Session {i % 4}",
+            create_time=1704067200.0 + i * 3600,
+            update_time=1704067200.0 + i * 3600 + (20 - i) * 60,
+        )
+        for i in range(20)
+    ]
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Twenty Claude conversations with varied topics, lengths and dates."""
+    data: list[dict[str, object]] = []
+    for i in range(20):
+        created = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(hours=i)
+        data += make_claude_export(
+            [
+                make_claude_message(uuid=f"m-{i}-{j}", sender=("human", "assistant")[j % 2], text=t)
+                for j, t in enumerate(_TOPICS[i % 5 : i % 5 + 1 + i % 3])
+            ],
+            conv_id=f"conv-{i:02d}",
+            title=f"Session {i % 4}",
+            created_at=created.isoformat().replace("+00:00", "Z"),
+        )
+    return write_export(data, tmp_path / "claude.json")
+
+
+QUERIES = [
+    SearchQuery(keywords=["python"], limit=3),
+    SearchQuery(keywords=["python", "rust"], limit=5),
+    SearchQuery(keywords=["python", "async"], match_mode="all", limit=10),
+    SearchQuery(keywords=["python"], exclude_keywords=["编程"], limit=4),
+    SearchQuery(keywords=["python"], role_filter="assistant", limit=10),
+    SearchQuery(phrases=["java streams"], keywords=["rust"], limit=10),
+    SearchQuery(title_filter="session 1", limit=2),
+    SearchQuery(keywords=["python"], sort_by="date", sort_order="asc", limit=3),
+    SearchQuery(keywords=["python"], sort_by="title", limit=6),
+    SearchQuery(keywords=["python"], sort_by="messages", sort_order="asc", limit=7),
+]
+
+
+def _results(adapter: Any, path: Path, query: SearchQuery, **kwargs: Any) -> list[Any]:
+    return [
+        (r.conversation.id, r.score, r.matched_message_ids, r.snippet)
+        for r in adapter.search(path, query, **kwargs)
+    ]
+
+
+class TestCorpusStatistics:
+    """Streaming statistics reproduce a full-corpus BM25Scorer."""
+
+    def test_scores_match_full_corpus(self) -> None:
+        texts = ["python is great", "python python rocks", "java is good", ""]
+        docs = [TokenizedDocument.from_text(t) for t in texts]
+        keywords = ["python", "java", "missing"]
+        stats = CorpusStatistics(tokenize_keywords(keywords))
+        for doc in docs:
+            stats.add(doc)
+        avg = sum(doc.length for doc in docs) / len(docs)
+
+        full = BM25Scorer(corpus=docs, avg_doc_length=avg)
+        streamed = BM25Scorer.from_statistics(stats)
+
+        assert stats.document_count == 4
+        assert streamed.avg_doc_length == avg
+        assert streamed.idf_scores == {t: full.idf_scores[t] for t in ("python", "java")}
+        for doc in docs:
+            assert streamed.score(doc, keywords) == full.score(doc, keywords)
+
+    def test_empty_statistics(self) -> None:
+        stats = CorpusStatistics(["python"])
+
+        assert stats.avg_doc_length == 0.0
+        assert BM25Scorer.from_statistics(stats).idf_scores == {}
+
+
+class TestLowMemorySearch:
+    """low_memory=True returns exactly the default search results."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    @pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+    def test_results_identical(
+        self,
+        adapter_cls: type[Any],
+        query: SearchQuery,
+        openai_export: Path,
+        claude_export: Path,
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        adapter = adapter_cls()
+
+        default = _results(adapter, path, query)
+        low_memory = _results(adapter, path, query, low_memory=True)
+
+        assert low_memory == default
+        assert default  # Fixture guarantees each query has matches
+
+    def test_no_candidates(self, openai_export: Path) -> None:
+        query = SearchQuery(keywords=["python"], title_filter="nothing")
+
+        assert list(OpenAIAdapter().search(openai_export, query, low_memory=True)) == []
+
+    def test_progress_reported_once(self, openai_export: Path) -> None:
+        counts: list[int] = []
+
+        list(
+            OpenAIAdapter().search(
+                openai_export,
+                SearchQuery(keywords=["python"]),
+                progress_callback=counts.append,
+                low_memory=True,
+            )
+        )
+
+        assert counts == [20]
+
+    def test_skips_reported_once(self, tmp_path: Path) -> None:
+        data = make_claude_export([make_claude_message(text="python")], conv_id="ok")
+        data += make_claude_export([make_claude_message(text="python")], conv_id="bad")
+        data[1]["created_at"] = "not-a-date"
+        path = write_export(data, tmp_path / "claude.json")
+        skipped: list[str] = []
+
+        results = list(
+            ClaudeAdapter().search(
+                path,
+                SearchQuery(keywords=["python"]),
+                on_skip=lambda conv_id, reason: skipped.append(conv_id),
+                low_memory=True,
+            )
+        )
+
+        assert [r.conversation.id for r in results] == ["ok"]
+        assert skipped == ["bad"]
@@ -0,0 +1,227 @@
+"""Unit tests for search predicate pushdown (header pre-filter).
+
+Title, date-range and min_messages filters are evaluated on raw header
+fields before Message/Conversation models are built. These tests verify
+that pushdown never changes search results and that excluded conversations
+are never parsed.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.models.search import SearchQuery
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+# 2024-01-01T00:00:00Z
+_JAN_1 = 1704067200.0
+_DAY = 86400.0
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Ten OpenAI conversations, one per day, with 1-10 messages."""
+    conversations = [
+        make_openai_conversation(
+            [
+                make_openai_message(id=f"m-{i}-{j}", parts=[f"python topic {i}"])
+                for j in range(i + 1)
+            ],
+            conv_id=f"conv-{i}",
+            title=f"{'Python' if i % 2 else 'Rust'} session {i}",
+            create_time=_JAN_1 + i * _DAY,
+            update_time=_JAN_1 + i * _DAY + 60,
+        )
+        for i in range(10)
+    ]
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Ten Claude conversations, one per day, with 1-10 messages."""
+    data: list[dict[str, object]] = []
+    for i in range(10):
+        day = (datetime(2024, 1, 1, tzinfo=UTC) + timedelta(days=i)).isoformat()
+        data += make_claude_export(
+            [
+                make_claude_message(uuid=f"m-{i}-{j}", text=f"python topic {i}")
+                for j in range(i + 1)
+            ],
+            conv_id=f"conv-{i}",
+            title=f"{'Python' if i % 2 else 'Rust'} session {i}",
+            created_at=day.replace("+00:00", "Z"),
+        )
+    return write_export(data, tmp_path / "claude.json")
+
+
+QUERIES = [
+    SearchQuery(keywords=["python"], title_filter="python", limit=100),
+    SearchQuery(keywords=["python"], from_date=date(2024, 1, 3), limit=100),
+    SearchQuery(keywords=["python"], to_date=date(2024, 1, 4), limit=100),
+    SearchQuery(keywords=["python"], min_messages=5, limit=100),
+    SearchQuery(
+        keywords=["python"],
+        title_filter="session",
+        from_date=date(2024, 1, 2),
+        to_date=date(2024, 1, 8),
+        min_messages=3,
+        max_messages=7,
+        limit=100,
+    ),
+]
+
+
+def _search_ids(adapter: Any, path: Path, query: SearchQuery) -> list[tuple[str, float]]:
+    return [(r.conversation.id, r.score) for r in adapter.search(path, query)]
+
+
+class TestExcludesHeader:
+    """SearchQuery.excludes_header mirrors the post-parse filters."""
+
+    def test_title_filter_case_insensitive_substring(self) -> None:
+        query = SearchQuery(title_filter="Python")
+
+        assert query.excludes_header(title="Learning rust") is True
+        assert query.excludes_header(title="learning PYTHON") is False
+
+    def test_date_bounds_inclusive(self) -> None:
+        query = SearchQuery(from_date=date(2024, 1, 2), to_date=date(2024, 1, 3))
+
+        assert query.excludes_header(created_at=datetime(2024, 1, 1, 23, tzinfo=UTC)) is True
+        assert query.excludes_header(created_at=datetime(2024, 1, 2, tzinfo=UTC)) is False
+        assert query.excludes_header(created_at=datetime(2024, 1, 3, 23, tzinfo=UTC)) is False
+        assert query.excludes_header(created_at=datetime(2024, 1, 4, tzinfo=UTC)) is True
+
+    def test_date_compared_in_utc(self) -> None:
+        query = SearchQuery(from_date=date(2024, 1, 2))
+        eastern = timezone(timedelta(hours=-5))
+
+        # 2024-01-01 23:30 -05:00 is 2024-01-02 04:30 UTC
+        assert (
+            query.excludes_header(created_at=datetime(2024, 1, 1, 23, 30, tzinfo=eastern)) is False
+        )
+
+    def test_naive_datetime_never_excludes(self) -> None:
+        query = SearchQuery(from_date=date(2024, 1, 2))
+
+        assert query.excludes_header(created_at=datetime(2000, 1, 1)) is False  # noqa: DTZ001
+
+    def test_min_messages_uses_upper_bound(self) -> None:
+        query = SearchQuery(min_messages=3)
+
+        assert query.excludes_header(max_message_count=2) is True
+        assert query.excludes_header(max_message_count=3) is False
+
+    def test_unknown_values_never_exclude(self) -> None:
+        query = SearchQuery(title_filter="x", from_date=date(2030, 1, 1), min_messages=99)
+
+        assert query.excludes_header() is False
+
+    def test_has_header_filter(self) -> None:
+        assert SearchQuery(title_filter="x").has_header_filter() is True
+        assert SearchQuery(to_date=date(2024, 1, 1)).has_header_filter() is True
+        assert SearchQuery(min_messages=2).has_header_filter() is True
+        assert SearchQuery(keywords=["x"], max_messages=2).has_header_filter() is False
+        assert SearchQuery(keywords=["x"], title_filter="  ").has_header_filter() is False
+
+
+class TestPushdownPreservesResults:
+    """Search results are identical with and without pushdown."""
+
+    @pytest.mark.parametrize("query", QUERIES)
+    @pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+    def test_results_identical(
+        self,
+        adapter_cls: type[Any],
+        query: SearchQuery,
+        openai_export: Path,
+        claude_export: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        adapter = adapter_cls()
+        pushed = _search_ids(adapter, path, query)
+
+        monkeypatch.setattr(SearchQuery, "has_header_filter", lambda self: False)
+        unpushed = _search_ids(adapter, path, query)
+
+        assert pushed == unpushed
+        assert pushed  # Fixture guarantees each query has matches
+
+
+class TestExcludedNotParsed:
+    """Excluded conversations never reach _parse_conversation."""
+
+    @pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+    def test_only_candidates_parsed(
+        self,
+        adapter_cls: type[Any],
+        openai_export: Path,
+        claude_export: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        adapter = adapter_cls()
+        parsed: list[str] = []
+        original = adapter._parse_conversation
+
+        def spy(raw: dict[str, Any], **kwargs: Any) -> Any:
+            conv = original(raw, **kwargs)
+            parsed.append(conv.id)
+            return conv
+
+        monkeypatch.setattr(adapter, "_parse_conversation", spy)
+        query = SearchQuery(
+            keywords=["python"], title_filter="python", from_date=date(2024, 1, 6), limit=100
+        )
+
+        results = list(adapter.search(path, query))
+
+        assert parsed == ["conv-5", "conv-7", "conv-9"]
+        assert sorted(r.conversation.id for r in results) == parsed
+
+    def test_stream_conversations_unaffected(self, openai_export: Path) -> None:
+        assert len(list(OpenAIAdapter().stream_conversations(openai_export))) == 10
+
+
+class TestMalformedHeaders:
+    """Unparseable header fields fall through to the normal skip path."""
+
+    def test_claude_bad_timestamp_still_reported(self, tmp_path: Path) -> None:
+        data = make_claude_export(
+            [make_claude_message(text="python")], conv_id="bad", created_at="not-a-date"
+        )
+        path = write_export(data, tmp_path / "claude.json")
+        skipped: list[str] = []
+
+        results = list(
+            ClaudeAdapter().search(
+                path,
+                SearchQuery(keywords=["python"], from_date=date(2024, 1, 1)),
+                on_skip=lambda conv_id, reason: skipped.append(conv_id),
+            )
+        )
+
+        assert results == []
+        assert skipped == ["bad"]
+
+    def test_openai_malformed_create_time_not_excluded(self) -> None:
+        conv = make_openai_conversation([make_openai_message(parts=["python"])])
+        conv["create_time"] = "garbage"
+        adapter = OpenAIAdapter()
+
+        assert adapter._header_excluded(conv, SearchQuery(from_date=date(2024, 1, 1))) is False
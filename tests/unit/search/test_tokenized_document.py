@@ -0,0 +1,133 @@
+"""Unit tests for the shared search tokenization cache.
+
+TokenizedDocument is computed once per conversation and reused by BM25
+scoring, match_mode='all', exclusion and per-message matching. Every stage
+must give the same answer as tokenizing the joined corpus text.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.models.search import SearchQuery
+from echomine.search import ranking
+from echomine.search.ranking import (
+    BM25Scorer,
+    TokenizedDocument,
+    all_terms_present,
+    exclude_filter,
+    tokenize,
+)
+from tests.factories import make_openai_export, make_openai_message, write_export
+
+
+MESSAGES = ["How do I sort a list in Python?", "Use sorted() — 很适合初学者", "Thanks!"]
+TITLE = "Python lists"
+
+
+class TestTokenize:
+    """Module-level tokenizer matches BM25Scorer._tokenize."""
+
+    def test_latin_and_cjk(self) -> None:
+        assert tokenize("Python很适合") == ["python", "很", "适", "合"]
+
+    def test_scorer_delegates(self) -> None:
+        scorer = BM25Scorer(corpus=["x"], avg_doc_length=1.0)
+
+        assert scorer._tokenize("Python? Yes, python!") == tokenize("Python? Yes, python!")
+
+
+class TestTokenizedDocument:
+    """Per-message tokenization equals tokenizing the joined corpus text."""
+
+    def test_stats_match_joined_text(self) -> None:
+        joined = f"{TITLE} " + " ".join(MESSAGES)
+
+        doc = TokenizedDocument.from_messages(MESSAGES, title=TITLE)
+
+        assert doc.term_frequencies == Counter(tokenize(joined))
+        assert doc.length == len(tokenize(joined))
+
+    def test_title_not_attributed_to_messages(self) -> None:
+        doc = TokenizedDocument.from_messages(MESSAGES, title=TITLE)
+
+        assert "lists" in doc
+        assert doc.matching_messages(["lists"]) == []
+
+    def test_matching_messages(self) -> None:
+        doc = TokenizedDocument.from_messages(MESSAGES)
+
+        assert doc.matching_messages(["sorted", "thanks"]) == [1, 2]
+        assert doc.matching_messages(["初学"]) == [1]
+        assert doc.matching_messages(["--"]) == []
+
+    def test_empty_document_is_falsy(self) -> None:
+        assert not TokenizedDocument.from_text("")
+        assert TokenizedDocument.from_text("a")
+
+    def test_restricted_keeps_query_terms_and_length(self) -> None:
+        doc = TokenizedDocument.from_messages(MESSAGES, title=TITLE)
+
+        restricted = doc.restricted_to(["sorted", "thanks", "missing"])
+
+        assert restricted.length == doc.length
+        assert set(restricted.term_frequencies) == {"sorted", "thanks"}
+        assert restricted.term_frequencies["sorted"] == doc.term_frequencies["sorted"]
+        assert restricted.matching_messages(["sorted", "thanks"]) == [1, 2]
+        assert "python" not in restricted
+
+
+class TestStagesAcceptDocuments:
+    """Ranking helpers give identical answers for text and cached tokens."""
+
+    @pytest.mark.parametrize("keywords", [["python"], ["python", "rust"], ["编程"], []])
+    def test_score_and_filters_match_text(self, keywords: list[str]) -> None:
+        texts = [f"{TITLE} " + " ".join(MESSAGES), "Rust ownership", "编程 python"]
+        docs = [TokenizedDocument.from_text(t) for t in texts]
+        text_scorer = BM25Scorer(corpus=texts, avg_doc_length=5.0)
+        doc_scorer = BM25Scorer(corpus=docs, avg_doc_length=5.0)
+
+        assert doc_scorer.idf_scores == text_scorer.idf_scores
+        for text, doc in zip(texts, docs, strict=True):
+            assert doc_scorer.score(doc, keywords) == text_scorer.score(text, keywords)
+            assert all_terms_present(doc, keywords, doc_scorer) == all_terms_present(
+                text, keywords, text_scorer
+            )
+            assert exclude_filter(doc, keywords, doc_scorer) == exclude_filter(
+                text, keywords, text_scorer
+            )
+
+
+class TestSearchTokenizesOnce:
+    """Adapter search tokenizes each conversation's text exactly once."""
+
+    def test_one_tokenize_call_per_message(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        messages = [
+            make_openai_message(id=f"m-{i}", parts=[f"python message {i}"]) for i in range(4)
+        ]
+        path = write_export(make_openai_export(messages), tmp_path / "export.json")
+        calls: list[str] = []
+        original = ranking.tokenize
+
+        def counting_tokenize(text: str) -> list[str]:
+            calls.append(text)
+            return original(text)
+
+        monkeypatch.setattr(ranking, "tokenize", counting_tokenize)
+        query = SearchQuery(keywords=["python"], exclude_keywords=["java"], match_mode="all")
+
+        results = list(OpenAIAdapter().search(path, query))
+
+        assert len(results) == 1
+        assert results[0].matched_message_ids == ["m-0", "m-1", "m-2", "m-3"]
+        # Title + 4 messages once each; the rest are keyword tokenizations
+        document_calls = [c for c in calls if c not in ("python", "java")]
+        assert sorted(document_calls) == sorted(
+            ["Test"] + [f"python message {i}" for i in range(4)]
+        )
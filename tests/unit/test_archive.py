@@ -0,0 +1,340 @@
+"""Unit tests for reading archived exports (echomine.utils.archive).
+
+Every reader must accept the provider's ``.zip`` bundle, and gzip/bz2/xz or
+packed files, and produce exactly what it produces for the plain
+``conversations.json``, whether the JSON can be read in place (stored
+members, packed blocks) or only by decompressing it in order.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.cli.provider import detect_provider
+from echomine.exceptions import ParseError
+from echomine.index import ExportIndex
+from echomine.models.search import SearchQuery
+from echomine.utils.archive import open_export, pack_export, supports_random_access
+from echomine.utils.asset_resolver import resolve_asset
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+COMPRESSION = [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED]
+
+CODECS = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n" + b"\x00" * 8
+
+
+@pytest.fixture
+def openai_json(tmp_path: Path) -> Path:
+    """120 OpenAI conversations; conv-060 is malformed (no title)."""
+    conversations = []
+    for i in range(120):
+        conv = make_openai_conversation(
+            [make_openai_message(id=f"m-{i}", parts=[f"python topic {i % 7}"])],
+            conv_id=f"conv-{i:03d}",
+            title=f"Session {i % 9}",
+        )
+        if i == 60:
+            del conv["title"]
+        conversations.append(conv)
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_json(tmp_path: Path) -> Path:
+    """40 Claude conversations."""
+    data: list[dict[str, object]] = []
+    for i in range(40):
+        data += make_claude_export(
+            [make_claude_message(uuid=f"m-{i}", text=f"python topic {i % 7}")],
+            conv_id=f"conv-{i:03d}",
+            title=f"Session {i % 9}",
+        )
+    return write_export(data, tmp_path / "claude.json")
+
+
+def _zip(
+    export: Path,
+    compression: int,
+    *,
+    member: str = "conversations.json",
+    extra: dict[str, bytes] | None = None,
+) -> Path:
+    """Bundle an export JSON file (plus extra members) into a ZIP archive."""
+    archive_path = export.with_name(f"{export.stem}-{compression}.zip")
+    with zipfile.ZipFile(archive_path, "w", compression=compression) as archive:
+        archive.writestr("user.json", b"{}")
+        for name, data in (extra or {}).items():
+            archive.writestr(name, data)
+        archive.write(export, member)
+    return archive_path
+
+
+@pytest.mark.parametrize("compression", COMPRESSION)
+class TestOpenExport:
+    """open_export() reads the conversations member."""
+
+    def test_reads_member(self, openai_json: Path, compression: int) -> None:
+        archive = _zip(openai_json, compression)
+
+        with open_export(archive) as f:
+            assert f.read() == openai_json.read_bytes()
+
+    def test_seek_and_read_ranges(self, openai_json: Path, compression: int) -> None:
+        archive = _zip(openai_json, compression)
+        data = openai_json.read_bytes()
+
+        with open_export(archive) as f:
+            f.seek(1000)
+            assert f.read(50) == data[1000:1050]
+            f.seek(100)
+            assert f.read(10) == data[100:110]
+            assert f.tell() == 110
+
+    def test_nested_member(self, openai_json: Path, compression: int) -> None:
+        archive = _zip(openai_json, compression, member="export/conversations.json")
+
+        with open_export(archive) as f:
+            assert f.read() == openai_json.read_bytes()
+
+    def test_random_access(self, openai_json: Path, compression: int) -> None:
+        archive = _zip(openai_json, compression)
+
+        assert supports_random_access(openai_json)
+        assert supports_random_access(archive) is (compression == zipfile.ZIP_STORED)
+
+
+class TestArchiveErrors:
+    """Unusable archives raise ParseError."""
+
+    def test_missing_member(self, tmp_path: Path) -> None:
+        archive = tmp_path / "export.zip"
+        with zipfile.ZipFile(archive, "w") as f:
+            f.writestr("user.json", b"{}")
+
+        with pytest.raises(ParseError, match=r"no conversations\.json"):
+            open_export(archive)
+
+    def test_not_a_zip(self, tmp_path: Path) -> None:
+        archive = tmp_path / "export.zip"
+        archive.write_bytes(b"[]")
+
+        with pytest.raises(ParseError, match="Invalid ZIP archive"):
+            OpenAIAdapter().get_conversation_by_id(archive, "conv-1")
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            list(OpenAIAdapter().stream_conversations(tmp_path / "missing.zip"))
+
+
+@pytest.mark.parametrize("compression", COMPRESSION)
+class TestAdaptersOnArchives:
+    """Adapters, indexes and detection give the same results for the ZIP."""
+
+    def test_stream_matches_json(
+        self, openai_json: Path, claude_json: Path, compression: int
+    ) -> None:
+        for adapter, export in ((OpenAIAdapter(), openai_json), (ClaudeAdapter(), claude_json)):
+            archive = _zip(export, compression)
+
+            assert list(adapter.stream_conversations(archive)) == list(
+                adapter.stream_conversations(export)
+            )
+
+    def test_parallel_matches_json(self, openai_json: Path, compression: int) -> None:
+        adapter = OpenAIAdapter()
+        archive = _zip(openai_json, compression)
+
+        parallel = list(adapter.stream_conversations(archive, workers=2))
+
+        assert parallel == list(adapter.stream_conversations(openai_json))
+
+    def test_detect_provider(self, openai_json: Path, claude_json: Path, compression: int) -> None:
+        assert detect_provider(_zip(openai_json, compression)) == "openai"
+        assert detect_provider(_zip(claude_json, compression)) == "claude"
+
+    def test_export_index(self, openai_json: Path, compression: int) -> None:
+        adapter = OpenAIAdapter()
+        archive = _zip(openai_json, compression)
+        ids = ["conv-101", "conv-007", "conv-060"]
+        expected = adapter.get_conversations_by_ids(openai_json, ids)
+
+        ExportIndex.build(archive, provider="openai")
+
+        assert ExportIndex.load(archive) is not None
+        assert adapter.get_conversations_by_ids(archive, ids) == expected
+        assert adapter.get_conversation_by_id(archive, "missing") is None
+        assert adapter.get_conversation_by_id(archive, "conv-119") == (
+            adapter.get_conversation_by_id(openai_json, "conv-119")
+        )
+
+    def test_search_index(self, claude_json: Path, compression: int) -> None:
+        adapter = ClaudeAdapter()
+        archive = _zip(claude_json, compression)
+        query = SearchQuery(keywords=["python", "topic"], limit=5)
+
+        def ranked(path: Path) -> list[Any]:
+            return [(r.conversation.id, r.score) for r in adapter.search(path, query)]
+
+        streamed = ranked(archive)
+        adapter.build_search_index(archive)
+
+        assert ranked(archive) == streamed == ranked(claude_json)
+
+
+class TestArchivedAssets:
+    """resolve_asset() matches asset pointers against archive members."""
+
+    def test_resolves_member(self, openai_json: Path) -> None:
+        archive = _zip(
+            openai_json,
+            zipfile.ZIP_DEFLATED,
+            extra={"dalle-generations/file-abc123-image.webp": PNG_HEADER, "file-xyz.txt": b""},
+        )
+
+        asset = resolve_asset(archive, "file-service://file-abc123")
+
+        assert asset is not None
+        assert asset.path == archive.resolve()
+        assert asset.member == "dalle-generations/file-abc123-image.webp"
+        assert asset.original_extension == ".webp"
+        assert asset.detected_type == "image/png"
+
+    def test_missing_asset(self, openai_json: Path) -> None:
+        archive = _zip(openai_json, zipfile.ZIP_STORED)
+
+        assert resolve_asset(archive, "file-service://file-missing") is None
+
+    def test_directory_assets_have_no_member(self, tmp_path: Path) -> None:
+        (tmp_path / "file-abc123.png").write_bytes(PNG_HEADER)
+
+        asset = resolve_asset(tmp_path, "file-service://file-abc123")
+
+        assert asset is not None
+        assert asset.member is None
+
+
+def _compress(export: Path, codec: str) -> Path:
+    """Compress an export JSON file; the name deliberately hides the codec."""
+    compressed = export.with_name(f"{export.stem}-{codec}.json")
+    compressed.write_bytes(CODECS[codec](export.read_bytes()))
+    return compressed
+
+
+def _pack(export: Path, block_size: int = 512) -> Path:
+    """Pack an export into many small blocks."""
+    packed = export.with_name(f"{export.stem}.json.gz")
+    pack_export(export, packed, block_size=block_size)
+    return packed
+
+
+@pytest.mark.parametrize("codec", list(CODECS))
+class TestCompressedInput:
+    """gzip/bz2/xz files are detected by magic bytes and decompressed as read."""
+
+    def test_reads_json(self, openai_json: Path, codec: str) -> None:
+        compressed = _compress(openai_json, codec)
+
+        with open_export(compressed) as f:
+            assert f.read() == openai_json.read_bytes()
+        assert not supports_random_access(compressed)
+
+    def test_adapters_and_detection(self, openai_json: Path, claude_json: Path, codec: str) -> None:
+        for adapter, export in ((OpenAIAdapter(), openai_json), (ClaudeAdapter(), claude_json)):
+            compressed = _compress(export, codec)
+
+            assert detect_provider(compressed) == detect_provider(export)
+            assert list(adapter.stream_conversations(compressed)) == list(
+                adapter.stream_conversations(export)
+            )
+
+    def test_parallel_and_index(self, openai_json: Path, codec: str) -> None:
+        adapter = OpenAIAdapter()
+        compressed = _compress(openai_json, codec)
+
+        assert list(adapter.stream_conversations(compressed, workers=2)) == list(
+            adapter.stream_conversations(openai_json)
+        )
+        ExportIndex.build(compressed, provider="openai")
+        assert adapter.get_conversations_by_ids(compressed, ["conv-101", "conv-007"]) == (
+            adapter.get_conversations_by_ids(openai_json, ["conv-101", "conv-007"])
+        )
+
+
+class TestPackedInput:
+    """Packed files are valid gzip and read in place, block by block."""
+
+    def test_round_trip(self, openai_json: Path) -> None:
+        packed = _pack(openai_json)
+        data = openai_json.read_bytes()
+
+        assert gzip.decompress(packed.read_bytes()) == data
+        assert supports_random_access(packed)
+        with open_export(packed) as f:
+            assert f.read() == data
+            f.seek(5000)
+            assert f.read(2000) == data[5000:7000]
+            f.seek(10)
+            assert f.read(10) == data[10:20]
+
+    def test_pack_from_zip_and_compressed(self, openai_json: Path, tmp_path: Path) -> None:
+        for source in (_zip(openai_json, zipfile.ZIP_DEFLATED), _compress(openai_json, "xz")):
+            packed = tmp_path / f"{source.stem}.packed.gz"
+
+            size = pack_export(source, packed)
+
+            assert size == openai_json.stat().st_size
+            assert gzip.decompress(packed.read_bytes()) == openai_json.read_bytes()
+
+    def test_empty_export(self, tmp_path: Path) -> None:
+        packed = _pack(write_export([], tmp_path / "empty.json"))
+
+        assert supports_random_access(packed)
+        assert list(OpenAIAdapter().stream_conversations(packed)) == []
+
+    def test_index_and_parallel(self, openai_json: Path) -> None:
+        adapter = OpenAIAdapter()
+        packed = _pack(openai_json)
+        ids = ["conv-119", "conv-000", "conv-060", "conv-042"]
+
+        ExportIndex.build(packed, provider="openai")
+
+        assert adapter.get_conversations_by_ids(packed, ids) == (
+            adapter.get_conversations_by_ids(openai_json, ids)
+        )
+        assert list(adapter.stream_conversations(packed, workers=2)) == list(
+            adapter.stream_conversations(openai_json)
+        )
+
+    def test_plain_gzip_is_not_packed(self, openai_json: Path) -> None:
+        packed = _pack(openai_json)
+        # Appending an ordinary gzip member leaves valid gzip, but not packed
+        with packed.open("ab") as f:
+            f.write(gzip.compress(b""))
+
+        assert not supports_random_access(packed)
+        with open_export(packed) as f:
+            assert f.read() == openai_json.read_bytes()
+
+    def test_invalid_arguments(self, openai_json: Path) -> None:
+        with pytest.raises(ValueError, match="block_size"):
+            pack_export(openai_json, openai_json.with_suffix(".gz"), block_size=0)
+        with pytest.raises(ValueError, match="onto itself"):
+            pack_export(openai_json, openai_json)
@@ -0,0 +1,263 @@
+"""Unit tests for bulk export (adapter.export_all and echomine.export.bulk).
+
+Every well-formed conversation must land in its own file with exactly the
+content the single-conversation export produces, for serial and parallel
+runs alike, and malformed entries must be skipped as in streaming.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.export import MarkdownExporter
+from echomine.export.bulk import (
+    MANIFEST_NAME,
+    SyncResult,
+    conversation_filename,
+    load_manifest,
+    sync_export,
+)
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Five conversations (two sharing a title) plus one without messages."""
+    conversations: list[dict[str, Any]] = [
+        make_openai_conversation(
+            [make_openai_message(id=f"m-{i}", parts=[f"Body {i}"])],
+            conv_id=f"conv-{i}",
+            title="Same title" if i < 2 else f"Python: tips #{i}",
+        )
+        for i in range(5)
+    ]
+    conversations.append(make_openai_conversation([], conv_id="empty"))
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Two Claude conversations, one untitled."""
+    data = make_claude_export(
+        [make_claude_message(uuid="m-1", text="hello")], conv_id="c-1", title="Rust"
+    ) + make_claude_export([make_claude_message(uuid="m-2", text="bye")], conv_id="c-2", title="")
+    return write_export(data, tmp_path / "claude.json")
+
+
+class TestConversationFilename:
+    """conversation_filename() builds unique, filesystem-safe names."""
+
+    @pytest.mark.parametrize(
+        ("conversation_id", "title", "expected"),
+        [
+            ("conv-1", "Python: tips #1", "python-tips-1_conv-1.md"),
+            ("abc", "机器学习入门 🚀", "机器学习入门_abc.md"),
+            ("x/y", "???", "untitled_x_y.md"),
+            ("..", "Dots", "dots__.md"),
+        ],
+    )
+    def test_names(self, conversation_id: str, title: str, expected: str) -> None:
+        assert conversation_filename(conversation_id, title, "markdown") == expected
+
+    def test_long_titles_truncated(self) -> None:
+        name = conversation_filename("id", "word " * 50, "json")
+
+        assert name.endswith("_id.json")
+        assert len(name) <= 60 + len("_id.json")
+
+
+class TestExportAll:
+    """export_all() writes one file per conversation in a single pass."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_markdown_matches_single_export(
+        self, openai_export: Path, tmp_path: Path, workers: int
+    ) -> None:
+        adapter = OpenAIAdapter()
+        out_dir = tmp_path / "out"
+        skipped: list[str] = []
+
+        exported = list(
+            adapter.export_all(
+                openai_export,
+                out_dir,
+                workers=workers,
+                on_skip=lambda conversation_id, reason: skipped.append(conversation_id),
+            )
+        )
+
+        assert sorted(e.conversation_id for e in exported) == [f"conv-{i}" for i in range(5)]
+        assert skipped == ["empty"]
+        assert sorted(p.name for p in out_dir.iterdir()) == sorted(e.path.name for e in exported)
+        exporter = MarkdownExporter()
+        for conversation in adapter.stream_conversations(openai_export):
+            path = out_dir / conversation_filename(conversation.id, conversation.title, "markdown")
+            content = path.read_text(encoding="utf-8")
+            # export_date in the frontmatter differs between renders
+            assert _without_export_date(content) == _without_export_date(
+                exporter.export_conversation_from_model(conversation)
+            )
+        assert {e.size for e in exported} == {len(e.path.read_bytes()) for e in exported}
+
+    def test_json_format(self, claude_export: Path, tmp_path: Path) -> None:
+        adapter = ClaudeAdapter()
+
+        exported = list(adapter.export_all(claude_export, tmp_path / "json", format="json"))
+
+        assert [e.path.name for e in exported] == ["rust_c-1.json", "no-title_c-2.json"]
+        conversations = list(adapter.stream_conversations(claude_export))
+        assert [e.path.read_text(encoding="utf-8") for e in exported] == [
+            c.model_dump_json(indent=2) for c in conversations
+        ]
+
+    def test_rerun_replaces_files_without_leftovers(
+        self, openai_export: Path, tmp_path: Path
+    ) -> None:
+        out_dir = tmp_path / "out"
+        list(OpenAIAdapter().export_all(openai_export, out_dir))
+
+        list(OpenAIAdapter().export_all(openai_export, out_dir, include_metadata=False))
+
+        files = list(out_dir.iterdir())
+        assert len(files) == 5
+        assert not any(f.name.endswith(".tmp") for f in files)
+        assert all(not f.read_text(encoding="utf-8").startswith("---") for f in files)
+
+
+def _conversations(titles: dict[str, str], updated: float = 1700001000.0) -> list[dict[str, Any]]:
+    return [
+        make_openai_conversation(
+            [make_openai_message(id=f"m-{conv_id}", parts=[f"Body of {conv_id}"])],
+            conv_id=conv_id,
+            title=title,
+            update_time=updated,
+        )
+        for conv_id, title in titles.items()
+    ]
+
+
+class TestSyncExport:
+    """sync_export() only renders and writes what changed since the last sync."""
+
+    def test_first_sync_writes_everything(self, openai_export: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "out"
+
+        result = sync_export(openai_export, out_dir, adapter=OpenAIAdapter())
+
+        assert result == SyncResult(written=5, unchanged=0, pruned=0)
+        manifest = load_manifest(out_dir, format="markdown", include_metadata=True)
+        assert sorted(manifest) == [f"conv-{i}" for i in range(5)]
+        assert all((out_dir / entry.path).is_file() for entry in manifest.values())
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unchanged_conversations_not_parsed(
+        self, openai_export: Path, tmp_path: Path, workers: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        out_dir = tmp_path / "out"
+        sync_export(openai_export, out_dir, adapter=OpenAIAdapter())
+        mtimes = {p.name: p.stat().st_mtime_ns for p in out_dir.iterdir()}
+
+        parse = OpenAIAdapter._parse_conversation
+        parsed: list[str] = []
+
+        def counting_parse(self: OpenAIAdapter, raw: dict[str, Any], **kwargs: Any) -> Any:
+            parsed.append(raw["id"])
+            return parse(self, raw, **kwargs)
+
+        monkeypatch.setattr(OpenAIAdapter, "_parse_conversation", counting_parse)
+        # Workers are spawned and do not see the monkeypatch; mtimes cover them
+        result = sync_export(openai_export, out_dir, adapter=OpenAIAdapter(), workers=workers)
+
+        assert result == SyncResult(written=0, unchanged=5, pruned=0)
+        # Only the malformed entry (never exported) goes through a full parse
+        assert parsed == ([] if workers > 1 else ["empty"])
+        assert {
+            p.name: p.stat().st_mtime_ns for p in out_dir.iterdir() if p.name != MANIFEST_NAME
+        } == {name: mtime for name, mtime in mtimes.items() if name != MANIFEST_NAME}
+
+    def test_changed_and_renamed_conversations_rewritten(self, tmp_path: Path) -> None:
+        export_file = tmp_path / "export.json"
+        out_dir = tmp_path / "out"
+        write_export(_conversations({"a": "Alpha", "b": "Beta", "c": "Gamma"}), export_file)
+        sync_export(export_file, out_dir, adapter=OpenAIAdapter())
+
+        conversations = _conversations({"a": "Alpha", "b": "Beta 2", "c": "Gamma"})
+        conversations[1]["update_time"] = 1700002000.0
+        conversations.append(_conversations({"d": "Delta"})[0])
+        write_export(conversations, export_file)
+        result = sync_export(export_file, out_dir, adapter=OpenAIAdapter())
+
+        assert result == SyncResult(written=2, unchanged=2, pruned=0)
+        assert sorted(p.name for p in out_dir.iterdir() if p.name != MANIFEST_NAME) == [
+            "alpha_a.md",
+            "beta-2_b.md",
+            "delta_d.md",
+            "gamma_c.md",
+        ]
+
+    def test_prune_removes_deleted_conversations(self, tmp_path: Path) -> None:
+        export_file = tmp_path / "export.json"
+        out_dir = tmp_path / "out"
+        write_export(_conversations({"a": "Alpha", "b": "Beta"}), export_file)
+        sync_export(export_file, out_dir, adapter=OpenAIAdapter())
+        (out_dir / "notes.md").write_text("not ours", encoding="utf-8")
+        write_export(_conversations({"a": "Alpha"}), export_file)
+
+        kept = sync_export(export_file, out_dir, adapter=OpenAIAdapter())
+        assert kept == SyncResult(written=0, unchanged=1, pruned=0)
+        assert (out_dir / "beta_b.md").is_file()
+
+        pruned = sync_export(export_file, out_dir, adapter=OpenAIAdapter(), prune=True)
+        assert pruned == SyncResult(written=0, unchanged=1, pruned=1)
+        assert sorted(p.name for p in out_dir.iterdir()) == [
+            MANIFEST_NAME,
+            "alpha_a.md",
+            "notes.md",
+        ]
+
+    def test_setting_change_rewrites_everything(self, openai_export: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "out"
+        sync_export(openai_export, out_dir, adapter=OpenAIAdapter())
+
+        result = sync_export(
+            openai_export, out_dir, adapter=OpenAIAdapter(), include_metadata=False
+        )
+
+        assert result == SyncResult(written=5, unchanged=0, pruned=0)
+        assert all(
+            not p.read_text(encoding="utf-8").startswith("---")
+            for p in out_dir.iterdir()
+            if p.name != MANIFEST_NAME
+        )
+
+    def test_deleted_file_rewritten_and_corrupt_manifest_ignored(
+        self, openai_export: Path, tmp_path: Path
+    ) -> None:
+        out_dir = tmp_path / "out"
+        sync_export(openai_export, out_dir, adapter=OpenAIAdapter())
+        (out_dir / conversation_filename("conv-3", "Python: tips #3", "markdown")).unlink()
+
+        assert sync_export(openai_export, out_dir, adapter=OpenAIAdapter()).written == 1
+
+        (out_dir / MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+        result = sync_export(openai_export, out_dir, adapter=OpenAIAdapter())
+
+        # Without a manifest every file is re-rendered, but identical ones are kept
+        assert result.written + result.unchanged == 5
+        assert json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))["version"] == 1
+
+
+def _without_export_date(markdown: str) -> str:
+    return "\n".join(line for line in markdown.splitlines() if not line.startswith("export_date"))
@@ -26,6 +26,7 @@ from __future__ import annotations
 
 from datetime import UTC
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -1265,34 +1266,35 @@ class TestGetConversationById:
         result_short = adapter.get_conversation_by_id(sample_export, "555")
         assert result_short is None
 
-    def test_retrieval_memory_efficiency(self, sample_export: Path) -> None:
+    def test_retrieval_memory_efficiency(
+        self, sample_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test T062: Uses streaming approach (FR-039).
 
         Validates:
-        - Uses stream_conversations (iterator pattern)
-        - No buffering of entire file
+        - Streams the export (no buffering of entire file)
+        - Only the matching conversation is parsed into models
         - Early termination when match found
         """
         adapter = ClaudeAdapter()
 
-        # Mock stream_conversations to verify it's called
-        original_stream = adapter.stream_conversations
-        call_count = 0
+        # Record which raw conversations are parsed into models
+        original_parse = ClaudeAdapter._parse_conversation
+        parsed: list[str] = []
 
-        def mock_stream(file_path: Path, **kwargs):  # type: ignore[no-untyped-def]
-            nonlocal call_count
-            call_count += 1
-            yield from original_stream(file_path, **kwargs)
+        def counting_parse(self: ClaudeAdapter, raw: dict[str, Any], **kwargs: Any) -> Any:
+            parsed.append(raw["uuid"])
+            return original_parse(self, raw, **kwargs)
 
-        adapter.stream_conversations = mock_stream  # type: ignore[method-assign]
+        monkeypatch.setattr(ClaudeAdapter, "_parse_conversation", counting_parse)
 
         # Call get_conversation_by_id
         result = adapter.get_conversation_by_id(
             sample_export, "5551eb71-ada2-45bd-8f91-0c4945a1e5a6"
         )
 
-        # Verify streaming was used
-        assert call_count == 1
+        # Verify only the match was parsed
+        assert parsed == ["5551eb71-ada2-45bd-8f91-0c4945a1e5a6"]
         assert result is not None
 
     def test_partial_id_matching(self, sample_export: Path) -> None:
@@ -1301,7 +1303,6 @@ class TestGetConversationById:
         Validates:
         - Minimum 4 characters for partial match
         - Case-insensitive prefix matching
-        - Returns first match if multiple prefixes match
         """
         adapter = ClaudeAdapter()
 
@@ -122,7 +122,7 @@ class TestGetConversationCoverage:
             # Successful commands return None, don't raise Exit
             get_conversation(
                 file_path=test_file,
-                conversation_id="test-conv-001",
+                conversation_ids=["test-conv-001"],
                 format="table",
                 verbose=False,
             )
@@ -150,7 +150,7 @@ class TestGetConversationCoverage:
             # Invoke with verbose=True
             get_conversation(
                 file_path=test_file,
-                conversation_id="test-conv-001",
+                conversation_ids=["test-conv-001"],
                 format="table",
                 verbose=True,
             )
@@ -171,7 +171,7 @@ class TestGetConversationCoverage:
             with pytest.raises(typer.Exit) as exc_info:
                 get_conversation(
                     file_path=test_file,
-                    conversation_id="test-conv-001",
+                    conversation_ids=["test-conv-001"],
                     format="json",
                     verbose=False,
                 )
@@ -193,7 +193,7 @@ class TestGetConversationCoverage:
             with pytest.raises(typer.Exit) as exc_info:
                 get_conversation(
                     file_path=test_file,
-                    conversation_id="test-conv-001",
+                    conversation_ids=["test-conv-001"],
                     format="json",
                     verbose=False,
                 )
@@ -215,7 +215,7 @@ class TestGetConversationCoverage:
             with pytest.raises(typer.Exit) as exc_info:
                 get_conversation(
                     file_path=test_file,
-                    conversation_id="test-conv-001",
+                    conversation_ids=["test-conv-001"],
                     format="json",
                     verbose=False,
                 )
@@ -255,7 +255,7 @@ class TestGetConversationCoverage:
             with pytest.raises(typer.Exit) as exc_info:
                 get_conversation(
                     file_path=test_file,
-                    conversation_id="test-conv-001",
+                    conversation_ids=["test-conv-001"],
                     format="json",
                     verbose=False,
                 )
@@ -277,7 +277,7 @@ class TestGetConversationCoverage:
             with pytest.raises(typer.Exit) as exc_info:
                 get_conversation(
                     file_path=test_file,
-                    conversation_id="test-conv-001",
+                    conversation_ids=["test-conv-001"],
                     format="json",
                     verbose=False,
                 )
@@ -299,7 +299,7 @@ class TestGetConversationCoverage:
             with pytest.raises(typer.Exit) as exc_info:
                 get_conversation(
                     file_path=test_file,
-                    conversation_id="test-conv-001",
+                    conversation_ids=["test-conv-001"],
                     format="json",
                     verbose=False,
                 )
@@ -772,7 +772,9 @@ class TestListCoverage:
         )
 
         with (
-            patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream,
+            patch(
+                "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+            ) as mock_stream,
             patch("typer.echo"),
         ):  # Suppress output for clean test
             mock_stream.return_value = [conv_without_update]
@@ -794,7 +796,9 @@ class TestListCoverage:
         test_file = tmp_path / "test_export.json"
         test_file.write_text("[]")
 
-        with patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream:
+        with patch(
+            "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+        ) as mock_stream:
             mock_stream.side_effect = FileNotFoundError("File not found")
 
             with pytest.raises(typer.Exit) as exc_info:
@@ -817,7 +821,9 @@ class TestListCoverage:
         test_file = tmp_path / "test_export.json"
         test_file.write_text("[]")
 
-        with patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream:
+        with patch(
+            "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+        ) as mock_stream:
             mock_stream.side_effect = PermissionError("Permission denied")
 
             with pytest.raises(typer.Exit) as exc_info:
@@ -840,7 +846,9 @@ class TestListCoverage:
         test_file = tmp_path / "test_export.json"
         test_file.write_text("[]")
 
-        with patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream:
+        with patch(
+            "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+        ) as mock_stream:
             mock_stream.side_effect = KeyboardInterrupt()
 
             with pytest.raises(typer.Exit) as exc_info:
@@ -0,0 +1,144 @@
+"""Unit tests for header-only streaming (stream_conversation_headers).
+
+Headers must carry the same id, title, timestamps and message count as the
+fully parsed conversations, skip the same malformed entries, and never build
+a Message model.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.models.conversation import ConversationHeader
+from echomine.statistics import calculate_statistics
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Conversations of 1-3 messages, a null update_time, and malformed entries."""
+    conversations: list[dict[str, Any]] = [
+        make_openai_conversation(
+            [make_openai_message(id=f"m-{i}-{j}", parts=[f"text {j}"]) for j in range(1 + i % 3)],
+            conv_id=f"conv-{i}",
+            title=f"Session {i}",
+            create_time=1704067200.0 + i * 3600,
+            update_time=1704067200.0 + i * 3600 + 60,
+        )
+        for i in range(6)
+    ]
+    conversations[0]["mapping"]["root"] = {"id": "root", "message": None, "children": []}
+    conversations[1]["update_time"] = None
+    no_title = make_openai_conversation([make_openai_message()], conv_id="no-title")
+    del no_title["title"]
+    no_messages = make_openai_conversation([], conv_id="no-messages")
+    backwards = make_openai_conversation(
+        [make_openai_message()], conv_id="backwards", create_time=2.0e9, update_time=1.0e9
+    )
+    conversations += [no_title, no_messages, backwards]
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Conversations of 0-2 messages, an untitled one, and a bad timestamp."""
+    data: list[dict[str, object]] = []
+    for i in range(6):
+        created = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(hours=i)
+        data += make_claude_export(
+            [make_claude_message(uuid=f"m-{i}-{j}", text=f"text {j}") for j in range(i % 3)],
+            conv_id=f"conv-{i}",
+            title="" if i == 4 else f"Session {i}",
+            created_at=created.isoformat().replace("+00:00", "Z"),
+            updated_at=(created + timedelta(minutes=5)).isoformat().replace("+00:00", "Z"),
+        )
+    data += make_claude_export([make_claude_message()], conv_id="bad-date")
+    data[-1]["created_at"] = "not-a-date"
+    return write_export(data, tmp_path / "claude.json")
+
+
+def _headers(conversations: list[Any]) -> list[tuple[Any, ...]]:
+    return [(c.id, c.title, c.created_at, c.updated_at, c.message_count) for c in conversations]
+
+
+@pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+class TestHeadersMatchConversations:
+    """Headers agree with stream_conversations field by field."""
+
+    def test_fields_and_skips(
+        self, adapter_cls: type[Any], openai_export: Path, claude_export: Path
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        full_skips: list[str] = []
+        header_skips: list[str] = []
+
+        full = list(
+            adapter_cls().stream_conversations(
+                path, on_skip=lambda conv_id, reason: full_skips.append(conv_id)
+            )
+        )
+        headers = list(
+            adapter_cls().stream_conversation_headers(
+                path, on_skip=lambda conv_id, reason: header_skips.append(conv_id)
+            )
+        )
+
+        assert all(isinstance(h, ConversationHeader) for h in headers)
+        assert _headers(headers) == _headers(full)
+        assert header_skips == full_skips
+        assert header_skips  # Fixture guarantees malformed entries
+
+    def test_no_messages_built(
+        self,
+        adapter_cls: type[Any],
+        openai_export: Path,
+        claude_export: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        adapter = adapter_cls()
+
+        def fail(*args: Any, **kwargs: Any) -> Any:
+            raise AssertionError("message parsed in header mode")
+
+        monkeypatch.setattr(adapter, "_parse_message", fail)
+
+        assert len(list(adapter.stream_conversation_headers(path))) == 6
+
+    def test_parallel_matches_serial(
+        self, adapter_cls: type[Any], openai_export: Path, claude_export: Path
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+
+        serial = list(adapter_cls().stream_conversation_headers(path))
+        parallel = list(adapter_cls().stream_conversation_headers(path, workers=2))
+
+        assert parallel == serial
+
+
+class TestStatisticsUseHeaders:
+    """calculate_statistics() reads headers only."""
+
+    def test_statistics_unchanged(self, openai_export: Path) -> None:
+        adapter = OpenAIAdapter()
+        conversations = list(adapter.stream_conversations(openai_export))
+
+        stats = calculate_statistics(openai_export, adapter=adapter)
+
+        assert stats.total_conversations == len(conversations)
+        assert stats.total_messages == sum(c.message_count for c in conversations)
+        assert stats.skipped_count == 3
+        assert stats.largest_conversation is not None
+        assert stats.largest_conversation.id == "conv-2"
@@ -17,6 +17,7 @@ Test Coverage:
     - T136: Newlines preserved in quoted fields (FR-053b)
     - T137: CSV parseable by Python csv module (FR-053c)
     - T139: Corrupted JSON during streaming handled gracefully (CHK054)
+    - write_* methods stream rows to a text stream from any iterable (FR-054)
 
 Requirements:
     - FR-049: CSV output format (--format csv)
@@ -34,6 +35,7 @@ Requirements:
 from __future__ import annotations
 
 import csv
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from io import StringIO
 
@@ -235,6 +237,55 @@ class TestExportMessages:
         assert lines[0] == "conversation_id,message_id,role,timestamp,content"
 
 
+class TestStreamingWrites:
+    """Test write_* methods stream rows to a text stream (FR-054)."""
+
+    def test_write_methods_match_export_methods(
+        self,
+        sample_conversation: Conversation,
+        conversation_with_null_updated: Conversation,
+        sample_search_result: SearchResult[Conversation],
+    ) -> None:
+        """Test each write_* method writes exactly what its export_* returns."""
+        exporter = CSVExporter()
+        conversations = [sample_conversation, conversation_with_null_updated]
+        results = [sample_search_result, sample_search_result]
+
+        cases = [
+            (exporter.write_conversations, exporter.export_conversations, conversations, 2),
+            (exporter.write_search_results, exporter.export_search_results, results, 2),
+            (exporter.write_messages, exporter.export_messages, sample_conversation, 2),
+            (
+                exporter.write_messages_from_results,
+                exporter.export_messages_from_results,
+                results,
+                4,
+            ),
+        ]
+        for write, export, data, expected_rows in cases:
+            out = StringIO()
+            assert write(data, out) == expected_rows  # type: ignore[operator]
+            assert out.getvalue() == export(data)  # type: ignore[operator]
+
+    def test_rows_written_as_iterator_is_consumed(
+        self, sample_search_result: SearchResult[Conversation]
+    ) -> None:
+        """Test rows reach the stream before the iterator is exhausted."""
+        exporter = CSVExporter()
+        out = StringIO()
+        seen: list[int] = []
+
+        def results() -> Iterator[SearchResult[Conversation]]:
+            for _ in range(3):
+                # Header plus two message rows per result already written
+                seen.append(len(out.getvalue().splitlines()))
+                yield sample_search_result
+
+        exporter.write_messages_from_results(results(), out)
+
+        assert seen == [1, 3, 5]
+
+
 # T134: Test CSV properly escapes commas and quotes (FR-053)
 class TestCSVEscaping:
     """Test RFC 4180 escaping rules (FR-053)."""
@@ -0,0 +1,78 @@
+"""Unit tests for bounded-memory sorting (echomine.utils.external_sort).
+
+external_sorted() must return exactly what sorted() returns, ties in input
+order included, whether the input fits in one run, spills to several, or
+needs more than one merge pass, and must leave no temp files behind.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from echomine.utils import external_sort
+from echomine.utils.external_sort import external_sorted
+
+
+# (key, input position): equal keys keep input order in a stable sort
+ITEMS = [(i * 37 % 11, i) for i in range(50)]
+
+
+def _key(item: tuple[int, int]) -> int:
+    return item[0]
+
+
+class TestExternalSorted:
+    """external_sorted() equals sorted() for any run size."""
+
+    @pytest.mark.parametrize("run_size", [1, 3, 7, 50, 1000])
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_equals_sorted(self, tmp_path: Path, run_size: int, reverse: bool) -> None:
+        result = external_sorted(
+            iter(ITEMS), key=_key, reverse=reverse, run_size=run_size, tmp_dir=tmp_path
+        )
+
+        assert list(result) == sorted(ITEMS, key=_key, reverse=reverse)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_multiple_merge_passes(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(external_sort, "_MAX_OPEN_RUNS", 3)
+        monkeypatch.setattr(external_sort, "_BLOCK_SIZE", 3)
+
+        result = external_sorted(ITEMS, key=_key, run_size=2, tmp_dir=tmp_path)
+
+        assert list(result) == sorted(ITEMS, key=_key)
+
+    def test_records_encoded_and_decoded(self, tmp_path: Path) -> None:
+        encoded: list[tuple[int, int]] = []
+
+        def encode(item: tuple[int, int]) -> list[int]:
+            encoded.append(item)
+            return list(item)
+
+        def decode(record: list[int]) -> tuple[int, int]:
+            return (record[0], record[1])
+
+        result = external_sorted(
+            ITEMS, key=_key, run_size=10, encode=encode, decode=decode, tmp_dir=tmp_path
+        )
+
+        assert list(result) == sorted(ITEMS, key=_key)
+        assert len(encoded) == len(ITEMS)
+
+    def test_closing_early_removes_runs(self, tmp_path: Path) -> None:
+        result = external_sorted(ITEMS, key=_key, run_size=4, tmp_dir=tmp_path)
+        next(result)
+        assert len(list(tmp_path.iterdir())) == 1
+
+        result.close()  # type: ignore[attr-defined]
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_empty_input(self) -> None:
+        assert list(external_sorted([], key=_key, run_size=1)) == []
+
+    def test_invalid_run_size(self) -> None:
+        with pytest.raises(ValueError, match="run_size must be at least 1"):
+            external_sorted(ITEMS, key=_key, run_size=0)
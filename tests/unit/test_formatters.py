@@ -16,7 +16,9 @@ Constitution Compliance:
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from io import StringIO
 
 import pytest
 
@@ -25,6 +27,9 @@ from echomine.cli.formatters import (
     format_search_results,
     format_search_results_json,
     format_text_table,
+    write_json_array,
+    write_jsonl,
+    write_search_results_jsonl,
 )
 from echomine.models.conversation import Conversation
 from echomine.models.search import SearchResult
@@ -378,6 +383,64 @@ class TestFormatJSON:
         assert len(data) == 0
 
 
+class TestStreamingJSONWriters:
+    """Unit tests for write_json_array(), write_jsonl() and write_search_results_jsonl()."""
+
+    @pytest.mark.parametrize("count", [0, 1, 2])
+    def test_write_json_array_matches_format_json(
+        self, sample_conversations: list[Conversation], count: int
+    ) -> None:
+        """Test streaming array output is byte-for-byte identical to format_json()."""
+        out = StringIO()
+
+        written = write_json_array(sample_conversations[:count], out)
+
+        assert written == count
+        assert out.getvalue() == format_json(sample_conversations[:count])
+
+    def test_write_jsonl_one_record_per_line(
+        self, sample_conversations: list[Conversation]
+    ) -> None:
+        """Test JSON Lines output has the format_json() records, one per line."""
+        out = StringIO()
+
+        assert write_jsonl(sample_conversations, out) == 2
+
+        lines = out.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == json.loads(format_json(sample_conversations))
+
+    def test_records_written_as_iterator_is_consumed(
+        self, sample_conversations: list[Conversation]
+    ) -> None:
+        """Test each record reaches the stream before the next is requested."""
+        out = StringIO()
+        seen: list[int] = []
+
+        def conversations() -> Iterator[Conversation]:
+            for conversation in sample_conversations:
+                seen.append(len(out.getvalue().splitlines()))
+                yield conversation
+
+        write_jsonl(conversations(), out)
+
+        assert seen == [0, 1]
+
+    def test_write_search_results_jsonl_matches_json_results(
+        self, sample_conversations: list[Conversation]
+    ) -> None:
+        """Test each line equals a format_search_results_json() result entry."""
+        results = [
+            SearchResult(conversation=conv, score=0.5, matched_message_ids=["msg-1"])
+            for conv in sample_conversations
+        ]
+        out = StringIO()
+
+        assert write_search_results_jsonl(results, out) == 2
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert lines == json.loads(format_search_results_json(results))["results"]
+
+
 class TestFormatSearchResults:
     """Unit tests for format_search_results() function."""
 
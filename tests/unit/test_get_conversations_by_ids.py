@@ -0,0 +1,215 @@
+"""Unit tests for batch retrieval (adapter.get_conversations_by_ids).
+
+A batch lookup must return what get_conversation_by_id returns for each ID,
+from one streaming pass that parses only requested conversations and stops
+once every ID is found, or from the sidecar index when there is one. IDs
+resolve as full IDs or unique 4+ character prefixes; ambiguous prefixes
+raise AmbiguousIdError on both paths.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.exceptions import AmbiguousIdError
+from echomine.index import ExportIndex
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """Ten conversations; conv-5 has no messages (malformed)."""
+    conversations = [
+        make_openai_conversation(
+            [make_openai_message(id=f"m-{i}", parts=[f"Body {i}"])] if i != 5 else [],
+            conv_id=f"conv-{i}",
+            title=f"Title {i}",
+        )
+        for i in range(10)
+    ]
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """Three Claude conversations with distinct UUID prefixes."""
+    data: list[dict[str, Any]] = []
+    for uuid in ("aaaa1111-0000", "bbbb2222-0000", "BBBB3333-0000"):
+        data += make_claude_export(
+            [make_claude_message(uuid=f"m-{uuid}", text="hi")], conv_id=uuid, title=uuid
+        )
+    return write_export(data, tmp_path / "claude.json")
+
+
+def _visited(monkeypatch: pytest.MonkeyPatch, adapter_class: type[Any], id_field: str) -> list[str]:
+    """Record the ID of every raw entry the batch parse hook sees."""
+    visited: list[str] = []
+    hook = adapter_class._parse_if_requested
+
+    def recording_hook(self: Any, raw: dict[str, Any], *args: Any, **kwargs: Any) -> Any:
+        visited.append(raw[id_field])
+        return hook(self, raw, *args, **kwargs)
+
+    monkeypatch.setattr(adapter_class, "_parse_if_requested", recording_hook)
+    return visited
+
+
+class TestOpenAIBatchGet:
+    """OpenAIAdapter.get_conversations_by_ids()."""
+
+    def test_matches_single_lookups(self, openai_export: Path) -> None:
+        adapter = OpenAIAdapter()
+        ids = ["conv-7", "conv-2", "missing", "conv-5", "conv-2"]
+
+        found = adapter.get_conversations_by_ids(openai_export, ids)
+
+        assert list(found) == ["conv-7", "conv-2"]
+        for cid in ids:
+            assert found.get(cid) == adapter.get_conversation_by_id(openai_export, cid)
+
+    def test_only_requested_parsed_and_stops_when_found(
+        self, openai_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        visited = _visited(monkeypatch, OpenAIAdapter, "id")
+        parse = OpenAIAdapter._parse_conversation
+        parsed: list[str] = []
+
+        def counting_parse(self: OpenAIAdapter, raw: dict[str, Any], **kwargs: Any) -> Any:
+            parsed.append(raw["id"])
+            return parse(self, raw, **kwargs)
+
+        monkeypatch.setattr(OpenAIAdapter, "_parse_conversation", counting_parse)
+
+        found = OpenAIAdapter().get_conversations_by_ids(openai_export, ["conv-6", "conv-1"])
+
+        assert list(found) == ["conv-6", "conv-1"]
+        assert parsed == ["conv-1", "conv-6"]
+        assert visited == [f"conv-{i}" for i in range(7)]
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_prefix_lookup(self, openai_export: Path, indexed: bool) -> None:
+        if indexed:
+            ExportIndex.build(openai_export, provider="openai")
+        adapter = OpenAIAdapter()
+
+        found = adapter.get_conversations_by_ids(openai_export, ["conv-7", "CONV-7", "con"])
+
+        assert list(found) == ["conv-7"]
+        with pytest.raises(AmbiguousIdError) as excinfo:
+            adapter.get_conversation_by_id(openai_export, "conv-")
+        assert excinfo.value.conversation_id == "conv-"
+        assert len(excinfo.value.matches) == 10
+        assert excinfo.value.more is False
+
+    def test_prefix_parses_only_match(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        conversations = [
+            make_openai_conversation([make_openai_message()], conv_id=conv_id)
+            for conv_id in ("a1b2-0", "c3d4-0", "a1b2", "e5f6-0")
+        ]
+        export_file = write_export(conversations, tmp_path / "export.json")
+        parse = OpenAIAdapter._parse_conversation
+        parsed: list[str] = []
+
+        def counting_parse(self: OpenAIAdapter, raw: dict[str, Any], **kwargs: Any) -> Any:
+            parsed.append(raw["id"])
+            return parse(self, raw, **kwargs)
+
+        monkeypatch.setattr(OpenAIAdapter, "_parse_conversation", counting_parse)
+        adapter = OpenAIAdapter()
+
+        conv = adapter.get_conversation_by_id(export_file, "c3d4")
+        # "a1b2" is a full ID and a prefix of "a1b2-0": the full match wins
+        # ("a1b2-0" comes first, so it is parsed in case no full match follows)
+        full = adapter.get_conversation_by_id(export_file, "a1b2")
+
+        assert conv is not None
+        assert conv.id == "c3d4-0"
+        assert full is not None
+        assert full.id == "a1b2"
+        assert parsed == ["c3d4-0", "a1b2-0", "a1b2"]
+
+    def test_empty_request(self, openai_export: Path) -> None:
+        assert OpenAIAdapter().get_conversations_by_ids(openai_export, []) == {}
+
+    def test_uses_sidecar_index(self, openai_export: Path) -> None:
+        adapter = OpenAIAdapter()
+        streamed = adapter.get_conversations_by_ids(openai_export, ["conv-3", "conv-5", "conv-0"])
+        ExportIndex.build(openai_export, provider="openai")
+
+        indexed = adapter.get_conversations_by_ids(openai_export, ["conv-3", "conv-5", "conv-0"])
+
+        assert indexed == streamed
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            OpenAIAdapter().get_conversations_by_ids(tmp_path / "missing.json", ["conv-1"])
+
+
+class TestClaudeBatchGet:
+    """ClaudeAdapter.get_conversations_by_ids()."""
+
+    def test_matches_single_lookups(self, claude_export: Path) -> None:
+        adapter = ClaudeAdapter()
+        # Full ID, case-insensitive prefix, too-short prefix
+        ids = ["aaaa1111-0000", "BBBB2", "aaa"]
+
+        found = adapter.get_conversations_by_ids(claude_export, ids)
+
+        assert {cid: conv.id for cid, conv in found.items()} == {
+            "aaaa1111-0000": "aaaa1111-0000",
+            "BBBB2": "bbbb2222-0000",
+        }
+        for cid in ids:
+            assert found.get(cid) == adapter.get_conversation_by_id(claude_export, cid)
+
+    def test_stops_when_found(self, claude_export: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        visited = _visited(monkeypatch, ClaudeAdapter, "uuid")
+
+        found = ClaudeAdapter().get_conversations_by_ids(claude_export, ["BBBB2222-0000"])
+
+        assert [conv.id for conv in found.values()] == ["bbbb2222-0000"]
+        assert visited == ["aaaa1111-0000", "bbbb2222-0000"]
+
+    def test_prefix_scans_for_other_matches(
+        self, claude_export: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        visited = _visited(monkeypatch, ClaudeAdapter, "uuid")
+
+        found = ClaudeAdapter().get_conversations_by_ids(claude_export, ["BBBB2222"])
+
+        assert [conv.id for conv in found.values()] == ["bbbb2222-0000"]
+        assert visited == ["aaaa1111-0000", "bbbb2222-0000", "BBBB3333-0000"]
+
+    @pytest.mark.parametrize("indexed", [False, True])
+    def test_ambiguous_prefix(self, claude_export: Path, indexed: bool) -> None:
+        if indexed:
+            ExportIndex.build(claude_export, provider="claude")
+
+        with pytest.raises(AmbiguousIdError) as excinfo:
+            ClaudeAdapter().get_conversations_by_ids(claude_export, ["aaaa1111", "bbbb"])
+
+        assert excinfo.value.conversation_id == "bbbb"
+        assert sorted(excinfo.value.matches) == ["BBBB3333-0000", "bbbb2222-0000"]
+
+    def test_uses_sidecar_index(self, claude_export: Path) -> None:
+        adapter = ClaudeAdapter()
+        streamed = adapter.get_conversations_by_ids(claude_export, ["bbbb3", "AAAA1111-0000"])
+        ExportIndex.build(claude_export, provider="claude")
+
+        indexed = adapter.get_conversations_by_ids(claude_export, ["bbbb3", "AAAA1111-0000"])
+
+        assert indexed == streamed
+        assert list(indexed) == ["bbbb3", "AAAA1111-0000"]
@@ -0,0 +1,94 @@
+"""Unit tests for conversation ID resolution (echomine.utils.id_lookup).
+
+IdResolver must apply the full-ID / unique-prefix rules to a stream of raw
+IDs, ask for a parse only when the conversation may be returned, and raise
+AmbiguousIdError for prefixes of several IDs.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from echomine.exceptions import AmbiguousIdError
+from echomine.utils import id_lookup
+from echomine.utils.id_lookup import IdResolver
+
+
+def _resolve(
+    requested: list[str], ids: list[str], *, case_sensitive: bool = True
+) -> tuple[dict[str, str], list[str]]:
+    """Feed ids (each "parsing" to itself) and return (resolved, parsed ids)."""
+    resolver: IdResolver[str] = IdResolver(requested, case_sensitive=case_sensitive)
+    parsed: list[str] = []
+    for conversation_id in ids:
+        if resolver.wants(conversation_id):
+            parsed.append(conversation_id)
+            resolver.add(conversation_id, conversation_id)
+            if resolver.done:
+                break
+    return resolver.resolve(), parsed
+
+
+class TestIdResolver:
+    """IdResolver resolves full IDs and unique prefixes."""
+
+    def test_full_ids_stop_early(self) -> None:
+        resolved, parsed = _resolve(["b-1", "a-1"], ["a-1", "b-1", "c-1"])
+
+        assert resolved == {"b-1": "b-1", "a-1": "a-1"}
+        assert parsed == ["a-1", "b-1"]
+
+    def test_unique_prefix_parses_only_candidate(self) -> None:
+        resolved, parsed = _resolve(["cccc"], ["aaaa-1", "cccc-1", "bbbb-1"])
+
+        assert resolved == {"cccc": "cccc-1"}
+        assert parsed == ["cccc-1"]
+
+    def test_full_match_wins_over_prefix(self) -> None:
+        resolved, _ = _resolve(["abcd"], ["abcd-1", "abcd", "abcd-2"])
+
+        assert resolved == {"abcd": "abcd"}
+
+    def test_short_ids_match_in_full_only(self) -> None:
+        resolved, parsed = _resolve(["abc", "x"], ["abcd-1", "x"])
+
+        assert resolved == {"x": "x"}
+        assert parsed == ["x"]
+
+    def test_case_sensitivity(self) -> None:
+        assert _resolve(["ABCD"], ["abcd-1"])[0] == {}
+        assert _resolve(["ABCD", "Abcd"], ["abcd-1"], case_sensitive=False)[0] == {
+            "ABCD": "abcd-1",
+            "Abcd": "abcd-1",
+        }
+
+    def test_ambiguous_prefix_raises(self) -> None:
+        resolver: IdResolver[str] = IdResolver(["abcd", "ab"], case_sensitive=True)
+        parsed = [cid for cid in ("abcd-1", "abcd-2", "abcd-1") if resolver.wants(cid)]
+
+        with pytest.raises(AmbiguousIdError) as excinfo:
+            resolver.resolve()
+
+        # Only the first candidate is parsed; the second makes it ambiguous
+        assert parsed == ["abcd-1", "abcd-1"]
+        assert excinfo.value.conversation_id == "abcd"
+        assert excinfo.value.matches == ["abcd-1", "abcd-2"]
+        assert "longer prefix" in str(excinfo.value)
+
+    def test_reported_matches_capped(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(id_lookup, "MAX_REPORTED_MATCHES", 2)
+
+        with pytest.raises(AmbiguousIdError) as excinfo:
+            _resolve(["conv"], [f"conv-{i}" for i in range(5)])
+
+        assert excinfo.value.matches == ["conv-0", "conv-1"]
+        assert excinfo.value.more
+
+    def test_malformed_full_match_not_replaced_by_prefix(self) -> None:
+        resolver: IdResolver[str] = IdResolver(["abcd"], case_sensitive=True)
+        # "abcd" exists but fails to parse, so it is never added
+        assert resolver.wants("abcd")
+        assert resolver.wants("abcd-1")
+        resolver.add("abcd-1", "abcd-1")
+
+        assert resolver.resolve() == {}
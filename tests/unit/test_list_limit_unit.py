@@ -25,6 +25,7 @@ Expected Failure Reason:
 
 from __future__ import annotations
 
+import json
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -123,7 +124,7 @@ class TestListLimitParameter:
         # Mock the adapter to return our conversations
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = conversations
+            mock_adapter.stream_conversation_headers.return_value = conversations
             mock_adapter_class.return_value = mock_adapter
 
             # Mock typer.echo to capture output
@@ -151,7 +152,9 @@ class TestListLimitParameter:
         assert "conv-004" not in output, "6th conversation should be excluded with limit=5"
         assert "conv-000" not in output, "Oldest conversation should be excluded"
 
-    def test_limit_parameter_with_json_format(self, tmp_path: Path) -> None:
+    def test_limit_parameter_with_json_format(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test limit parameter works with JSON output format.
 
         Validates:
@@ -178,23 +181,16 @@ class TestListLimitParameter:
 
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = conversations
+            mock_adapter.stream_conversation_headers.return_value = conversations
             mock_adapter_class.return_value = mock_adapter
 
-            outputs: list[str] = []
-
-            def capture_echo(text: str, nl: bool = True) -> None:
-                outputs.append(text)
-
-            with patch("echomine.cli.commands.list.typer.echo", side_effect=capture_echo):
-                # Act: Call with limit=10 and JSON format
-                list_conversations(file_path=test_file, format="json", limit=10)
+            # Act: Call with limit=10 and JSON format
+            list_conversations(file_path=test_file, format="json", limit=10)
 
-        # Assert: Parse JSON output
+        # Assert: JSON is streamed straight to stdout
         import json
 
-        output = outputs[0] if outputs else "[]"
-        data = json.loads(output)
+        data = json.loads(capsys.readouterr().out)
 
         # Should have exactly 10 conversations
         assert len(data) == 10, f"Expected 10 conversations with limit=10. Got {len(data)}"
@@ -203,7 +199,9 @@ class TestListLimitParameter:
         assert data[0]["id"] == "conv-019", "First should be newest"
         assert data[9]["id"] == "conv-010", "Last should be 10th from top"
 
-    def test_limit_parameter_value_1_returns_single_conversation(self, tmp_path: Path) -> None:
+    def test_limit_parameter_value_1_returns_single_conversation(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test limit=1 returns only the newest conversation.
 
         Validates:
@@ -228,28 +226,23 @@ class TestListLimitParameter:
 
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = conversations
+            mock_adapter.stream_conversation_headers.return_value = conversations
             mock_adapter_class.return_value = mock_adapter
 
-            outputs: list[str] = []
-
-            def capture_echo(text: str, nl: bool = True) -> None:
-                outputs.append(text)
-
-            with patch("echomine.cli.commands.list.typer.echo", side_effect=capture_echo):
-                # Act: Call with limit=1
-                list_conversations(file_path=test_file, format="json", limit=1)
+            # Act: Call with limit=1
+            list_conversations(file_path=test_file, format="json", limit=1)
 
-        # Assert
+        # Assert: JSON is streamed straight to stdout
         import json
 
-        output = outputs[0] if outputs else "[]"
-        data = json.loads(output)
+        data = json.loads(capsys.readouterr().out)
 
         assert len(data) == 1, f"Expected exactly 1 conversation. Got {len(data)}"
         assert data[0]["id"] == "conv-004", "Should return newest conversation"
 
-    def test_limit_parameter_greater_than_total_returns_all(self, tmp_path: Path) -> None:
+    def test_limit_parameter_greater_than_total_returns_all(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test limit > total conversations returns all conversations.
 
         Validates:
@@ -275,27 +268,22 @@ class TestListLimitParameter:
 
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = conversations
+            mock_adapter.stream_conversation_headers.return_value = conversations
             mock_adapter_class.return_value = mock_adapter
 
-            outputs: list[str] = []
-
-            def capture_echo(text: str, nl: bool = True) -> None:
-                outputs.append(text)
-
-            with patch("echomine.cli.commands.list.typer.echo", side_effect=capture_echo):
-                # Act: Request limit=100 from file with only 3 conversations
-                list_conversations(file_path=test_file, format="json", limit=100)
+            # Act: Request limit=100 from file with only 3 conversations
+            list_conversations(file_path=test_file, format="json", limit=100)
 
         # Assert: Should return all 3 conversations
         import json
 
-        output = outputs[0] if outputs else "[]"
-        data = json.loads(output)
+        data = json.loads(capsys.readouterr().out)
 
         assert len(data) == 3, "Should return all 3 available conversations"
 
-    def test_limit_parameter_applies_after_sorting(self, tmp_path: Path) -> None:
+    def test_limit_parameter_applies_after_sorting(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test limit is applied AFTER sorting by created_at descending.
 
         Validates:
@@ -324,23 +312,16 @@ class TestListLimitParameter:
 
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = conversations
+            mock_adapter.stream_conversation_headers.return_value = conversations
             mock_adapter_class.return_value = mock_adapter
 
-            outputs: list[str] = []
-
-            def capture_echo(text: str, nl: bool = True) -> None:
-                outputs.append(text)
-
-            with patch("echomine.cli.commands.list.typer.echo", side_effect=capture_echo):
-                # Act: Request top 3 with limit=3
-                list_conversations(file_path=test_file, format="json", limit=3)
+            # Act: Request top 3 with limit=3
+            list_conversations(file_path=test_file, format="json", limit=3)
 
         # Assert: Should get conv-009, conv-008, conv-007 (newest 3 after sorting)
         import json
 
-        output = outputs[0] if outputs else "[]"
-        data = json.loads(output)
+        data = json.loads(capsys.readouterr().out)
 
         assert len(data) == 3
         assert data[0]["id"] == "conv-009", "First should be newest (hour=9)"
@@ -442,7 +423,9 @@ class TestListLimitParameterValidation:
 class TestListLimitEdgeCases:
     """Edge case unit tests for limit parameter."""
 
-    def test_limit_parameter_with_empty_file_returns_empty(self, tmp_path: Path) -> None:
+    def test_limit_parameter_with_empty_file_returns_empty(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test limit with empty file returns empty array (not error).
 
         Validates:
@@ -457,26 +440,21 @@ class TestListLimitEdgeCases:
 
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = []  # Empty
+            mock_adapter.stream_conversation_headers.return_value = []  # Empty
             mock_adapter_class.return_value = mock_adapter
 
-            outputs: list[str] = []
-
-            def capture_echo(text: str, nl: bool = True) -> None:
-                outputs.append(text)
-
-            with patch("echomine.cli.commands.list.typer.echo", side_effect=capture_echo):
-                # Act: Should not raise exception
-                list_conversations(file_path=test_file, format="json", limit=10)
+            # Act: Should not raise exception
+            list_conversations(file_path=test_file, format="json", limit=10)
 
         # Assert: Empty array
         import json
 
-        output = outputs[0] if outputs else "[]"
-        data = json.loads(output)
+        data = json.loads(capsys.readouterr().out)
         assert data == [], "Empty file should return empty array"
 
-    def test_limit_parameter_none_returns_all_conversations(self, tmp_path: Path) -> None:
+    def test_limit_parameter_none_returns_all_conversations(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Test limit=None (default) returns all conversations (no limit).
 
         Validates:
@@ -502,22 +480,83 @@ class TestListLimitEdgeCases:
 
         with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
             mock_adapter = MagicMock()
-            mock_adapter.stream_conversations.return_value = conversations
+            mock_adapter.stream_conversation_headers.return_value = conversations
             mock_adapter_class.return_value = mock_adapter
 
-            outputs: list[str] = []
-
-            def capture_echo(text: str, nl: bool = True) -> None:
-                outputs.append(text)
-
-            with patch("echomine.cli.commands.list.typer.echo", side_effect=capture_echo):
-                # Act: Call without limit parameter (or limit=None)
-                # This tests default behavior when --limit flag not provided
-                list_conversations(file_path=test_file, format="json")
+            # Act: Call without limit parameter (or limit=None)
+            # This tests default behavior when --limit flag not provided
+            list_conversations(file_path=test_file, format="json")
 
         # Assert: All 10 conversations returned
         import json
 
-        output = outputs[0] if outputs else "[]"
-        data = json.loads(output)
+        data = json.loads(capsys.readouterr().out)
         assert len(data) == 10, "Without limit, should return all conversations"
+
+
+@pytest.mark.unit
+class TestListTopK:
+    """--sort with --limit selects the top N with a bounded heap."""
+
+    @pytest.mark.parametrize("sort", ["date", "title", "messages"])
+    @pytest.mark.parametrize("order", ["asc", "desc"])
+    def test_limited_equals_sorted_prefix(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], sort: str, order: str
+    ) -> None:
+        """Test limited output equals the first N of the full sort, ties included."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text("[]")
+        base_time = datetime(2024, 1, 1, tzinfo=UTC)
+        # Equal dates, titles and message counts force the conversation_id tie-break
+        conversations = [
+            create_test_conversation(
+                conv_id=f"conv-{i * 7 % 12:03d}",
+                title=f"Title {i % 3}",
+                created_at=base_time.replace(hour=i % 4),
+                message_count=i % 2 + 1,
+            )
+            for i in range(12)
+        ]
+
+        def listed(limit: int | None) -> list[str]:
+            with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
+                mock_adapter = MagicMock()
+                # A one-shot iterator: selection must work in a single pass
+                mock_adapter.stream_conversation_headers.return_value = iter(conversations)
+                mock_adapter_class.return_value = mock_adapter
+                list_conversations(
+                    file_path=test_file, format="jsonl", sort=sort, order=order, limit=limit
+                )
+            return [json.loads(line)["id"] for line in capsys.readouterr().out.splitlines()]
+
+        assert listed(limit=5) == listed(limit=None)[:5]
+
+    @pytest.mark.parametrize("sort", ["date", "title", "messages"])
+    def test_spilled_sort_equals_in_memory_sort(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str], sort: str
+    ) -> None:
+        """Test a listing sorted through temp-file runs matches the in-memory sort."""
+        test_file = tmp_path / "test.json"
+        test_file.write_text("[]")
+        base_time = datetime(2024, 1, 1, tzinfo=UTC)
+        conversations = [
+            create_test_conversation(
+                conv_id=f"conv-{i * 7 % 12:03d}",
+                title=f"Title {i % 3}",
+                created_at=base_time.replace(hour=i % 4),
+                message_count=i % 2 + 1,
+            )
+            for i in range(12)
+        ]
+
+        def listed(run_size: int) -> str:
+            with patch("echomine.cli.commands.list.get_adapter") as mock_adapter_class:
+                mock_adapter = MagicMock()
+                mock_adapter.stream_conversation_headers.return_value = iter(conversations)
+                mock_adapter_class.return_value = mock_adapter
+                list_conversations(
+                    file_path=test_file, format="jsonl", sort=sort, run_size=run_size
+                )
+            return capsys.readouterr().out
+
+        assert listed(run_size=5) == listed(run_size=100)
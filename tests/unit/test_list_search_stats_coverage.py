@@ -131,7 +131,9 @@ class TestListCoverageGaps:
         )
 
         with (
-            patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream,
+            patch(
+                "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+            ) as mock_stream,
             patch("typer.echo"),
         ):
             mock_stream.return_value = [conv]
@@ -170,7 +172,9 @@ class TestListCoverageGaps:
         )
 
         with (
-            patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream,
+            patch(
+                "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+            ) as mock_stream,
             patch("echomine.cli.commands.list.is_rich_enabled", return_value=True),
             patch("echomine.cli.commands.list.create_rich_table") as mock_create_table,
             patch("echomine.cli.commands.list.Console") as mock_console_class,
@@ -202,7 +206,9 @@ class TestListCoverageGaps:
         test_file = tmp_path / "test_export.json"
         test_file.write_text("[]")
 
-        with patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream:
+        with patch(
+            "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+        ) as mock_stream:
             mock_stream.side_effect = ParseError("Invalid JSON syntax")
 
             with pytest.raises(typer.Exit) as exc_info:
@@ -225,7 +231,9 @@ class TestListCoverageGaps:
         test_file = tmp_path / "test_export.json"
         test_file.write_text("[]")
 
-        with patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream:
+        with patch(
+            "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+        ) as mock_stream:
             # Use echomine.exceptions.ValidationError
             mock_stream.side_effect = ValidationError("Schema validation failed")
 
@@ -265,7 +273,9 @@ class TestListCoverageGaps:
         except PydanticValidationError as e:
             mock_error = e
 
-        with patch("echomine.adapters.openai.OpenAIAdapter.stream_conversations") as mock_stream:
+        with patch(
+            "echomine.adapters.openai.OpenAIAdapter.stream_conversation_headers"
+        ) as mock_stream:
             mock_stream.side_effect = mock_error
 
             with pytest.raises(typer.Exit) as exc_info:
@@ -526,7 +536,7 @@ class TestStatisticsCoverageGaps:
 
         # Mock adapter that returns multiple conversations
         mock_adapter = MagicMock()
-        mock_adapter.stream_conversations.return_value = [
+        mock_adapter.stream_conversation_headers.return_value = [
             sample_conversation_no_update,
             older_conv,
         ]
@@ -583,7 +593,7 @@ class TestStatisticsCoverageGaps:
         )
 
         mock_adapter = MagicMock()
-        mock_adapter.stream_conversations.return_value = [older_conv, newer_conv]
+        mock_adapter.stream_conversation_headers.return_value = [older_conv, newer_conv]
 
         # Act
         stats = calculate_statistics(
@@ -0,0 +1,125 @@
+"""Unit tests for streaming lookups in MarkdownExporter.export_conversation(s).
+
+The OpenAI-path exporter must render exactly what it rendered when it loaded
+the whole export, stop reading once every requested conversation was found,
+and seek through the offset index when one is current.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.export.markdown import MarkdownExporter
+from echomine.index import ExportIndex, iter_element_spans
+from tests.factories import make_openai_conversation, make_openai_message, write_export
+
+
+@pytest.fixture
+def export_file(tmp_path: Path) -> Path:
+    """Four conversations; conv-2 is only addressable by conversation_id."""
+    conversations: list[dict[str, Any]] = [
+        make_openai_conversation(
+            [make_openai_message(id=f"m-{i}-{j}", parts=[f"Résumé {i}.{j} 🚀"]) for j in range(2)],
+            conv_id=f"conv-{i}",
+            title=f"Session {i}",
+        )
+        for i in range(4)
+    ]
+    conversations[2]["conversation_id"] = conversations[2].pop("id")
+    return write_export(conversations, tmp_path / "export.json")
+
+
+def _render_loaded(export_file: Path, position: int) -> str:
+    """Render the conversation at a list position from a full json.load."""
+    data = json.loads(export_file.read_text(encoding="utf-8"))
+    exporter = MarkdownExporter()
+    return exporter._render_conversation_data(
+        data[position], include_metadata=True, include_message_ids=True
+    )
+
+
+class TestExportConversation:
+    """export_conversation() streams to the first match."""
+
+    @pytest.mark.parametrize(("conversation_id", "position"), [("conv-1", 1), ("conv-2", 2)])
+    def test_matches_full_load(
+        self, export_file: Path, conversation_id: str, position: int
+    ) -> None:
+        markdown = MarkdownExporter().export_conversation(export_file, conversation_id)
+
+        assert markdown == _render_loaded(export_file, position)
+
+    def test_stops_at_first_match(self, export_file: Path) -> None:
+        # Everything after conv-1 is unreadable; the lookup must not get there
+        data = export_file.read_bytes()
+        export_file.write_bytes(data[: data.index(b'"conv-2"')] + b"{broken")
+
+        assert "# Session 1" in MarkdownExporter().export_conversation(export_file, "conv-1")
+
+    def test_not_found_raises(self, export_file: Path) -> None:
+        with pytest.raises(ValueError, match="not found"):
+            MarkdownExporter().export_conversation(export_file, "missing")
+
+    def test_invalid_json_raises(self, tmp_path: Path) -> None:
+        broken = tmp_path / "broken.json"
+        broken.write_text('[{"id": "conv-0", "mapping": ', encoding="utf-8")
+
+        with pytest.raises(json.JSONDecodeError):
+            MarkdownExporter().export_conversation(broken, "conv-1")
+
+    def test_uses_current_index(self, export_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        expected = MarkdownExporter().export_conversation(export_file, "conv-3")
+        ExportIndex.build(export_file, provider="openai")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("streamed despite current index")
+
+        monkeypatch.setattr("echomine.export.markdown.iter_element_spans", fail)
+
+        assert MarkdownExporter().export_conversation(export_file, "conv-3") == expected
+
+
+class TestExportConversations:
+    """export_conversations() renders many conversations in one pass."""
+
+    def test_same_output_as_single_exports(self, export_file: Path) -> None:
+        exporter = MarkdownExporter()
+
+        rendered = exporter.export_conversations(
+            export_file, ["conv-3", "missing", "conv-0", "conv-2"], include_metadata=False
+        )
+
+        assert list(rendered) == ["conv-0", "conv-2", "conv-3"]
+        for conversation_id, markdown in rendered.items():
+            assert markdown == exporter.export_conversation(
+                export_file, conversation_id, include_metadata=False
+            )
+
+    def test_single_pass(self, export_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        passes: list[int] = []
+
+        def counting_scan(*args: Any, **kwargs: Any) -> Any:
+            passes.append(1)
+            return iter_element_spans(*args, **kwargs)
+
+        monkeypatch.setattr("echomine.export.markdown.iter_element_spans", counting_scan)
+
+        rendered = MarkdownExporter().export_conversations(export_file, ["conv-0", "conv-3"])
+
+        assert len(rendered) == 2
+        assert len(passes) == 1
+
+    def test_with_index_matches_streaming(self, export_file: Path) -> None:
+        ids = ["conv-1", "conv-3", "conv-0", "conv-2", "missing"]
+        streamed = MarkdownExporter().export_conversations(export_file, ids)
+        single = MarkdownExporter().export_conversation(export_file, "conv-2")
+        ExportIndex.build(export_file, provider="openai")
+
+        # conv-2 has no indexed id: found by the streaming fallback
+        assert MarkdownExporter().export_conversations(export_file, ids) == streamed
+        assert sorted(streamed) == ["conv-0", "conv-1", "conv-2", "conv-3"]
+        assert MarkdownExporter().export_conversation(export_file, "conv-2") == single
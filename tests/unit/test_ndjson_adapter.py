@@ -0,0 +1,277 @@
+"""Unit tests for normalized NDJSON files (echomine.adapters.ndjson).
+
+A file written by ``write_ndjson`` from a provider adapter's conversations
+must read back, through NDJSONAdapter, exactly as the provider adapter reads
+the raw export: conversations, headers, search results and lookups.
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.ndjson import (
+    NDJSONAdapter,
+    dump_conversation,
+    is_ndjson,
+    ndjson_provider,
+    write_ndjson,
+)
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.cli.provider import get_adapter
+from echomine.exceptions import AmbiguousIdError, ParseError
+from echomine.models.search import SearchQuery
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_json(tmp_path: Path) -> Path:
+    """120 OpenAI conversations; conv-060 is malformed (no title)."""
+    conversations = []
+    for i in range(120):
+        conv = make_openai_conversation(
+            [
+                make_openai_message(id=f"m-{i}-{j}", parts=[f"python topic {i % 7} part {j}"])
+                for j in range(3)
+            ],
+            conv_id=f"conv-{i:03d}",
+            title=f"Session {i % 9}",
+        )
+        if i == 60:
+            del conv["title"]
+        conversations.append(conv)
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_json(tmp_path: Path) -> Path:
+    """40 Claude conversations."""
+    data: list[dict[str, object]] = []
+    for i in range(40):
+        data += make_claude_export(
+            [make_claude_message(uuid=f"m-{i}", text=f"python topic {i % 7}")],
+            conv_id=f"conv-{i:03d}",
+            title=f"Session {i % 9}",
+        )
+    return write_export(data, tmp_path / "claude.json")
+
+
+def _normalize(
+    export: Path, adapter: OpenAIAdapter | ClaudeAdapter, *, header: bool = False
+) -> Path:
+    """Write an export's conversations as NDJSON next to it."""
+    ndjson = export.with_suffix(".ndjson")
+    provider = adapter.provider if header else None
+    write_ndjson(adapter.stream_conversations(export), ndjson, provider=provider)
+    return ndjson
+
+
+class TestWriteNDJSON:
+    """write_ndjson() writes one model_dump_json line per conversation."""
+
+    def test_one_line_per_conversation(self, openai_json: Path) -> None:
+        adapter = OpenAIAdapter()
+        conversations = list(adapter.stream_conversations(openai_json))
+        ndjson = openai_json.with_suffix(".ndjson")
+
+        count = write_ndjson(conversations, ndjson)
+
+        lines = ndjson.read_bytes().splitlines()
+        assert count == len(lines) == 119
+        assert [json.loads(line) for line in lines] == [
+            json.loads(conv.model_dump_json()) for conv in conversations
+        ]
+        assert is_ndjson(ndjson)
+        assert not is_ndjson(openai_json)
+
+    def test_header_line_records_provider(self, claude_json: Path) -> None:
+        ndjson = _normalize(claude_json, ClaudeAdapter(), header=True)
+
+        header, *lines = ndjson.read_bytes().splitlines()
+        assert json.loads(header) == {"echomine_ndjson": 1, "provider": "claude"}
+        assert len(lines) == 40
+        assert is_ndjson(ndjson)
+        assert ndjson_provider(ndjson) == "claude"
+        assert ndjson_provider(_normalize(claude_json, ClaudeAdapter())) is None
+
+    def test_header_line_not_read_as_conversation(self, claude_json: Path) -> None:
+        ndjson = _normalize(claude_json, ClaudeAdapter(), header=True)
+        adapter = NDJSONAdapter()
+        skipped: list[str] = []
+
+        conversations = list(
+            adapter.stream_conversations(ndjson, on_skip=lambda cid, _reason: skipped.append(cid))
+        )
+
+        assert conversations == list(ClaudeAdapter().stream_conversations(claude_json))
+        assert skipped == []
+        assert list(adapter.stream_conversations(ndjson, workers=2)) == conversations
+        assert len(list(adapter.stream_conversation_headers(ndjson))) == 40
+
+    def test_decimal_metadata_written_as_numbers(self, tmp_path: Path) -> None:
+        export = write_export(
+            [
+                make_openai_conversation(
+                    [make_openai_message(id="m-1", update_time=1700000002.123)], conv_id="conv-1"
+                )
+            ],
+            tmp_path / "export.json",
+        )
+        conversation = next(OpenAIAdapter().stream_conversations(export))
+        assert conversation.messages[0].metadata["update_time"] == Decimal("1700000002.123")
+
+        line = json.loads(dump_conversation(conversation))
+        ndjson = _normalize(export, OpenAIAdapter())
+
+        assert line["messages"][0]["metadata"]["update_time"] == 1700000002.123
+        read_back = next(NDJSONAdapter().stream_conversations(ndjson))
+        assert read_back.messages[0].metadata["update_time"] == 1700000002.123
+
+
+class TestNDJSONAdapter:
+    """NDJSONAdapter reads back what the provider adapter read from the export."""
+
+    @pytest.mark.parametrize("provider", ["openai", "claude"])
+    def test_stream_matches_export(
+        self, openai_json: Path, claude_json: Path, provider: str
+    ) -> None:
+        adapter, export = (
+            (OpenAIAdapter(), openai_json)
+            if provider == "openai"
+            else (ClaudeAdapter(), claude_json)
+        )
+        ndjson = _normalize(export, adapter)
+
+        assert list(NDJSONAdapter().stream_conversations(ndjson)) == list(
+            adapter.stream_conversations(export)
+        )
+        assert list(NDJSONAdapter().stream_conversation_headers(ndjson)) == list(
+            adapter.stream_conversation_headers(export)
+        )
+
+    def test_parallel_matches_serial(self, openai_json: Path) -> None:
+        ndjson = _normalize(openai_json, OpenAIAdapter())
+        adapter = NDJSONAdapter()
+        serial = list(adapter.stream_conversations(ndjson))
+
+        assert list(adapter.stream_conversations(ndjson, workers=2)) == serial
+        assert sorted(
+            adapter.stream_conversations(ndjson, workers=2, ordered=False), key=lambda c: c.id
+        ) == sorted(serial, key=lambda c: c.id)
+        assert list(adapter.stream_conversation_headers(ndjson, workers=2)) == list(
+            adapter.stream_conversation_headers(ndjson)
+        )
+
+    @pytest.mark.parametrize("low_memory", [False, True])
+    def test_search_matches_export(self, openai_json: Path, low_memory: bool) -> None:
+        ndjson = _normalize(openai_json, OpenAIAdapter())
+        query = SearchQuery(keywords=["python", "topic"], title_filter="session 3", limit=5)
+
+        def ranked(adapter: OpenAIAdapter | NDJSONAdapter, path: Path) -> list[object]:
+            return [
+                (r.conversation.id, r.score, r.matched_message_ids, r.snippet)
+                for r in adapter.search(path, query, low_memory=low_memory)
+            ]
+
+        assert ranked(NDJSONAdapter(), ndjson) == ranked(OpenAIAdapter(), openai_json)
+
+    def test_lookups_match_export(self, openai_json: Path) -> None:
+        ndjson = _normalize(openai_json, OpenAIAdapter())
+        adapter = NDJSONAdapter()
+        ids = ["conv-119", "conv-000", "conv-060", "missing"]
+
+        assert adapter.get_conversations_by_ids(ndjson, ids) == (
+            OpenAIAdapter().get_conversations_by_ids(openai_json, ids)
+        )
+        assert adapter.get_message_by_id(ndjson, "m-77-2") == (
+            OpenAIAdapter().get_message_by_id(openai_json, "m-77-2")
+        )
+        assert adapter.get_message_by_id(ndjson, "m-77-2", conversation_id="conv-076") is None
+        assert adapter.get_message_by_id(ndjson, "missing") is None
+
+    def test_claude_ids_match_case_insensitively(self, claude_json: Path) -> None:
+        ndjson = _normalize(claude_json, ClaudeAdapter(), header=True)
+        ids = ["CONV-007", "Conv-03a", "cOnV-039"]
+
+        found = NDJSONAdapter().get_conversations_by_ids(ndjson, ids)
+
+        assert found == ClaudeAdapter().get_conversations_by_ids(claude_json, ids)
+        assert [conv.id for conv in found.values()] == ["conv-007", "conv-039"]
+        assert NDJSONAdapter().get_conversation_by_id(ndjson, "CONV-012") is not None
+
+    def test_ids_case_sensitive_without_header(self, claude_json: Path) -> None:
+        ndjson = _normalize(claude_json, ClaudeAdapter())
+
+        assert NDJSONAdapter().get_conversation_by_id(ndjson, "CONV-007") is None
+        assert NDJSONAdapter().get_conversation_by_id(ndjson, "conv-007") is not None
+
+    def test_ambiguous_prefix(self, openai_json: Path) -> None:
+        ndjson = _normalize(openai_json, OpenAIAdapter())
+
+        with pytest.raises(AmbiguousIdError):
+            NDJSONAdapter().get_conversation_by_id(ndjson, "conv-1")
+
+    def test_malformed_lines_skipped(self, openai_json: Path) -> None:
+        ndjson = _normalize(openai_json, OpenAIAdapter())
+        lines = ndjson.read_bytes().splitlines(keepends=True)
+        # Truncated line, blank line, and a line that is not a conversation
+        lines[3] = lines[3][:50] + b"\n"
+        lines.insert(5, b"\n")
+        lines.insert(7, b'{"id": "bogus"}\n')
+        ndjson.write_bytes(b"".join(lines))
+        skipped: list[str] = []
+
+        conversations = list(
+            NDJSONAdapter().stream_conversations(
+                ndjson, on_skip=lambda cid, _reason: skipped.append(cid)
+            )
+        )
+
+        assert len(conversations) == 118
+        assert skipped == ["conv-003", "bogus"]
+        assert NDJSONAdapter().get_conversation_by_id(ndjson, "conv-003") is None
+        assert NDJSONAdapter().get_conversation_by_id(ndjson, "conv-004") is not None
+
+    def test_raw_export_rejected(self, openai_json: Path) -> None:
+        with pytest.raises(ParseError, match="one JSON object per line"):
+            list(NDJSONAdapter().stream_conversations(openai_json))
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        ndjson = tmp_path / "empty.ndjson"
+        write_ndjson([], ndjson)
+
+        assert list(NDJSONAdapter().stream_conversations(ndjson, workers=2)) == []
+        assert NDJSONAdapter().get_conversation_by_id(ndjson, "conv-1") is None
+        assert NDJSONAdapter().get_message_by_id(ndjson, "m-1") is None
+
+    def test_get_adapter_detects_ndjson(self, openai_json: Path) -> None:
+        ndjson = _normalize(openai_json, OpenAIAdapter())
+
+        assert isinstance(get_adapter(None, ndjson), NDJSONAdapter)
+        assert isinstance(get_adapter(None, openai_json), OpenAIAdapter)
+
+    def test_single_object_exports_not_ndjson(self, tmp_path: Path) -> None:
+        openai = tmp_path / "openai-single.json"
+        openai.write_text(
+            json.dumps(make_openai_conversation([make_openai_message()], conv_id="conv-1"))
+        )
+        claude = tmp_path / "claude-single.json"
+        claude.write_text(json.dumps(make_claude_export([make_claude_message()])[0]))
+        truncated = tmp_path / "truncated.ndjson"
+        truncated.write_text('{"id": "conv-1", "messages": [')
+
+        assert not is_ndjson(openai)
+        assert not is_ndjson(claude)
+        assert not is_ndjson(truncated)
+        assert isinstance(get_adapter(None, openai), OpenAIAdapter)
+        assert isinstance(get_adapter(None, claude), ClaudeAdapter)
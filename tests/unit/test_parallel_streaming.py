@@ -0,0 +1,188 @@
+"""Unit tests for multi-process parsing (stream_conversations(..., workers=N)).
+
+Parallel streaming must yield exactly what serial streaming yields (in file
+order unless ordered=False) and invoke progress_callback/on_skip the same way.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from echomine.adapters.claude import ClaudeAdapter
+from echomine.adapters.openai import OpenAIAdapter
+from echomine.adapters.parallel import Skipped, iter_parallel
+from echomine.exceptions import ParseError
+from echomine.models.search import SearchQuery
+from tests.factories import (
+    make_claude_export,
+    make_claude_message,
+    make_openai_conversation,
+    make_openai_message,
+    write_export,
+)
+
+
+@pytest.fixture
+def openai_export(tmp_path: Path) -> Path:
+    """250 OpenAI conversations; every 50th is malformed (no title)."""
+    conversations = []
+    for i in range(250):
+        conv = make_openai_conversation(
+            [make_openai_message(id=f"m-{i}", parts=[f"python topic {i % 7}"])],
+            conv_id=f"conv-{i:03d}",
+            title=f"Session {i % 9}",
+            create_time=1704067200.0 + i * 3600,
+            update_time=1704067200.0 + i * 3600 + 60,
+        )
+        if i % 50 == 0:
+            del conv["title"]
+        conversations.append(conv)
+    return write_export(conversations, tmp_path / "openai.json")
+
+
+@pytest.fixture
+def claude_export(tmp_path: Path) -> Path:
+    """250 Claude conversations; every 50th is malformed (bad date)."""
+    data: list[dict[str, object]] = []
+    for i in range(250):
+        data += make_claude_export(
+            [make_claude_message(uuid=f"m-{i}", text=f"python topic {i % 7}")],
+            conv_id=f"conv-{i:03d}",
+            title=f"Session {i % 9}",
+        )
+        if i % 50 == 0:
+            data[-1]["created_at"] = "not-a-date"
+    return write_export(data, tmp_path / "claude.json")
+
+
+def _stream(adapter: Any, path: Path, **kwargs: Any) -> tuple[list[Any], list[int], list[str]]:
+    progress: list[int] = []
+    skipped: list[str] = []
+    conversations = list(
+        adapter.stream_conversations(
+            path,
+            progress_callback=progress.append,
+            on_skip=lambda conv_id, reason: skipped.append(conv_id),
+            **kwargs,
+        )
+    )
+    return conversations, progress, skipped
+
+
+@pytest.mark.parametrize("adapter_cls", [OpenAIAdapter, ClaudeAdapter])
+class TestParallelStreaming:
+    """workers > 1 reproduces serial streaming."""
+
+    def test_ordered_matches_serial(
+        self, adapter_cls: type[Any], openai_export: Path, claude_export: Path
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+
+        serial = _stream(adapter_cls(), path)
+        parallel = _stream(adapter_cls(), path, workers=2)
+
+        assert parallel == serial
+        assert len(serial[0]) == 245
+        assert serial[1] == [100, 200]
+        assert serial[2] == ["conv-000", "conv-050", "conv-100", "conv-150", "conv-200"]
+
+    def test_unordered_yields_same_conversations(
+        self, adapter_cls: type[Any], openai_export: Path, claude_export: Path
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+
+        serial, progress, skipped = _stream(adapter_cls(), path)
+        parallel, parallel_progress, parallel_skipped = _stream(
+            adapter_cls(), path, workers=2, ordered=False
+        )
+
+        assert sorted(c.id for c in parallel) == [c.id for c in serial]
+        assert parallel_progress == progress
+        assert sorted(parallel_skipped) == skipped
+
+    def test_search_matches_serial(
+        self, adapter_cls: type[Any], openai_export: Path, claude_export: Path
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        query = SearchQuery(keywords=["topic", "3"], title_filter="session 4", limit=5)
+
+        def results(**kwargs: Any) -> list[Any]:
+            return [
+                (r.conversation.id, r.score) for r in adapter_cls().search(path, query, **kwargs)
+            ]
+
+        assert results(workers=2) == results()
+
+    def test_parent_does_not_open_export(
+        self,
+        adapter_cls: type[Any],
+        openai_export: Path,
+        claude_export: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        path = openai_export if adapter_cls is OpenAIAdapter else claude_export
+        serial = _stream(adapter_cls(), path)
+
+        def fail(*_args: Any, **_kwargs: Any) -> Any:
+            raise AssertionError("export opened in the parent process")
+
+        # Workers are spawned, so they keep the real open_export
+        monkeypatch.setattr("echomine.adapters.base.open_export", fail)
+
+        assert _stream(adapter_cls(), path, workers=2) == serial
+
+
+class TestIterParallel:
+    """Batching, ordering and error propagation of the worker pool."""
+
+    def test_small_batches_keep_file_order(self, openai_export: Path) -> None:
+        outcomes = list(
+            iter_parallel(OpenAIAdapter()._parse_or_skip, openai_export, workers=3, batch_bytes=1)
+        )
+
+        assert len(outcomes) == 250
+        assert [o.conversation_id for o in outcomes if isinstance(o, Skipped)] == [
+            "conv-000",
+            "conv-050",
+            "conv-100",
+            "conv-150",
+            "conv-200",
+        ]
+        ids = [o.id for o in outcomes if o is not None and not isinstance(o, Skipped)]
+        assert ids == sorted(ids)
+
+    def test_prefilter_excludes_before_parsing(self, openai_export: Path) -> None:
+        query = SearchQuery(title_filter="session 4")
+
+        outcomes = list(
+            iter_parallel(
+                OpenAIAdapter()._parse_or_skip,
+                openai_export,
+                workers=2,
+                prefilter=query,
+                batch_bytes=4096,
+            )
+        )
+
+        parsed = [o for o in outcomes if o is not None]
+        assert parsed
+        assert all(o.title == "Session 4" for o in parsed if not isinstance(o, Skipped))
+        assert outcomes.count(None) == 250 - len(parsed)
+
+    def test_early_exit(self, openai_export: Path) -> None:
+        stream = OpenAIAdapter().stream_conversations(openai_export, workers=2)
+
+        first = next(stream)
+        stream.close()
+
+        assert first.id == "conv-001"
+
+    def test_invalid_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "broken.json"
+        path.write_text('[{"id": "a"}, {"id": ', encoding="utf-8")
+
+        with pytest.raises(ParseError):
+            list(OpenAIAdapter().stream_conversations(path, workers=2))